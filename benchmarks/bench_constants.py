@@ -0,0 +1,62 @@
+"""
+Tiempo de importación y memoria residente (RSS máxima) de los catálogos.
+
+Cada medición corre en un intérprete nuevo para que nada quede cacheado
+entre casos. Compara importar sifen.utils.constants solo, importarlo y
+acceder a todos los catálogos diferidos (el costo que antes se pagaba
+siempre al importar) e importar el XMLBuilder.
+
+Uso:
+    python benchmarks/bench_constants.py [repeticiones]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MEDIR = """
+import json, resource, time
+inicio = time.perf_counter()
+{codigo}
+ms = (time.perf_counter() - inicio) * 1000
+print(json.dumps({{"ms": ms, "rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}}))
+"""
+
+CASOS = {
+    "intérprete vacío": "pass",
+    "import constants": "from sifen.utils import constants",
+    "import constants + todos los catálogos": (
+        "from sifen.utils import constants\n"
+        "for nombre in constants.CATALOGOS_DIFERIDOS: getattr(constants, nombre)"
+    ),
+    "import XMLBuilder": "from sifen.core.builders.xml_builder import XMLBuilder",
+}
+
+
+def medir(codigo: str, repeticiones: int) -> dict:
+    muestras = []
+    for _ in range(repeticiones):
+        salida = subprocess.run(
+            [sys.executable, "-c", MEDIR.format(codigo=codigo)],
+            cwd=RAIZ, capture_output=True, text=True, check=True,
+        ).stdout
+        muestras.append(json.loads(salida))
+    return {
+        "ms": statistics.median(m["ms"] for m in muestras),
+        "rss_kb": statistics.median(m["rss_kb"] for m in muestras),
+    }
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    print(f"{'caso':<42}{'import (ms)':>12}{'RSS (KB)':>12}")
+    for nombre, codigo in CASOS.items():
+        resultado = medir(codigo, repeticiones)
+        print(f"{nombre:<42}{resultado['ms']:>12.2f}{resultado['rss_kb']:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+BandejaContingencia con 100k documentos: guardado, drenado y seguimiento.
+
+Guarda N rDE firmados (copias de uno solo con CDC distintos) en una bandeja
+nueva y mide el guardado, la toma de lotes sobre la tabla llena y el
+drenado completo contra el servidor local (sifen.emulador.servidor):
+envío en lotes de 50 y consulta de cada lote hasta aprobar todos los DE.
+Al final comprueba que ningún CDC llegó dos veces al servidor.
+
+Uso:
+    python benchmarks/bench_contingencia.py [--documentos 100000] [--lotes-en-vuelo 8]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sifen.core.clients.consulta_lote import ClienteConsultaLote  # noqa: E402
+from sifen.core.clients.contingencia import BandejaContingencia, DrenadorContingencia  # noqa: E402
+from sifen.core.clients.lote import ClienteLote, cdc_de  # noqa: E402
+from sifen.core.emision import emitir_factura  # noqa: E402
+from sifen.emulador.servidor import ServidorSIFEN  # noqa: E402
+from tests.conftest import crear_factura  # noqa: E402
+
+
+def documentos(cantidad: int):
+    xml = emitir_factura(crear_factura())
+    original = cdc_de(xml)
+    for i in range(cantidad):
+        yield xml.replace(original.encode(), f"{original[:-7]}{i:07d}".encode())
+
+
+async def drenar(bandeja: BandejaContingencia, lotes_en_vuelo: int, latencia: float):
+    async with ServidorSIFEN(latencia=latencia) as servidor:
+        async with ClienteLote(url_base=servidor.url, max_conexiones=lotes_en_vuelo) as lote, \
+                ClienteConsultaLote(url_base=servidor.url, max_conexiones=lotes_en_vuelo) as consulta:
+            drenador = DrenadorContingencia(
+                bandeja, lote, consulta, espera_inicial=0.05, max_concurrencia=lotes_en_vuelo
+            )
+            lotes = await drenador.drenar()
+        return lotes, servidor.lotes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documentos", type=int, default=100000)
+    parser.add_argument("--lotes-en-vuelo", type=int, default=8)
+    parser.add_argument("--latencia", type=float, default=0.02)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "contingencia.db")
+        bandeja = BandejaContingencia(ruta)
+
+        inicio = time.perf_counter()
+        bandeja.guardar_muchos(documentos(args.documentos))
+        guardado = time.perf_counter() - inicio
+        tamano = os.path.getsize(ruta) / 2**20
+        print(f"guardado   {args.documentos} documentos en {guardado:.1f} s "
+              f"({args.documentos / guardado:.0f}/s, {tamano:.0f} MB)")
+
+        inicio = time.perf_counter()
+        tomados = bandeja.tomar(50)
+        bandeja.devolver([cdc for cdc, _ in tomados])
+        print(f"tomar 50   {(time.perf_counter() - inicio) * 1000:.1f} ms con la tabla llena")
+
+        inicio = time.perf_counter()
+        lotes, recibidos = asyncio.run(drenar(bandeja, args.lotes_en_vuelo, args.latencia))
+        drenado = time.perf_counter() - inicio
+        print(f"drenado    {lotes} lotes en {drenado:.1f} s ({args.documentos / drenado:.0f} DE/s)")
+
+        envios = Counter(cdc for cdcs in recibidos.values() for cdc in cdcs)
+        print(f"estados    {bandeja.contar()}")
+        print(f"CDC recibidos por el servidor: {len(envios)}, repetidos: {sum(n > 1 for n in envios.values())}")
+        bandeja.cerrar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Eventos de cancelación por segundo: armado/firma y envío a siRecepEvento.
+
+Primero compara el armado de los grupos de 15 eventos con EventoBuilder
+(clave cargada una vez, plantilla de Signature copiada, esquema compilado
+una vez) contra el armado ingenuo que lee la clave del disco en cada
+evento y compila siRecepEvento_v150.xsd en cada grupo. Después envía todos
+los eventos al servidor local (sifen.emulador.servidor), con latencia fija
+por solicitud, variando la cantidad de envíos en vuelo.
+
+Uso:
+    python benchmarks/bench_eventos.py [--eventos 10000] [--latencia 0.02]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import xmlsec  # noqa: E402
+from lxml import etree  # noqa: E402
+
+from sifen.core.builders import evento_builder  # noqa: E402
+from sifen.core.builders.evento_builder import EventoBuilder  # noqa: E402
+from sifen.core.clients.eventos import ClienteEventos  # noqa: E402
+from sifen.core.signers.almacen_claves import CERT_PATH, KEY_PATH  # noqa: E402
+from sifen.core.validators.registro_esquemas import RegistroEsquemas  # noqa: E402
+from sifen.emulador.servidor import ServidorSIFEN  # noqa: E402
+from sifen.models.evento import EventoCancelacion  # noqa: E402
+
+CONCURRENCIAS = (1, 4, 16)
+SIFEN_NS = evento_builder.SIFEN_NS
+
+
+def eventos_de_prueba(cantidad: int):
+    return [EventoCancelacion(f"018001234567001001{i:026d}", "Error en el precio") for i in range(cantidad)]
+
+
+def grupo_ingenuo(eventos, ids) -> etree._Element:
+    """Lo que haría un bucle sin builder: todo se prepara de nuevo cada vez."""
+    grupo = etree.Element("{%s}gGroupGesEve" % SIFEN_NS, nsmap={None: SIFEN_NS})
+    for evento in eventos:
+        ges_eve = etree.SubElement(grupo, "{%s}rGesEve" % SIFEN_NS)
+        r_eve = evento_builder._sub(ges_eve, "rEve")
+        r_eve.set("Id", str(next(ids)))
+        evento_builder._sub(r_eve, "dFecFirma").text = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        evento_builder._sub(r_eve, "dVerFor").text = "150"
+        can = evento_builder._sub(evento_builder._sub(r_eve, "gGroupTiEvt"), "rGeVeCan")
+        evento_builder._sub(can, "Id").text = evento.cdc
+        evento_builder._sub(can, "mOtEve").text = evento.motivo
+
+        firma = xmlsec.template.create(ges_eve, xmlsec.Transform.EXCL_C14N, xmlsec.Transform.RSA_SHA256)
+        referencia = xmlsec.template.add_reference(firma, xmlsec.Transform.SHA256, uri="#" + r_eve.get("Id"))
+        xmlsec.template.add_transform(referencia, xmlsec.Transform.ENVELOPED)
+        xmlsec.template.add_transform(referencia, xmlsec.Transform.EXCL_C14N)
+        xmlsec.template.add_x509_data(xmlsec.template.ensure_key_info(firma))
+        ges_eve.append(firma)
+        xmlsec.tree.add_ids(ges_eve, ["Id"])
+        ctx = xmlsec.SignatureContext()
+        ctx.key = xmlsec.Key.from_file(KEY_PATH, xmlsec.KeyFormat.PEM)
+        ctx.key.load_cert_from_file(CERT_PATH, xmlsec.KeyFormat.PEM)
+        ctx.sign(firma)
+    # Un registro nuevo compila el esquema otra vez
+    RegistroEsquemas().validar(grupo, "siRecepEvento")
+    return grupo
+
+
+def medir_armado(eventos) -> None:
+    ids = iter(range(1, len(eventos) + 1))
+    inicio = time.perf_counter()
+    for i in range(0, len(eventos), evento_builder.MAX_EVENTOS_POR_ENVIO):
+        grupo_ingenuo(eventos[i:i + evento_builder.MAX_EVENTOS_POR_ENVIO], ids)
+    ingenuo = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    grupos = sum(1 for _ in EventoBuilder(id_inicial=1).agrupar(eventos))
+    builder = time.perf_counter() - inicio
+
+    print(f"Armado y firma de {len(eventos)} eventos en {grupos} grupos")
+    print(f"{'':>14}{'s':>8}{'eventos/s':>12}")
+    print(f"{'ingenuo':>14}{ingenuo:>8.2f}{len(eventos) / ingenuo:>12.0f}")
+    print(f"{'EventoBuilder':>14}{builder:>8.2f}{len(eventos) / builder:>12.0f}")
+
+
+async def medir_envio(eventos, latencia: float, concurrencia: int) -> tuple:
+    async with ServidorSIFEN(latencia=latencia) as servidor:
+        cliente = ClienteEventos(url_base=servidor.url, concurrencia=concurrencia, max_conexiones=concurrencia)
+        async with cliente:
+            inicio = time.perf_counter()
+            envios = await cliente.enviar_eventos(eventos)
+            segundos = time.perf_counter() - inicio
+        errores = sum(envio.error is not None for envio in envios)
+        return len(eventos) / segundos, len(envios), errores
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--eventos", type=int, default=10000)
+    parser.add_argument("--latencia", type=float, default=0.02)
+    args = parser.parse_args()
+
+    eventos = eventos_de_prueba(args.eventos)
+    medir_armado(eventos)
+
+    print(f"\nEnvío de {args.eventos} eventos, latencia {args.latencia * 1000:.0f} ms")
+    print(f"{'en vuelo':>9}{'eventos/s':>12}{'envíos':>9}{'errores':>9}")
+    for concurrencia in CONCURRENCIAS:
+        eps, envios, errores = asyncio.run(medir_envio(eventos, args.latencia, concurrencia))
+        print(f"{concurrencia:>9}{eps:>12.0f}{envios:>9}{errores:>9}")
+
+
+if __name__ == "__main__":
+    main()
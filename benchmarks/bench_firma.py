@@ -0,0 +1,50 @@
+"""
+Documentos firmados por segundo con cada backend de firma.
+
+Se arman los rDE una sola vez y cada backend firma su propia copia de
+cada uno (firmar_xml sobre el árbol, con el dCarQR incluido); al final se
+comprueba que los bytes firmados de ambos backends son idénticos.
+
+Uso:
+    python benchmarks/bench_firma.py [--documentos 2000]
+"""
+import argparse
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sifen.core.builders.xml_builder import XMLBuilder  # noqa: E402
+from sifen.core.signers.firmantes import BACKEND_PYTHON, BACKEND_XMLSEC  # noqa: E402
+from sifen.core.signers.signer import firmar_xml, serializar_xml  # noqa: E402
+from sifen.emulador.carga import facturas_sinteticas  # noqa: E402
+from tests.conftest import crear_factura  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documentos", type=int, default=2000)
+    args = parser.parse_args()
+
+    arboles = [XMLBuilder.build_tree(f) for f in facturas_sinteticas(crear_factura(), args.documentos)]
+    firmados = {}
+    for backend in (BACKEND_XMLSEC, BACKEND_PYTHON):
+        copias = [copy.deepcopy(arbol) for arbol in arboles]
+        firmar_xml(copy.deepcopy(arboles[0]), backend=backend)  # Carga de clave y esqueleto fuera de la medición
+        inicio = time.perf_counter()
+        for arbol in copias:
+            firmar_xml(arbol, backend=backend)
+        segundos = time.perf_counter() - inicio
+        print(f"{backend:<8}{args.documentos / segundos:>10.0f} docs/s  ({segundos * 1000 / args.documentos:.3f} ms/doc)")
+        firmados[backend] = [serializar_xml(arbol) for arbol in copias]
+
+    iguales = firmados[BACKEND_XMLSEC] == firmados[BACKEND_PYTHON]
+    print(f"Salida idéntica byte a byte: {'sí' if iguales else 'NO'}")
+    if not iguales:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Escalado de Firmador.firmar_muchos con la cantidad de hilos.
+
+Firma los mismos rDE (copias nuevas en cada corrida) con 1, 2, 4, ... hasta
+--hilos hilos y muestra documentos por segundo y la aceleración respecto de
+un hilo. xmlsec suelta el GIL durante la firma, así que el techo lo pone la
+cantidad de núcleos (os.cpu_count()) y la parte de Python que queda con el
+GIL tomado (copiar la plantilla, armar el dCarQR).
+
+Uso:
+    python benchmarks/bench_firma_hilos.py [--documentos 2000] [--hilos 8] [--backend xmlsec]
+"""
+import argparse
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sifen.core.builders.xml_builder import XMLBuilder  # noqa: E402
+from sifen.core.signers.firmador import Firmador  # noqa: E402
+from sifen.core.signers.firmantes import BACKEND_PYTHON, BACKEND_XMLSEC  # noqa: E402
+from sifen.emulador.carga import facturas_sinteticas  # noqa: E402
+from tests.conftest import crear_factura  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documentos", type=int, default=2000)
+    parser.add_argument("--hilos", type=int, default=max(4, os.cpu_count() or 1))
+    parser.add_argument("--backend", choices=(BACKEND_XMLSEC, BACKEND_PYTHON), default=BACKEND_XMLSEC)
+    args = parser.parse_args()
+
+    arboles = [XMLBuilder.build_tree(f) for f in facturas_sinteticas(crear_factura(), args.documentos)]
+    print(f"{args.documentos} documentos, backend {args.backend}, {os.cpu_count()} CPU")
+
+    hilos, base = 1, None
+    while hilos <= args.hilos:
+        copias = [copy.deepcopy(arbol) for arbol in arboles]
+        with Firmador(backend=args.backend, hilos=hilos) as firmador:
+            firmador.firmar_muchos([copy.deepcopy(arboles[0]) for _ in range(hilos)])  # Estado de cada hilo
+            inicio = time.perf_counter()
+            firmador.firmar_muchos(copias)
+            segundos = time.perf_counter() - inicio
+        por_segundo = args.documentos / segundos
+        base = base or por_segundo
+        print(f"{hilos:>3} hilos {por_segundo:>10.0f} docs/s  x{por_segundo / base:.2f}")
+        hilos *= 2
+
+
+if __name__ == "__main__":
+    main()
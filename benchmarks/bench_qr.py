@@ -0,0 +1,75 @@
+"""
+URLs dCarQR por segundo: el armado anterior de generar_dCarQR (rutas con
+prefijos y un HMAC nuevo por documento) contra ServicioQR.generar_qr_lote
+(hijos directos filtrados por lxml y copia de un HMAC ya inicializado con
+el CSC), a partir del rDE firmado o de los DatosQR ya extraídos.
+
+Se firma un único rDE y se repite en la entrada: lo que se mide es solo
+el armado del QR.
+
+Uso:
+    python benchmarks/bench_qr.py [--documentos 20000]
+"""
+import argparse
+import hashlib
+import hmac
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sifen.core.emision import emitir_arbol  # noqa: E402
+from sifen.core.signers.qr import CSC_PRUEBA, ID_CSC_PRUEBA, DatosQR, ServicioQR  # noqa: E402
+from tests.conftest import crear_factura  # noqa: E402
+
+NS = {"sifen": "http://ekuatia.set.gov.py/sifen/xsd", "ds": "http://www.w3.org/2000/09/xmldsig#"}
+
+
+def dcarqr_ingenuo(xml_root, id_csc, clave_csc):
+    """generar_dCarQR tal como estaba antes de ServicioQR."""
+    de = xml_root.find("sifen:DE", namespaces=NS)
+    parametros = {
+        "nVersion": "150",
+        "Id": de.get("Id"),
+        "dFeEmiDE": de.findtext("sifen:gDatGralOpe/sifen:dFeEmiDE", namespaces=NS),
+        "dRucRec": de.findtext("sifen:gDatGralOpe/sifen:gDatRec/sifen:dRucRec", namespaces=NS),
+        "dTotGralOpe": de.findtext("sifen:gTotSub/sifen:dTotGralOpe", namespaces=NS),
+        "dTotIVA": de.findtext("sifen:gTotSub/sifen:dTotIVA", namespaces=NS),
+        "cItems": str(len(de.findall("sifen:gDtipDE/sifen:gCamItem", namespaces=NS))),
+        "DigestValue": xml_root.findtext("ds:Signature/ds:SignedInfo/ds:Reference/ds:DigestValue", namespaces=NS),
+        "IdCSC": id_csc,
+    }
+    cadena = "&".join(f"{k}={v}" for k, v in parametros.items())
+    hash_qr = hmac.new(clave_csc.encode("utf-8"), cadena.encode("utf-8"), hashlib.sha256).hexdigest()
+    return f"https://ekuatia.set.gov.py/consultas-test/qr?{cadena}&cHashQR={hash_qr}"
+
+
+def medir(nombre: str, funcion, cantidad: int):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    segundos = time.perf_counter() - inicio
+    print(f"{nombre:<40}{cantidad / segundos:>12.0f} QR/s")
+    return resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documentos", type=int, default=20000)
+    args = parser.parse_args()
+
+    root = emitir_arbol(crear_factura(), validar=False)
+    documentos = [root] * args.documentos
+    servicio = ServicioQR(ID_CSC_PRUEBA, CSC_PRUEBA)
+
+    ingenuo = medir("find + hmac.new por documento",
+                    lambda: [dcarqr_ingenuo(d, ID_CSC_PRUEBA, CSC_PRUEBA) for d in documentos],
+                    args.documentos)
+    lote = medir("ServicioQR.generar_qr_lote (rDE)", lambda: servicio.generar_qr_lote(documentos), args.documentos)
+    datos = [DatosQR.desde_arbol(root)] * args.documentos
+    medir("ServicioQR.generar_qr_lote (DatosQR)", lambda: servicio.generar_qr_lote(datos), args.documentos)
+    assert ingenuo == lote
+
+
+if __name__ == "__main__":
+    main()
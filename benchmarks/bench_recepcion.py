@@ -0,0 +1,80 @@
+"""
+Solicitudes por segundo de ClienteRecepcion contra el servidor local.
+
+El servidor (sifen.emulador.servidor) corre en el mismo event loop con una
+latencia fija por solicitud, que simula el tiempo de proceso de SIFEN. Se
+mide cada tamaño de pool con keep-alive y, como referencia, el caso de una
+conexión nueva por envío (lo que hace un bucle con requests sin Session).
+Con --tls la conexión usa TLS mutuo con certificados generados al vuelo.
+
+Uso:
+    python benchmarks/bench_recepcion.py [--envios 400] [--latencia 0.02] [--tls]
+"""
+import argparse
+import asyncio
+import os
+import ssl
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sifen.core.clients.http import crear_contexto_ssl  # noqa: E402
+from sifen.core.clients.recepcion import ClienteRecepcion  # noqa: E402
+from sifen.core.emision import emitir_factura  # noqa: E402
+from sifen.emulador.servidor import ServidorSIFEN  # noqa: E402
+from tests.conftest import crear_factura, generar_certificado  # noqa: E402
+
+TAMANOS_POOL = (1, 2, 4, 8, 16, 32)
+
+
+def contextos_tls(directorio: Path):
+    cert_servidor, key_servidor = generar_certificado(directorio, "servidor")
+    cert_cliente, key_cliente = generar_certificado(directorio, "cliente")
+    servidor = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH, cafile=cert_cliente)
+    servidor.load_cert_chain(cert_servidor, key_servidor)
+    servidor.verify_mode = ssl.CERT_REQUIRED
+    return servidor, lambda: crear_contexto_ssl(cert_cliente, key_cliente, cafile=cert_servidor)
+
+
+async def medir(documento: bytes, envios: int, latencia: float, max_conexiones: int,
+                keep_alive: bool, tls) -> tuple:
+    contexto_servidor, contexto_cliente = tls or (None, lambda: None)
+    async with ServidorSIFEN(latencia=latencia, contexto_ssl=contexto_servidor) as servidor:
+        cliente = ClienteRecepcion(
+            url_base=servidor.url, contexto_ssl=contexto_cliente(), max_conexiones=max_conexiones
+        )
+        if not keep_alive:
+            cliente.pool.max_inactiva = 0
+        async with cliente:
+            inicio = time.perf_counter()
+            respuestas = await cliente.enviar_muchos([documento] * envios)
+            segundos = time.perf_counter() - inicio
+        errores = sum(isinstance(r, Exception) for r in respuestas)
+        return envios / segundos, cliente.pool.conexiones_creadas, errores
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--envios", type=int, default=400)
+    parser.add_argument("--latencia", type=float, default=0.02)
+    parser.add_argument("--tls", action="store_true")
+    args = parser.parse_args()
+
+    documento = emitir_factura(crear_factura())
+    with tempfile.TemporaryDirectory() as directorio:
+        tls = contextos_tls(Path(directorio)) if args.tls else None
+        print(f"{args.envios} envíos, latencia {args.latencia * 1000:.0f} ms, TLS {'sí' if tls else 'no'}")
+        print(f"{'pool':>6}{'keep-alive':>12}{'req/s':>10}{'conexiones':>12}{'errores':>9}")
+        for tamano in TAMANOS_POOL:
+            for keep_alive in (False, True):
+                rps, conexiones, errores = asyncio.run(
+                    medir(documento, args.envios, args.latencia, tamano, keep_alive, tls)
+                )
+                print(f"{tamano:>6}{'sí' if keep_alive else 'no':>12}{rps:>10.1f}{conexiones:>12}{errores:>9}")
+
+
+if __name__ == "__main__":
+    main()
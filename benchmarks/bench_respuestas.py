@@ -0,0 +1,120 @@
+"""
+Lectura de respuestas de siConsLote con 50 DE: árbol completo vs iterparse.
+
+Arma un sobre rResEnviConsLoteDe sintético (por defecto 50 gResProcLote con
+5 gResProc cada uno, el máximo del esquema) y mide el tiempo por respuesta
+de extraer (CDC, estado, códigos):
+
+- árbol completo: leer_sobre + findall + leer_resultado sobre cada elemento
+- iterparse: respuestas.iterar_resultados
+- iterparse + XSD: igual, validando cada gResProcLote contra su esquema
+
+Con 50 DE el árbol completo cabe holgado en memoria y es algo más rápido;
+lo que gana iterparse es memoria acotada. Para mostrarlo se lee además, en
+un intérprete nuevo por caso, un archivo con --des-memoria resultados y se
+informa cuánto creció el pico de memoria residente (Linux).
+
+Uso:
+    python benchmarks/bench_respuestas.py [--des 50] [--errores 5] [--repeticiones 200]
+                                          [--des-memoria 20000]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sifen.core.clients.respuestas import iterar_resultados, leer_resultado  # noqa: E402
+from sifen.core.clients.soap import leer_sobre, sifen  # noqa: E402
+from sifen.core.validators.registro_esquemas import registro  # noqa: E402
+from tests.conftest import respuesta_consulta_lote  # noqa: E402
+
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# VmHWM (pico de RSS) en vez de ru_maxrss, que el hijo hereda del proceso
+# que lo lanza y acá ese proceso acaba de armar una respuesta enorme
+MEDIR_MEMORIA = """
+import json, re
+from lxml import etree
+from sifen.core.clients.respuestas import iterar_resultados, leer_resultado
+from sifen.core.clients.soap import sifen
+def pico():
+    return int(re.search(r"VmHWM:\\s+(\\d+)", open("/proc/self/status").read()).group(1))
+antes = pico()
+{codigo}
+print(json.dumps({{"leidos": leidos, "kb": pico() - antes}}))
+"""
+
+CASOS_MEMORIA = {
+    "árbol completo": (
+        "raiz = etree.parse({ruta!r}).getroot()\n"
+        "leidos = sum(1 for g in raiz.iter(sifen('gResProcLote')) if leer_resultado(g))"
+    ),
+    "iterparse": "leidos = sum(1 for _ in iterar_resultados({ruta!r}))",
+}
+
+
+def arbol_completo(xml: bytes) -> list:
+    cuerpo = leer_sobre(xml)
+    return [leer_resultado(g) for g in cuerpo.iterfind(sifen("gResProcLote"))]
+
+
+def medir(funcion, repeticiones: int) -> float:
+    muestras = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        muestras.append(time.perf_counter() - inicio)
+    return statistics.median(muestras) * 1000
+
+
+def medir_memoria(ruta: str, codigo: str) -> dict:
+    salida = subprocess.run(
+        [sys.executable, "-c", MEDIR_MEMORIA.format(codigo=codigo.format(ruta=ruta))],
+        cwd=RAIZ, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(salida)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--des", type=int, default=50)
+    parser.add_argument("--errores", type=int, default=5)
+    parser.add_argument("--repeticiones", type=int, default=200)
+    parser.add_argument("--des-memoria", type=int, default=20000)
+    args = parser.parse_args()
+
+    xml = respuesta_consulta_lote(args.des, args.errores)
+    registro.obtener("gResProcLote")
+    assert arbol_completo(xml) == list(iterar_resultados(xml))
+
+    casos = {
+        "árbol completo": lambda: arbol_completo(xml),
+        "iterparse": lambda: list(iterar_resultados(xml)),
+        "iterparse + XSD": lambda: list(iterar_resultados(xml, validar=True)),
+    }
+    print(f"{args.des} DE x {args.errores} gResProc, {len(xml) / 1024:.0f} KB por respuesta")
+    print(f"{'caso':<20}{'ms/respuesta':>14}")
+    for nombre, funcion in casos.items():
+        print(f"{nombre:<20}{medir(funcion, args.repeticiones):>14.3f}")
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "respuesta.xml")
+        with open(ruta, "wb") as archivo:
+            archivo.write(respuesta_consulta_lote(args.des_memoria, args.errores))
+        print(f"\n{args.des_memoria} DE, {os.path.getsize(ruta) / 2**20:.1f} MB en disco")
+        print(f"{'caso':<20}{'RSS extra (MB)':>16}")
+        for nombre, codigo in CASOS_MEMORIA.items():
+            resultado = medir_memoria(ruta, codigo)
+            assert resultado["leidos"] == args.des_memoria
+            print(f"{nombre:<20}{resultado['kb'] / 1024:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Documentos recibidos verificados por segundo con verificar_firmas.
+
+Genera --documentos rDE firmados por --proveedores certificados distintos,
+los guarda en una carpeta temporal y los verifica (firma y dCarQR) por
+ruta, en el proceso actual y con un pool de procesos. Muestra cuántos
+certificados se parsearon: uno por proveedor, no uno por documento.
+
+Uso:
+    python benchmarks/bench_verificacion.py [--documentos 2000] [--proveedores 5] [--workers 4]
+"""
+import argparse
+import os
+import pathlib
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sifen.core.emision import emitir_lote  # noqa: E402
+from sifen.core.signers import verificacion  # noqa: E402
+from sifen.core.signers.almacen_claves import AlmacenClaves  # noqa: E402
+from sifen.core.signers.qr import CSC_PRUEBA, ID_CSC_PRUEBA  # noqa: E402
+from sifen.emulador.carga import facturas_sinteticas  # noqa: E402
+from tests.conftest import crear_factura, generar_certificado  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documentos", type=int, default=2000)
+    parser.add_argument("--proveedores", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=max(2, os.cpu_count() or 1))
+    args = parser.parse_args()
+
+    factura = crear_factura()
+    cscs = {factura.emisor.ruc: (ID_CSC_PRUEBA, CSC_PRUEBA)}
+    with tempfile.TemporaryDirectory() as carpeta:
+        directorio = pathlib.Path(carpeta)
+        rutas = []
+        por_proveedor = -(-args.documentos // args.proveedores)
+        for p in range(args.proveedores):
+            cert_path, key_path = generar_certificado(directorio, f"proveedor{p}", ruc=factura.emisor.ruc)
+            facturas = facturas_sinteticas(factura, por_proveedor, inicio=p * por_proveedor + 1)
+            for resultado in emitir_lote(facturas, workers=1, almacen=AlmacenClaves(key_path, cert_path),
+                                         validar=False):
+                ruta = directorio / f"{resultado.cdc}.xml"
+                ruta.write_bytes(resultado.xml)
+                rutas.append(str(ruta))
+        rutas = rutas[:args.documentos]
+        print(f"{len(rutas)} documentos de {args.proveedores} proveedores")
+
+        for workers in (1, args.workers):
+            inicio = time.perf_counter()
+            resultados = list(verificacion.verificar_firmas(rutas, workers=workers, cscs=cscs))
+            segundos = time.perf_counter() - inicio
+            validos = sum(r.ok for r in resultados)
+            print(f"workers={workers:<3}{len(rutas) / segundos:>10.0f} docs/s  {validos} válidos")
+        print(f"Certificados parseados en el proceso actual: {verificacion.cache_por_defecto().parseados}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Prueba de carga del flujo construir -> firmar -> validar -> enviar ->
+consultar contra el emulador de SIFEN, con p50/p95/p99 por etapa.
+
+Sin --url levanta el emulador en el mismo proceso (los tiempos de red
+incluyen entonces la CPU del emulador); para medir solo el cliente,
+levantarlo aparte con `python -m sifen.emulador --puerto 8080` y pasar
+--url http://127.0.0.1:8080.
+
+Uso:
+    python benchmarks/carga_emulador.py [--documentos 1000] [--modo lote|sincrono]
+        [--concurrencia 8] [--url URL] [--latencia 0.02] [--tasa-errores 0]
+        [--tasa-rechazos 0.05]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sifen.emulador.carga import MODO_LOTE, MODO_SINCRONO, GeneradorCarga, facturas_sinteticas  # noqa: E402
+from sifen.emulador.servidor import ServidorSIFEN  # noqa: E402
+from tests.conftest import crear_factura  # noqa: E402
+
+
+async def correr(args):
+    facturas = facturas_sinteticas(crear_factura(), args.documentos)
+    opciones = dict(modo=args.modo, concurrencia=args.concurrencia, validar=not args.sin_validar)
+    if args.url:
+        return await GeneradorCarga(args.url, **opciones).ejecutar(facturas)
+
+    azar = random.Random(0)
+    servidor = ServidorSIFEN(
+        latencia=lambda: azar.uniform(0.5 * args.latencia, 1.5 * args.latencia),
+        consultas_en_proceso=1,
+        tasa_errores=args.tasa_errores,
+        tasa_rechazos=args.tasa_rechazos,
+        azar=azar,
+    )
+    async with servidor:
+        return await GeneradorCarga(servidor.url, **opciones).ejecutar(facturas)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documentos", type=int, default=1000)
+    parser.add_argument("--modo", choices=(MODO_LOTE, MODO_SINCRONO), default=MODO_LOTE)
+    parser.add_argument("--concurrencia", type=int, default=8)
+    parser.add_argument("--url")
+    parser.add_argument("--latencia", type=float, default=0.02)
+    parser.add_argument("--tasa-errores", type=float, default=0.0)
+    parser.add_argument("--tasa-rechazos", type=float, default=0.05)
+    parser.add_argument("--sin-validar", action="store_true")
+    args = parser.parse_args()
+
+    print(f"{args.documentos} facturas, modo {args.modo}, concurrencia {args.concurrencia}")
+    print(asyncio.run(correr(args)).tabla())
+
+
+if __name__ == "__main__":
+    main()
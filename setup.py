@@ -11,6 +11,6 @@ setup(
         'python-dotenv>=1.0.0'
     ],
     package_data={
-        'sifen': ['schemas/*.xsd', 'certs/dev/*.pem'],
+        'sifen': ['schemas/*.xsd', 'certs/dev/*.pem', 'utils/catalogos/*.json'],
     },
 )
\ No newline at end of file
@@ -0,0 +1,68 @@
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Callable, Hashable, Optional
+
+from lxml import etree
+
+
+class CacheFragmentos:
+    """
+    Cache LRU de subárboles XML que se repiten entre documentos (gEmis de un
+    mismo emisor, gTimb de un mismo timbrado).
+
+    El subárbol se construye una vez con la función indicada y en los usos
+    siguientes se entrega una copia, que lxml hace en C sin volver a crear
+    cada elemento desde Python. Es seguro usarlo desde varios hilos.
+
+    Args:
+        max_entradas: Cantidad máxima de fragmentos guardados; al superarla se
+            descarta el usado hace más tiempo. Con 0 no se guarda nada.
+    """
+
+    def __init__(self, max_entradas: int = 1024):
+        self.max_entradas = max_entradas
+        self._fragmentos = OrderedDict()
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def obtener(self, clave: Hashable, construir: Callable[[], etree._Element]) -> etree._Element:
+        """
+        Devuelve una copia del fragmento guardado con `clave`, construyéndolo
+        con `construir()` si todavía no existe.
+        """
+        with self._lock:
+            fragmento = self._fragmentos.get(clave)
+            if fragmento is not None:
+                self._fragmentos.move_to_end(clave)
+                self.aciertos += 1
+            else:
+                self.fallos += 1
+
+        if fragmento is None:
+            fragmento = construir()
+            if self.max_entradas > 0:
+                with self._lock:
+                    self._fragmentos[clave] = fragmento
+                    while len(self._fragmentos) > self.max_entradas:
+                        self._fragmentos.popitem(last=False)
+
+        return deepcopy(fragmento)
+
+    def invalidar(self, clave: Optional[Hashable] = None):
+        """Descarta el fragmento indicado, o todos si no se indica clave."""
+        with self._lock:
+            if clave is None:
+                self._fragmentos.clear()
+            else:
+                self._fragmentos.pop(clave, None)
+
+    def estadisticas(self) -> dict:
+        """Aciertos, fallos y cantidad de fragmentos guardados."""
+        with self._lock:
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "entradas": len(self._fragmentos),
+            }
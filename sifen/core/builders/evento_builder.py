@@ -0,0 +1,151 @@
+import itertools
+import time
+from copy import deepcopy
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional
+
+import xmlsec
+from lxml import etree
+
+from sifen.core.signers.almacen_claves import AlmacenClaves, almacen_por_defecto
+from sifen.core.validators.registro_esquemas import registro
+from sifen.models.evento import Evento, EventoCancelacion, EventoInutilizacion
+
+SIFEN_NS = "http://ekuatia.set.gov.py/sifen/xsd"
+DS_NS = "http://www.w3.org/2000/09/xmldsig#"
+
+# Un rEnviEventoDe admite hasta 15 rGesEve (tgGroupGesEve)
+MAX_EVENTOS_POR_ENVIO = 15
+# Mayor Id de rEve admitido (tdIdEve: 1 a 9999999999)
+ID_EVE_MAXIMO = 9999999999
+
+
+def _sub(parent, tag):
+    return etree.SubElement(parent, "{" + SIFEN_NS + "}" + tag)
+
+
+def _plantilla_firma() -> etree._Element:
+    """Signature sin firmar (misma estructura que la del DE), para copiar."""
+    firma = xmlsec.template.create(
+        etree.Element("{%s}rGesEve" % SIFEN_NS), xmlsec.Transform.EXCL_C14N, xmlsec.Transform.RSA_SHA256
+    )
+    referencia = xmlsec.template.add_reference(firma, xmlsec.Transform.SHA256, uri="#0")
+    xmlsec.template.add_transform(referencia, xmlsec.Transform.ENVELOPED)
+    xmlsec.template.add_transform(referencia, xmlsec.Transform.EXCL_C14N)
+    xmlsec.template.add_x509_data(xmlsec.template.ensure_key_info(firma))
+    return firma
+
+
+class EventoBuilder:
+    """
+    Arma y firma eventos del emisor (cancelación e inutilización) y los
+    agrupa en gGroupGesEve de hasta 15 eventos, listos para rEnviEventoDe.
+
+    Pensado para corridas de miles de eventos: la clave se obtiene del
+    almacén una sola vez al crear el builder, la plantilla de Signature se
+    arma una vez y se copia para cada evento, y cada grupo se valida contra
+    siRecepEvento_v150.xsd, compilado una única vez por proceso. Un builder
+    no debe usarse desde varios hilos a la vez (comparte el contador de Id
+    y la clave); para eso, uno por hilo.
+
+    Args:
+        almacen: Almacén de claves (por defecto el del proceso).
+        id_inicial: Primer Id de rEve; los siguientes son correlativos y
+            después de ID_EVE_MAXIMO vuelven a 1. Por defecto se toma de
+            la hora actual, en milisegundos.
+        validar: Si es True cada grupo se valida contra el esquema.
+
+    Ejemplo:
+        builder = EventoBuilder()
+        eventos = [EventoCancelacion(cdc, "Error en el precio") for cdc in cdcs]
+        for grupo in builder.agrupar(eventos):
+            ...  # ClienteEventos.enviar(grupo)
+    """
+
+    def __init__(
+        self,
+        almacen: Optional[AlmacenClaves] = None,
+        id_inicial: Optional[int] = None,
+        validar: bool = True,
+    ):
+        almacen = almacen or almacen_por_defecto()
+        self._clave = almacen.obtener_clave()
+        self._plantilla = _plantilla_firma()
+        # El Id de rEve va de 1 a 9999999999; construir da la vuelta al pasarse
+        self._ids = itertools.count(id_inicial if id_inicial is not None else int(time.time() * 1000) % 10**10)
+        self.validar = validar
+        self.firmados = 0
+
+    def construir(self, evento: Evento, fecha_firma: Optional[datetime] = None) -> etree._Element:
+        """
+        rGesEve firmado para un evento.
+
+        Raises:
+            ValueError: Si el evento no es válido o su tipo no está soportado.
+        """
+        evento.validar()
+        ges_eve = etree.Element("{%s}rGesEve" % SIFEN_NS, nsmap={None: SIFEN_NS})
+        r_eve = _sub(ges_eve, "rEve")
+        id_eve = str((next(self._ids) - 1) % ID_EVE_MAXIMO + 1)
+        r_eve.set("Id", id_eve)
+        _sub(r_eve, "dFecFirma").text = (fecha_firma or datetime.now()).strftime("%Y-%m-%dT%H:%M:%S")
+        _sub(r_eve, "dVerFor").text = "150"
+        grupo = _sub(r_eve, "gGroupTiEvt")
+
+        if isinstance(evento, EventoCancelacion):
+            can = _sub(grupo, "rGeVeCan")
+            _sub(can, "Id").text = evento.cdc
+            _sub(can, "mOtEve").text = evento.motivo.strip()
+        elif isinstance(evento, EventoInutilizacion):
+            inu = _sub(grupo, "rGeVeInu")
+            _sub(inu, "dNumTim").text = evento.timbrado
+            _sub(inu, "dEst").text = evento.establecimiento
+            _sub(inu, "dPunExp").text = evento.punto_expedicion
+            _sub(inu, "dNumIn").text = f"{int(evento.numero_inicio):07d}"
+            _sub(inu, "dNumFin").text = f"{int(evento.numero_fin):07d}"
+            _sub(inu, "iTiDE").text = str(evento.tipo_documento)
+            _sub(inu, "mOtEve").text = evento.motivo.strip()
+        else:
+            raise ValueError(f"Tipo de evento no soportado: {type(evento).__name__}")
+
+        firma = deepcopy(self._plantilla)
+        firma.find(f"{{{DS_NS}}}SignedInfo/{{{DS_NS}}}Reference").set("URI", "#" + id_eve)
+        ges_eve.append(firma)
+        xmlsec.tree.add_ids(ges_eve, ["Id"])
+        # Un SignatureContext de xmlsec firma una sola vez; la clave sí se reutiliza
+        contexto = xmlsec.SignatureContext()
+        contexto.key = self._clave
+        contexto.sign(firma)
+        self.firmados += 1
+        return ges_eve
+
+    def construir_grupo(self, eventos: Iterable[Evento]) -> etree._Element:
+        """
+        gGroupGesEve con los eventos firmados.
+
+        Raises:
+            ValueError: Si el grupo está vacío, supera MAX_EVENTOS_POR_ENVIO
+                o no es válido según el esquema.
+        """
+        grupo = etree.Element("{%s}gGroupGesEve" % SIFEN_NS, nsmap={None: SIFEN_NS})
+        for evento in eventos:
+            grupo.append(self.construir(evento))
+        if not 1 <= len(grupo) <= MAX_EVENTOS_POR_ENVIO:
+            raise ValueError(f"Un envío de eventos lleva entre 1 y {MAX_EVENTOS_POR_ENVIO} eventos, no {len(grupo)}.")
+        if self.validar:
+            try:
+                registro.validar(grupo, "siRecepEvento")
+            except etree.DocumentInvalid as e:
+                raise ValueError(f"Grupo de eventos inválido: {e}") from e
+        return grupo
+
+    def agrupar(self, eventos: Iterable[Evento], tamano: int = MAX_EVENTOS_POR_ENVIO) -> Iterator[etree._Element]:
+        """Arma gGroupGesEve de a `tamano` eventos, a medida que se consumen."""
+        if not 1 <= tamano <= MAX_EVENTOS_POR_ENVIO:
+            raise ValueError(f"El tamaño de grupo debe estar entre 1 y {MAX_EVENTOS_POR_ENVIO}.")
+        iterador = iter(eventos)
+        while True:
+            bloque: List[Evento] = list(itertools.islice(iterador, tamano))
+            if not bloque:
+                return
+            yield self.construir_grupo(bloque)
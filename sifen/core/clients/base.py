@@ -0,0 +1,99 @@
+import itertools
+import ssl
+import time
+from typing import Optional
+
+from lxml import etree
+
+from sifen.core.clients.http import ErrorHTTP, PoolConexiones
+from sifen.core.clients.limites import LimitadorSIFEN
+from sifen.core.clients.soap import CONTENT_TYPE, armar_sobre, leer_sobre
+from sifen.core.signers.almacen_claves import AlmacenClaves, almacen_por_defecto
+
+URLS_SIFEN = {
+    "test": "https://sifen-test.set.gov.py",
+    "prod": "https://sifen.set.gov.py",
+}
+
+
+class ClienteSIFEN:
+    """
+    Base de los clientes asíncronos de los servicios web de SIFEN.
+
+    Mantiene un PoolConexiones con TLS mutuo (el certificado del
+    contribuyente se toma del AlmacenClaves) y resuelve el armado y la
+    lectura del sobre SOAP. Cada servicio define sus rutas y mensajes.
+
+    Args:
+        url_base: URL del servidor; por defecto la del `ambiente`.
+        ambiente: "test" o "prod".
+        almacen: Par clave/certificado para el TLS mutuo (por defecto el
+            del proceso); puede ser un AlmacenPKCS12.
+        contexto_ssl: Contexto TLS ya armado; reemplaza al del almacen.
+        max_conexiones: Conexiones simultáneas como máximo.
+        timeout: Segundos por solicitud.
+        limitador: Límite de tasa y corta circuito por servicio; conviene
+            compartir una misma instancia entre todos los clientes.
+    """
+
+    def __init__(
+        self,
+        url_base: Optional[str] = None,
+        ambiente: str = "test",
+        almacen: Optional[AlmacenClaves] = None,
+        contexto_ssl: Optional[ssl.SSLContext] = None,
+        max_conexiones: int = 10,
+        timeout: float = 30.0,
+        limitador: Optional[LimitadorSIFEN] = None,
+    ):
+        self.url_base = url_base or URLS_SIFEN[ambiente]
+        if contexto_ssl is None and self.url_base.startswith("https"):
+            almacen = almacen or almacen_por_defecto()
+            contexto_ssl = almacen.contexto_ssl()
+        self.pool = PoolConexiones(self.url_base, contexto_ssl, max_conexiones, timeout)
+        self.limitador = limitador
+        # dId: identificador de control de cada envío (hasta 15 dígitos)
+        self._ids = itertools.count(int(time.time() * 1000) % 10**12)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *excinfo):
+        await self.cerrar()
+
+    async def cerrar(self):
+        await self.pool.cerrar()
+
+    def nuevo_id(self) -> str:
+        return str(next(self._ids))
+
+    async def llamar(self, ruta: str, contenido: etree._Element) -> etree._Element:
+        """
+        Envía `contenido` dentro de un sobre SOAP y devuelve el elemento de
+        la respuesta.
+
+        Raises:
+            ErrorSOAP: Si el servicio responde con un soap:Fault.
+            ErrorHTTP: Si la respuesta no es un sobre SOAP.
+            CircuitoAbierto: Si el limitador tiene el servicio cortado.
+        """
+        return leer_sobre(await self.llamar_crudo(ruta, contenido))
+
+    async def llamar_crudo(self, ruta: str, contenido: etree._Element) -> bytes:
+        """
+        Igual que llamar, pero devuelve el sobre de respuesta sin parsear,
+        para leerlo de forma incremental.
+        """
+        sobre = armar_sobre(contenido)
+        if self.limitador is None:
+            return await self._solicitar(ruta, sobre)
+        async with self.limitador.llamada(ruta):
+            return await self._solicitar(ruta, sobre)
+
+    async def _solicitar(self, ruta: str, sobre: bytes) -> bytes:
+        respuesta = await self.pool.solicitar("POST", ruta, sobre, {"Content-Type": CONTENT_TYPE})
+        if respuesta.estado >= 400:
+            if respuesta.cuerpo.lstrip().startswith(b"<"):
+                leer_sobre(respuesta.cuerpo)  # Lanza ErrorSOAP si es un soap:Fault
+            raise ErrorHTTP(f"HTTP {respuesta.estado}", respuesta.estado, respuesta.cuerpo)
+        return respuesta.cuerpo
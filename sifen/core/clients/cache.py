@@ -0,0 +1,159 @@
+import asyncio
+import json
+import math
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Awaitable, Callable, Dict, Generic, Optional, Type, TypeVar
+
+T = TypeVar("T")
+
+PERMANENTE = math.inf
+
+
+class CacheConsultas(Generic[T]):
+    """
+    Cache LRU con vencimiento para resultados de consultas a SIFEN.
+
+    Guarda hasta `max_entradas` resultados (dataclasses de tipo `tipo`) en
+    memoria, cada uno con su propio vencimiento. Con `ruta_sqlite` además
+    los persiste en un archivo SQLite (modo WAL), que comparten todos los
+    procesos que lo abran y sobrevive a un reinicio; un fallo en memoria se
+    busca ahí antes de consultar a SIFEN. Es seguro compartirla entre hilos.
+
+    Args:
+        tipo: Dataclass de los resultados; se reconstruye desde JSON.
+        tabla: Tabla SQLite donde se guardan.
+        max_entradas: Tamaño máximo de la cache en memoria.
+        ttl: Segundos de vigencia por defecto (PERMANENTE para no vencer).
+        ruta_sqlite: Archivo SQLite opcional.
+        reloj: Función que devuelve la hora actual en segundos (time.time).
+    """
+
+    def __init__(
+        self,
+        tipo: Type[T],
+        tabla: str,
+        max_entradas: int = 10000,
+        ttl: float = 24 * 3600.0,
+        ruta_sqlite: Optional[str] = None,
+        reloj: Callable[[], float] = time.time,
+    ):
+        self.tipo = tipo
+        self.tabla = tabla
+        self.max_entradas = max_entradas
+        self.ttl = ttl
+        self.reloj = reloj
+        self._entradas: "OrderedDict[str, tuple]" = OrderedDict()  # clave -> (vence, resultado)
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.aciertos = 0
+        self.fallos = 0
+        if ruta_sqlite:
+            self._db = sqlite3.connect(ruta_sqlite, check_same_thread=False, timeout=30)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                f"CREATE TABLE IF NOT EXISTS {tabla} "
+                "(clave TEXT PRIMARY KEY, datos TEXT NOT NULL, vence REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def obtener(self, clave: str) -> Optional[T]:
+        """Resultado vigente para la clave, o None."""
+        ahora = self.reloj()
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is not None:
+                if entrada[0] > ahora:
+                    self._entradas.move_to_end(clave)
+                    self.aciertos += 1
+                    return entrada[1]
+                del self._entradas[clave]
+
+            if self._db is not None:
+                fila = self._db.execute(
+                    f"SELECT datos, vence FROM {self.tabla} WHERE clave = ? AND vence > ?", (clave, ahora)
+                ).fetchone()
+                if fila is not None:
+                    resultado = self.tipo(**json.loads(fila[0]))
+                    self._poner(clave, fila[1], resultado)
+                    self.aciertos += 1
+                    return resultado
+
+            self.fallos += 1
+            return None
+
+    def poner(self, clave: str, resultado: T, ttl: Optional[float] = None):
+        """Guarda el resultado por `ttl` segundos (por defecto self.ttl)."""
+        vence = self.reloj() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._poner(clave, vence, resultado)
+            if self._db is not None:
+                self._db.execute(
+                    f"INSERT OR REPLACE INTO {self.tabla} (clave, datos, vence) VALUES (?, ?, ?)",
+                    (clave, json.dumps(asdict(resultado)), vence),
+                )
+                self._db.commit()
+
+    def invalidar(self, clave: Optional[str] = None):
+        """Descarta la clave indicada (o todas)."""
+        with self._lock:
+            if clave is None:
+                self._entradas.clear()
+            else:
+                self._entradas.pop(clave, None)
+            if self._db is not None:
+                if clave is None:
+                    self._db.execute(f"DELETE FROM {self.tabla}")
+                else:
+                    self._db.execute(f"DELETE FROM {self.tabla} WHERE clave = ?", (clave,))
+                self._db.commit()
+
+    def cerrar(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _poner(self, clave: str, vence: float, resultado: T):
+        self._entradas[clave] = (vence, resultado)
+        self._entradas.move_to_end(clave)
+        while len(self._entradas) > self.max_entradas:
+            self._entradas.popitem(last=False)
+
+
+class ConsultasEnCurso:
+    """
+    Une las consultas simultáneas de una misma clave: la primera llama a
+    SIFEN y las demás esperan su resultado (o su excepción).
+    """
+
+    def __init__(self):
+        self._futuros: Dict[str, asyncio.Future] = {}
+
+    def __len__(self):
+        return len(self._futuros)
+
+    async def ejecutar(self, clave: str, consulta: Callable[[], Awaitable[T]]) -> T:
+        futuro = self._futuros.get(clave)
+        if futuro is not None:
+            return await asyncio.shield(futuro)
+
+        futuro = asyncio.get_running_loop().create_future()
+        self._futuros[clave] = futuro
+        try:
+            resultado = await consulta()
+        except BaseException as e:
+            futuro.set_exception(e)
+            futuro.exception()  # Evita el aviso si nadie más la esperaba
+            raise
+        else:
+            futuro.set_result(resultado)
+            return resultado
+        finally:
+            del self._futuros[clave]
+
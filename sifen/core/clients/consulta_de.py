@@ -0,0 +1,161 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Union
+
+from lxml import etree
+
+from sifen.core.clients.base import ClienteSIFEN
+from sifen.core.clients.cache import PERMANENTE, CacheConsultas, ConsultasEnCurso
+from sifen.core.clients.limites import LimiteTasa
+from sifen.core.clients.soap import SIFEN_NS, sifen
+
+RUTA_CONSULTA_DE = "/de/ws/consultas/consulta.wsdl"
+
+# Valores de dCodRes
+DE_INEXISTENTE = "0420"   # No existe en SIFEN o fue rechazado
+DE_ENCONTRADO = "0422"
+
+ESTADO_APROBADO = "Aprobado"
+ESTADO_CANCELADO = "Cancelado"
+ESTADO_INEXISTENTE = "Inexistente"
+
+# Un DE aprobado o cancelado ya no cambia de estado: se guarda sin
+# vencimiento. El resto se vuelve a consultar pasado ttl_pendiente.
+ESTADOS_FINALES = (ESTADO_APROBADO, ESTADO_CANCELADO)
+
+
+@dataclass
+class EstadoDE:
+    """Resultado de siConsDE (rEnviConsDeResponse) para un CDC."""
+    cdc: str
+    codigo: str                             # dCodRes
+    mensaje: str = ""                       # dMsgRes
+    fecha_proceso: Optional[str] = None     # dFecProc
+    estado: str = ESTADO_INEXISTENTE        # Aprobado, Cancelado o Inexistente
+    protocolo: Optional[str] = None         # dProtAut del contenido
+    contenido: Optional[str] = None         # xContenDE tal como llegó
+
+    @property
+    def final(self) -> bool:
+        return self.estado in ESTADOS_FINALES
+
+
+def leer_renviconsderesponse(respuesta: etree._Element, cdc: str) -> EstadoDE:
+    resultado = EstadoDE(
+        cdc=cdc,
+        codigo=respuesta.findtext(sifen("dCodRes")),
+        mensaje=respuesta.findtext(sifen("dMsgRes")) or "",
+        fecha_proceso=respuesta.findtext(sifen("dFecProc")),
+        contenido=respuesta.findtext(sifen("xContenDE")),
+    )
+    if resultado.codigo != DE_ENCONTRADO:
+        return resultado
+
+    resultado.estado = ESTADO_APROBADO
+    if resultado.contenido:
+        try:
+            contenido = etree.fromstring(resultado.contenido.encode("utf-8"))
+        except etree.XMLSyntaxError:
+            return resultado
+        resultado.protocolo = contenido.findtext(f".//{sifen('dProtAut')}")
+        # Un evento de cancelación registrado sobre el DE
+        if contenido.find(f".//{sifen('rGeVeCan')}") is not None:
+            resultado.estado = ESTADO_CANCELADO
+    return resultado
+
+
+class CacheDE(CacheConsultas[EstadoDE]):
+    """
+    CacheConsultas de resultados de siConsDE, por CDC.
+
+    Los estados finales (ESTADOS_FINALES) se guardan sin vencimiento; los
+    demás solo por `ttl_pendiente` segundos. Con `ruta_sqlite` la comparten
+    todos los procesos que abran el mismo archivo.
+    """
+
+    def __init__(
+        self,
+        max_entradas: int = 10000,
+        ttl_pendiente: float = 60.0,
+        ruta_sqlite: Optional[str] = None,
+        reloj: Callable[[], float] = time.time,
+    ):
+        super().__init__(EstadoDE, "consultas_de", max_entradas, ttl_pendiente, ruta_sqlite, reloj)
+
+    def guardar(self, resultado: EstadoDE):
+        self.poner(resultado.cdc, resultado, PERMANENTE if resultado.final else None)
+
+
+class ClienteConsultaDE(ClienteSIFEN):
+    """
+    Cliente asíncrono de siConsDE (estado de un DE por su CDC) con cache.
+
+    Los CDC en estado final se responden desde la CacheDE sin volver a
+    consultar a SIFEN. `consultar_muchos` consulta varios CDC a la vez, con
+    a lo sumo `concurrencia` llamadas en vuelo y no más de `por_segundo`
+    llamadas por segundo.
+
+    Ejemplo:
+        cache = CacheDE(ruta_sqlite="/var/lib/sifen/consultas.db")
+        async with ClienteConsultaDE(cache=cache, por_segundo=20) as cliente:
+            estados = await cliente.consultar_muchos(cdcs)
+    """
+
+    def __init__(
+        self,
+        *args,
+        cache: Optional[CacheDE] = None,
+        concurrencia: Optional[int] = None,
+        por_segundo: Optional[float] = None,
+        ruta: str = RUTA_CONSULTA_DE,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.cache = cache if cache is not None else CacheDE()
+        self.concurrencia = concurrencia or self.pool.max_conexiones
+        self.limite = LimiteTasa(por_segundo)
+        self.ruta = ruta
+        self.consultas = 0
+        self._en_curso = ConsultasEnCurso()
+
+    async def consultar(self, cdc: str) -> EstadoDE:
+        """
+        Estado del DE, desde la cache o consultando a SIFEN.
+
+        Raises:
+            ErrorSOAP: Si SIFEN responde con un soap:Fault.
+            ErrorHTTP: Si la respuesta no es un sobre SOAP.
+        """
+        resultado = self.cache.obtener(cdc)
+        if resultado is not None:
+            return resultado
+        return await self._en_curso.ejecutar(cdc, lambda: self._consultar_sifen(cdc))
+
+    async def consultar_muchos(self, cdcs: Iterable[str]) -> Dict[str, Union[EstadoDE, Exception]]:
+        """
+        Consulta varios CDC (sin repetir) y devuelve {cdc: EstadoDE}; una
+        consulta fallida aparece como su excepción.
+        """
+        semaforo = asyncio.Semaphore(self.concurrencia)
+        unicos = list(dict.fromkeys(cdcs))
+
+        async def consultar_uno(cdc):
+            resultado = self.cache.obtener(cdc)
+            if resultado is not None:
+                return resultado
+            async with semaforo:
+                return await self.consultar(cdc)
+
+        resultados = await asyncio.gather(*(consultar_uno(cdc) for cdc in unicos), return_exceptions=True)
+        return dict(zip(unicos, resultados))
+
+    async def _consultar_sifen(self, cdc: str) -> EstadoDE:
+        mensaje = etree.Element(sifen("rEnviConsDeRequest"), nsmap={None: SIFEN_NS})
+        etree.SubElement(mensaje, sifen("dId")).text = self.nuevo_id()
+        etree.SubElement(mensaje, sifen("dCDC")).text = cdc
+        await self.limite.esperar()
+        self.consultas += 1
+        resultado = leer_renviconsderesponse(await self.llamar(self.ruta, mensaje), cdc)
+        self.cache.guardar(resultado)
+        return resultado
@@ -0,0 +1,111 @@
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+
+from lxml import etree
+
+from sifen.core.clients.base import ClienteSIFEN
+from sifen.core.clients.respuestas import (
+    TAG_GRESPROCLOTE,
+    Fuente,
+    ResultadoDE,
+    abrir_fuente,
+    leer_resultado,
+    liberar_elemento,
+)
+from sifen.core.clients.soap import SIFEN_NS, ErrorSOAP, sifen
+
+RUTA_CONSULTA_LOTE = "/de/ws/consultas/consulta-lote.wsdl"
+
+# Valores de dCodResLot
+LOTE_INEXISTENTE = "0360"
+LOTE_EN_PROCESO = "0361"
+LOTE_CONCLUIDO = "0362"
+LOTE_EXTEMPORANEO = "0364"
+
+_CABECERA = {
+    sifen("dCodResLot"): "codigo",
+    sifen("dMsgResLot"): "mensaje",
+    sifen("dFecProc"): "fecha_proceso",
+}
+
+
+@dataclass
+class EstadoLote:
+    """Cabecera de rResEnviConsLoteDe."""
+    codigo: Optional[str] = None            # dCodResLot
+    mensaje: Optional[str] = None           # dMsgResLot
+    fecha_proceso: Optional[str] = None     # dFecProc
+
+    @property
+    def concluido(self) -> bool:
+        return self.codigo == LOTE_CONCLUIDO
+
+    @property
+    def en_proceso(self) -> bool:
+        return self.codigo == LOTE_EN_PROCESO
+
+
+def leer_consulta_lote(
+    xml: Fuente, lote: Optional[str] = None, validar: bool = False
+) -> Tuple[EstadoLote, Iterator[ResultadoDE]]:
+    """
+    Lee una respuesta rResEnviConsLoteDe de forma incremental.
+
+    La cabecera se devuelve de inmediato; los gResProcLote se entregan de a
+    uno a medida que se consume el iterador y se descartan apenas se
+    convierten en ResultadoDE (ver respuestas.iterar_resultados).
+
+    Args:
+        xml: Respuesta en bytes, ruta a un archivo o archivo binario abierto.
+        lote: dProtConsLote consultado, se registra en cada resultado.
+        validar: Valida cada gResProcLote contra WS_SiConsLote_v141.xsd.
+
+    Raises:
+        ErrorSOAP: Si la respuesta no contiene rResEnviConsLoteDe.
+    """
+    eventos = etree.iterparse(abrir_fuente(xml), events=("end",))
+    estado = EstadoLote()
+    encontrado = False
+    primero = None
+
+    for _, elemento in eventos:
+        atributo = _CABECERA.get(elemento.tag)
+        if atributo:
+            setattr(estado, atributo, elemento.text)
+            encontrado = True
+        elif elemento.tag == TAG_GRESPROCLOTE:
+            primero = elemento
+            break
+
+    if not encontrado:
+        raise ErrorSOAP("La respuesta no contiene rResEnviConsLoteDe")
+
+    def resultados() -> Iterator[ResultadoDE]:
+        elemento = primero
+        while elemento is not None:
+            resultado = leer_resultado(elemento, lote, validar)
+            liberar_elemento(elemento)
+            yield resultado
+            elemento = next((e for _, e in eventos if e.tag == TAG_GRESPROCLOTE), None)
+
+    return estado, resultados()
+
+
+class ClienteConsultaLote(ClienteSIFEN):
+    """Cliente asíncrono de siConsLote (resultado de un lote enviado)."""
+
+    def __init__(self, *args, ruta: str = RUTA_CONSULTA_LOTE, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.ruta = ruta
+
+    async def consultar(self, protocolo: str) -> Tuple[EstadoLote, Iterator[ResultadoDE]]:
+        """
+        Consulta un lote por su dProtConsLote.
+
+        Returns:
+            (EstadoLote, iterador de ResultadoDE) como en leer_consulta_lote.
+        """
+        mensaje = etree.Element(sifen("rEnviConsLoteDe"), nsmap={None: SIFEN_NS})
+        etree.SubElement(mensaje, sifen("dId")).text = self.nuevo_id()
+        etree.SubElement(mensaje, sifen("dProtConsLote")).text = str(protocolo)
+        return leer_consulta_lote(await self.llamar_crudo(self.ruta, mensaje), str(protocolo))
@@ -0,0 +1,162 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Union
+
+from lxml import etree
+
+from sifen.core.clients.base import ClienteSIFEN
+from sifen.core.clients.cache import CacheConsultas, ConsultasEnCurso
+from sifen.core.clients.soap import SIFEN_NS, sifen
+
+RUTA_CONSULTA_RUC = "/de/ws/consultas/consulta-ruc.wsdl"
+
+# Valores de dCodRes
+RUC_INEXISTENTE = "0500"
+RUC_SIN_PERMISO = "0501"
+RUC_ENCONTRADO = "0502"
+
+# Respuestas definitivas: se guardan en la cache. El resto (sin permiso,
+# errores) se vuelve a consultar.
+CODIGOS_CACHEABLES = (RUC_INEXISTENTE, RUC_ENCONTRADO)
+
+
+@dataclass
+class DatosRUC:
+    """Resultado de siConsRUC (rResEnviConsRUC)."""
+    ruc: str                                    # dRUCCons consultado
+    codigo: str                                 # dCodRes
+    mensaje: str = ""                           # dMsgRes
+    razon_social: Optional[str] = None          # dRazCons
+    codigo_estado: Optional[str] = None         # dCodEstCons (ACT, SUS, CAN, ...)
+    estado: Optional[str] = None                # dDesEstCons
+    factura_electronica: Optional[str] = None   # dRUCFactElec (S/N)
+
+    @property
+    def encontrado(self) -> bool:
+        return self.codigo == RUC_ENCONTRADO
+
+    @property
+    def activo(self) -> bool:
+        return self.encontrado and self.codigo_estado == "ACT"
+
+    @property
+    def facturador_electronico(self) -> bool:
+        return self.factura_electronica == "S"
+
+
+def normalizar_ruc(ruc: Union[str, int]) -> str:
+    """RUC sin DV ni espacios ("80012345-6" -> "80012345")."""
+    return str(ruc).strip().split("-")[0]
+
+
+def leer_rresenviconsruc(respuesta: etree._Element, ruc: str) -> DatosRUC:
+    contenedor = respuesta.find(sifen("xContRUC"))
+    datos = DatosRUC(
+        ruc=ruc,
+        codigo=respuesta.findtext(sifen("dCodRes")),
+        mensaje=respuesta.findtext(sifen("dMsgRes")) or "",
+    )
+    if contenedor is not None:
+        datos.ruc = contenedor.findtext(sifen("dRUCCons")) or ruc
+        datos.razon_social = contenedor.findtext(sifen("dRazCons"))
+        datos.codigo_estado = contenedor.findtext(sifen("dCodEstCons"))
+        datos.estado = contenedor.findtext(sifen("dDesEstCons"))
+        datos.factura_electronica = contenedor.findtext(sifen("dRUCFactElec"))
+    return datos
+
+
+class CacheRUC(CacheConsultas[DatosRUC]):
+    """
+    CacheConsultas de resultados de siConsRUC, por RUC.
+
+    Solo guarda respuestas definitivas (ver CODIGOS_CACHEABLES), todas con
+    el mismo `ttl`.
+    """
+
+    def __init__(
+        self,
+        max_entradas: int = 10000,
+        ttl: float = 24 * 3600.0,
+        ruta_sqlite: Optional[str] = None,
+        reloj: Callable[[], float] = time.time,
+    ):
+        super().__init__(DatosRUC, "consultas_ruc", max_entradas, ttl, ruta_sqlite, reloj)
+
+    def guardar(self, datos: DatosRUC, ruc: Optional[str] = None):
+        """Guarda el resultado si es definitivo."""
+        if datos.codigo in CODIGOS_CACHEABLES:
+            self.poner(ruc or datos.ruc, datos)
+
+
+class ClienteConsultaRUC(ClienteSIFEN):
+    """
+    Cliente asíncrono de siConsRUC con cache.
+
+    Cada RUC se busca primero en la CacheRUC. Las consultas simultáneas de
+    un mismo RUC que no está en cache se unen en una sola llamada a SIFEN,
+    cuyo resultado reciben todas. `consultar_muchos` consulta un conjunto
+    de RUC con a lo sumo `concurrencia` llamadas en vuelo.
+
+    Ejemplo:
+        async with ClienteConsultaRUC(cache=CacheRUC(ruta_sqlite="ruc.db")) as cliente:
+            datos = await cliente.consultar("80012345")
+            receptor = Receptor.desde_consulta_ruc(datos)
+    """
+
+    def __init__(
+        self,
+        *args,
+        cache: Optional[CacheRUC] = None,
+        concurrencia: Optional[int] = None,
+        ruta: str = RUTA_CONSULTA_RUC,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.cache = cache if cache is not None else CacheRUC()
+        self.concurrencia = concurrencia or self.pool.max_conexiones
+        self.ruta = ruta
+        self.consultas = 0
+        self._en_curso = ConsultasEnCurso()
+
+    async def consultar(self, ruc: Union[str, int]) -> DatosRUC:
+        """
+        Datos del contribuyente, desde la cache o consultando a SIFEN.
+
+        Raises:
+            ErrorSOAP: Si SIFEN responde con un soap:Fault.
+            ErrorHTTP: Si la respuesta no es un sobre SOAP.
+        """
+        ruc = normalizar_ruc(ruc)
+        datos = self.cache.obtener(ruc)
+        if datos is not None:
+            return datos
+
+        return await self._en_curso.ejecutar(ruc, lambda: self._consultar_sifen(ruc))
+
+    async def consultar_muchos(self, rucs: Iterable[Union[str, int]]) -> Dict[str, Union[DatosRUC, Exception]]:
+        """
+        Consulta varios RUC (sin repetir) y devuelve {ruc: DatosRUC}; una
+        consulta fallida aparece como su excepción.
+        """
+        semaforo = asyncio.Semaphore(self.concurrencia)
+        unicos = list(dict.fromkeys(normalizar_ruc(ruc) for ruc in rucs))
+
+        async def consultar_uno(ruc):
+            datos = self.cache.obtener(ruc)
+            if datos is not None:
+                return datos
+            async with semaforo:
+                return await self.consultar(ruc)
+
+        resultados = await asyncio.gather(*(consultar_uno(ruc) for ruc in unicos), return_exceptions=True)
+        return dict(zip(unicos, resultados))
+
+    async def _consultar_sifen(self, ruc: str) -> DatosRUC:
+        mensaje = etree.Element(sifen("rEnviConsRUC"), nsmap={None: SIFEN_NS})
+        etree.SubElement(mensaje, sifen("dId")).text = self.nuevo_id()
+        etree.SubElement(mensaje, sifen("dRUCCons")).text = ruc
+        self.consultas += 1
+        datos = leer_rresenviconsruc(await self.llamar(self.ruta, mensaje), ruc)
+        self.cache.guardar(datos, ruc)
+        return datos
@@ -0,0 +1,433 @@
+import asyncio
+import itertools
+import logging
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from lxml import etree
+
+from sifen.core.clients.consulta_de import ClienteConsultaDE
+from sifen.core.clients.consulta_lote import ClienteConsultaLote
+from sifen.core.clients.limites import CircuitoAbierto
+from sifen.core.clients.lote import MAX_DES_POR_LOTE, ClienteLote, Documento, cdc_de
+from sifen.core.clients.planificador import PlanificadorConsultas
+from sifen.core.clients.respuestas import ResultadoDE
+from sifen.core.clients.soap import ErrorSOAP
+
+logger = logging.getLogger(__name__)
+
+# Estados de un documento en la bandeja
+PENDIENTE = "PENDIENTE"   # Guardado, nunca enviado (o SIFEN confirmó que no lo recibió)
+ENVIANDO = "ENVIANDO"     # Tomado para un lote; el envío pudo o no llegar a SIFEN
+DUDOSO = "DUDOSO"         # No se sabe si SIFEN lo recibió; se verifica con siConsDE
+ENVIADO = "ENVIADO"       # En un lote recibido por SIFEN (protocolo_lote), sin resultado aún
+APROBADO = "APROBADO"
+RECHAZADO = "RECHAZADO"
+
+ESTADOS_FINALES = (APROBADO, RECHAZADO)
+
+# Errores en los que es seguro que la solicitud no llegó a procesarse:
+# no hubo conexión, SIFEN contestó con un soap:Fault o el corta circuito
+# del limitador no dejó hacer la llamada
+_NO_RECIBIDO = (ConnectionRefusedError, socket.gaierror, ErrorSOAP, CircuitoAbierto)
+
+_ESQUEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS documentos (
+        orden INTEGER PRIMARY KEY AUTOINCREMENT,
+        cdc TEXT NOT NULL UNIQUE,
+        xml BLOB NOT NULL,
+        estado TEXT NOT NULL,
+        intentos INTEGER NOT NULL DEFAULT 0,
+        protocolo_lote TEXT,
+        protocolo TEXT,
+        mensaje TEXT,
+        creado REAL NOT NULL,
+        actualizado REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS documentos_estado ON documentos (estado, orden)",
+)
+
+
+@dataclass
+class DocumentoContingencia:
+    """Estado de un documento guardado en la bandeja (sin el XML)."""
+    cdc: str
+    estado: str                             # PENDIENTE, ENVIANDO, DUDOSO, ENVIADO, APROBADO o RECHAZADO
+    intentos: int = 0                       # Veces que se tomó para un lote
+    protocolo_lote: Optional[str] = None    # dProtConsLote del último lote recibido
+    protocolo: Optional[str] = None         # dProtAut
+    mensaje: Optional[str] = None           # Último dMsgRes o error
+    actualizado: float = 0.0                # Hora del último cambio de estado
+
+
+class BandejaContingencia:
+    """
+    Bandeja de salida persistente para emitir en contingencia.
+
+    Guarda los rDE firmados en un archivo SQLite (modo WAL, con
+    synchronous=FULL para que cada cambio de estado esté en disco antes de
+    hablar con SIFEN), indexados por CDC. Cada documento avanza por
+    PENDIENTE -> ENVIANDO -> ENVIADO -> APROBADO | RECHAZADO; cada
+    transición solo se aplica desde los estados previstos, de modo que un
+    resultado tardío o duplicado no hace retroceder a un documento.
+
+    Un CDC se guarda una sola vez y solo se toma para un lote estando
+    PENDIENTE. Si un envío termina sin saber si SIFEN lo recibió (timeout,
+    conexión cortada, o el proceso murió con el documento ENVIANDO), el
+    documento pasa a DUDOSO y no vuelve a PENDIENTE hasta que siConsDE
+    confirme que SIFEN no lo tiene; así ningún CDC se envía dos veces.
+
+    Varios procesos pueden compartir el archivo: la toma de documentos se
+    hace en una transacción inmediata. Es seguro compartirla entre hilos.
+
+    Args:
+        ruta: Archivo SQLite.
+        reloj: Función que devuelve la hora actual en segundos (time.time).
+
+    Ejemplo:
+        bandeja = BandejaContingencia("/var/lib/sifen/contingencia.db")
+        for resultado in emitir_lote(facturas):
+            if resultado.ok:
+                bandeja.guardar(resultado.xml, resultado.cdc)
+    """
+
+    def __init__(self, ruta: str, reloj: Callable[[], float] = time.time):
+        self.ruta = ruta
+        self.reloj = reloj
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(ruta, check_same_thread=False, timeout=30, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=FULL")
+        for sentencia in _ESQUEMA:
+            self._db.execute(sentencia)
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM documentos").fetchone()[0]
+
+    def cerrar(self):
+        with self._lock:
+            self._db.close()
+
+    @contextmanager
+    def _transaccion(self):
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def guardar(self, documento: Documento, cdc: Optional[str] = None) -> bool:
+        """
+        Guarda un rDE firmado como PENDIENTE.
+
+        Returns:
+            False si el CDC ya estaba en la bandeja (no se modifica).
+
+        Raises:
+            ValueError: Si no se encuentra el Id del DE.
+        """
+        return self.guardar_muchos([documento], [cdc] if cdc else None) == 1
+
+    def guardar_muchos(
+        self, documentos: Iterable[Documento], cdcs: Optional[Sequence[str]] = None, tamano_bloque: int = 1000
+    ) -> int:
+        """
+        Guarda muchos rDE en transacciones de `tamano_bloque` documentos.
+        Devuelve cuántos eran nuevos.
+        """
+        cdcs_iter = iter(cdcs) if cdcs is not None else None
+        nuevos = 0
+        iterador = iter(documentos)
+        while True:
+            bloque = list(itertools.islice(iterador, tamano_bloque))
+            if not bloque:
+                return nuevos
+            ahora = self.reloj()
+            filas = []
+            for documento in bloque:
+                cdc = next(cdcs_iter) if cdcs_iter is not None else cdc_de(documento)
+                if not cdc:
+                    raise ValueError("No se encontró el Id del DE en el documento.")
+                xml = documento if isinstance(documento, bytes) else etree.tostring(documento, encoding="utf-8")
+                filas.append((cdc, xml, PENDIENTE, ahora, ahora))
+            with self._transaccion() as db:
+                antes = db.total_changes
+                db.executemany(
+                    "INSERT OR IGNORE INTO documentos (cdc, xml, estado, creado, actualizado) VALUES (?, ?, ?, ?, ?)",
+                    filas,
+                )
+                nuevos += db.total_changes - antes
+
+    def tomar(self, cantidad: int = MAX_DES_POR_LOTE) -> List[Tuple[str, bytes]]:
+        """
+        Pasa hasta `cantidad` documentos PENDIENTE (los más antiguos) a
+        ENVIANDO y los devuelve como (cdc, xml).
+        """
+        with self._transaccion() as db:
+            filas = db.execute(
+                "SELECT orden, cdc, xml FROM documentos WHERE estado = ? ORDER BY orden LIMIT ?",
+                (PENDIENTE, cantidad),
+            ).fetchall()
+            db.executemany(
+                "UPDATE documentos SET estado = ?, intentos = intentos + 1, actualizado = ? WHERE orden = ?",
+                [(ENVIANDO, self.reloj(), orden) for orden, _, _ in filas],
+            )
+        return [(cdc, xml) for _, cdc, xml in filas]
+
+    def _transicion(self, cdcs: Iterable[str], desde: Tuple[str, ...], hacia: str, **campos) -> int:
+        asignaciones = "".join(f", {campo} = ?" for campo in campos)
+        marcas = ", ".join("?" * len(desde))
+        sentencia = (
+            f"UPDATE documentos SET estado = ?, actualizado = ?{asignaciones} "
+            f"WHERE cdc = ? AND estado IN ({marcas})"
+        )
+        ahora = self.reloj()
+        with self._transaccion() as db:
+            antes = db.total_changes
+            db.executemany(
+                sentencia, [(hacia, ahora, *campos.values(), cdc, *desde) for cdc in cdcs]
+            )
+            return db.total_changes - antes
+
+    def marcar_enviados(self, cdcs: Iterable[str], protocolo_lote: str) -> int:
+        """ENVIANDO -> ENVIADO, con el dProtConsLote del lote."""
+        return self._transicion(cdcs, (ENVIANDO,), ENVIADO, protocolo_lote=protocolo_lote)
+
+    def devolver(self, cdcs: Iterable[str], mensaje: Optional[str] = None) -> int:
+        """ENVIANDO o DUDOSO -> PENDIENTE: SIFEN no recibió los documentos."""
+        return self._transicion(cdcs, (ENVIANDO, DUDOSO), PENDIENTE, mensaje=mensaje)
+
+    def marcar_dudosos(self, cdcs: Iterable[str], mensaje: Optional[str] = None) -> int:
+        """ENVIANDO o ENVIADO -> DUDOSO: no se sabe si SIFEN los tiene."""
+        return self._transicion(cdcs, (ENVIANDO, ENVIADO), DUDOSO, mensaje=mensaje)
+
+    def rechazar(self, cdcs: Iterable[str], mensaje: Optional[str] = None) -> int:
+        """ENVIANDO -> RECHAZADO, sin más reintentos."""
+        return self._transicion(cdcs, (ENVIANDO,), RECHAZADO, mensaje=mensaje)
+
+    def registrar_resultado(self, resultado: ResultadoDE) -> bool:
+        """
+        Aplica el resultado de un DE (de siConsLote o siConsDE). Solo cambia
+        documentos ENVIADO o DUDOSO.
+        """
+        mensaje = resultado.resultados[0][1] if resultado.resultados else resultado.estado
+        hacia = APROBADO if resultado.aprobado else RECHAZADO
+        return self._transicion(
+            [resultado.cdc], (ENVIADO, DUDOSO), hacia, protocolo=resultado.protocolo, mensaje=mensaje
+        ) == 1
+
+    def recuperar(self) -> int:
+        """
+        Al arrancar tras una caída: los documentos que quedaron ENVIANDO
+        pasan a DUDOSO. Devuelve cuántos.
+        """
+        with self._lock:
+            filas = [cdc for (cdc,) in self._db.execute(
+                "SELECT cdc FROM documentos WHERE estado = ?", (ENVIANDO,)
+            )]
+        return self._transicion(filas, (ENVIANDO,), DUDOSO, mensaje="Interrumpido durante el envío")
+
+    def dudosos(self, antes_de: Optional[float] = None, limite: int = 1000) -> List[str]:
+        """CDC en DUDOSO cuyo último cambio fue antes de `antes_de`."""
+        with self._lock:
+            return [cdc for (cdc,) in self._db.execute(
+                "SELECT cdc FROM documentos WHERE estado = ? AND actualizado <= ? ORDER BY orden LIMIT ?",
+                (DUDOSO, self.reloj() if antes_de is None else antes_de, limite),
+            )]
+
+    def lotes_enviados(self) -> Dict[str, List[str]]:
+        """{dProtConsLote: [cdc, ...]} de los documentos ENVIADO."""
+        lotes: Dict[str, List[str]] = {}
+        with self._lock:
+            for protocolo_lote, cdc in self._db.execute(
+                "SELECT protocolo_lote, cdc FROM documentos WHERE estado = ? ORDER BY orden", (ENVIADO,)
+            ):
+                lotes.setdefault(protocolo_lote, []).append(cdc)
+        return lotes
+
+    def contar(self) -> Dict[str, int]:
+        """Cantidad de documentos por estado."""
+        with self._lock:
+            return dict(self._db.execute("SELECT estado, COUNT(*) FROM documentos GROUP BY estado"))
+
+    def obtener(self, cdc: str) -> Optional[DocumentoContingencia]:
+        with self._lock:
+            fila = self._db.execute(
+                "SELECT cdc, estado, intentos, protocolo_lote, protocolo, mensaje, actualizado "
+                "FROM documentos WHERE cdc = ?",
+                (cdc,),
+            ).fetchone()
+        return DocumentoContingencia(*fila) if fila else None
+
+
+class DrenadorContingencia:
+    """
+    Envía a SIFEN, en lotes, los documentos de una BandejaContingencia.
+
+    En cada pasada (`drenar`) primero verifica con siConsDE los documentos
+    DUDOSO que llevan más de `espera_dudosos` segundos así: los que SIFEN
+    ya tiene se dan por aprobados y los que no, vuelven a PENDIENTE. Luego
+    toma los PENDIENTE de a `tamano_lote` y los envía con hasta
+    `lotes_en_vuelo` lotes a la vez. Si SIFEN no responde, la pasada se
+    corta y los documentos vuelven a PENDIENTE (o quedan DUDOSO si el envío
+    pudo haber llegado). Por último, si hay cliente de siConsLote, sigue
+    los lotes enviados con un PlanificadorConsultas hasta conocer el
+    resultado de cada DE.
+
+    `ejecutar` repite las pasadas cada `intervalo` segundos hasta que se
+    active `detener`, recuperando antes lo que una caída dejó a medias.
+
+    Args:
+        bandeja: Bandeja de donde se toman los documentos.
+        cliente_lote: Cliente de siRecepLoteDE.
+        cliente_consulta_lote: Cliente de siConsLote; sin él los documentos
+            quedan ENVIADO.
+        cliente_consulta_de: Cliente de siConsDE; sin él los DUDOSO quedan
+            así hasta resolverlos a mano (BandejaContingencia.devolver).
+        tamano_lote: DE por lote (máximo 50).
+        lotes_en_vuelo: Lotes enviándose a la vez (por defecto la
+            concurrencia de cliente_lote).
+        espera_dudosos: Segundos antes de verificar un documento DUDOSO;
+            deja tiempo a SIFEN para procesar un lote que sí llegó.
+        max_intentos: Veces que un documento se reenvía tras un lote no
+            encolado antes de darlo por RECHAZADO.
+        planificador: Opciones para el PlanificadorConsultas.
+
+    Ejemplo:
+        drenador = DrenadorContingencia(bandeja, cliente_lote, cliente_consulta_lote, cliente_consulta_de)
+        tarea = asyncio.create_task(drenador.ejecutar(detener))
+    """
+
+    def __init__(
+        self,
+        bandeja: BandejaContingencia,
+        cliente_lote: ClienteLote,
+        cliente_consulta_lote: Optional[ClienteConsultaLote] = None,
+        cliente_consulta_de: Optional[ClienteConsultaDE] = None,
+        tamano_lote: int = MAX_DES_POR_LOTE,
+        lotes_en_vuelo: Optional[int] = None,
+        espera_dudosos: float = 600.0,
+        max_intentos: int = 5,
+        **planificador,
+    ):
+        if not 1 <= tamano_lote <= MAX_DES_POR_LOTE:
+            raise ValueError(f"El tamaño del lote debe estar entre 1 y {MAX_DES_POR_LOTE}.")
+        self.bandeja = bandeja
+        self.cliente_lote = cliente_lote
+        self.cliente_consulta_de = cliente_consulta_de
+        self.tamano_lote = tamano_lote
+        self.lotes_en_vuelo = lotes_en_vuelo or cliente_lote.concurrencia
+        self.espera_dudosos = espera_dudosos
+        self.max_intentos = max_intentos
+        self.planificador: Optional[PlanificadorConsultas] = None
+        if cliente_consulta_lote is not None:
+            self.planificador = PlanificadorConsultas(
+                cliente_consulta_lote,
+                al_resultado=bandeja.registrar_resultado,
+                al_error=self._lote_sin_resultado,
+                **planificador,
+            )
+        self.lotes_enviados = 0
+
+    async def drenar(self) -> int:
+        """Una pasada completa. Devuelve la cantidad de lotes recibidos por SIFEN."""
+        await self.verificar_dudosos()
+        enviados_antes = self.lotes_enviados
+        sin_conexion = asyncio.Event()
+
+        async def trabajador():
+            while not sin_conexion.is_set():
+                documentos = self.bandeja.tomar(self.tamano_lote)
+                if not documentos:
+                    return
+                await self._enviar(documentos, sin_conexion)
+
+        await asyncio.gather(*(trabajador() for _ in range(self.lotes_en_vuelo)))
+        if self.planificador is not None:
+            await self.planificador.ejecutar()
+        return self.lotes_enviados - enviados_antes
+
+    async def ejecutar(self, detener: asyncio.Event, intervalo: float = 30.0):
+        """Pasadas cada `intervalo` segundos hasta que se active `detener`."""
+        recuperados = self.bandeja.recuperar()
+        if recuperados:
+            logger.warning("%d documentos quedaron a medio enviar; se verificarán con siConsDE", recuperados)
+        if self.planificador is not None:
+            for protocolo_lote, cdcs in self.bandeja.lotes_enviados().items():
+                self.planificador.agregar(protocolo_lote, cdcs, espera=0)
+
+        while not detener.is_set():
+            try:
+                await self.drenar()
+            except Exception:
+                logger.exception("Error drenando la bandeja de contingencia")
+            try:
+                await asyncio.wait_for(detener.wait(), intervalo)
+            except asyncio.TimeoutError:
+                pass
+
+    async def verificar_dudosos(self) -> int:
+        """
+        Resuelve con siConsDE los DUDOSO vencidos. Devuelve cuántos
+        volvieron a PENDIENTE.
+        """
+        if self.cliente_consulta_de is None:
+            return 0
+        devueltos = 0
+        while True:
+            cdcs = self.bandeja.dudosos(self.bandeja.reloj() - self.espera_dudosos)
+            if not cdcs:
+                return devueltos
+            estados = await self.cliente_consulta_de.consultar_muchos(cdcs)
+            resueltos = 0
+            for cdc, estado in estados.items():
+                if isinstance(estado, Exception):
+                    continue
+                if estado.final:
+                    resueltos += self.bandeja.registrar_resultado(ResultadoDE(
+                        cdc=cdc, estado="Aprobado", protocolo=estado.protocolo,
+                        resultados=[(estado.codigo, estado.mensaje)],
+                    ))
+                else:
+                    resueltos += self.bandeja.devolver([cdc], estado.mensaje)
+                    devueltos += 1
+            if not resueltos:
+                return devueltos
+
+    async def _enviar(self, documentos: List[Tuple[str, bytes]], sin_conexion: asyncio.Event):
+        cdcs = [cdc for cdc, _ in documentos]
+        lote = await self.cliente_lote.enviar_lote([xml for _, xml in documentos])
+
+        if lote.recibido:
+            self.bandeja.marcar_enviados(cdcs, lote.protocolo)
+            self.lotes_enviados += 1
+            if self.planificador is not None:
+                self.planificador.agregar(lote.protocolo, cdcs)
+        elif lote.excepcion is None:
+            # SIFEN contestó que no encoló el lote
+            mensaje = f"{lote.codigo}: {lote.mensaje}"
+            agotados = [cdc for cdc in cdcs if self.bandeja.obtener(cdc).intentos >= self.max_intentos]
+            self.bandeja.rechazar(agotados, mensaje)
+            self.bandeja.devolver(cdcs, mensaje)
+        elif isinstance(lote.excepcion, _NO_RECIBIDO):
+            sin_conexion.set()
+            self.bandeja.devolver(cdcs, lote.error)
+        else:
+            sin_conexion.set()
+            self.bandeja.marcar_dudosos(cdcs, lote.error)
+
+    def _lote_sin_resultado(self, lote, estado):
+        # Lote inexistente, extemporáneo o sin más reintentos: se verifica
+        # cada DE con siConsDE
+        self.bandeja.marcar_dudosos(lote.cdcs, lote.ultimo_error or (estado.mensaje if estado else None))
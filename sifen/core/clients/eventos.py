@@ -0,0 +1,149 @@
+import asyncio
+import itertools
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from lxml import etree
+
+from sifen.core.builders.evento_builder import MAX_EVENTOS_POR_ENVIO, EventoBuilder
+from sifen.core.clients.base import ClienteSIFEN
+from sifen.core.clients.soap import SIFEN_NS, sifen
+from sifen.models.evento import Evento
+
+RUTA_EVENTOS = "/de/ws/eventos/evento.wsdl"
+
+# dCodRes con el que SIFEN registra un evento
+EVENTO_REGISTRADO = "0600"
+
+
+@dataclass
+class ResultadoEvento:
+    """Resultado del procesamiento de un evento (gResProcEVe)."""
+    id: str                                 # Id del rEve
+    estado: Optional[str]                   # dEstRes
+    protocolo: Optional[str] = None         # dProtAut
+    resultados: List[Tuple[str, str]] = field(default_factory=list)  # (dCodRes, dMsgRes)
+
+    @property
+    def aprobado(self) -> bool:
+        return bool(self.estado) and self.estado.startswith("Aprobado")
+
+
+@dataclass
+class EnvioEventos:
+    """Un rEnviEventoDe enviado a siRecepEvento y lo que respondió SIFEN."""
+    numero: int                             # Correlativo local del envío
+    ids: List[str]                          # Id de cada rEve, en orden
+    d_id: Optional[str] = None              # dId del rEnviEventoDe
+    fecha_proceso: Optional[str] = None     # dFecProc
+    resultados: Dict[str, ResultadoEvento] = field(default_factory=dict)  # Id del rEve -> resultado
+    error: Optional[str] = None             # Error de comunicación, si lo hubo
+
+
+def leer_rretenvieventode(respuesta: etree._Element) -> Tuple[Optional[str], List[ResultadoEvento]]:
+    """dFecProc y los gResProcEVe de un rRetEnviEventoDe."""
+    resultados = []
+    for g_res in respuesta.iterfind(sifen("gResProcEVe")):
+        resultados.append(ResultadoEvento(
+            id=g_res.findtext(sifen("id")),
+            estado=g_res.findtext(sifen("dEstRes")),
+            protocolo=g_res.findtext(sifen("dProtAut")),
+            resultados=[
+                (res.findtext(sifen("dCodRes")), res.findtext(sifen("dMsgRes")) or "")
+                for res in g_res.iterfind(sifen("gResProc"))
+            ],
+        ))
+    return respuesta.findtext(sifen("dFecProc")), resultados
+
+
+class ClienteEventos(ClienteSIFEN):
+    """
+    Cliente asíncrono de siRecepEvento (eventos del emisor: cancelación e
+    inutilización).
+
+    Los eventos se firman con un EventoBuilder (por defecto uno propio, que
+    carga la clave una sola vez) y se envían de a 15 por rEnviEventoDe, con
+    hasta `concurrencia` envíos en vuelo. Mientras se espera la respuesta
+    de un envío se arma y firma el siguiente grupo.
+
+    Ejemplo:
+        eventos = [EventoCancelacion(cdc, "Error en el precio") for cdc in cdcs]
+        async with ClienteEventos(ambiente="test") as cliente:
+            envios = await cliente.enviar_eventos(eventos)
+    """
+
+    def __init__(
+        self,
+        *args,
+        builder: Optional[EventoBuilder] = None,
+        concurrencia: Optional[int] = None,
+        ruta: str = RUTA_EVENTOS,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.builder = builder or EventoBuilder()
+        self.concurrencia = concurrencia or self.pool.max_conexiones
+        self.ruta = ruta
+        self.envios: Dict[int, EnvioEventos] = {}
+        self._numeros = itertools.count(1)
+
+    async def enviar_grupo(self, grupo: etree._Element) -> EnvioEventos:
+        """
+        Envía un gGroupGesEve ya armado (EventoBuilder.construir_grupo). Los
+        errores de comunicación se informan en EnvioEventos.error.
+        """
+        return await self._enviar(self._registrar(grupo), grupo)
+
+    async def enviar_eventos(
+        self, eventos: Iterable[Evento], tamano: int = MAX_EVENTOS_POR_ENVIO
+    ) -> List[EnvioEventos]:
+        """
+        Firma, agrupa y envía los eventos. Devuelve los envíos en el orden
+        de los eventos.
+
+        Raises:
+            ValueError: Si algún evento no es válido; los envíos ya iniciados
+                se cancelan.
+        """
+        semaforo = asyncio.Semaphore(self.concurrencia)
+        tareas = []
+
+        async def enviar(envio, grupo):
+            try:
+                return await self._enviar(envio, grupo)
+            finally:
+                semaforo.release()
+
+        try:
+            for grupo in self.builder.agrupar(eventos, tamano):
+                await semaforo.acquire()
+                tareas.append(asyncio.create_task(enviar(self._registrar(grupo), grupo)))
+                # Deja arrancar el envío antes de firmar el grupo siguiente
+                await asyncio.sleep(0)
+        except BaseException:
+            for tarea in tareas:
+                tarea.cancel()
+            raise
+        return list(await asyncio.gather(*tareas))
+
+    def _registrar(self, grupo: etree._Element) -> EnvioEventos:
+        ids = [ges_eve.find(sifen("rEve")).get("Id") for ges_eve in grupo]
+        envio = EnvioEventos(numero=next(self._numeros), ids=ids)
+        self.envios[envio.numero] = envio
+        return envio
+
+    async def _enviar(self, envio: EnvioEventos, grupo: etree._Element) -> EnvioEventos:
+        envio.d_id = self.nuevo_id()
+        mensaje = etree.Element(sifen("rEnviEventoDe"), nsmap={None: SIFEN_NS})
+        etree.SubElement(mensaje, sifen("dId")).text = envio.d_id
+        etree.SubElement(mensaje, sifen("dEvReg")).append(grupo)
+
+        try:
+            respuesta = await self.llamar(self.ruta, mensaje)
+        except Exception as e:
+            envio.error = f"{type(e).__name__}: {str(e)}"
+            return envio
+
+        envio.fecha_proceso, resultados = leer_rretenvieventode(respuesta)
+        envio.resultados = {resultado.id: resultado for resultado in resultados}
+        return envio
@@ -0,0 +1,247 @@
+import asyncio
+import ssl
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional
+from urllib.parse import urlsplit
+
+
+class ErrorHTTP(Exception):
+    """Respuesta HTTP con estado de error o ilegible."""
+
+    def __init__(self, mensaje: str, estado: Optional[int] = None, cuerpo: bytes = b""):
+        super().__init__(mensaje)
+        self.estado = estado
+        self.cuerpo = cuerpo
+
+
+@dataclass
+class RespuestaHTTP:
+    estado: int
+    encabezados: Dict[str, str] = field(default_factory=dict)  # Nombres en minúscula
+    cuerpo: bytes = b""
+
+
+def crear_contexto_ssl(
+    cert_path: Optional[str] = None,
+    key_path: Optional[str] = None,
+    password: Optional[str] = None,
+    cafile: Optional[str] = None,
+    verificar: bool = True,
+) -> ssl.SSLContext:
+    """
+    Contexto TLS de cliente. Con cert_path/key_path se presenta el
+    certificado del contribuyente (TLS mutuo, como exige SIFEN).
+
+    Args:
+        cert_path: Certificado del cliente en PEM.
+        key_path: Clave privada del cliente en PEM.
+        password: Contraseña de la clave privada, si la tiene.
+        cafile: CAs adicionales para validar al servidor.
+        verificar: Si es False no se valida el certificado del servidor
+            (solo para pruebas contra servidores locales).
+    """
+    contexto = ssl.create_default_context(cafile=cafile)
+    if not verificar:
+        contexto.check_hostname = False
+        contexto.verify_mode = ssl.CERT_NONE
+    if cert_path:
+        contexto.load_cert_chain(cert_path, key_path, password)
+    return contexto
+
+
+class _Conexion:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.usos = 0
+        self.ultimo_uso = time.monotonic()
+
+    def utilizable(self, max_inactiva: float) -> bool:
+        return (
+            not self.writer.is_closing()
+            and not self.reader.at_eof()
+            and time.monotonic() - self.ultimo_uso < max_inactiva
+        )
+
+    def cerrar(self):
+        self.writer.close()
+
+
+class PoolConexiones:
+    """
+    Pool acotado de conexiones HTTP/1.1 persistentes (keep-alive) a un host.
+
+    Nunca hay más de `max_conexiones` conexiones abiertas a la vez; quien
+    pide una cuando están todas ocupadas espera a que se libere alguna. Las
+    conexiones libres se reutilizan (la última devuelta primero), de modo
+    que el handshake TLS se hace una vez por conexión y no por solicitud.
+
+    Args:
+        url_base: Esquema, host y puerto (p. ej. "https://sifen.set.gov.py").
+        contexto_ssl: Contexto TLS para URLs https (ver crear_contexto_ssl).
+        max_conexiones: Conexiones simultáneas como máximo.
+        timeout: Segundos para completar cada solicitud.
+        max_inactiva: Segundos que una conexión libre se considera reutilizable.
+    """
+
+    def __init__(
+        self,
+        url_base: str,
+        contexto_ssl: Optional[ssl.SSLContext] = None,
+        max_conexiones: int = 10,
+        timeout: float = 30.0,
+        max_inactiva: float = 30.0,
+    ):
+        partes = urlsplit(url_base)
+        self.https = partes.scheme == "https"
+        self.host = partes.hostname
+        self.puerto = partes.port or (443 if self.https else 80)
+        self.contexto_ssl = contexto_ssl if self.https else None
+        if self.https and self.contexto_ssl is None:
+            self.contexto_ssl = crear_contexto_ssl()
+        self.max_conexiones = max_conexiones
+        self.timeout = timeout
+        self.max_inactiva = max_inactiva
+        self._libres: Deque[_Conexion] = deque()
+        self._semaforo = asyncio.Semaphore(max_conexiones)
+        self.conexiones_creadas = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *excinfo):
+        await self.cerrar()
+
+    async def solicitar(
+        self,
+        metodo: str,
+        ruta: str,
+        cuerpo: bytes = b"",
+        encabezados: Optional[Dict[str, str]] = None,
+    ) -> RespuestaHTTP:
+        """
+        Envía una solicitud y devuelve la respuesta completa.
+
+        Si una conexión reutilizada resulta cerrada por el servidor antes de
+        responder, se reintenta una vez con una conexión nueva.
+
+        Raises:
+            ErrorHTTP: Si la respuesta no se puede interpretar.
+            asyncio.TimeoutError: Si no se completa dentro de `timeout`.
+        """
+        async with self._semaforo:
+            for intento in range(2):
+                conexion = await self._tomar()
+                reutilizada = conexion.usos > 0
+                try:
+                    respuesta, mantener = await asyncio.wait_for(
+                        self._intercambiar(conexion, metodo, ruta, cuerpo, encabezados or {}),
+                        self.timeout,
+                    )
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    conexion.cerrar()
+                    if reutilizada and intento == 0:
+                        continue
+                    raise
+                except BaseException:
+                    conexion.cerrar()
+                    raise
+
+                if mantener:
+                    conexion.usos += 1
+                    conexion.ultimo_uso = time.monotonic()
+                    self._libres.append(conexion)
+                else:
+                    conexion.cerrar()
+                return respuesta
+
+    async def _tomar(self) -> _Conexion:
+        while self._libres:
+            conexion = self._libres.pop()
+            if conexion.utilizable(self.max_inactiva):
+                return conexion
+            conexion.cerrar()
+
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                self.host,
+                self.puerto,
+                ssl=self.contexto_ssl,
+                server_hostname=self.host if self.https else None,
+            ),
+            self.timeout,
+        )
+        self.conexiones_creadas += 1
+        return _Conexion(reader, writer)
+
+    async def _intercambiar(self, conexion, metodo, ruta, cuerpo, encabezados):
+        host = self.host if self.puerto in (80, 443) else f"{self.host}:{self.puerto}"
+        lineas = [f"{metodo} {ruta} HTTP/1.1", f"Host: {host}", f"Content-Length: {len(cuerpo)}"]
+        lineas.extend(f"{nombre}: {valor}" for nombre, valor in encabezados.items())
+        conexion.writer.write(("\r\n".join(lineas) + "\r\n\r\n").encode("latin-1") + cuerpo)
+        await conexion.writer.drain()
+        return await leer_respuesta(conexion.reader)
+
+    async def cerrar(self):
+        """Cierra las conexiones libres."""
+        while self._libres:
+            conexion = self._libres.pop()
+            conexion.cerrar()
+            try:
+                await conexion.writer.wait_closed()
+            except (ConnectionError, ssl.SSLError):
+                pass
+
+
+async def leer_encabezados(reader: asyncio.StreamReader) -> Dict[str, str]:
+    encabezados = {}
+    while True:
+        linea = await reader.readline()
+        if not linea:
+            raise asyncio.IncompleteReadError(linea, None)
+        if linea in (b"\r\n", b"\n"):
+            return encabezados
+        nombre, _, valor = linea.decode("latin-1").partition(":")
+        encabezados[nombre.strip().lower()] = valor.strip()
+
+
+async def leer_cuerpo(reader: asyncio.StreamReader, encabezados: Dict[str, str]) -> Optional[bytes]:
+    """
+    Cuerpo según Content-Length o Transfer-Encoding: chunked. Devuelve None
+    si no hay ninguno de los dos (el cuerpo termina al cerrar la conexión).
+    """
+    if "chunked" in encabezados.get("transfer-encoding", "").lower():
+        partes = []
+        while True:
+            tamano = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+            if tamano == 0:
+                await leer_encabezados(reader)  # Trailers
+                return b"".join(partes)
+            partes.append(await reader.readexactly(tamano))
+            await reader.readexactly(2)
+    if "content-length" in encabezados:
+        return await reader.readexactly(int(encabezados["content-length"]))
+    return None
+
+
+async def leer_respuesta(reader: asyncio.StreamReader):
+    """Lee una respuesta HTTP/1.1; devuelve (RespuestaHTTP, mantener_conexion)."""
+    linea = await reader.readline()
+    if not linea:
+        raise ConnectionResetError("El servidor cerró la conexión sin responder")
+    try:
+        version, estado = linea.decode("latin-1").split(None, 2)[:2]
+        estado = int(estado)
+    except ValueError:
+        raise ErrorHTTP(f"Línea de estado inválida: {linea!r}")
+
+    encabezados = await leer_encabezados(reader)
+    cuerpo = await leer_cuerpo(reader, encabezados)
+    mantener = cuerpo is not None and encabezados.get("connection", "").lower() != "close"
+    if cuerpo is None:
+        cuerpo = await reader.read()
+    if version == "HTTP/1.0" and encabezados.get("connection", "").lower() != "keep-alive":
+        mantener = False
+    return RespuestaHTTP(estado, encabezados, cuerpo), mantener
@@ -0,0 +1,315 @@
+import asyncio
+import os
+import struct
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: sin coordinación entre procesos
+    fcntl = None
+
+from sifen.core.clients.http import ErrorHTTP
+from sifen.core.clients.soap import ErrorSOAP
+
+# Estados del CortaCircuito
+CERRADO = "cerrado"          # Las llamadas pasan
+ABIERTO = "abierto"          # Se rechazan sin llamar a SIFEN
+SEMIABIERTO = "semiabierto"  # Pasan unas pocas sondas para ver si SIFEN volvió
+
+# Estado compartido de una cubeta en archivo: tokens y hora de la última
+# actualización, dos doubles
+_ESTADO = struct.Struct("dd")
+
+
+class CircuitoAbierto(Exception):
+    """El corta circuito del servicio está abierto: la llamada no se hizo."""
+
+    def __init__(self, ruta: str, reintentar_en: float):
+        super().__init__(f"Circuito abierto para {ruta}; reintentar en {reintentar_en:.1f} s")
+        self.ruta = ruta
+        self.reintentar_en = reintentar_en
+
+
+class CubetaTokens:
+    """
+    Cubeta de tokens: admite ráfagas de hasta `capacidad` llamadas y, en
+    promedio, no más de `por_segundo` llamadas por segundo.
+
+    Cada llamada reserva su token al pedirlo (la cubeta puede quedar en
+    negativo) y espera lo que falte para que se reponga, de modo que las
+    esperas se reparten en orden de llegada sin reintentos. Con `ruta` el
+    estado vive en un archivo, protegido con flock, y lo comparten todos
+    los procesos que usen la misma ruta; sin ella vive en memoria y es
+    seguro compartirla entre hilos.
+
+    Args:
+        por_segundo: Tasa sostenida (sin límite si es None o 0).
+        capacidad: Ráfaga máxima (por defecto, un segundo de tasa).
+        ruta: Archivo de estado compartido entre procesos (POSIX).
+        reloj: Función que devuelve la hora actual en segundos. Con `ruta`
+            debe ser la misma en todos los procesos (time.time).
+    """
+
+    def __init__(
+        self,
+        por_segundo: Optional[float],
+        capacidad: Optional[float] = None,
+        ruta: Optional[str] = None,
+        reloj: Callable[[], float] = time.time,
+    ):
+        if ruta and fcntl is None:
+            raise RuntimeError("La cubeta compartida entre procesos requiere fcntl (POSIX).")
+        self.por_segundo = por_segundo
+        self.capacidad = capacidad if capacidad is not None else max(1.0, por_segundo or 1.0)
+        self.ruta = ruta
+        self.reloj = reloj
+        self._tokens = self.capacidad
+        self._marca = reloj()
+        self._lock = threading.Lock()
+        self.llamadas = 0
+        self.esperas = 0            # Llamadas que tuvieron que esperar
+        self.tiempo_limitado = 0.0  # Segundos esperados en total
+
+    async def adquirir(self) -> float:
+        """Toma un token, esperando si hace falta. Devuelve los segundos esperados."""
+        if not self.por_segundo:
+            return 0.0
+        espera = self.reservar()
+        self.llamadas += 1
+        if espera > 0:
+            self.esperas += 1
+            self.tiempo_limitado += espera
+            await asyncio.sleep(espera)
+        return espera
+
+    def reservar(self) -> float:
+        """Reserva un token y devuelve cuánto hay que esperar para usarlo."""
+        with self._lock:
+            if self.ruta is None:
+                self._tokens, self._marca, espera = self._reponer_y_tomar(self._tokens, self._marca)
+                return espera
+            descriptor = os.open(self.ruta, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(descriptor, fcntl.LOCK_EX)
+                datos = os.pread(descriptor, _ESTADO.size, 0)
+                tokens, marca = _ESTADO.unpack(datos) if len(datos) == _ESTADO.size else (self.capacidad, self.reloj())
+                tokens, marca, espera = self._reponer_y_tomar(tokens, marca)
+                os.pwrite(descriptor, _ESTADO.pack(tokens, marca), 0)
+                return espera
+            finally:
+                os.close(descriptor)  # También libera el flock
+
+    def _reponer_y_tomar(self, tokens: float, marca: float):
+        ahora = max(self.reloj(), marca)
+        tokens = min(self.capacidad, tokens + (ahora - marca) * self.por_segundo) - 1
+        espera = -tokens / self.por_segundo if tokens < 0 else 0.0
+        return tokens, ahora, espera
+
+    def metricas(self) -> Dict[str, float]:
+        return {"llamadas": self.llamadas, "esperas": self.esperas, "tiempo_limitado": self.tiempo_limitado}
+
+
+class LimiteTasa(CubetaTokens):
+    """
+    Espaciado mínimo entre llamadas para no superar `por_segundo`
+    solicitudes por segundo (sin límite si es None): una CubetaTokens sin
+    ráfagas.
+    """
+
+    def __init__(self, por_segundo: Optional[float] = None):
+        super().__init__(por_segundo, capacidad=1.0, reloj=time.monotonic)
+
+    async def esperar(self):
+        await self.adquirir()
+
+
+def es_falla_servicio(error: BaseException) -> bool:
+    """
+    True si el error indica que el servicio está caído o saturado (y debe
+    contar para el CortaCircuito); False si es un rechazo del mensaje.
+    """
+    if isinstance(error, ErrorSOAP):
+        return error.codigo is None or error.codigo.endswith("Receiver")
+    if isinstance(error, ErrorHTTP):
+        return error.estado is None or error.estado == 429 or error.estado >= 500
+    return isinstance(error, (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError))
+
+
+class CortaCircuito:
+    """
+    Corta las llamadas a un servicio que falla seguido.
+
+    Tras `umbral_fallos` fallas consecutivas (ver es_falla_servicio) pasa a
+    ABIERTO y rechaza las llamadas con CircuitoAbierto durante
+    `espera_apertura` segundos. Después pasa a SEMIABIERTO y deja pasar
+    hasta `sondas` llamadas: si una sale bien vuelve a CERRADO; si falla,
+    a ABIERTO otra vez.
+
+    Args:
+        umbral_fallos: Fallas consecutivas que abren el circuito.
+        espera_apertura: Segundos en ABIERTO antes de sondear.
+        sondas: Llamadas simultáneas permitidas en SEMIABIERTO.
+        reloj: Función que devuelve la hora actual en segundos.
+    """
+
+    def __init__(
+        self,
+        umbral_fallos: int = 5,
+        espera_apertura: float = 30.0,
+        sondas: int = 1,
+        reloj: Callable[[], float] = time.monotonic,
+    ):
+        self.umbral_fallos = umbral_fallos
+        self.espera_apertura = espera_apertura
+        self.sondas = sondas
+        self.reloj = reloj
+        self._estado = CERRADO
+        self._abierto_desde = 0.0
+        self._sondas_en_curso = 0
+        self.fallos_consecutivos = 0
+        self.aperturas = 0
+        self.rechazadas = 0  # Llamadas cortadas sin llegar a SIFEN
+
+    @property
+    def estado(self) -> str:
+        if self._estado == ABIERTO and self.reloj() - self._abierto_desde >= self.espera_apertura:
+            self._estado = SEMIABIERTO
+            self._sondas_en_curso = 0
+        return self._estado
+
+    def permitir(self, ruta: str = "") -> bool:
+        """
+        Registra el inicio de una llamada. Devuelve True si es una sonda.
+
+        Raises:
+            CircuitoAbierto: Si la llamada no debe hacerse.
+        """
+        estado = self.estado
+        if estado == CERRADO:
+            return False
+        if estado == SEMIABIERTO and self._sondas_en_curso < self.sondas:
+            self._sondas_en_curso += 1
+            return True
+        self.rechazadas += 1
+        restante = max(0.0, self.espera_apertura - (self.reloj() - self._abierto_desde))
+        raise CircuitoAbierto(ruta, restante)
+
+    def liberar(self, sonda: bool = False):
+        """Una llamada terminó sin resultado (p. ej. se canceló)."""
+        if sonda:
+            self._sondas_en_curso -= 1
+
+    def exito(self, sonda: bool = False):
+        self.liberar(sonda)
+        self.fallos_consecutivos = 0
+        self._estado = CERRADO
+
+    def fallo(self, sonda: bool = False):
+        self.liberar(sonda)
+        self.fallos_consecutivos += 1
+        if sonda or (self._estado == CERRADO and self.fallos_consecutivos >= self.umbral_fallos):
+            self._estado = ABIERTO
+            self._abierto_desde = self.reloj()
+            self.aperturas += 1
+
+    def metricas(self) -> Dict[str, Union[str, int]]:
+        return {
+            "estado": self.estado,
+            "fallos_consecutivos": self.fallos_consecutivos,
+            "aperturas": self.aperturas,
+            "rechazadas": self.rechazadas,
+        }
+
+
+class LimitadorSIFEN:
+    """
+    Límite de tasa y corta circuito por servicio (ruta) de SIFEN.
+
+    ClienteSIFEN pasa cada llamada por `llamada(ruta)`: primero el
+    CortaCircuito de la ruta (si está abierto la llamada falla al instante
+    con CircuitoAbierto), luego un token de su CubetaTokens. El resultado
+    de la llamada alimenta al corta circuito. Una misma instancia se
+    comparte entre todos los clientes del proceso; con `directorio` las
+    cubetas se coordinan además entre procesos (un archivo por ruta).
+
+    Args:
+        por_segundo: Tasa por ruta; un número para todas o
+            {ruta: tasa}, con la clave None como valor por defecto.
+        capacidad: Ráfaga máxima de cada cubeta.
+        directorio: Carpeta de las cubetas compartidas entre procesos.
+        umbral_fallos, espera_apertura, sondas: Ver CortaCircuito.
+
+    Ejemplo:
+        limitador = LimitadorSIFEN({None: 10, RUTA_CONSULTA_RUC: 2}, directorio="/run/sifen")
+        async with ClienteLote(limitador=limitador) as cliente:
+            ...
+        print(limitador.metricas())
+    """
+
+    def __init__(
+        self,
+        por_segundo: Union[None, float, Dict[Optional[str], float]] = None,
+        capacidad: Optional[float] = None,
+        directorio: Optional[str] = None,
+        umbral_fallos: int = 5,
+        espera_apertura: float = 30.0,
+        sondas: int = 1,
+    ):
+        self.por_segundo = por_segundo if isinstance(por_segundo, dict) else {None: por_segundo}
+        self.capacidad = capacidad
+        self.directorio = directorio
+        self._circuito = dict(umbral_fallos=umbral_fallos, espera_apertura=espera_apertura, sondas=sondas)
+        self.cubetas: Dict[str, CubetaTokens] = {}
+        self.circuitos: Dict[str, CortaCircuito] = {}
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+
+    def cubeta(self, ruta: str) -> CubetaTokens:
+        cubeta = self.cubetas.get(ruta)
+        if cubeta is None:
+            archivo = None
+            if self.directorio:
+                archivo = os.path.join(self.directorio, ruta.strip("/").replace("/", "_") + ".cubeta")
+            tasa = self.por_segundo.get(ruta, self.por_segundo.get(None))
+            cubeta = self.cubetas[ruta] = CubetaTokens(tasa, self.capacidad, archivo)
+        return cubeta
+
+    def circuito(self, ruta: str) -> CortaCircuito:
+        circuito = self.circuitos.get(ruta)
+        if circuito is None:
+            circuito = self.circuitos[ruta] = CortaCircuito(**self._circuito)
+        return circuito
+
+    @asynccontextmanager
+    async def llamada(self, ruta: str):
+        """
+        Envuelve una llamada a SIFEN.
+
+        Raises:
+            CircuitoAbierto: Si el circuito de la ruta está abierto.
+        """
+        circuito = self.circuito(ruta)
+        sonda = circuito.permitir(ruta)
+        try:
+            await self.cubeta(ruta).adquirir()
+            yield
+        except Exception as e:
+            # Un rechazo del mensaje también es una respuesta del servicio
+            if es_falla_servicio(e):
+                circuito.fallo(sonda)
+            else:
+                circuito.exito(sonda)
+            raise
+        except BaseException:
+            circuito.liberar(sonda)
+            raise
+        else:
+            circuito.exito(sonda)
+
+    def metricas(self) -> Dict[str, Dict[str, Union[str, float]]]:
+        """{ruta: métricas de su cubeta y de su corta circuito}."""
+        rutas = set(self.cubetas) | set(self.circuitos)
+        return {ruta: {**self.cubeta(ruta).metricas(), **self.circuito(ruta).metricas()} for ruta in sorted(rutas)}
@@ -0,0 +1,173 @@
+import asyncio
+import base64
+import io
+import itertools
+import re
+import zipfile
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from lxml import etree
+
+from sifen.core.clients.base import ClienteSIFEN
+from sifen.core.clients.soap import SIFEN_NS, sifen
+
+RUTA_RECEPCION_LOTE = "/de/ws/async/recibe-lote.wsdl"
+MAX_DES_POR_LOTE = 50
+ARCHIVO_LOTE = "lote.xml"
+
+# Código de dCodRes con el que SIFEN confirma que encoló el lote
+LOTE_RECIBIDO = "0300"
+
+_DECLARACION = re.compile(rb"^\s*<\?xml[^>]*\?>\s*")
+_ID_DE = re.compile(rb"<(?:[\w.-]+:)?DE\b[^>]*?\sId=\"([^\"]+)\"")
+
+Documento = Union[bytes, etree._Element]
+
+
+@dataclass
+class Lote:
+    """Un envío a siRecepLoteDE y lo que respondió SIFEN."""
+    numero: int                            # Correlativo local del lote
+    cdcs: List[str]                        # CDC de cada rDE, en orden
+    d_id: Optional[str] = None             # dId del rEnvioLote
+    protocolo: Optional[str] = None        # dProtConsLote, para consultar el lote
+    codigo: Optional[str] = None           # dCodRes
+    mensaje: Optional[str] = None          # dMsgRes
+    fecha_proceso: Optional[str] = None    # dFecProc
+    tiempo_proceso: Optional[int] = None   # dTpoProces
+    error: Optional[str] = None            # Error de comunicación, si lo hubo
+    excepcion: Optional[Exception] = None  # La excepción de ese error
+
+    @property
+    def recibido(self) -> bool:
+        return self.codigo == LOTE_RECIBIDO and self.protocolo is not None
+
+
+def cdc_de(documento: Documento) -> Optional[str]:
+    """Id del DE contenido en un rDE, sin parsear el documento si son bytes."""
+    if isinstance(documento, bytes):
+        coincidencia = _ID_DE.search(documento)
+        return coincidencia.group(1).decode("ascii") if coincidencia else None
+    de = documento.find(sifen("DE"))
+    return de.get("Id") if de is not None else None
+
+
+def agrupar(documentos: Iterable[Documento], tamano: int = MAX_DES_POR_LOTE) -> Iterator[List[Documento]]:
+    """Reparte los documentos en grupos de a lo sumo `tamano` (máximo 50)."""
+    if not 1 <= tamano <= MAX_DES_POR_LOTE:
+        raise ValueError(f"El tamaño del lote debe estar entre 1 y {MAX_DES_POR_LOTE}.")
+    iterador = iter(documentos)
+    while True:
+        grupo = list(itertools.islice(iterador, tamano))
+        if not grupo:
+            return
+        yield grupo
+
+
+def armar_rlotede(documentos: List[Documento]) -> bytes:
+    """
+    Serializa un rLoteDE con los rDE firmados, sin volver a parsear los que
+    ya vienen como bytes (solo se les quita la declaración XML).
+    """
+    if not 1 <= len(documentos) <= MAX_DES_POR_LOTE:
+        raise ValueError(f"Un lote debe tener entre 1 y {MAX_DES_POR_LOTE} documentos.")
+    partes = [b'<?xml version="1.0" encoding="UTF-8"?><rLoteDE xmlns="%s">' % SIFEN_NS.encode()]
+    for documento in documentos:
+        if isinstance(documento, bytes):
+            partes.append(_DECLARACION.sub(b"", documento, count=1))
+        else:
+            partes.append(etree.tostring(documento, encoding="utf-8"))
+    partes.append(b"</rLoteDE>")
+    return b"".join(partes)
+
+
+def empaquetar_lote(documentos: List[Documento]) -> str:
+    """
+    rLoteDE comprimido en zip y codificado en base64, listo para el xDE de
+    rEnvioLote. Todo se hace en memoria.
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archivo:
+        archivo.writestr(ARCHIVO_LOTE, armar_rlotede(documentos))
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def desempaquetar_lote(xde: Union[str, bytes]) -> etree._Element:
+    """Inverso de empaquetar_lote: devuelve el rLoteDE."""
+    with zipfile.ZipFile(io.BytesIO(base64.b64decode(xde))) as archivo:
+        return etree.fromstring(archivo.read(archivo.namelist()[0]))
+
+
+class ClienteLote(ClienteSIFEN):
+    """
+    Cliente asíncrono de siRecepLoteDE (recepción de lotes de hasta 50 DE).
+
+    Cada lote enviado queda registrado en `lotes`, indexado por su número
+    correlativo, con los CDC que contiene y el dProtConsLote asignado por
+    SIFEN para consultarlo luego.
+
+    Ejemplo:
+        async with ClienteLote(ambiente="test") as cliente:
+            lotes = await cliente.enviar_lotes(documentos_firmados)
+            protocolos = [lote.protocolo for lote in lotes if lote.recibido]
+    """
+
+    def __init__(self, *args, concurrencia: Optional[int] = None, ruta: str = RUTA_RECEPCION_LOTE, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.ruta = ruta
+        self.concurrencia = concurrencia or self.pool.max_conexiones
+        self.lotes: Dict[int, Lote] = {}
+        self._numeros = itertools.count(1)
+
+    async def enviar_lote(self, documentos: List[Documento]) -> Lote:
+        """
+        Empaqueta y envía un lote. Los errores de comunicación se informan
+        en Lote.error; un lote rechazado por SIFEN queda con su dCodRes.
+        """
+        return await self._enviar(self._registrar(documentos), documentos)
+
+    def _registrar(self, documentos: List[Documento]) -> Lote:
+        lote = Lote(numero=next(self._numeros), cdcs=[cdc_de(doc) for doc in documentos])
+        self.lotes[lote.numero] = lote
+        return lote
+
+    async def _enviar(self, lote: Lote, documentos: List[Documento]) -> Lote:
+        xde = empaquetar_lote(documentos)
+
+        lote.d_id = self.nuevo_id()
+        mensaje = etree.Element(sifen("rEnvioLote"), nsmap={None: SIFEN_NS})
+        etree.SubElement(mensaje, sifen("dId")).text = lote.d_id
+        etree.SubElement(mensaje, sifen("xDE")).text = xde
+
+        try:
+            respuesta = await self.llamar(self.ruta, mensaje)
+        except Exception as e:
+            lote.error = f"{type(e).__name__}: {str(e)}"
+            lote.excepcion = e
+            return lote
+
+        lote.fecha_proceso = respuesta.findtext(sifen("dFecProc"))
+        lote.codigo = respuesta.findtext(sifen("dCodRes"))
+        lote.mensaje = respuesta.findtext(sifen("dMsgRes"))
+        lote.protocolo = respuesta.findtext(sifen("dProtConsLote"))
+        tiempo = respuesta.findtext(sifen("dTpoProces"))
+        lote.tiempo_proceso = int(tiempo) if tiempo else None
+        return lote
+
+    async def enviar_lotes(
+        self, documentos: Iterable[Documento], tamano_lote: int = MAX_DES_POR_LOTE
+    ) -> List[Lote]:
+        """
+        Agrupa los documentos en lotes de `tamano_lote` y los envía en
+        paralelo (hasta `concurrencia` a la vez). Devuelve los lotes en el
+        orden de los documentos.
+        """
+        semaforo = asyncio.Semaphore(self.concurrencia)
+
+        async def enviar(grupo):
+            lote = self._registrar(grupo)
+            async with semaforo:
+                return await self._enviar(lote, grupo)
+
+        return await asyncio.gather(*(enviar(grupo) for grupo in agrupar(documentos, tamano_lote)))
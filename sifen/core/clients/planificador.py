@@ -0,0 +1,191 @@
+import asyncio
+import heapq
+import inspect
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Union
+
+from sifen.core.clients.consulta_lote import ClienteConsultaLote, EstadoLote
+from sifen.core.clients.respuestas import ResultadoDE
+
+logger = logging.getLogger(__name__)
+
+Callback = Callable[..., Union[None, Awaitable[None]]]
+
+
+@dataclass
+class LotePendiente:
+    protocolo: str                      # dProtConsLote
+    cdcs: List[str] = field(default_factory=list)
+    intentos: int = 0
+    ultimo_error: Optional[str] = None
+
+
+class PlanificadorConsultas:
+    """
+    Consulta periódicamente muchos lotes pendientes hasta conocer su
+    resultado, sin saturar siConsLote.
+
+    Cada lote se vuelve a consultar con espera exponencial con jitter
+    (espera_inicial * factor^intentos, hasta espera_maxima, multiplicada por
+    un azar en [1 - jitter, 1 + jitter]) mientras SIFEN lo informe en
+    procesamiento o falle la comunicación. Los lotes esperan en un heap
+    ordenado por próximo intento, por lo que miles de lotes no implican
+    miles de tareas; nunca hay más de `max_concurrencia` consultas en vuelo.
+
+    Los resultados de cada DE se leen de forma incremental y se entregan
+    apenas llegan, a `al_resultado(ResultadoDE)` y a la cola de eventos que
+    recorre `resultados()`. Un lote que termina sin resultados por DE
+    (inexistente, extemporáneo o sin más reintentos) se informa a
+    `al_error(LotePendiente, EstadoLote | None)`. Ambos callbacks pueden
+    ser funciones o corrutinas.
+
+    Ejemplo:
+        planificador = PlanificadorConsultas(cliente, al_resultado=guardar)
+        for lote in lotes_enviados:
+            planificador.agregar(lote.protocolo, lote.cdcs)
+        await planificador.ejecutar()
+    """
+
+    def __init__(
+        self,
+        cliente: ClienteConsultaLote,
+        al_resultado: Optional[Callback] = None,
+        al_error: Optional[Callback] = None,
+        max_concurrencia: int = 8,
+        espera_inicial: float = 2.0,
+        espera_maxima: float = 120.0,
+        factor: float = 2.0,
+        jitter: float = 0.25,
+        max_intentos: Optional[int] = 30,
+        azar: Optional[random.Random] = None,
+    ):
+        self.cliente = cliente
+        self.al_resultado = al_resultado
+        self.al_error = al_error
+        self.max_concurrencia = max_concurrencia
+        self.espera_inicial = espera_inicial
+        self.espera_maxima = espera_maxima
+        self.factor = factor
+        self.jitter = jitter
+        self.max_intentos = max_intentos
+        self.azar = azar or random.Random()
+        self.pendientes: Dict[str, LotePendiente] = {}
+        self.consultas = 0
+        self._agenda: List[tuple] = []
+        self._cambios = asyncio.Event()
+        self._eventos: Optional[asyncio.Queue] = None
+
+    def agregar(self, protocolo: str, cdcs: Optional[List[str]] = None, espera: Optional[float] = None):
+        """
+        Empieza a seguir un lote. La primera consulta es tras `espera`
+        segundos (por defecto espera_inicial, con jitter).
+        """
+        protocolo = str(protocolo)
+        if protocolo in self.pendientes:
+            return
+        self.pendientes[protocolo] = LotePendiente(protocolo, list(cdcs or []))
+        self._agendar(protocolo, self.proxima_espera(0) if espera is None else espera)
+
+    def _agendar(self, protocolo: str, espera: float):
+        heapq.heappush(self._agenda, (time.monotonic() + espera, protocolo))
+        self._cambios.set()
+
+    def proxima_espera(self, intentos: int) -> float:
+        base = min(self.espera_maxima, self.espera_inicial * self.factor ** intentos)
+        return base * self.azar.uniform(1 - self.jitter, 1 + self.jitter)
+
+    async def ejecutar(self):
+        """Consulta hasta que no quede ningún lote pendiente."""
+        semaforo = asyncio.Semaphore(self.max_concurrencia)
+        tareas = set()
+
+        while self._agenda or tareas:
+            self._cambios.clear()
+            espera = self._agenda[0][0] - time.monotonic() if self._agenda else None
+
+            if espera is not None and espera <= 0:
+                _, protocolo = heapq.heappop(self._agenda)
+                await semaforo.acquire()
+                tarea = asyncio.create_task(self._consultar(protocolo))
+                tareas.add(tarea)
+                tarea.add_done_callback(lambda t: (tareas.discard(t), semaforo.release()))
+                continue
+
+            # Esperar al próximo vencimiento, a que termine una consulta o a
+            # que se agregue o reagende un lote
+            cambio = asyncio.create_task(self._cambios.wait())
+            await asyncio.wait(tareas | {cambio}, timeout=espera, return_when=asyncio.FIRST_COMPLETED)
+            cambio.cancel()
+
+        if self._eventos is not None:
+            await self._eventos.put(None)
+
+    async def resultados(self) -> AsyncIterator[ResultadoDE]:
+        """
+        Ejecuta el planificador y entrega cada ResultadoDE a medida que
+        llega, además de llamar a al_resultado.
+        """
+        self._eventos = asyncio.Queue()
+        ejecucion = asyncio.create_task(self.ejecutar())
+        try:
+            while True:
+                resultado = await self._eventos.get()
+                if resultado is None:
+                    break
+                yield resultado
+            await ejecucion
+        finally:
+            ejecucion.cancel()
+            self._eventos = None
+
+    async def _consultar(self, protocolo: str):
+        lote = self.pendientes[protocolo]
+        lote.intentos += 1
+        self.consultas += 1
+        try:
+            estado, resultados = await self.cliente.consultar(protocolo)
+        except Exception as e:
+            logger.warning("Error consultando el lote %s: %s", protocolo, e)
+            await self._reintentar(lote, None, f"{type(e).__name__}: {str(e)}")
+            return
+        if estado.en_proceso:
+            await self._reintentar(lote, estado, None)
+            return
+
+        del self.pendientes[protocolo]
+        entregados = 0
+        ilegible = False
+        try:
+            for resultado in resultados:
+                entregados += 1
+                await self._emitir(self.al_resultado, resultado)
+                if self._eventos is not None:
+                    await self._eventos.put(resultado)
+        except Exception as e:
+            logger.error("Respuesta ilegible del lote %s: %s", protocolo, e)
+            lote.ultimo_error = f"{type(e).__name__}: {str(e)}"
+            ilegible = True
+        if ilegible or not entregados:
+            await self._emitir(self.al_error, lote, estado)
+
+    async def _reintentar(self, lote: LotePendiente, estado: Optional[EstadoLote], error: Optional[str]):
+        lote.ultimo_error = error
+        if self.max_intentos is not None and lote.intentos >= self.max_intentos:
+            del self.pendientes[lote.protocolo]
+            await self._emitir(self.al_error, lote, estado)
+            return
+        self._agendar(lote.protocolo, self.proxima_espera(lote.intentos))
+
+    @staticmethod
+    async def _emitir(callback: Optional[Callback], *args):
+        if callback is None:
+            return
+        try:
+            resultado = callback(*args)
+            if inspect.isawaitable(resultado):
+                await resultado
+        except Exception:
+            logger.exception("Error en el callback %r", callback)
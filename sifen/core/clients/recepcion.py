@@ -0,0 +1,99 @@
+import asyncio
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Tuple, Union
+
+from lxml import etree
+
+from sifen.core.clients.base import ClienteSIFEN
+from sifen.core.clients.soap import SIFEN_NS, sifen
+
+RUTA_RECEPCION = "/de/ws/sync/recibe.wsdl"
+
+
+@dataclass
+class RespuestaRecepcion:
+    """Contenido de rProtDe devuelto por siRecepDE."""
+    cdc: Optional[str]                # Id del DE procesado
+    fecha_proceso: Optional[str]      # dFecProc
+    estado: Optional[str]             # dEstRes (Aprobado, Aprobado con observación, Rechazado)
+    protocolo: Optional[str] = None   # dProtAut
+    resultados: List[Tuple[str, str]] = field(default_factory=list)  # (dCodRes, dMsgRes)
+    xml: Optional[bytes] = None       # rRetEnviDe tal como llegó
+
+    @property
+    def aprobado(self) -> bool:
+        return bool(self.estado) and self.estado.startswith("Aprobado")
+
+
+def armar_renvide(d_id: str, rde: Union[bytes, etree._Element]) -> etree._Element:
+    """
+    Mensaje rEnviDe con el rDE firmado dentro de xDE. Si se recibe un
+    elemento se inserta una copia, para no mover el original de su árbol.
+    """
+    rde = etree.fromstring(rde) if isinstance(rde, bytes) else deepcopy(rde)
+    mensaje = etree.Element(sifen("rEnviDe"), nsmap={None: SIFEN_NS})
+    etree.SubElement(mensaje, sifen("dId")).text = d_id
+    etree.SubElement(mensaje, sifen("xDE")).append(rde)
+    return mensaje
+
+
+def leer_rprotde(prot: etree._Element) -> RespuestaRecepcion:
+    return RespuestaRecepcion(
+        cdc=prot.findtext(sifen("Id")),
+        fecha_proceso=prot.findtext(sifen("dFecProc")),
+        estado=prot.findtext(sifen("dEstRes")),
+        protocolo=prot.findtext(sifen("dProtAut")),
+        resultados=[
+            (g.findtext(sifen("dCodRes")), g.findtext(sifen("dMsgRes")))
+            for g in prot.iterfind(sifen("gResProc"))
+        ],
+    )
+
+
+class ClienteRecepcion(ClienteSIFEN):
+    """
+    Cliente asíncrono del servicio siRecepDE (recepción sincrónica de un DE).
+
+    Comparte las conexiones TLS entre envíos gracias al pool de
+    ClienteSIFEN; `concurrencia` limita cuántos envíos de enviar_muchos
+    están en vuelo a la vez (por defecto, tantos como conexiones).
+
+    Ejemplo:
+        async with ClienteRecepcion(ambiente="test", max_conexiones=8) as cliente:
+            respuestas = await cliente.enviar_muchos(documentos_firmados)
+    """
+
+    def __init__(self, *args, concurrencia: Optional[int] = None, ruta: str = RUTA_RECEPCION, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.ruta = ruta
+        self.concurrencia = concurrencia or self.pool.max_conexiones
+
+    async def enviar(self, rde: Union[bytes, etree._Element], d_id: Optional[str] = None) -> RespuestaRecepcion:
+        """
+        Envía un rDE firmado y devuelve el protocolo de procesamiento.
+
+        Raises:
+            ErrorSOAP: Si SIFEN responde con un soap:Fault.
+            ErrorHTTP: Si la respuesta no es un sobre SOAP.
+        """
+        respuesta = await self.llamar(self.ruta, armar_renvide(d_id or self.nuevo_id(), rde))
+        prot = respuesta.find(sifen("rProtDe"))
+        resultado = leer_rprotde(prot if prot is not None else respuesta)
+        resultado.xml = etree.tostring(respuesta)
+        return resultado
+
+    async def enviar_muchos(
+        self, documentos: Iterable[Union[bytes, etree._Element]]
+    ) -> List[Union[RespuestaRecepcion, Exception]]:
+        """
+        Envía varios rDE en paralelo. Devuelve un resultado por documento y
+        en el mismo orden; un envío fallido aparece como su excepción.
+        """
+        semaforo = asyncio.Semaphore(self.concurrencia)
+
+        async def enviar_uno(rde):
+            async with semaforo:
+                return await self.enviar(rde)
+
+        return await asyncio.gather(*(enviar_uno(rde) for rde in documentos), return_exceptions=True)
@@ -0,0 +1,130 @@
+import io
+from dataclasses import dataclass, field
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
+
+from lxml import etree
+
+from sifen.core.clients.soap import sifen
+from sifen.core.validators.registro_esquemas import registro
+
+# Elementos con el resultado de un DE: rProtDe (siRecepDE, rResEnviLoteDe)
+# y gResProcLote (siConsLote)
+TAG_RPROTDE = sifen("rProtDe")
+TAG_GRESPROCLOTE = sifen("gResProcLote")
+
+_ID_PROT = sifen("Id")
+_ID_LOTE = sifen("id")
+_EST_RES = sifen("dEstRes")
+_PROT_AUT = sifen("dProtAut")
+_RES_PROC = sifen("gResProc")
+_COD_RES = sifen("dCodRes")
+_MSG_RES = sifen("dMsgRes")
+_FEC_PROC = sifen("dFecProc")
+_DIG_VAL = sifen("dDigVal")
+
+Fuente = Union[bytes, str, BinaryIO]
+
+
+@dataclass
+class ResultadoDE:
+    """Resultado del procesamiento de un DE (rProtDe o gResProcLote)."""
+    cdc: Optional[str]                      # Id / id
+    estado: Optional[str]                   # dEstRes
+    protocolo: Optional[str] = None         # dProtAut
+    resultados: List[Tuple[str, str]] = field(default_factory=list)  # (dCodRes, dMsgRes)
+    fecha_proceso: Optional[str] = None     # dFecProc (solo rProtDe)
+    digest: Optional[str] = None            # dDigVal (solo rProtDe)
+    lote: Optional[str] = None              # dProtConsLote consultado
+
+    @property
+    def aprobado(self) -> bool:
+        return bool(self.estado) and self.estado.startswith("Aprobado")
+
+    @property
+    def codigos(self) -> List[str]:
+        return [codigo for codigo, _ in self.resultados]
+
+
+def abrir_fuente(xml: Fuente):
+    """iterparse acepta rutas y archivos; los bytes se envuelven."""
+    return io.BytesIO(xml) if isinstance(xml, bytes) else xml
+
+
+def leer_resultado(
+    elemento: etree._Element, lote: Optional[str] = None, validar: bool = False
+) -> ResultadoDE:
+    """
+    Convierte un rProtDe o gResProcLote en ResultadoDE.
+
+    Args:
+        elemento: Elemento completo (evento "end" de iterparse o ya parseado).
+        lote: dProtConsLote al que pertenece, si se conoce.
+        validar: Valida el elemento contra su esquema (protProcesDE_v150.xsd
+            para rProtDe, WS_SiConsLote_v141.xsd para gResProcLote).
+
+    Raises:
+        etree.DocumentInvalid: Si `validar` y el elemento no es válido.
+    """
+    if validar:
+        registro.validar(elemento, "rProtDe" if elemento.tag == TAG_RPROTDE else "gResProcLote")
+
+    cdc = estado = protocolo = fecha = digest = None
+    resultados = []
+    for hijo in elemento:
+        tag = hijo.tag
+        if tag == _ID_PROT or tag == _ID_LOTE:
+            cdc = hijo.text
+        elif tag == _EST_RES:
+            estado = hijo.text
+        elif tag == _PROT_AUT:
+            protocolo = hijo.text
+        elif tag == _RES_PROC:
+            resultados.append((hijo.findtext(_COD_RES), hijo.findtext(_MSG_RES)))
+        elif tag == _FEC_PROC:
+            fecha = hijo.text
+        elif tag == _DIG_VAL:
+            digest = hijo.text
+    return ResultadoDE(
+        cdc=cdc,
+        estado=estado,
+        protocolo=protocolo,
+        resultados=resultados,
+        fecha_proceso=fecha,
+        digest=digest,
+        lote=lote,
+    )
+
+
+def liberar_elemento(elemento: etree._Element):
+    """Descarta el elemento ya leído y los hermanos anteriores."""
+    elemento.clear(keep_tail=True)
+    padre = elemento.getparent()
+    if padre is not None:
+        while elemento.getprevious() is not None:
+            del padre[0]
+
+
+def iterar_resultados(
+    xml: Fuente, lote: Optional[str] = None, validar: bool = False
+) -> Iterator[ResultadoDE]:
+    """
+    Recorre una respuesta de SIFEN (sobre SOAP completo o solo el cuerpo) y
+    entrega un ResultadoDE por cada rProtDe o gResProcLote que contenga.
+
+    El XML se lee con iterparse: cada resultado se convierte apenas se
+    cierra su elemento y luego se descarta, por lo que la memoria no crece
+    con la cantidad de DE ni con la longitud de sus listas de errores.
+
+    Args:
+        xml: Respuesta en bytes, ruta a un archivo o archivo binario abierto.
+        lote: dProtConsLote a registrar en cada resultado.
+        validar: Valida cada resultado contra su esquema XSD.
+
+    Raises:
+        etree.XMLSyntaxError: Si el XML está mal formado.
+        etree.DocumentInvalid: Si `validar` y algún resultado no es válido.
+    """
+    for _, elemento in etree.iterparse(abrir_fuente(xml), events=("end",), tag=(TAG_RPROTDE, TAG_GRESPROCLOTE)):
+        resultado = leer_resultado(elemento, lote, validar)
+        liberar_elemento(elemento)
+        yield resultado
@@ -0,0 +1,56 @@
+from typing import Optional
+
+from lxml import etree
+
+SOAP_NS = "http://www.w3.org/2003/05/soap-envelope"
+SIFEN_NS = "http://ekuatia.set.gov.py/sifen/xsd"
+CONTENT_TYPE = "application/soap+xml; charset=utf-8"
+
+_SOBRE = "{%s}Envelope" % SOAP_NS
+_CUERPO = "{%s}Body" % SOAP_NS
+_FALLA = "{%s}Fault" % SOAP_NS
+
+
+class ErrorSOAP(Exception):
+    """El servicio respondió con un soap:Fault o con un sobre inválido."""
+
+    def __init__(self, mensaje: str, codigo: Optional[str] = None):
+        super().__init__(mensaje)
+        self.codigo = codigo
+
+
+def armar_sobre(contenido: etree._Element) -> bytes:
+    """Envuelve `contenido` en un sobre SOAP 1.2 y lo serializa."""
+    sobre = etree.Element(_SOBRE, nsmap={"soap": SOAP_NS})
+    etree.SubElement(sobre, "{%s}Header" % SOAP_NS)
+    etree.SubElement(sobre, _CUERPO).append(contenido)
+    return etree.tostring(sobre, encoding="utf-8", xml_declaration=True)
+
+
+def leer_sobre(xml: bytes) -> etree._Element:
+    """
+    Devuelve el primer elemento dentro de soap:Body.
+
+    Raises:
+        ErrorSOAP: Si el sobre no es válido o contiene un soap:Fault.
+    """
+    try:
+        sobre = etree.fromstring(xml)
+    except etree.XMLSyntaxError as e:
+        raise ErrorSOAP(f"Respuesta SOAP ilegible: {str(e)}")
+
+    cuerpo = sobre.find(_CUERPO) if sobre.tag == _SOBRE else None
+    contenido = cuerpo[0] if cuerpo is not None and len(cuerpo) else None
+    if contenido is None:
+        raise ErrorSOAP("Respuesta sin soap:Body")
+
+    if contenido.tag == _FALLA:
+        codigo = contenido.findtext(".//{%s}Value" % SOAP_NS)
+        motivo = contenido.findtext(".//{%s}Text" % SOAP_NS) or "soap:Fault"
+        raise ErrorSOAP(motivo, codigo)
+    return contenido
+
+
+def sifen(tag: str) -> str:
+    """Nombre calificado en el namespace de SIFEN."""
+    return "{%s}%s" % (SIFEN_NS, tag)
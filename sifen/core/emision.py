@@ -0,0 +1,196 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from lxml import etree
+
+from sifen.core.builders.xml_builder import SIFEN_NS, XMLBuilder
+from sifen.core.signers.almacen_claves import AlmacenClaves, almacen_por_defecto
+from sifen.core.signers.qr import ServicioQR
+from sifen.core.signers.signer import firmar_xml, serializar_xml
+from sifen.core.validators.registro_esquemas import precargar_esquemas
+from sifen.core.validators.validator import validar_xml
+from sifen.models.factura import Factura
+
+
+@dataclass
+class ResultadoEmision:
+    """Resultado de emitir una factura dentro de un lote."""
+    indice: int                  # Posición de la factura en la entrada
+    cdc: Optional[str] = None    # Id del DE firmado
+    xml: Optional[bytes] = None  # rDE firmado serializado
+    error: Optional[str] = None  # Mensaje si la emisión falló
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def emitir_arbol(
+    factura: Factura,
+    almacen: Optional[AlmacenClaves] = None,
+    validar: bool = True,
+    servicio_qr: Optional[ServicioQR] = None,
+    backend: Optional[str] = None,
+) -> etree._Element:
+    """
+    Construye, firma y valida la factura trabajando siempre sobre el mismo
+    árbol lxml, sin serializar ni volver a parsear entre etapas.
+
+    Args:
+        factura: Factura a emitir.
+        almacen: Almacén de claves para la firma (por defecto el del proceso).
+        validar: Si es True se valida el rDE firmado contra siRecepDE.
+        servicio_qr: ServicioQR con el CSC del emisor (ver firmar_xml).
+        backend: Backend de firma (ver firmar_xml).
+
+    Returns:
+        etree._Element: rDE firmado.
+
+    Raises:
+        ValueError: Si el documento firmado no es válido según el XSD.
+    """
+    root = XMLBuilder.build_tree(factura)
+    firmar_xml(root, almacen, servicio_qr, backend)
+
+    if validar:
+        es_valido, mensaje = validar_xml(root)
+        if not es_valido:
+            raise ValueError(mensaje)
+    return root
+
+
+def emitir_factura(
+    factura: Factura,
+    almacen: Optional[AlmacenClaves] = None,
+    validar: bool = True,
+    servicio_qr: Optional[ServicioQR] = None,
+    backend: Optional[str] = None,
+) -> bytes:
+    """
+    Igual que emitir_arbol, pero devuelve el rDE firmado serializado una
+    única vez al final.
+    """
+    return serializar_xml(emitir_arbol(factura, almacen, validar, servicio_qr, backend))
+
+
+# Almacén de claves y ServicioQR propios de cada proceso del pool (ver _iniciar_worker)
+_almacen_worker: Optional[AlmacenClaves] = None
+_servicio_qr_worker: Optional[ServicioQR] = None
+
+
+def _iniciar_worker(almacen: AlmacenClaves, validar: bool, servicio_qr: Optional[ServicioQR]):
+    """Deja el esquema compilado, la clave cargada y el ServicioQR armado al arrancar el worker."""
+    global _almacen_worker, _servicio_qr_worker
+    if validar:
+        precargar_esquemas("siRecepDE")
+    # El almacén llega con su mismo tipo (PEM o PKCS#12) y configuración
+    _almacen_worker = almacen
+    _almacen_worker.precargar()
+    _servicio_qr_worker = servicio_qr
+
+
+def _emitir_uno(
+    indice: int,
+    factura: Factura,
+    almacen: Optional[AlmacenClaves],
+    validar: bool,
+    backend: Optional[str] = None,
+    servicio_qr: Optional[ServicioQR] = None,
+) -> ResultadoEmision:
+    try:
+        root = emitir_arbol(factura, almacen, validar, servicio_qr, backend)
+        cdc = root.find("{%s}DE" % SIFEN_NS).get("Id")
+        return ResultadoEmision(indice=indice, cdc=cdc, xml=serializar_xml(root))
+    except Exception as e:
+        return ResultadoEmision(indice=indice, error=f"{type(e).__name__}: {str(e)}")
+
+
+def _emitir_bloque(bloque: List[Tuple[int, Factura]], validar: bool, backend: Optional[str]) -> List[ResultadoEmision]:
+    return [
+        _emitir_uno(indice, factura, _almacen_worker, validar, backend, _servicio_qr_worker)
+        for indice, factura in bloque
+    ]
+
+
+def emitir_lote(
+    facturas: Iterable[Factura],
+    workers: Optional[int] = None,
+    almacen: Optional[AlmacenClaves] = None,
+    validar: bool = True,
+    tamano_bloque: int = 16,
+    bloques_en_vuelo: Optional[int] = None,
+    mp_context=None,
+    backend: Optional[str] = None,
+    servicio_qr: Optional[ServicioQR] = None,
+) -> Iterator[ResultadoEmision]:
+    """
+    Emite muchas facturas repartiéndolas entre varios procesos.
+
+    Las facturas se envían a los workers en bloques de `tamano_bloque`; cada
+    worker compila el esquema y carga la clave una sola vez al arrancar. Los
+    resultados se devuelven a medida que están listos pero siempre en el
+    orden de entrada. Un error en una factura se informa en su
+    ResultadoEmision y no interrumpe el lote.
+
+    Args:
+        facturas: Facturas a emitir; puede ser un generador.
+        workers: Cantidad de procesos (por defecto, uno por CPU). Con 1 se
+            emite en el proceso actual, sin pool.
+        almacen: Almacén cuyo par clave/certificado usarán los workers (por
+            defecto el del proceso); cada worker recibe una copia del mismo
+            tipo, p. ej. un AlmacenPKCS12, y carga el par al arrancar.
+        validar: Si es True cada rDE firmado se valida contra siRecepDE.
+        tamano_bloque: Facturas por tarea enviada a un worker.
+        bloques_en_vuelo: Máximo de bloques pendientes a la vez; limita la
+            memoria cuando la entrada es muy grande (por defecto 2 por worker).
+        mp_context: Contexto de multiprocessing para el pool.
+        backend: Backend de firma (ver firmar_xml).
+        servicio_qr: ServicioQR con el CSC del emisor (ver firmar_xml); cada
+            worker recibe su propia copia al arrancar.
+
+    Yields:
+        ResultadoEmision, uno por factura y en el mismo orden.
+    """
+    almacen = almacen or almacen_por_defecto()
+    entrada = enumerate(facturas)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        for indice, factura in entrada:
+            yield _emitir_uno(indice, factura, almacen, validar, backend, servicio_qr)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=_iniciar_worker,
+        initargs=(almacen, validar, servicio_qr),
+    ) as pool:
+        limite = bloques_en_vuelo or 2 * workers
+        pendientes = deque()
+
+        def enviar_siguiente():
+            bloque = list(islice(entrada, tamano_bloque))
+            if bloque:
+                indices = [indice for indice, _ in bloque]
+                pendientes.append((indices, pool.submit(_emitir_bloque, bloque, validar, backend)))
+            return bool(bloque)
+
+        while len(pendientes) < limite and enviar_siguiente():
+            pass
+
+        while pendientes:
+            indices, futuro = pendientes.popleft()
+            try:
+                resultados = futuro.result()
+            except Exception as e:
+                # El bloque entero falló (p. ej. una factura no serializable
+                # o un worker caído): se informa en cada una de sus facturas.
+                error = f"{type(e).__name__}: {str(e)}"
+                resultados = [ResultadoEmision(indice=indice, error=error) for indice in indices]
+            enviar_siguiente()
+            yield from resultados
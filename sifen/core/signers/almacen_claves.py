@@ -0,0 +1,213 @@
+import os
+import ssl
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.serialization import pkcs12
+
+from sifen.core.clients.http import crear_contexto_ssl
+
+try:
+    import xmlsec
+except ImportError:  # Sin xmlsec se firma con el backend de Python puro
+    xmlsec = None
+
+CERT_DIR = os.path.join(os.path.dirname(__file__), "cert")
+KEY_PATH = os.path.join(CERT_DIR, "key.pem")
+CERT_PATH = os.path.join(CERT_DIR, "cert.pem")
+
+
+@dataclass
+class ParClaves:
+    """Clave privada y certificado ya cargados en memoria."""
+    key_path: str
+    cert_path: str
+    key_pem: bytes
+    cert_pem: bytes
+    clave: Optional["xmlsec.Key"]  # None si xmlsec no está instalado
+    mtime_key: float
+    mtime_cert: float
+    verificado: float = 0.0
+    derivados: Dict[str, Any] = field(default_factory=dict)  # Material precalculado por backend de firma
+    vence: Optional[datetime] = None  # Fin de validez del certificado (UTC)
+
+
+class AlmacenClaves:
+    """
+    Mantiene en memoria los pares clave/certificado usados para firmar.
+
+    Cada par se lee y parsea una sola vez; en los usos siguientes solo se
+    compara el mtime de los archivos y se recarga si cambiaron (por ejemplo,
+    al renovar el certificado). Es seguro compartirlo entre hilos; al
+    pasarlo a otro proceso se copia solo la configuración y el par se
+    vuelve a leer allá.
+
+    Args:
+        key_path: Clave privada PEM por defecto.
+        cert_path: Certificado PEM por defecto.
+        password: Contraseña de la clave privada, si la tiene.
+        intervalo_verificacion: Segundos entre comprobaciones de mtime de un
+            mismo par. Con 0 se comprueba en cada firma.
+    """
+
+    def __init__(
+        self,
+        key_path: str = KEY_PATH,
+        cert_path: str = CERT_PATH,
+        password: Optional[str] = None,
+        intervalo_verificacion: float = 1.0,
+    ):
+        self.key_path = key_path
+        self.cert_path = cert_path
+        self.password = password
+        self.intervalo_verificacion = intervalo_verificacion
+        self._pares: Dict[Tuple[str, str], ParClaves] = {}
+        self._lock = threading.Lock()
+        self.cargas = 0
+
+    def __reduce__(self):
+        return (type(self), (self.key_path, self.cert_path, self.password, self.intervalo_verificacion))
+
+    def obtener_par(self, key_path: Optional[str] = None, cert_path: Optional[str] = None) -> ParClaves:
+        """Devuelve el par cargado, leyéndolo del disco solo si hace falta."""
+        clave = (key_path or self.key_path, cert_path or self.cert_path)
+        par = self._pares.get(clave)
+        ahora = time.monotonic()
+
+        if par is not None and ahora - par.verificado < self.intervalo_verificacion:
+            return par
+
+        with self._lock:
+            par = self._pares.get(clave)
+            mtime_key = os.stat(clave[0]).st_mtime
+            mtime_cert = os.stat(clave[1]).st_mtime
+            if par is None or par.mtime_key != mtime_key or par.mtime_cert != mtime_cert:
+                par = self._cargar(clave[0], clave[1], mtime_key, mtime_cert)
+                self._pares[clave] = par
+            par.verificado = ahora
+        return par
+
+    def obtener_clave(self, key_path: Optional[str] = None, cert_path: Optional[str] = None) -> "xmlsec.Key":
+        """Devuelve la xmlsec.Key (con su certificado) lista para firmar."""
+        return self.obtener_par(key_path, cert_path).clave
+
+    def precargar(self):
+        """Carga el par por defecto; pensado para el arranque de un worker."""
+        self.obtener_par()
+
+    def contexto_ssl(self, cafile: Optional[str] = None, verificar: bool = True) -> ssl.SSLContext:
+        """
+        Contexto TLS de cliente que presenta el par por defecto (TLS mutuo).
+
+        Se arma con la clave y el certificado ya cargados en memoria, no con
+        las rutas, así que sirve igual para un par PEM que para un PKCS#12:
+        ssl solo los lee de un archivo, que se escribe con permisos 0600 y
+        se borra apenas se cargan.
+
+        Args:
+            cafile: CAs adicionales para validar al servidor.
+            verificar: Ver crear_contexto_ssl.
+        """
+        par = self.obtener_par()
+        contexto = crear_contexto_ssl(cafile=cafile, verificar=verificar)
+        descriptor, ruta = tempfile.mkstemp(suffix=".pem")
+        try:
+            with os.fdopen(descriptor, "wb") as f:
+                f.write(par.key_pem + b"\n" + par.cert_pem)
+            contexto.load_cert_chain(ruta, password=self.password)
+        finally:
+            os.unlink(ruta)
+        return contexto
+
+    def invalidar(self):
+        """Descarta todos los pares; se releen en el próximo uso."""
+        with self._lock:
+            self._pares.clear()
+
+    def _leer(self, key_path: str, cert_path: str) -> Tuple[bytes, bytes]:
+        """Devuelve la clave y el certificado en PEM."""
+        with open(key_path, "rb") as f:
+            key_pem = f.read()
+        with open(cert_path, "rb") as f:
+            cert_pem = f.read()
+        return key_pem, cert_pem
+
+    def _cargar(self, key_path: str, cert_path: str, mtime_key: float, mtime_cert: float) -> ParClaves:
+        key_pem, cert_pem = self._leer(key_path, cert_path)
+
+        clave = None
+        if xmlsec is not None:
+            clave = xmlsec.Key.from_memory(key_pem, xmlsec.KeyFormat.PEM, self.password)
+            clave.load_cert_from_memory(cert_pem, xmlsec.KeyFormat.PEM)
+        self.cargas += 1
+
+        return ParClaves(
+            key_path=key_path,
+            cert_path=cert_path,
+            key_pem=key_pem,
+            cert_pem=cert_pem,
+            clave=clave,
+            mtime_key=mtime_key,
+            mtime_cert=mtime_cert,
+            vence=x509.load_pem_x509_certificate(cert_pem).not_valid_after_utc,
+        )
+
+
+class AlmacenPKCS12(AlmacenClaves):
+    """
+    AlmacenClaves para un par guardado en un archivo PKCS#12 (.p12/.pfx),
+    el formato en que suelen entregarse los certificados de firma.
+
+    La clave se descifra al cargar y se guarda en memoria como PEM sin
+    contraseña, de modo que los backends de firma y contexto_ssl la usan
+    igual que la de un par PEM; key_path y cert_path apuntan los dos al
+    archivo PKCS#12, así que no sirven para cargarlos como PEM. Se recarga
+    si cambia el mtime del archivo.
+
+    Args:
+        ruta: Archivo PKCS#12.
+        contrasena: Contraseña del archivo, si la tiene.
+        intervalo_verificacion: Ver AlmacenClaves.
+    """
+
+    def __init__(self, ruta: str, contrasena: Optional[str] = None, intervalo_verificacion: float = 1.0):
+        super().__init__(ruta, ruta, None, intervalo_verificacion)
+        self.contrasena = contrasena
+
+    def __reduce__(self):
+        return (type(self), (self.key_path, self.contrasena, self.intervalo_verificacion))
+
+    def _leer(self, key_path: str, cert_path: str) -> Tuple[bytes, bytes]:
+        with open(key_path, "rb") as f:
+            datos = f.read()
+        clave, certificado, _ = pkcs12.load_key_and_certificates(
+            datos, self.contrasena.encode("utf-8") if self.contrasena else None
+        )
+        if clave is None or certificado is None:
+            raise ValueError(f"El archivo {key_path} no tiene clave privada y certificado.")
+        key_pem = clave.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        return key_pem, certificado.public_bytes(serialization.Encoding.PEM)
+
+
+_almacen_por_defecto: Optional[AlmacenClaves] = None
+_almacen_lock = threading.Lock()
+
+
+def almacen_por_defecto() -> AlmacenClaves:
+    """Almacén compartido del proceso para el par cert/key.pem del módulo."""
+    global _almacen_por_defecto
+    if _almacen_por_defecto is None:
+        with _almacen_lock:
+            if _almacen_por_defecto is None:
+                _almacen_por_defecto = AlmacenClaves()
+    return _almacen_por_defecto
@@ -0,0 +1,93 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Union
+
+from lxml import etree
+
+from .almacen_claves import AlmacenClaves, almacen_por_defecto
+from .firmantes import Firmante, obtener_firmante
+from .qr import ServicioQR
+from .signer import firmar_xml
+
+Documento = Union[bytes, etree._Element]
+
+
+class Firmador:
+    """
+    Firma rDE desde varios hilos a la vez.
+
+    Una misma instancia se comparte entre todos los hilos del servidor:
+    el almacén de claves y el ServicioQR son seguros entre hilos, y el
+    firmante guarda por hilo su copia de la clave y su plantilla de
+    <Signature> (ver FirmanteXmlsec), así que ningún estado de xmlsec se
+    comparte entre hilos. Cada documento, en cambio, debe firmarlo un solo
+    hilo a la vez.
+
+    firmar_muchos reparte los documentos en un ThreadPoolExecutor propio:
+    xmlsec (y OpenSSL debajo) suelta el GIL mientras calcula el digest y
+    la firma RSA, que es casi todo el costo, así que con varios núcleos la
+    firma escala con los hilos sin recurrir a procesos.
+
+    Args:
+        almacen: Almacén de claves (por defecto el del proceso).
+        servicio_qr: ServicioQR con el CSC del emisor (ver firmar_xml).
+        backend: Backend de firma (ver firmar_xml).
+        hilos: Hilos de firmar_muchos (por defecto, uno por CPU).
+
+    Ejemplo:
+        with Firmador(hilos=8) as firmador:
+            firmados = firmador.firmar_muchos(arboles)
+    """
+
+    def __init__(
+        self,
+        almacen: Optional[AlmacenClaves] = None,
+        servicio_qr: Optional[ServicioQR] = None,
+        backend: Union[None, str, Firmante] = None,
+        hilos: Optional[int] = None,
+    ):
+        self.almacen = almacen or almacen_por_defecto()
+        self.servicio_qr = servicio_qr
+        self.firmante = obtener_firmante(backend)
+        self.hilos = hilos or os.cpu_count() or 1
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def firmar(self, documento: Documento) -> Documento:
+        """Igual que firmar_xml con la configuración del firmador."""
+        return firmar_xml(documento, self.almacen, self.servicio_qr, self.firmante)
+
+    def firmar_muchos(self, documentos: Iterable[Documento]) -> List[Documento]:
+        """
+        Firma los documentos repartiéndolos entre los hilos del firmador.
+
+        Returns:
+            Los documentos firmados, en el orden de entrada (bytes o
+            elementos, igual que firmar_xml).
+
+        Raises:
+            Exception: La primera falla de firma, en orden de entrada.
+        """
+        if self.hilos == 1:
+            return [self.firmar(documento) for documento in documentos]
+        return list(self._ejecutor().map(self.firmar, documentos))
+
+    def _ejecutor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.hilos, thread_name_prefix="firmador")
+            return self._pool
+
+    def cerrar(self):
+        """Termina los hilos de firmar_muchos."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def __enter__(self) -> "Firmador":
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
@@ -0,0 +1,259 @@
+import base64
+import copy
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from lxml import etree
+
+try:
+    import xmlsec
+except ImportError:  # Instalación sin la librería nativa: solo BACKEND_PYTHON
+    xmlsec = None
+
+from .almacen_claves import AlmacenClaves, ParClaves
+
+DS_NS = "http://www.w3.org/2000/09/xmldsig#"
+
+BACKEND_XMLSEC = "xmlsec"  # Plantilla y SignatureContext de xmlsec (libxmlsec1)
+BACKEND_PYTHON = "python"  # C14N de lxml y RSA-SHA256 de cryptography
+BACKEND_POR_DEFECTO = BACKEND_XMLSEC if xmlsec is not None else BACKEND_PYTHON
+
+# Base64 en líneas de 64 caracteres, como lo escribe xmlsec
+_ANCHO_BASE64 = 64
+
+
+class FirmanteXmlsec:
+    """
+    Firma el <DE> con xmlsec.
+
+    Cada hilo guarda su propia copia de la xmlsec.Key y una plantilla de
+    <Signature> ya armada que se copia por documento, en lugar de volver a
+    llamar a xmlsec.template. El SignatureContext sí es nuevo en cada
+    firma: xmlsec no permite firmar dos veces con el mismo contexto, y
+    crearlo sin asignarle la clave es casi gratis. Es seguro usar la misma
+    instancia desde varios hilos mientras cada documento sea de un solo
+    hilo; xmlsec suelta el GIL durante la firma.
+    """
+
+    def __init__(self):
+        self._hilo = threading.local()
+
+    def firmar(self, root: etree._Element, de_node: etree._Element, almacen: AlmacenClaves) -> etree._Element:
+        """
+        Agrega el <Signature> del DE a continuación del <DE>.
+
+        Returns:
+            etree._Element: El nodo <Signature> agregado.
+        """
+        if xmlsec is None:
+            raise RuntimeError("El backend de firma 'xmlsec' requiere el paquete xmlsec.")
+        estado = _estado_hilo(self._hilo, almacen.obtener_par(), self._preparar)
+
+        # Registrar atributo Id como tipo ID
+        xmlsec.tree.add_ids(root, ["Id"])
+
+        # Insertar la firma después de <DE>; al moverla al documento lxml
+        # reusa el prefijo de xmldsig del rDE si ya está declarado
+        signature_node = copy.deepcopy(estado.plantilla)
+        signature_node[0][2].set("URI", "#" + de_node.get("Id"))
+        de_node.addnext(signature_node)
+
+        ctx = xmlsec.SignatureContext()
+        ctx.key = estado.clave
+        ctx.sign(signature_node)
+        return signature_node
+
+    @staticmethod
+    def _preparar(par: ParClaves) -> "_EstadoXmlsec":
+        # Plantilla <Signature> (sin Id: en un rLoteDE se repetiría entre los
+        # rDE y el Id es de tipo xs:ID, que debe ser único en el documento)
+        plantilla = xmlsec.template.create(
+            etree.Element("rDE"),
+            xmlsec.Transform.EXCL_C14N,
+            xmlsec.Transform.RSA_SHA256,
+        )
+
+        # Referencia a <DE>; la URI se completa en cada documento
+        ref = xmlsec.template.add_reference(plantilla, xmlsec.Transform.SHA256, uri="#")
+        xmlsec.template.add_transform(ref, xmlsec.Transform.ENVELOPED)
+        xmlsec.template.add_transform(ref, xmlsec.Transform.EXCL_C14N)
+
+        key_info = xmlsec.template.ensure_key_info(plantilla)
+        xmlsec.template.add_x509_data(key_info)
+        return _EstadoXmlsec(par, copy.copy(par.clave), plantilla)
+
+
+@dataclass
+class _EstadoXmlsec:
+    """Estado de FirmanteXmlsec propio de un hilo."""
+    par: ParClaves         # Par del que se derivó (si el almacén lo recarga, se rearma)
+    clave: "xmlsec.Key"    # Copia de la clave y el certificado del par
+    plantilla: etree._Element
+
+
+def _estado_hilo(hilo: threading.local, par: ParClaves, preparar: Callable):
+    """Estado del hilo actual para `par`, armándolo si no existe o si el par cambió."""
+    estado = getattr(hilo, "estado", None)
+    if estado is None or estado.par is not par:
+        estado = hilo.estado = preparar(par)
+    return estado
+
+
+@dataclass
+class _Esqueleto:
+    """<Signature> prearmado para un prefijo de xmldsig."""
+    firma: etree._Element                    # <Signature> con el certificado, sin digest ni firma
+    signed_info: Tuple[bytes, bytes, bytes]  # SignedInfo canonizado, partido en la URI y el DigestValue
+
+
+@dataclass
+class _MaterialPython:
+    """Clave de cryptography y certificado derivados de un ParClaves."""
+    clave: object      # RSAPrivateKey (se puede usar desde varios hilos)
+    certificado: str   # DER del certificado en base64, en líneas de 64
+
+
+@dataclass
+class _EstadoPython:
+    """Estado de FirmantePython propio de un hilo."""
+    par: ParClaves
+    material: _MaterialPython
+    esqueletos: Dict[Optional[str], _Esqueleto]  # Por prefijo de xmldsig en el rDE
+
+
+class FirmantePython:
+    """
+    Firma el <DE> sin xmlsec: el DigestValue sale de la C14N exclusiva de
+    lxml y la SignatureValue de RSA-SHA256 (PKCS#1 v1.5) de cryptography.
+
+    Por cada par clave/certificado se arma una sola vez un <Signature> con
+    el KeyInfo completo (el certificado en base64 no cambia) y el SignedInfo
+    ya canonizado; en cada documento solo se completan la URI, el
+    DigestValue y la SignatureValue. El resultado es byte a byte el mismo
+    que el de FirmanteXmlsec.
+
+    La transformación enveloped-signature no cambia nada porque el
+    <Signature> es hermano del <DE>, no descendiente. Como en
+    FirmanteXmlsec, los esqueletos son propios de cada hilo.
+    """
+
+    def __init__(self):
+        self._hilo = threading.local()
+
+    def firmar(self, root: etree._Element, de_node: etree._Element, almacen: AlmacenClaves) -> etree._Element:
+        """
+        Agrega el <Signature> del DE a continuación del <DE>.
+
+        Returns:
+            etree._Element: El nodo <Signature> agregado.
+        """
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+
+        estado = _estado_hilo(
+            self._hilo,
+            almacen.obtener_par(),
+            lambda par: _EstadoPython(par, self._material(par, almacen.password), {}),
+        )
+        material = estado.material
+        # Mismo prefijo que usaría xmlsec: el de xmldsig si ya está declarado
+        prefijo = next((p for p, uri in (root.nsmap or {}).items() if uri == DS_NS), None)
+        esqueleto = estado.esqueletos.get(prefijo)
+        if esqueleto is None:
+            esqueleto = estado.esqueletos[prefijo] = _armar_esqueleto(prefijo, material.certificado)
+
+        uri = "#" + de_node.get("Id")
+        canonico = etree.tostring(de_node, method="c14n", exclusive=True)
+        digest = base64.b64encode(hashlib.sha256(canonico).digest()).decode("ascii")
+        antes, medio, despues = esqueleto.signed_info
+        signed_info = b"".join((antes, uri.encode("utf-8"), medio, digest.encode("ascii"), despues))
+        firma = material.clave.sign(signed_info, padding.PKCS1v15(), hashes.SHA256())
+
+        signature_node = copy.deepcopy(esqueleto.firma)
+        reference = signature_node[0][2]
+        reference.set("URI", uri)
+        reference[-1].text = digest
+        signature_node[1].text = _envolver(base64.b64encode(firma).decode("ascii"))
+        de_node.addnext(signature_node)
+        return signature_node
+
+    @staticmethod
+    def _material(par: ParClaves, password: Optional[str]) -> _MaterialPython:
+        # Se guarda en el par: si el almacén recarga los archivos, el par
+        # nuevo arranca sin material y se vuelve a derivar
+        material = par.derivados.get(BACKEND_PYTHON)
+        if material is None:
+            from cryptography import x509
+            from cryptography.hazmat.primitives import serialization
+
+            clave = serialization.load_pem_private_key(
+                par.key_pem, password.encode("utf-8") if password else None
+            )
+            der = x509.load_pem_x509_certificate(par.cert_pem).public_bytes(serialization.Encoding.DER)
+            material = _MaterialPython(clave, _envolver(base64.b64encode(der).decode("ascii")) + "\n")
+            par.derivados[BACKEND_PYTHON] = material
+        return material
+
+
+def _envolver(texto: str) -> str:
+    return "\n".join(texto[i:i + _ANCHO_BASE64] for i in range(0, len(texto), _ANCHO_BASE64))
+
+
+def _armar_esqueleto(prefijo: Optional[str], certificado: str) -> _Esqueleto:
+    """
+    Arma el <Signature> con la misma forma que la plantilla de xmlsec
+    (saltos de línea entre nodos incluidos) y canoniza su SignedInfo con
+    marcadores en la URI y el DigestValue.
+    """
+    p = f"{prefijo}:" if prefijo else ""
+    xmlns = f"xmlns:{prefijo}" if prefijo else "xmlns"
+    firma = etree.fromstring(
+        f'<{p}Signature {xmlns}="{DS_NS}">\n'
+        f'<{p}SignedInfo>\n'
+        f'<{p}CanonicalizationMethod Algorithm="http://www.w3.org/2001/10/xml-exc-c14n#"/>\n'
+        f'<{p}SignatureMethod Algorithm="http://www.w3.org/2001/04/xmldsig-more#rsa-sha256"/>\n'
+        f'<{p}Reference URI="@URI@">\n'
+        f'<{p}Transforms>\n'
+        f'<{p}Transform Algorithm="http://www.w3.org/2000/09/xmldsig#enveloped-signature"/>\n'
+        f'<{p}Transform Algorithm="http://www.w3.org/2001/10/xml-exc-c14n#"/>\n'
+        f'</{p}Transforms>\n'
+        f'<{p}DigestMethod Algorithm="http://www.w3.org/2001/04/xmlenc#sha256"/>\n'
+        f'<{p}DigestValue>@DIGEST@</{p}DigestValue>\n'
+        f'</{p}Reference>\n'
+        f'</{p}SignedInfo>\n'
+        f'<{p}SignatureValue/>\n'
+        f'<{p}KeyInfo>\n'
+        f'<{p}X509Data>\n'
+        f'<{p}X509Certificate>{certificado}</{p}X509Certificate>\n'
+        f'</{p}X509Data>\n'
+        f'</{p}KeyInfo>\n'
+        f'</{p}Signature>'
+    )
+    canonico = etree.tostring(firma[0], method="c14n", exclusive=True)
+    antes, resto = canonico.split(b"@URI@")
+    medio, despues = resto.split(b"@DIGEST@")
+    return _Esqueleto(firma, (antes, medio, despues))
+
+
+Firmante = Union[FirmanteXmlsec, FirmantePython]
+
+_FIRMANTES = {BACKEND_XMLSEC: FirmanteXmlsec(), BACKEND_PYTHON: FirmantePython()}
+
+
+def obtener_firmante(backend: Union[None, str, Firmante] = None) -> Firmante:
+    """
+    Devuelve el firmante del backend indicado (por defecto xmlsec si está
+    instalado, si no el de Python puro). Si se pasa un firmante ya creado
+    se devuelve tal cual.
+
+    Raises:
+        ValueError: Si el backend no existe.
+    """
+    if backend is not None and not isinstance(backend, str):
+        return backend
+    backend = backend or BACKEND_POR_DEFECTO
+    if backend not in _FIRMANTES:
+        raise ValueError(f"Backend de firma desconocido: {backend}")
+    return _FIRMANTES[backend]
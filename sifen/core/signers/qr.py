@@ -0,0 +1,187 @@
+import hashlib
+import hmac
+import threading
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Union
+
+from lxml import etree
+
+SIFEN_NS = "http://ekuatia.set.gov.py/sifen/xsd"
+DS_NS = "http://www.w3.org/2000/09/xmldsig#"
+
+URLS_QR = {
+    "test": "https://ekuatia.set.gov.py/consultas-test/qr?",
+    "prod": "https://ekuatia.set.gov.py/consultas/qr?",
+}
+
+# CSC de ejemplo con el que firmar_xml armaba siempre el dCarQR
+ID_CSC_PRUEBA = "0001"
+CSC_PRUEBA = "CLAVE_SECRETA_PROVISTA_POR_LA_SET"
+
+# Tags en notación Clark: se comparan directamente contra los hijos, sin
+# compilar una ruta con prefijos en cada documento
+_DE = "{%s}DE" % SIFEN_NS
+_G_DAT_GRAL_OPE = "{%s}gDatGralOpe" % SIFEN_NS
+_D_FE_EMI_DE = "{%s}dFeEmiDE" % SIFEN_NS
+_G_DAT_REC = "{%s}gDatRec" % SIFEN_NS
+_D_RUC_REC = "{%s}dRucRec" % SIFEN_NS
+_G_DTIP_DE = "{%s}gDtipDE" % SIFEN_NS
+_G_CAM_ITEM = "{%s}gCamItem" % SIFEN_NS
+_G_TOT_SUB = "{%s}gTotSub" % SIFEN_NS
+_D_TOT_GRAL_OPE = "{%s}dTotGralOpe" % SIFEN_NS
+_D_TOT_IVA = "{%s}dTotIVA" % SIFEN_NS
+_SIGNATURE = "{%s}Signature" % DS_NS
+_DIGEST_VALUE = "{%s}DigestValue" % DS_NS
+
+
+@dataclass
+class DatosQR:
+    """Campos del DE que entran en la cadena del dCarQR."""
+    id: str                       # CDC (atributo Id del DE)
+    fecha_emision: Optional[str]  # dFeEmiDE
+    ruc_receptor: Optional[str]   # dRucRec (None si el receptor no es contribuyente)
+    total: Optional[str]          # dTotGralOpe
+    total_iva: Optional[str]      # dTotIVA
+    items: int                    # Cantidad de gCamItem
+    digest: Optional[str]         # DigestValue de la firma del DE
+
+    @classmethod
+    def desde_arbol(cls, de: etree._Element, firma: Optional[etree._Element] = None) -> "DatosQR":
+        """
+        Toma los campos navegando por los hijos directos del <DE> ya
+        armado, sin rutas con prefijos, y el DigestValue del <Signature>
+        recién firmado.
+
+        Args:
+            de: Nodo <DE> (o el rDE que lo contiene).
+            firma: Nodo <Signature>; por defecto el hermano siguiente del DE.
+        """
+        if de.tag != _DE:
+            de = de.find(_DE)
+        gral = _hijo(de, _G_DAT_GRAL_OPE)
+        receptor = _hijo(gral, _G_DAT_REC)
+        detalle = _hijo(de, _G_DTIP_DE)
+        totales = _hijo(de, _G_TOT_SUB)
+        items = sum(1 for _ in detalle.iterchildren(_G_CAM_ITEM)) if detalle is not None else 0
+
+        if firma is None:
+            firma = de.getnext()
+        digest = None
+        if firma is not None and firma.tag == _SIGNATURE:
+            # SignedInfo/Reference/DigestValue: la primera coincidencia en
+            # orden de documento es la de la única referencia
+            digest = _texto(firma.iter(_DIGEST_VALUE))
+
+        return cls(
+            id=de.get("Id"),
+            fecha_emision=_texto_hijo(gral, _D_FE_EMI_DE),
+            ruc_receptor=_texto_hijo(receptor, _D_RUC_REC),
+            total=_texto_hijo(totales, _D_TOT_GRAL_OPE),
+            total_iva=_texto_hijo(totales, _D_TOT_IVA),
+            items=items,
+            digest=digest,
+        )
+
+
+def _hijo(padre: Optional[etree._Element], tag: str) -> Optional[etree._Element]:
+    """Primer hijo directo con ese tag (filtrado en C por lxml)."""
+    return next(padre.iterchildren(tag), None) if padre is not None else None
+
+
+def _texto(elementos) -> Optional[str]:
+    elemento = next(elementos, None)
+    return elemento.text if elemento is not None else None
+
+
+def _texto_hijo(padre: Optional[etree._Element], tag: str) -> Optional[str]:
+    return _texto(padre.iterchildren(tag)) if padre is not None else None
+
+
+class ServicioQR:
+    """
+    Arma el dCarQR de los DE de un emisor con su CSC.
+
+    El HMAC-SHA256 queda inicializado con el CSC una sola vez; cada
+    documento parte de una copia de ese estado en lugar de volver a
+    codificar la clave y armar el HMAC desde cero. Es seguro compartirlo
+    entre hilos, y se puede pasar a otros procesos (p. ej. a los workers
+    de emitir_lote): al copiarlo se vuelve a armar con el mismo CSC.
+
+    Args:
+        id_csc: Identificador del CSC (IdCSC), p. ej. "0001".
+        csc: Código secreto del contribuyente provisto por la SET.
+        ambiente: "test" o "prod"; elige la URL base de consulta.
+        url_base: URL base explícita (reemplaza la del ambiente); debe
+            terminar en "?".
+
+    Ejemplo:
+        servicio = ServicioQR("0001", csc, ambiente="prod")
+        emitir_factura(factura, servicio_qr=servicio)
+    """
+
+    def __init__(self, id_csc: str, csc: str, ambiente: str = "test", url_base: Optional[str] = None):
+        if url_base is None and ambiente not in URLS_QR:
+            raise ValueError(f"Ambiente desconocido: {ambiente}")
+        self.id_csc = id_csc
+        self.url_base = url_base or URLS_QR[ambiente]
+        self._csc = csc
+        self._hmac = hmac.new(csc.encode("utf-8"), digestmod=hashlib.sha256)
+        self._lock = threading.Lock()
+
+    def __reduce__(self):
+        # El HMAC y el lock no se copian entre procesos: se rearman desde el CSC
+        return (type(self), (self.id_csc, self._csc, "test", self.url_base))
+
+    def cadena(self, datos: DatosQR) -> str:
+        """Parámetros del QR, en el orden del Manual Técnico y sin el hash."""
+        return (
+            f"nVersion=150&Id={datos.id}&dFeEmiDE={datos.fecha_emision}&dRucRec={datos.ruc_receptor}"
+            f"&dTotGralOpe={datos.total}&dTotIVA={datos.total_iva}&cItems={datos.items}"
+            f"&DigestValue={datos.digest}&IdCSC={self.id_csc}"
+        )
+
+    def generar(self, datos: Union[DatosQR, etree._Element]) -> str:
+        """
+        Devuelve la URL completa del dCarQR.
+
+        Args:
+            datos: DatosQR o el rDE firmado.
+        """
+        if not isinstance(datos, DatosQR):
+            datos = DatosQR.desde_arbol(datos)
+        cadena = self.cadena(datos)
+        with self._lock:
+            calculo = self._hmac.copy()
+        calculo.update(cadena.encode("utf-8"))
+        return f"{self.url_base}{cadena}&cHashQR={calculo.hexdigest()}"
+
+    def generar_qr_lote(self, documentos: Iterable[Union[DatosQR, etree._Element]]) -> List[str]:
+        """
+        Igual que generar, para muchos documentos en una sola llamada.
+
+        Returns:
+            Las URL en el orden de entrada.
+        """
+        with self._lock:
+            base = self._hmac.copy()
+        copiar, cadena, url_base = base.copy, self.cadena, self.url_base
+        urls = []
+        for datos in documentos:
+            if not isinstance(datos, DatosQR):
+                datos = DatosQR.desde_arbol(datos)
+            texto = cadena(datos)
+            calculo = copiar()
+            calculo.update(texto.encode("utf-8"))
+            urls.append(f"{url_base}{texto}&cHashQR={calculo.hexdigest()}")
+        return urls
+
+
+_servicio_prueba: Optional[ServicioQR] = None
+
+
+def servicio_qr_por_defecto() -> ServicioQR:
+    """ServicioQR con el CSC de ejemplo del ambiente de pruebas."""
+    global _servicio_prueba
+    if _servicio_prueba is None:
+        _servicio_prueba = ServicioQR(ID_CSC_PRUEBA, CSC_PRUEBA)
+    return _servicio_prueba
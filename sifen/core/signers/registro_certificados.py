@@ -0,0 +1,181 @@
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, Optional, Tuple, Union
+
+from .almacen_claves import AlmacenClaves, AlmacenPKCS12
+
+EXTENSIONES_PKCS12 = (".p12", ".pfx")
+
+Contrasenas = Union[Dict[str, str], Callable[[str], Optional[str]]]
+
+
+class CertificadoVencido(Exception):
+    """El certificado del emisor vence antes del momento pedido."""
+
+    def __init__(self, ruc: str, vence: datetime):
+        super().__init__(f"El certificado del RUC {ruc} vence el {vence.isoformat()}")
+        self.ruc = ruc
+        self.vence = vence
+
+
+class RegistroCertificados:
+    """
+    Certificados de firma de muchos emisores en un mismo proceso.
+
+    Cada RUC se resuelve, la primera vez que se usa, a un archivo del
+    `directorio`:
+
+        <ruc>.p12 o <ruc>.pfx         PKCS#12 (contraseña en `contrasenas`)
+        <ruc>.pem y <ruc>_key.pem     Certificado y clave PEM
+
+    o a lo indicado con registrar/registrar_pkcs12. El registro guarda un
+    AlmacenClaves por RUC, con la clave ya parseada, y conserva solo los
+    `capacidad` usados más recientemente: al pasarse, el menos usado se
+    descarta y se vuelve a cargar si se lo pide otra vez.
+
+    almacen(ruc) comprueba el vencimiento antes de devolver el almacén, y
+    por_vencer permite revisar todos los RUC de un lote antes de empezar
+    a firmarlo. Es seguro compartirlo entre los hilos que firman (por
+    ejemplo, varios Firmador o emitir_arbol en un pool de hilos).
+
+    Args:
+        directorio: Carpeta con los certificados por RUC.
+        contrasenas: {ruc: contraseña} o función ruc -> contraseña, para
+            los PKCS#12 y las claves PEM cifradas.
+        capacidad: Máximo de RUC con la clave cargada en memoria.
+        margen: Un certificado que vence antes de ahora + margen se
+            considera vencido.
+        intervalo_verificacion: Ver AlmacenClaves.
+        reloj: Función que devuelve la hora actual (datetime con zona).
+
+    Ejemplo:
+        registro = RegistroCertificados("/etc/sifen/certs", contrasenas, capacidad=100)
+        registro.por_vencer(f.emisor.ruc for f in facturas)  # {} si todos sirven
+        emitir_arbol(factura, almacen=registro.almacen(factura.emisor.ruc))
+    """
+
+    def __init__(
+        self,
+        directorio: Optional[str] = None,
+        contrasenas: Optional[Contrasenas] = None,
+        capacidad: int = 64,
+        margen: timedelta = timedelta(0),
+        intervalo_verificacion: float = 1.0,
+        reloj: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        self.directorio = directorio
+        self.contrasenas = contrasenas or {}
+        self.capacidad = capacidad
+        self.margen = margen
+        self.intervalo_verificacion = intervalo_verificacion
+        self.reloj = reloj
+        self._fuentes: Dict[str, Tuple[str, ...]] = {}
+        self._almacenes: "OrderedDict[str, AlmacenClaves]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.cargas = 0     # Almacenes creados (la primera vez o tras un descarte)
+        self.descartes = 0  # Almacenes sacados por el límite de capacidad
+
+    def registrar(self, ruc: str, key_path: str, cert_path: str, password: Optional[str] = None):
+        """Asocia el RUC a un par PEM fuera del directorio."""
+        self._registrar(ruc, ("pem", key_path, cert_path, password))
+
+    def registrar_pkcs12(self, ruc: str, ruta: str, contrasena: Optional[str] = None):
+        """Asocia el RUC a un archivo PKCS#12 fuera del directorio."""
+        self._registrar(ruc, ("pkcs12", ruta, contrasena))
+
+    def _registrar(self, ruc: str, fuente: Tuple[str, ...]):
+        with self._lock:
+            self._fuentes[ruc] = fuente
+            self._almacenes.pop(ruc, None)
+
+    def almacen(self, ruc: str, vigente_hasta: Optional[datetime] = None) -> AlmacenClaves:
+        """
+        Devuelve el almacén del RUC, con la clave cargada.
+
+        Args:
+            ruc: RUC del emisor.
+            vigente_hasta: Momento hasta el que el certificado debe seguir
+                vigente (por defecto, ahora + margen).
+
+        Raises:
+            FileNotFoundError: Si no hay certificado para el RUC.
+            CertificadoVencido: Si el certificado vence antes de vigente_hasta.
+        """
+        almacen = self._obtener(ruc)
+        # La carga (y la recarga si cambió el archivo) la hace el almacén
+        # con su propio lock, sin frenar a los demás RUC
+        vence = almacen.obtener_par().vence
+        if vence is not None and vence <= (vigente_hasta or self.reloj() + self.margen):
+            raise CertificadoVencido(ruc, vence)
+        return almacen
+
+    def vencimiento(self, ruc: str) -> Optional[datetime]:
+        """Fin de validez del certificado del RUC."""
+        return self._obtener(ruc).obtener_par().vence
+
+    def por_vencer(self, rucs: Iterable[str], vigente_hasta: Optional[datetime] = None) -> Dict[str, datetime]:
+        """
+        Revisa de una vez los RUC de un lote.
+
+        Returns:
+            {ruc: vencimiento} de los certificados que vencen antes de
+            vigente_hasta (por defecto, ahora + margen); vacío si todos
+            sirven.
+
+        Raises:
+            FileNotFoundError: Si algún RUC no tiene certificado.
+        """
+        limite = vigente_hasta or self.reloj() + self.margen
+        vencidos = {}
+        for ruc in dict.fromkeys(rucs):
+            vence = self.vencimiento(ruc)
+            if vence is not None and vence <= limite:
+                vencidos[ruc] = vence
+        return vencidos
+
+    def _obtener(self, ruc: str) -> AlmacenClaves:
+        with self._lock:
+            almacen = self._almacenes.get(ruc)
+            if almacen is not None:
+                self._almacenes.move_to_end(ruc)
+                return almacen
+            almacen = self._crear(ruc)
+            self._almacenes[ruc] = almacen
+            self.cargas += 1
+            while len(self._almacenes) > self.capacidad:
+                self._almacenes.popitem(last=False)
+                self.descartes += 1
+            return almacen
+
+    def _crear(self, ruc: str) -> AlmacenClaves:
+        fuente = self._fuentes.get(ruc) or self._buscar(ruc)
+        if fuente[0] == "pkcs12":
+            _, ruta, contrasena = fuente
+            return AlmacenPKCS12(ruta, contrasena, self.intervalo_verificacion)
+        _, key_path, cert_path, password = fuente
+        return AlmacenClaves(key_path, cert_path, password, self.intervalo_verificacion)
+
+    def _buscar(self, ruc: str) -> Tuple[str, ...]:
+        if self.directorio is None or not ruc.isdigit():
+            raise FileNotFoundError(f"No hay certificado registrado para el RUC {ruc}")
+        contrasena = self._contrasena(ruc)
+        for extension in EXTENSIONES_PKCS12:
+            ruta = os.path.join(self.directorio, ruc + extension)
+            if os.path.exists(ruta):
+                return ("pkcs12", ruta, contrasena)
+        cert_path = os.path.join(self.directorio, f"{ruc}.pem")
+        key_path = os.path.join(self.directorio, f"{ruc}_key.pem")
+        if os.path.exists(cert_path) and os.path.exists(key_path):
+            return ("pem", key_path, cert_path, contrasena)
+        raise FileNotFoundError(f"No hay certificado para el RUC {ruc} en {self.directorio}")
+
+    def _contrasena(self, ruc: str) -> Optional[str]:
+        if callable(self.contrasenas):
+            return self.contrasenas(ruc)
+        return self.contrasenas.get(ruc)
+
+    def metricas(self) -> Dict[str, int]:
+        with self._lock:
+            return {"en_memoria": len(self._almacenes), "cargas": self.cargas, "descartes": self.descartes}
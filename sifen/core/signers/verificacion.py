@@ -0,0 +1,368 @@
+import base64
+import functools
+import hashlib
+import hmac
+import os
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from cryptography import x509
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.x509.oid import NameOID
+from lxml import etree
+
+from .qr import URLS_QR, DatosQR, ServicioQR
+
+SIFEN_NS = "http://ekuatia.set.gov.py/sifen/xsd"
+DS_NS = "http://www.w3.org/2000/09/xmldsig#"
+EC_NS = "http://www.w3.org/2001/10/xml-exc-c14n#"
+
+# Algoritmos que exige el Manual Técnico de SIFEN para la firma del DE
+ALG_EXC_C14N = "http://www.w3.org/2001/10/xml-exc-c14n#"
+ALG_ENVELOPED = "http://www.w3.org/2000/09/xmldsig#enveloped-signature"
+ALG_RSA_SHA256 = "http://www.w3.org/2001/04/xmldsig-more#rsa-sha256"
+ALG_SHA256 = "http://www.w3.org/2001/04/xmlenc#sha256"
+
+Entrada = Union[str, os.PathLike, bytes]
+# {RUC del emisor: (IdCSC, CSC)}
+CSCs = Dict[str, Tuple[str, str]]
+
+
+# Los documentos vienen de terceros: sin entidades externas ni red
+_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
+
+
+def _ds(nombre: str) -> str:
+    return "{%s}%s" % (DS_NS, nombre)
+
+
+def _sifen(nombre: str) -> str:
+    return "{%s}%s" % (SIFEN_NS, nombre)
+
+
+@dataclass
+class ResultadoVerificacion:
+    """Resultado de verificar un rDE recibido."""
+    indice: int                             # Posición del documento en la entrada
+    origen: Optional[str] = None            # Ruta del archivo, si la entrada era una ruta
+    cdc: Optional[str] = None               # Id del DE
+    firma_valida: bool = False              # DigestValue y SignatureValue correctos, certificado del emisor
+    qr_valido: Optional[bool] = None        # None si no hay dCarQR o no se conoce el CSC del emisor
+    certificado: Optional[str] = None       # Huella SHA-256 (hex) del certificado firmante
+    ruc_certificado: Optional[str] = None   # RUC del SERIAL_NUMBER del sujeto del certificado
+    error: Optional[str] = None             # Motivo si la firma o el QR no verifican
+
+    @property
+    def ok(self) -> bool:
+        return self.firma_valida and self.qr_valido is not False
+
+
+class CacheCertificados:
+    """
+    Clave pública y RUC de los certificados firmantes, por huella SHA-256
+    del DER: un proveedor que se repite no vuelve a parsear su certificado.
+    Guarda hasta `capacidad` certificados (LRU) y es seguro entre hilos.
+    """
+
+    def __init__(self, capacidad: int = 1024):
+        self.capacidad = capacidad
+        self._claves: "OrderedDict[str, Tuple[object, Optional[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.parseados = 0
+
+    def obtener(self, der: bytes) -> Tuple[str, object, Optional[str]]:
+        """Devuelve (huella, clave pública, RUC del sujeto) del certificado DER."""
+        huella = hashlib.sha256(der).hexdigest()
+        with self._lock:
+            datos = self._claves.get(huella)
+            if datos is not None:
+                self._claves.move_to_end(huella)
+                return (huella, *datos)
+        certificado = x509.load_der_x509_certificate(der)
+        datos = (certificado.public_key(), ruc_del_certificado(certificado))
+        with self._lock:
+            self.parseados += 1
+            self._claves[huella] = datos
+            while len(self._claves) > self.capacidad:
+                self._claves.popitem(last=False)
+        return (huella, *datos)
+
+
+def ruc_del_certificado(certificado: x509.Certificate) -> Optional[str]:
+    """
+    RUC del titular según el SERIAL_NUMBER del sujeto, sin prefijo ni
+    dígito verificador ("RUC80012345-6" -> "80012345", "CI1234567" ->
+    "1234567"); None si no lo trae.
+    """
+    atributos = certificado.subject.get_attributes_for_oid(NameOID.SERIAL_NUMBER)
+    if not atributos:
+        return None
+    valor = atributos[0].value.upper().lstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZ ")
+    return valor.partition("-")[0].strip() or None
+
+
+_cache_por_defecto = CacheCertificados()
+
+
+def cache_por_defecto() -> CacheCertificados:
+    """CacheCertificados compartida del proceso (la de cada worker, en el pool)."""
+    return _cache_por_defecto
+
+
+class _FirmaInvalida(Exception):
+    pass
+
+
+def verificar_documento(
+    documento: Union[Entrada, etree._Element],
+    cscs: Optional[CSCs] = None,
+    cache: Optional[CacheCertificados] = None,
+    indice: int = 0,
+) -> ResultadoVerificacion:
+    """
+    Verifica la firma XMLDSig del <DE> de un rDE y, si se conoce el CSC del
+    emisor, el cHashQR del dCarQR. Un dCarQR que no apunta a la consulta
+    de la SET (URLS_QR) se rechaza aunque no se conozca el CSC.
+
+    La firma se comprueba sin xmlsec: el DigestValue contra la C14N
+    exclusiva del <DE> y la SignatureValue (RSA-SHA256) contra el
+    SignedInfo canonizado, con la clave pública del X509Certificate que
+    trae el propio documento. Ese certificado tiene que ser del emisor: el
+    RUC del SERIAL_NUMBER de su sujeto debe coincidir con el dRucEm. Solo
+    se aceptan los algoritmos del Manual Técnico; la confianza en el
+    certificado (cadena, vigencia) queda a cargo de quien usa la huella
+    devuelta.
+
+    Args:
+        documento: Ruta del archivo, bytes o elemento rDE.
+        cscs: {RUC del emisor: (IdCSC, CSC)} para verificar el dCarQR.
+        cache: Cache de certificados (por defecto, la del proceso).
+        indice: Posición a informar en el resultado.
+
+    Returns:
+        ResultadoVerificacion: Nunca lanza; los problemas van en `error`.
+    """
+    resultado = ResultadoVerificacion(indice=indice)
+    try:
+        if isinstance(documento, etree._Element):
+            root = documento
+        elif isinstance(documento, bytes):
+            root = etree.fromstring(documento, _PARSER)
+        else:
+            resultado.origen = os.fspath(documento)
+            root = etree.parse(resultado.origen, _PARSER).getroot()
+
+        de = root.find(_sifen("DE"))
+        if de is None:
+            raise _FirmaInvalida("No se encontró el nodo <DE>")
+        resultado.cdc = de.get("Id")
+        firma = root.find(_ds("Signature"))
+        if firma is None:
+            raise _FirmaInvalida("El rDE no tiene <Signature>")
+
+        digest = _verificar_firma(de, firma, cache or _cache_por_defecto, resultado)
+        resultado.firma_valida = True
+        resultado.qr_valido, resultado.error = _verificar_qr(root, de, firma, digest, cscs or {})
+    except _FirmaInvalida as e:
+        resultado.error = str(e)
+    except Exception as e:
+        resultado.error = f"{type(e).__name__}: {str(e)}"
+    return resultado
+
+
+def _verificar_firma(de: etree._Element, firma: etree._Element, cache: CacheCertificados,
+                     resultado: ResultadoVerificacion) -> str:
+    """Comprueba digest, firma y RUC del certificado; devuelve el DigestValue."""
+    signed_info = firma.find(_ds("SignedInfo"))
+    if signed_info is None:
+        raise _FirmaInvalida("La firma no tiene <SignedInfo>")
+    metodo_c14n = signed_info.find(_ds("CanonicalizationMethod"))
+    metodo_firma = signed_info.find(_ds("SignatureMethod"))
+    referencias = signed_info.findall(_ds("Reference"))
+    if _algoritmo(metodo_c14n) != ALG_EXC_C14N or _algoritmo(metodo_firma) != ALG_RSA_SHA256:
+        raise _FirmaInvalida("Algoritmo de canonización o de firma no admitido")
+    if len(referencias) != 1 or referencias[0].get("URI") != "#" + (resultado.cdc or ""):
+        raise _FirmaInvalida("La firma no referencia al <DE>")
+    referencia = referencias[0]
+
+    transformaciones = referencia.findall(f"{_ds('Transforms')}/{_ds('Transform')}")
+    if any(_algoritmo(t) not in (ALG_ENVELOPED, ALG_EXC_C14N) for t in transformaciones):
+        raise _FirmaInvalida("Transformación no admitida")
+    if _algoritmo(referencia.find(_ds("DigestMethod"))) != ALG_SHA256:
+        raise _FirmaInvalida("Algoritmo de digest no admitido")
+
+    # enveloped-signature no cambia nada: el <Signature> es hermano del <DE>
+    exc_c14n = [t for t in transformaciones if _algoritmo(t) == ALG_EXC_C14N]
+    canonico = etree.tostring(
+        de, method="c14n", exclusive=True,
+        inclusive_ns_prefixes=_prefijos_inclusivos(exc_c14n[0] if exc_c14n else None),
+    )
+    digest = referencia.findtext(_ds("DigestValue"), "").strip()
+    calculado = base64.b64encode(hashlib.sha256(canonico).digest()).decode("ascii")
+    if not hmac.compare_digest(calculado, digest):
+        raise _FirmaInvalida("El DigestValue no coincide con el <DE>")
+
+    certificado = firma.findtext(f"{_ds('KeyInfo')}/{_ds('X509Data')}/{_ds('X509Certificate')}")
+    if not certificado:
+        raise _FirmaInvalida("La firma no trae X509Certificate")
+    resultado.certificado, clave, resultado.ruc_certificado = cache.obtener(base64.b64decode(certificado))
+
+    firmado = etree.tostring(
+        signed_info, method="c14n", exclusive=True,
+        inclusive_ns_prefixes=_prefijos_inclusivos(metodo_c14n),
+    )
+    valor = base64.b64decode(firma.findtext(_ds("SignatureValue"), ""))
+    try:
+        clave.verify(valor, firmado, padding.PKCS1v15(), hashes.SHA256())
+    except InvalidSignature:
+        raise _FirmaInvalida("La SignatureValue no es válida") from None
+
+    # Una firma correcta con el certificado de otro contribuyente no vale
+    ruc = de.findtext(f"{_sifen('gDatGralOpe')}/{_sifen('gEmis')}/{_sifen('dRucEm')}")
+    if resultado.ruc_certificado is None or resultado.ruc_certificado != ruc:
+        raise _FirmaInvalida(
+            f"El certificado firmante (RUC {resultado.ruc_certificado}) no es del emisor (RUC {ruc})"
+        )
+    return digest
+
+
+def _algoritmo(nodo: Optional[etree._Element]) -> Optional[str]:
+    return nodo.get("Algorithm") if nodo is not None else None
+
+
+def _prefijos_inclusivos(metodo: Optional[etree._Element]) -> Optional[List[str]]:
+    """PrefixList de ec:InclusiveNamespaces, si el método lo declara."""
+    if metodo is None:
+        return None
+    inclusivos = metodo.find("{%s}InclusiveNamespaces" % EC_NS)
+    if inclusivos is None:
+        return None
+    return [("" if p == "#default" else p) for p in inclusivos.get("PrefixList", "").split()]
+
+
+def _verificar_qr(root: etree._Element, de: etree._Element, firma: etree._Element, digest: str,
+                  cscs: CSCs) -> Tuple[Optional[bool], Optional[str]]:
+    """
+    (True/False según la URL y el cHashQR, motivo si es False); None si no
+    hay dCarQR o, con la URL de la SET, no se conoce el CSC del emisor.
+    """
+    qr = root.findtext(f"{_sifen('gCamFuFD')}/{_sifen('dCarQR')}")
+    if not qr:
+        return None, None
+    url_base, _, consulta = qr.partition("?")
+    url_base += "?"
+    if url_base not in URLS_QR.values():
+        return False, f"El dCarQR no apunta a la consulta de la SET: {url_base}"
+    ruc = de.findtext(f"{_sifen('gDatGralOpe')}/{_sifen('gEmis')}/{_sifen('dRucEm')}")
+    if ruc not in cscs:
+        return None, None
+    datos = DatosQR.desde_arbol(de, firma)
+    # El QR debe llevar el mismo DigestValue que la firma ya verificada
+    datos.digest = digest
+    esperado = _servicio_qr(*cscs[ruc], url_base).generar(datos)
+    if not hmac.compare_digest(esperado.partition("?")[2], consulta):
+        return False, "El cHashQR del dCarQR no coincide"
+    return True, None
+
+
+@functools.lru_cache(maxsize=256)
+def _servicio_qr(id_csc: str, csc: str, url_base: str) -> ServicioQR:
+    """ServicioQR por CSC y URL, con el HMAC ya inicializado."""
+    return ServicioQR(id_csc, csc, url_base=url_base)
+
+
+# Configuración propia de cada proceso del pool (ver _iniciar_worker)
+_cscs_worker: Optional[CSCs] = None
+
+
+def _iniciar_worker(cscs: Optional[CSCs]):
+    global _cscs_worker
+    _cscs_worker = cscs
+
+
+def _verificar_bloque(bloque: List[Tuple[int, Entrada]]) -> List[ResultadoVerificacion]:
+    return [verificar_documento(documento, _cscs_worker, indice=indice) for indice, documento in bloque]
+
+
+def verificar_firmas(
+    documentos: Iterable[Entrada],
+    workers: Optional[int] = None,
+    cscs: Optional[CSCs] = None,
+    tamano_bloque: int = 32,
+    bloques_en_vuelo: Optional[int] = None,
+    mp_context=None,
+) -> Iterator[ResultadoVerificacion]:
+    """
+    Verifica muchos rDE recibidos (compras) repartiéndolos entre procesos.
+
+    Cada documento se verifica con verificar_documento. Los workers tienen
+    su propia CacheCertificados, que se mantiene entre bloques: los
+    proveedores que se repiten no vuelven a parsear su certificado. Los
+    resultados se devuelven a medida que están listos, en el orden de
+    entrada; un documento con problemas se informa en su resultado y no
+    interrumpe el resto.
+
+    Args:
+        documentos: Rutas o bytes de rDE firmados; puede ser un generador.
+            Conviene pasar rutas: viajan al worker sin copiar el XML.
+        workers: Cantidad de procesos (por defecto, uno por CPU). Con 1 se
+            verifica en el proceso actual, sin pool.
+        cscs: {RUC del emisor: (IdCSC, CSC)} para verificar el dCarQR.
+        tamano_bloque: Documentos por tarea enviada a un worker.
+        bloques_en_vuelo: Máximo de bloques pendientes (por defecto 2 por
+            worker).
+        mp_context: Contexto de multiprocessing para el pool.
+
+    Yields:
+        ResultadoVerificacion, uno por documento y en el mismo orden.
+    """
+    entrada = enumerate(documentos)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        for indice, documento in entrada:
+            yield verificar_documento(documento, cscs, indice=indice)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=_iniciar_worker,
+        initargs=(cscs,),
+    ) as pool:
+        limite = bloques_en_vuelo or 2 * workers
+        pendientes = deque()
+
+        def enviar_siguiente():
+            bloque = list(islice(entrada, tamano_bloque))
+            if bloque:
+                pendientes.append((bloque, pool.submit(_verificar_bloque, bloque)))
+            return bool(bloque)
+
+        while len(pendientes) < limite and enviar_siguiente():
+            pass
+
+        while pendientes:
+            bloque, futuro = pendientes.popleft()
+            try:
+                resultados = futuro.result()
+            except Exception as e:
+                # El bloque entero falló (p. ej. un worker caído): se informa
+                # en cada uno de sus documentos
+                error = f"{type(e).__name__}: {str(e)}"
+                resultados = [
+                    ResultadoVerificacion(
+                        indice=indice,
+                        origen=None if isinstance(documento, bytes) else os.fspath(documento),
+                        error=error,
+                    )
+                    for indice, documento in bloque
+                ]
+            enviar_siguiente()
+            yield from resultados
@@ -0,0 +1,219 @@
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+from lxml import etree
+
+SCHEMAS_DIR = Path(__file__).parent.parent.parent / 'schemas'
+
+# Los XSD publicados por la SET se incluyen entre sí con URLs absolutas;
+# se resuelven contra la copia local para no depender de la red.
+URL_BASE_SET = "https://ekuatia.set.gov.py/sifen/xsd/"
+
+# Esquema raíz de cada documento, identificado por su elemento principal
+ESQUEMAS = {
+    "siRecepDE": "siRecepDE_v150.xsd",
+    "siRecepEvento": "siRecepEvento_v150.xsd",
+    "rEnviDe": "WS_SiRecepDE_v150.xsd",
+    "rEnvioLote": "WS_SiRecepLoteDE_v141.xsd",
+    "rEnviConsLoteDe": "WS_SiConsLote_v141.xsd",
+    "rEnviConsRUC": "WS_SiConsRUC_v141.xsd",
+    "rEnviConsDe": "WS_SiConsDE_v141.xsd",
+    "rEnviEventoDe": "WS_SiRecepEvento_v150.xsd",
+}
+
+# rLoteDE es el contenido del zip enviado en rEnvioLote; la SET no publica
+# un XSD propio, se arma sobre la definición de rDE de DE_v150.xsd.
+ESQUEMA_RLOTEDE = b"""<?xml version="1.0" encoding="utf-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+        elementFormDefault="qualified"
+        xmlns="http://ekuatia.set.gov.py/sifen/xsd"
+        targetNamespace="http://ekuatia.set.gov.py/sifen/xsd">
+    <xs:include schemaLocation="DE_v150.xsd"/>
+    <xs:element name="rLoteDE">
+        <xs:complexType>
+            <xs:sequence>
+                <xs:element name="rDE" type="rDE" maxOccurs="50"/>
+            </xs:sequence>
+        </xs:complexType>
+    </xs:element>
+</xs:schema>
+"""
+
+# protProcesDE_v150.xsd y WS_SiConsLote_v141.xsd solo definen los tipos de
+# cada resultado; estos esquemas declaran el elemento para poder validar
+# cada rProtDe / gResProcLote por separado mientras se lee la respuesta.
+ESQUEMA_RPROTDE = b"""<?xml version="1.0" encoding="utf-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+        elementFormDefault="qualified"
+        xmlns="http://ekuatia.set.gov.py/sifen/xsd"
+        targetNamespace="http://ekuatia.set.gov.py/sifen/xsd">
+    <xs:include schemaLocation="protProcesDE_v150.xsd"/>
+    <xs:element name="rProtDe" type="rProtDe"/>
+</xs:schema>
+"""
+
+ESQUEMA_GRESPROCLOTE = b"""<?xml version="1.0" encoding="utf-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+        elementFormDefault="qualified"
+        xmlns="http://ekuatia.set.gov.py/sifen/xsd"
+        targetNamespace="http://ekuatia.set.gov.py/sifen/xsd">
+    <xs:include schemaLocation="WS_SiConsLote_v141.xsd"/>
+    <xs:element name="gResProcLote" type="tgResProcLote"/>
+</xs:schema>
+"""
+
+# Esquemas armados en el paquete, además de los publicados por la SET
+ESQUEMAS_ARMADOS = {
+    "rLoteDE": ESQUEMA_RLOTEDE,
+    "rProtDe": ESQUEMA_RPROTDE,
+    "gResProcLote": ESQUEMA_GRESPROCLOTE,
+}
+
+
+class _ResolverSET(etree.Resolver):
+    """Redirige los includes remotos de la SET a los XSD locales."""
+
+    def __init__(self, schemas_dir: Path):
+        super().__init__()
+        self.schemas_dir = schemas_dir
+
+    def resolve(self, system_url, public_id, context):
+        if system_url and system_url.startswith(URL_BASE_SET):
+            local = self.schemas_dir / system_url[len(URL_BASE_SET):]
+            if local.exists():
+                return self.resolve_filename(str(local), context)
+        return None
+
+
+class RegistroEsquemas:
+    """
+    Registro de esquemas XSD compilados, compartido por todo el proceso.
+
+    Cada esquema se compila una única vez, la primera vez que se pide, y
+    luego se reutiliza. Es seguro usarlo desde varios hilos: la compilación
+    se hace bajo un lock por esquema.
+    """
+
+    def __init__(self, schemas_dir: Union[str, Path] = SCHEMAS_DIR):
+        self.schemas_dir = Path(schemas_dir)
+        self._fuentes: Dict[str, Union[str, bytes]] = dict(ESQUEMAS)
+        self._fuentes.update(ESQUEMAS_ARMADOS)
+        self._esquemas: Dict[str, etree.XMLSchema] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def registrar(self, nombre: str, fuente: Union[str, bytes]):
+        """
+        Registra (o reemplaza) un esquema raíz.
+
+        Args:
+            nombre: Clave con la que se pedirá el esquema.
+            fuente: Nombre del archivo XSD dentro de `schemas_dir`, o el
+                contenido del XSD en bytes.
+        """
+        with self._lock:
+            self._fuentes[nombre] = fuente
+            self._esquemas.pop(nombre, None)
+
+    def obtener(self, nombre: str = "siRecepDE") -> etree.XMLSchema:
+        """
+        Devuelve el esquema compilado, compilándolo si aún no lo está.
+
+        Raises:
+            KeyError: Si el nombre no corresponde a ningún esquema registrado.
+            FileNotFoundError: Si el XSD raíz no existe en `schemas_dir`.
+            etree.XMLSchemaParseError: Si el XSD no es válido.
+        """
+        esquema = self._esquemas.get(nombre)
+        if esquema is not None:
+            return esquema
+
+        with self._lock:
+            if nombre not in self._fuentes:
+                raise KeyError(f"Esquema no registrado: {nombre}")
+            lock = self._locks.setdefault(nombre, threading.Lock())
+
+        with lock:
+            esquema = self._esquemas.get(nombre)
+            if esquema is None:
+                esquema = self._compilar(self._fuentes[nombre])
+                self._esquemas[nombre] = esquema
+        return esquema
+
+    def validar(self, documento, nombre: str = "siRecepDE"):
+        """
+        Valida un documento ya parseado contra el esquema indicado.
+
+        El esquema compilado se comparte entre hilos, pero lxml acumula los
+        errores de validación en el propio objeto XMLSchema; por eso cada
+        validación se hace bajo el lock del esquema.
+
+        Raises:
+            etree.DocumentInvalid: Si el documento no es válido.
+        """
+        esquema = self.obtener(nombre)
+        with self._locks[nombre]:
+            esquema.assertValid(documento)
+
+    def precargar(self, nombres: Optional[Iterable[str]] = None):
+        """
+        Compila por adelantado los esquemas indicados (todos si no se indica
+        ninguno). Pensado para llamarse al iniciar un worker.
+        """
+        for nombre in (list(self._fuentes) if nombres is None else nombres):
+            self.obtener(nombre)
+
+    def recargar(self, nombre: Optional[str] = None):
+        """
+        Descarta el esquema compilado (o todos) para que se vuelva a leer del
+        disco en el próximo uso; por ejemplo cuando la SET publica nuevos XSD.
+        """
+        with self._lock:
+            if nombre is None:
+                self._esquemas.clear()
+            else:
+                self._esquemas.pop(nombre, None)
+
+    def fuente(self, nombre: str):
+        """Archivo XSD (o contenido) registrado para el esquema."""
+        return self._fuentes.get(nombre)
+
+    def compilados(self):
+        """Nombres de los esquemas ya compilados."""
+        return list(self._esquemas)
+
+    def _compilar(self, fuente: Union[str, bytes]) -> etree.XMLSchema:
+        parser = etree.XMLParser()
+        parser.resolvers.add(_ResolverSET(self.schemas_dir))
+
+        if isinstance(fuente, bytes):
+            # base_url para que los includes relativos apunten a schemas_dir
+            base_url = str(self.schemas_dir / "__inline__.xsd")
+            schema_doc = etree.fromstring(fuente, parser, base_url=base_url).getroottree()
+        else:
+            xsd_path = self.schemas_dir / fuente
+            if not xsd_path.exists():
+                raise FileNotFoundError(f"Archivo XSD no encontrado en: {xsd_path}")
+            schema_doc = etree.parse(str(xsd_path), parser)
+
+        return etree.XMLSchema(schema_doc)
+
+
+# Registro por defecto del proceso
+registro = RegistroEsquemas()
+
+
+def obtener_esquema(nombre: str = "siRecepDE") -> etree.XMLSchema:
+    """Atajo a `registro.obtener`."""
+    return registro.obtener(nombre)
+
+
+def precargar_esquemas(*nombres: str):
+    """Compila por adelantado los esquemas indicados (o todos)."""
+    registro.precargar(nombres or None)
+
+
+def recargar_esquemas(nombre: Optional[str] = None):
+    """Invalida el esquema indicado (o todos) del registro por defecto."""
+    registro.recargar(nombre)
@@ -1,46 +1,42 @@
-import os
-from pathlib import Path
 from lxml import etree
-from typing import Tuple
+from typing import Tuple, Union
 
-def validar_xml(xml_bytes: bytes) -> Tuple[bool, str]:
+from .registro_esquemas import registro
+
+def validar_xml(xml_bytes: Union[bytes, etree._Element], esquema: str = "siRecepDE") -> Tuple[bool, str]:
     """
     Valida un XML contra el esquema XSD de SIFEN.
     
     Args:
-        xml_bytes: XML a validar en formato bytes
+        xml_bytes: XML a validar, en bytes o como elemento ya parseado
+        esquema: Nombre del esquema raíz en el registro (por defecto siRecepDE)
     
     Returns:
         Tuple[bool, str]: (True, None) si es válido, (False, mensaje_error) si no
     """
     try:
-        # 1. Configuración de rutas - Más robusto con pathlib
-        current_dir = Path(__file__).parent
-        schemas_dir = current_dir.parent.parent / 'schemas'  # Sube dos niveles desde validators/
-        xsd_path = schemas_dir / 'siRecepDE_v150.xsd'
-        
-        # Verificar existencia del XSD
-        if not xsd_path.exists():
+        # 1. Esquema compilado una sola vez por proceso (ver registro_esquemas)
+        try:
+            registro.obtener(esquema)
+        except FileNotFoundError as e:
             error_msg = (
-                f"Archivo XSD no encontrado en: {xsd_path}\n"
+                f"{str(e)}\n"
                 "Por favor asegúrate de:\n"
-                "1. Tener el archivo 'siRecepDE_v150.xsd' en la carpeta 'sifen/schemas/'\n"
+                f"1. Tener el archivo '{registro.fuente(esquema)}' en la carpeta 'sifen/schemas/'\n"
                 "2. Descargar la versión correcta desde el portal SIFEN"
             )
             return False, error_msg
-
-        # 2. Cargar esquema XSD con manejo explícito de encoding
-        try:
-            schema_doc = etree.parse(str(xsd_path))
-            schema = etree.XMLSchema(schema_doc)
-        except etree.XMLSyntaxError as e:
+        except (etree.XMLSyntaxError, etree.XMLSchemaParseError) as e:
             return False, f"Error en el esquema XSD: {str(e)}"
 
-        # 3. Parsear y validar el XML
+        # 2. Parsear y validar el XML
         try:
-            parser = etree.XMLParser(remove_blank_text=True)
-            xml_doc = etree.fromstring(xml_bytes, parser)
-            schema.assertValid(xml_doc)
+            if isinstance(xml_bytes, etree._Element):
+                xml_doc = xml_bytes
+            else:
+                parser = etree.XMLParser(remove_blank_text=True)
+                xml_doc = etree.fromstring(xml_bytes, parser)
+            registro.validar(xml_doc, esquema)
             return True, None
             
         except etree.DocumentInvalid as e:
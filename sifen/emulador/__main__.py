@@ -0,0 +1,53 @@
+"""
+Levanta el emulador de SIFEN en primer plano.
+
+Uso:
+    python -m sifen.emulador [--puerto 8080] [--latencia 0.05] [--variacion 0.02]
+                             [--tasa-errores 0.01] [--tasa-rechazos 0.05]
+                             [--consultas-en-proceso 1] [--validar]
+"""
+import argparse
+import asyncio
+import random
+
+from sifen.emulador.servidor import ServidorSIFEN
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8080)
+    parser.add_argument("--latencia", type=float, default=0.0, help="Demora media por solicitud (s)")
+    parser.add_argument("--variacion", type=float, default=0.0, help="Variación uniforme de la demora (± s)")
+    parser.add_argument("--tasa-errores", type=float, default=0.0)
+    parser.add_argument("--tasa-rechazos", type=float, default=0.0)
+    parser.add_argument("--consultas-en-proceso", type=int, default=0)
+    parser.add_argument("--validar", action="store_true", help="Validar cada mensaje contra su XSD")
+    args = parser.parse_args()
+
+    latencia = args.latencia
+    if args.variacion:
+        latencia = lambda: max(0.0, random.uniform(args.latencia - args.variacion, args.latencia + args.variacion))  # noqa: E731
+
+    async def servir():
+        servidor = ServidorSIFEN(
+            args.host,
+            args.puerto,
+            latencia=latencia,
+            consultas_en_proceso=args.consultas_en_proceso,
+            tasa_errores=args.tasa_errores,
+            tasa_rechazos=args.tasa_rechazos,
+            validar=args.validar,
+        )
+        async with servidor:
+            print(f"Emulador de SIFEN en {servidor.url}")
+            await asyncio.Event().wait()
+
+    try:
+        asyncio.run(servir())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+import asyncio
+import copy
+import math
+import ssl
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sifen.core.builders.xml_builder import SIFEN_NS, XMLBuilder
+from sifen.core.clients.consulta_de import CacheDE, ClienteConsultaDE
+from sifen.core.clients.consulta_lote import ClienteConsultaLote
+from sifen.core.clients.lote import MAX_DES_POR_LOTE, ClienteLote
+from sifen.core.clients.recepcion import ClienteRecepcion
+from sifen.core.signers.almacen_claves import AlmacenClaves, almacen_por_defecto
+from sifen.core.signers.signer import firmar_xml, serializar_xml
+from sifen.core.validators.validator import validar_xml
+from sifen.models.factura import Factura
+
+ETAPAS = ("construccion", "firma", "validacion", "envio", "consulta", "total")
+PERCENTILES = (50, 95, 99)
+
+MODO_SINCRONO = "sincrono"  # siRecepDE de a un DE y siConsDE
+MODO_LOTE = "lote"          # siRecepLoteDE y siConsLote
+
+
+def percentil(valores: List[float], p: float) -> float:
+    """Percentil p (0-100) por rango más cercano; 0.0 si no hay valores."""
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    return ordenados[max(0, math.ceil(p / 100 * len(ordenados)) - 1)]
+
+
+@dataclass
+class Etapa:
+    """Duraciones (en segundos) medidas para una etapa del flujo."""
+    nombre: str
+    duraciones: List[float] = field(default_factory=list)
+    errores: int = 0
+
+    def percentil(self, p: float) -> float:
+        return percentil(self.duraciones, p)
+
+
+@dataclass
+class ResultadoCarga:
+    """Resumen de una corrida de GeneradorCarga."""
+    etapas: Dict[str, Etapa]
+    documentos: int = 0     # Facturas tomadas de la entrada
+    aprobados: int = 0
+    rechazados: int = 0
+    fallidos: int = 0       # Se perdieron por un error en alguna etapa
+    segundos: float = 0.0   # Duración de la corrida
+
+    def tabla(self) -> str:
+        """Tabla de texto con p50/p95/p99 y máximo por etapa, en ms."""
+        columnas = "".join(f"{'p%d' % p:>9}" for p in PERCENTILES)
+        lineas = [f"{'etapa':<14}{'n':>7}{columnas}{'max':>9}{'errores':>9}"]
+        for etapa in self.etapas.values():
+            if not etapa.duraciones and not etapa.errores:
+                continue
+            valores = "".join(f"{etapa.percentil(p) * 1000:>9.1f}" for p in PERCENTILES)
+            maximo = max(etapa.duraciones, default=0.0) * 1000
+            lineas.append(f"{etapa.nombre:<14}{len(etapa.duraciones):>7}{valores}{maximo:>9.1f}{etapa.errores:>9}")
+        lineas.append(
+            f"{self.documentos} documentos en {self.segundos:.2f} s "
+            f"({self.documentos / self.segundos if self.segundos else 0:.0f}/s): "
+            f"{self.aprobados} aprobados, {self.rechazados} rechazados, {self.fallidos} fallidos"
+        )
+        return "\n".join(lineas)
+
+
+def facturas_sinteticas(base: Factura, cantidad: int, inicio: int = 1) -> Iterator[Factura]:
+    """
+    Copias de `base` con números de factura correlativos (y por lo tanto
+    CDC distintos), generadas a medida que se consumen.
+    """
+    establecimiento, punto_expedicion = base.numero_factura.split("-")[:2]
+    for numero in range(inicio, inicio + cantidad):
+        factura = copy.deepcopy(base)
+        factura.numero_factura = f"{establecimiento}-{punto_expedicion}-{numero % 10**7:07d}"
+        yield factura
+
+
+class GeneradorCarga:
+    """
+    Genera carga sobre el emulador (o cualquier servidor con la interfaz de
+    SIFEN) recorriendo el flujo completo por cada factura: construcción,
+    firma, validación contra el XSD, envío y consulta del resultado.
+
+    Mide cada etapa por documento (el envío y la consulta, por solicitud) y
+    el tiempo total desde que se empieza a construir un DE hasta conocer su
+    resultado. La construcción y la firma se hacen en el mismo event loop
+    que los envíos, de a un documento por vez y con hasta
+    `concurrencia` envíos en vuelo; para que los tiempos de red no incluyan
+    la CPU del emulador, conviene levantarlo en otro proceso
+    (python -m sifen.emulador).
+
+    Args:
+        url_base: URL del servidor.
+        modo: MODO_LOTE (siRecepLoteDE + siConsLote) o MODO_SINCRONO
+            (siRecepDE + siConsDE).
+        concurrencia: Envíos (DE o lotes) en vuelo a la vez.
+        tamano_lote: DE por lote en MODO_LOTE.
+        validar: Valida cada rDE firmado contra siRecepDE.
+        intervalo_consulta: Segundos entre consultas de un lote en proceso.
+        max_consultas: Consultas de un lote antes de darlo por fallido.
+        contexto_ssl: Contexto TLS de cliente, si el servidor usa https.
+        almacen: Almacén de claves para la firma.
+
+    Ejemplo:
+        generador = GeneradorCarga(servidor.url, modo=MODO_LOTE)
+        resultado = await generador.ejecutar(facturas_sinteticas(factura, 1000))
+        print(resultado.tabla())
+    """
+
+    def __init__(
+        self,
+        url_base: str,
+        modo: str = MODO_LOTE,
+        concurrencia: int = 8,
+        tamano_lote: int = MAX_DES_POR_LOTE,
+        validar: bool = True,
+        intervalo_consulta: float = 0.05,
+        max_consultas: int = 100,
+        contexto_ssl: Optional[ssl.SSLContext] = None,
+        almacen: Optional[AlmacenClaves] = None,
+    ):
+        if modo not in (MODO_LOTE, MODO_SINCRONO):
+            raise ValueError(f"Modo desconocido: {modo}")
+        self.url_base = url_base
+        self.modo = modo
+        self.concurrencia = concurrencia
+        self.tamano_lote = tamano_lote
+        self.validar = validar
+        self.intervalo_consulta = intervalo_consulta
+        self.max_consultas = max_consultas
+        self.contexto_ssl = contexto_ssl
+        self.almacen = almacen or almacen_por_defecto()
+
+    async def ejecutar(self, facturas: Iterable[Factura]) -> ResultadoCarga:
+        resultado = ResultadoCarga(etapas={nombre: Etapa(nombre) for nombre in ETAPAS})
+        opciones = dict(url_base=self.url_base, contexto_ssl=self.contexto_ssl, max_conexiones=self.concurrencia)
+        # Backpressure: no se firma mucho más de lo que se alcanza a enviar
+        tamano = self.tamano_lote if self.modo == MODO_LOTE else 1
+        cola: asyncio.Queue = asyncio.Queue(maxsize=2 * self.concurrencia * tamano)
+
+        inicio = time.perf_counter()
+        if self.modo == MODO_LOTE:
+            async with ClienteLote(**opciones) as envio, ClienteConsultaLote(**opciones) as consulta:
+                consumidor = asyncio.create_task(self._consumir_lotes(cola, envio, consulta, resultado))
+                await self._producir(facturas, cola, resultado)
+                await consumidor
+        else:
+            async with ClienteRecepcion(**opciones) as envio, \
+                    ClienteConsultaDE(**opciones, cache=CacheDE(ttl_pendiente=0)) as consulta:
+                trabajadores = [
+                    asyncio.create_task(self._consumir_de_a_uno(cola, envio, consulta, resultado))
+                    for _ in range(self.concurrencia)
+                ]
+                await self._producir(facturas, cola, resultado)
+                for _ in trabajadores:
+                    await cola.put(None)
+                await asyncio.gather(*trabajadores)
+        resultado.segundos = time.perf_counter() - inicio
+        return resultado
+
+    async def _producir(self, facturas: Iterable[Factura], cola: asyncio.Queue, resultado: ResultadoCarga):
+        etapas = resultado.etapas
+        for factura in facturas:
+            resultado.documentos += 1
+            comienzo = time.perf_counter()
+            documento = self._medir(etapas["construccion"], XMLBuilder.build_tree, factura)
+            if documento is not None:
+                documento = self._medir(etapas["firma"], firmar_xml, documento, self.almacen)
+            if documento is not None and self.validar:
+                # validar_xml no lanza: informa el error en la tupla
+                es_valido, _ = self._medir(etapas["validacion"], validar_xml, documento)
+                if not es_valido:
+                    etapas["validacion"].errores += 1
+                    documento = None
+            if documento is None:
+                resultado.fallidos += 1
+            else:
+                cdc = documento.find("{%s}DE" % SIFEN_NS).get("Id")
+                await cola.put((cdc, serializar_xml(documento), comienzo))
+            # Deja avanzar los envíos entre documento y documento
+            await asyncio.sleep(0)
+        if self.modo == MODO_LOTE:
+            await cola.put(None)
+
+    @staticmethod
+    def _medir(etapa: Etapa, funcion, *args):
+        inicio = time.perf_counter()
+        try:
+            valor = funcion(*args)
+        except Exception:
+            etapa.errores += 1
+            return None
+        etapa.duraciones.append(time.perf_counter() - inicio)
+        return valor
+
+    async def _consumir_de_a_uno(self, cola, envio: ClienteRecepcion, consulta: ClienteConsultaDE, resultado):
+        etapas = resultado.etapas
+        while True:
+            item = await cola.get()
+            if item is None:
+                return
+            cdc, xml, comienzo = item
+            inicio = time.perf_counter()
+            try:
+                respuesta = await envio.enviar(xml)
+            except Exception:
+                etapas["envio"].errores += 1
+                resultado.fallidos += 1
+                continue
+            etapas["envio"].duraciones.append(time.perf_counter() - inicio)
+            if not respuesta.aprobado:
+                resultado.rechazados += 1
+                continue
+
+            inicio = time.perf_counter()
+            try:
+                await consulta.consultar(cdc)
+            except Exception:
+                etapas["consulta"].errores += 1
+                resultado.fallidos += 1
+                continue
+            ahora = time.perf_counter()
+            etapas["consulta"].duraciones.append(ahora - inicio)
+            etapas["total"].duraciones.append(ahora - comienzo)
+            resultado.aprobados += 1
+
+    async def _consumir_lotes(self, cola, envio: ClienteLote, consulta: ClienteConsultaLote, resultado):
+        semaforo = asyncio.Semaphore(self.concurrencia)
+        tareas = set()
+        grupo: List[Tuple[str, bytes, float]] = []
+        while True:
+            item = await cola.get()
+            if item is not None:
+                grupo.append(item)
+            if grupo and (item is None or len(grupo) == self.tamano_lote):
+                await semaforo.acquire()
+                tarea = asyncio.create_task(self._procesar_lote(grupo, envio, consulta, resultado))
+                tarea.add_done_callback(lambda t: semaforo.release())
+                tareas.add(tarea)
+                grupo = []
+            if item is None:
+                break
+        await asyncio.gather(*tareas)
+
+    async def _procesar_lote(self, grupo, envio: ClienteLote, consulta: ClienteConsultaLote, resultado):
+        etapas = resultado.etapas
+        comienzos = {cdc: comienzo for cdc, _, comienzo in grupo}
+        inicio = time.perf_counter()
+        lote = await envio.enviar_lote([xml for _, xml, _ in grupo])
+        if not lote.recibido:
+            etapas["envio"].errores += 1
+            resultado.fallidos += len(grupo)
+            return
+        etapas["envio"].duraciones.append(time.perf_counter() - inicio)
+
+        for _ in range(self.max_consultas):
+            await asyncio.sleep(self.intervalo_consulta)
+            inicio = time.perf_counter()
+            try:
+                estado, resultados = await consulta.consultar(lote.protocolo)
+                resultados = list(resultados)
+            except Exception:
+                etapas["consulta"].errores += 1
+                continue
+            ahora = time.perf_counter()
+            etapas["consulta"].duraciones.append(ahora - inicio)
+            if estado.en_proceso:
+                continue
+            for resultado_de in resultados:
+                if resultado_de.aprobado:
+                    resultado.aprobados += 1
+                    etapas["total"].duraciones.append(ahora - comienzos[resultado_de.cdc])
+                else:
+                    resultado.rechazados += 1
+            resultado.fallidos += len(grupo) - len(resultados)
+            return
+        resultado.fallidos += len(grupo)
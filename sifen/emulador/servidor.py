@@ -0,0 +1,376 @@
+import asyncio
+import itertools
+import random
+import ssl
+from collections import Counter
+from datetime import datetime, timezone, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from lxml import etree
+
+from sifen.core.clients.http import leer_cuerpo, leer_encabezados
+from sifen.core.clients.lote import MAX_DES_POR_LOTE, desempaquetar_lote
+from sifen.core.clients.soap import CONTENT_TYPE, SIFEN_NS, SOAP_NS, armar_sobre, sifen
+from sifen.core.validators.registro_esquemas import registro
+
+ZONA_PY = timezone(timedelta(hours=-3))
+
+# Un manejador recibe el elemento del soap:Body y devuelve el de la respuesta
+Manejador = Callable[[etree._Element], Awaitable[etree._Element]]
+
+# Segundos fijos, o una función que devuelve la demora de cada solicitud
+Latencia = Union[float, Callable[[], float]]
+
+# Esquema del registro con el que se valida cada mensaje recibido
+ESQUEMAS_OPERACION = {
+    "rEnviDe": "rEnviDe",
+    "rEnvioLote": "rEnvioLote",
+    "rEnviConsLoteDe": "rEnviConsLoteDe",
+    "rEnviConsRUC": "rEnviConsRUC",
+    "rEnviConsDeRequest": "rEnviConsDe",
+    "rEnviEventoDe": "rEnviEventoDe",
+}
+
+# (dCodRes, dMsgRes) con que se rechaza un DE cuando `tasa_rechazos` > 0
+RECHAZOS = (
+    ("1000", "CDC no corresponde con las informaciones del XML"),
+    ("1001", "CDC duplicado"),
+)
+
+
+def fecha_proceso() -> str:
+    """Fecha/hora actual con el formato fecUTC de SIFEN."""
+    return datetime.now(ZONA_PY).replace(microsecond=0).isoformat()
+
+
+def respuesta_falla(codigo: str, motivo: str) -> bytes:
+    """soap:Fault serializado."""
+    falla = etree.Element("{%s}Fault" % SOAP_NS)
+    etree.SubElement(etree.SubElement(falla, "{%s}Code" % SOAP_NS), "{%s}Value" % SOAP_NS).text = codigo
+    etree.SubElement(etree.SubElement(falla, "{%s}Reason" % SOAP_NS), "{%s}Text" % SOAP_NS).text = motivo
+    return armar_sobre(falla)
+
+
+class ServidorSIFEN:
+    """
+    Servidor SOAP local que imita los servicios web de SIFEN, para pruebas
+    y benchmarks sin salir de la máquina.
+
+    Atiende HTTP/1.1 con keep-alive (y TLS si se indica un contexto de
+    servidor) y responde según el elemento raíz del soap:Body. Implementa
+    rEnviDe (aprueba todo DE recibido), rEnvioLote (encola el lote y
+    guarda sus CDC en `lotes`) y rEnviConsLoteDe (informa el lote en
+    procesamiento durante `consultas_en_proceso` consultas y luego aprueba
+    todos sus DE), rEnviConsRUC (encuentra los RUC cargados en
+    `contribuyentes`), rEnviConsDeRequest (informa el estado guardado en
+    `documentos` de cada DE aprobado) y rEnviEventoDe (registra todo
+    evento recibido y marca como cancelados los DE de las cancelaciones);
+    se pueden agregar o reemplazar manejadores en `manejadores`.
+
+    Para pruebas de carga se puede configurar la demora de cada operación
+    (fija o aleatoria), una fracción de solicitudes que fallan con un
+    soap:Fault de error interno, una fracción de DE rechazados (con uno de
+    los códigos de `rechazos`) y la validación de cada mensaje contra su
+    XSD, como hace SIFEN. Un mensaje inválido se responde con un soap:Fault.
+
+    Args:
+        host: Dirección donde escuchar.
+        puerto: Puerto (0 para uno libre; queda en `puerto` al iniciar).
+        contexto_ssl: Contexto TLS de servidor, para atender por https.
+        latencia: Demora de cada solicitud, en segundos o como función.
+        consultas_en_proceso: Consultas de un lote que lo informan en
+            procesamiento antes de concluirlo.
+        latencias: Demora por operación (elemento raíz del mensaje), en
+            lugar de `latencia`.
+        tasa_errores: Fracción de solicitudes que fallan con HTTP 500.
+        tasa_rechazos: Fracción de DE (de rEnviDe y de los lotes) rechazados.
+        rechazos: Códigos y mensajes de rechazo posibles.
+        validar: Valida cada mensaje contra su XSD (ESQUEMAS_OPERACION).
+        azar: Generador aleatorio, para resultados reproducibles.
+
+    Ejemplo:
+        async with ServidorSIFEN() as servidor:
+            async with ClienteRecepcion(url_base=servidor.url) as cliente:
+                await cliente.enviar(xml_firmado)
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        puerto: int = 0,
+        contexto_ssl: Optional[ssl.SSLContext] = None,
+        latencia: Latencia = 0.0,
+        consultas_en_proceso: int = 0,
+        latencias: Optional[Dict[str, Latencia]] = None,
+        tasa_errores: float = 0.0,
+        tasa_rechazos: float = 0.0,
+        rechazos: Sequence[Tuple[str, str]] = RECHAZOS,
+        validar: bool = False,
+        azar: Optional[random.Random] = None,
+    ):
+        self.host = host
+        self.puerto = puerto
+        self.contexto_ssl = contexto_ssl
+        self.latencia = latencia
+        self.consultas_en_proceso = consultas_en_proceso
+        self.latencias = dict(latencias or {})
+        self.tasa_errores = tasa_errores
+        self.tasa_rechazos = tasa_rechazos
+        self.rechazos = list(rechazos)
+        self.validar = validar
+        self.azar = azar or random.Random()
+        self.manejadores: Dict[str, Manejador] = {
+            "rEnviDe": self._recibir_de,
+            "rEnvioLote": self._recibir_lote,
+            "rEnviConsLoteDe": self._consultar_lote,
+            "rEnviConsRUC": self._consultar_ruc,
+            "rEnviConsDeRequest": self._consultar_de,
+            "rEnviEventoDe": self._recibir_eventos,
+        }
+        self.solicitudes = 0
+        self.conexiones = 0
+        self.lotes: Dict[str, List[str]] = {}  # dProtConsLote -> CDC del lote
+        self.consultas_lote: Dict[str, int] = {}
+        self.contribuyentes: Dict[str, str] = {}  # RUC -> razón social
+        self.documentos: Dict[str, str] = {}  # CDC -> estado (Aprobado, Cancelado)
+        self.eventos = 0  # Eventos registrados
+        self.rechazados: Dict[str, Tuple[str, str]] = {}  # CDC -> (dCodRes, dMsgRes)
+        self.operaciones: Counter = Counter()  # Solicitudes atendidas por operación
+        self.errores = 0  # Solicitudes respondidas con error interno
+        self.en_curso = 0
+        self.max_en_curso = 0
+        self._protocolos = itertools.count(1)
+        self._protocolos_lote = itertools.count(1)
+        self._servidor: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def url(self) -> str:
+        esquema = "https" if self.contexto_ssl else "http"
+        return f"{esquema}://{self.host}:{self.puerto}"
+
+    async def __aenter__(self):
+        await self.iniciar()
+        return self
+
+    async def __aexit__(self, *excinfo):
+        await self.detener()
+
+    async def iniciar(self):
+        self._servidor = await asyncio.start_server(
+            self._atender, self.host, self.puerto, ssl=self.contexto_ssl
+        )
+        self.puerto = self._servidor.sockets[0].getsockname()[1]
+
+    async def detener(self):
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+            self._servidor = None
+
+    async def _atender(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.conexiones += 1
+        try:
+            while True:
+                linea = await reader.readline()
+                if not linea.strip():
+                    break
+                encabezados = await leer_encabezados(reader)
+                cuerpo = await leer_cuerpo(reader, encabezados) or b""
+                self.solicitudes += 1
+
+                estado, respuesta = await self._procesar(cuerpo)
+                cerrar = encabezados.get("connection", "").lower() == "close"
+                writer.write(
+                    (
+                        f"HTTP/1.1 {estado}\r\n"
+                        f"Content-Type: {CONTENT_TYPE}\r\n"
+                        f"Content-Length: {len(respuesta)}\r\n"
+                        f"Connection: {'close' if cerrar else 'keep-alive'}\r\n\r\n"
+                    ).encode("latin-1")
+                    + respuesta
+                )
+                await writer.drain()
+                if cerrar:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ssl.SSLError):
+            pass
+        finally:
+            writer.close()
+
+    async def _procesar(self, cuerpo: bytes):
+        try:
+            contenido = etree.fromstring(cuerpo).find("{%s}Body" % SOAP_NS)[0]
+        except (etree.XMLSyntaxError, TypeError, IndexError):
+            return "400 Bad Request", respuesta_falla("soap:Sender", "Sobre SOAP inválido")
+
+        operacion = etree.QName(contenido).localname
+        manejador = self.manejadores.get(operacion)
+        if manejador is None:
+            return "500 Internal Server Error", respuesta_falla(
+                "soap:Sender", f"Operación no soportada: {operacion}"
+            )
+        self.operaciones[operacion] += 1
+        self.en_curso += 1
+        self.max_en_curso = max(self.max_en_curso, self.en_curso)
+        try:
+            latencia = self.latencias.get(operacion, self.latencia)
+            latencia = latencia() if callable(latencia) else latencia
+            if latencia:
+                await asyncio.sleep(latencia)
+            if self.tasa_errores and self.azar.random() < self.tasa_errores:
+                self.errores += 1
+                return "500 Internal Server Error", respuesta_falla("soap:Receiver", "Error interno del servidor")
+            if self.validar and operacion in ESQUEMAS_OPERACION:
+                try:
+                    registro.validar(contenido, ESQUEMAS_OPERACION[operacion])
+                except etree.DocumentInvalid as e:
+                    return "400 Bad Request", respuesta_falla("soap:Sender", f"Mensaje inválido: {e}")
+            return "200 OK", armar_sobre(await manejador(contenido))
+        finally:
+            self.en_curso -= 1
+
+    def _rechazo(self, cdc: str) -> Optional[Tuple[str, str]]:
+        """Decide (una sola vez por CDC) si el DE se rechaza."""
+        if cdc not in self.rechazados and self.tasa_rechazos and self.azar.random() < self.tasa_rechazos:
+            self.rechazados[cdc] = self.azar.choice(self.rechazos)
+        return self.rechazados.get(cdc)
+
+    async def _recibir_de(self, mensaje: etree._Element) -> etree._Element:
+        de = mensaje.find("%s/%s/%s" % (sifen("xDE"), sifen("rDE"), sifen("DE")))
+        digest = mensaje.findtext(".//{http://www.w3.org/2000/09/xmldsig#}DigestValue")
+
+        respuesta = etree.Element(sifen("rRetEnviDe"), nsmap={None: SIFEN_NS})
+        prot = etree.SubElement(respuesta, sifen("rProtDe"))
+        if de is not None:
+            etree.SubElement(prot, sifen("Id")).text = de.get("Id")
+        etree.SubElement(prot, sifen("dFecProc")).text = fecha_proceso()
+        if digest:
+            etree.SubElement(prot, sifen("dDigVal")).text = digest
+        rechazo = self._rechazo(de.get("Id")) if de is not None else ("0160", "XML malformado")
+        if rechazo:
+            etree.SubElement(prot, sifen("dEstRes")).text = "Rechazado"
+            resultado = rechazo
+        else:
+            etree.SubElement(prot, sifen("dEstRes")).text = "Aprobado"
+            etree.SubElement(prot, sifen("dProtAut")).text = str(next(self._protocolos))
+            self.documentos[de.get("Id")] = "Aprobado"
+            resultado = ("0260", "Autorización del DE satisfactoria")
+        g_res = etree.SubElement(prot, sifen("gResProc"))
+        etree.SubElement(g_res, sifen("dCodRes")).text = resultado[0]
+        etree.SubElement(g_res, sifen("dMsgRes")).text = resultado[1]
+        return respuesta
+
+    async def _recibir_lote(self, mensaje: etree._Element) -> etree._Element:
+        respuesta = etree.Element(sifen("rResEnviLoteDe"), nsmap={None: SIFEN_NS})
+        etree.SubElement(respuesta, sifen("dFecProc")).text = fecha_proceso()
+        try:
+            lote = desempaquetar_lote(mensaje.findtext(sifen("xDE")) or "")
+        except Exception:
+            lote = None
+
+        documentos = lote.findall(sifen("rDE")) if lote is not None else []
+        if not documentos or len(documentos) > MAX_DES_POR_LOTE:
+            etree.SubElement(respuesta, sifen("dCodRes")).text = "0301"
+            etree.SubElement(respuesta, sifen("dMsgRes")).text = "Lote no encolado para procesamiento"
+            return respuesta
+
+        protocolo = str(next(self._protocolos_lote))
+        self.lotes[protocolo] = [rde.find(sifen("DE")).get("Id") for rde in documentos]
+        for cdc in self.lotes[protocolo]:
+            self._rechazo(cdc)
+        etree.SubElement(respuesta, sifen("dCodRes")).text = "0300"
+        etree.SubElement(respuesta, sifen("dMsgRes")).text = "Lote recibido con éxito"
+        etree.SubElement(respuesta, sifen("dProtConsLote")).text = protocolo
+        etree.SubElement(respuesta, sifen("dTpoProces")).text = "0"
+        return respuesta
+
+    async def _consultar_lote(self, mensaje: etree._Element) -> etree._Element:
+        protocolo = mensaje.findtext(sifen("dProtConsLote"))
+        respuesta = etree.Element(sifen("rResEnviConsLoteDe"), nsmap={None: SIFEN_NS})
+        etree.SubElement(respuesta, sifen("dFecProc")).text = fecha_proceso()
+
+        if protocolo not in self.lotes:
+            codigo, texto = "0360", "Número de Lote inexistente"
+        else:
+            consultas = self.consultas_lote[protocolo] = self.consultas_lote.get(protocolo, 0) + 1
+            if consultas <= self.consultas_en_proceso:
+                codigo, texto = "0361", f"Lote {protocolo} en procesamiento"
+            else:
+                codigo, texto = "0362", f"Procesamiento de lote {protocolo} concluido"
+        etree.SubElement(respuesta, sifen("dCodResLot")).text = codigo
+        etree.SubElement(respuesta, sifen("dMsgResLot")).text = texto
+
+        if codigo == "0362":
+            for cdc in self.lotes[protocolo]:
+                rechazo = self.rechazados.get(cdc)
+                g_res_lote = etree.SubElement(respuesta, sifen("gResProcLote"))
+                etree.SubElement(g_res_lote, sifen("id")).text = cdc
+                if rechazo:
+                    etree.SubElement(g_res_lote, sifen("dEstRes")).text = "Rechazado"
+                else:
+                    etree.SubElement(g_res_lote, sifen("dEstRes")).text = "Aprobado"
+                    etree.SubElement(g_res_lote, sifen("dProtAut")).text = str(next(self._protocolos))
+                    self.documentos.setdefault(cdc, "Aprobado")
+                g_res = etree.SubElement(g_res_lote, sifen("gResProc"))
+                codigo, mensaje = rechazo or ("0260", "Autorización del DE satisfactoria")
+                etree.SubElement(g_res, sifen("dCodRes")).text = codigo
+                etree.SubElement(g_res, sifen("dMsgRes")).text = mensaje
+        return respuesta
+
+    async def _consultar_ruc(self, mensaje: etree._Element) -> etree._Element:
+        ruc = mensaje.findtext(sifen("dRUCCons"))
+        respuesta = etree.Element(sifen("rResEnviConsRUC"), nsmap={None: SIFEN_NS})
+        if ruc not in self.contribuyentes:
+            etree.SubElement(respuesta, sifen("dCodRes")).text = "0500"
+            etree.SubElement(respuesta, sifen("dMsgRes")).text = "RUC no existe"
+            return respuesta
+
+        etree.SubElement(respuesta, sifen("dCodRes")).text = "0502"
+        etree.SubElement(respuesta, sifen("dMsgRes")).text = "RUC encontrado"
+        contenedor = etree.SubElement(respuesta, sifen("xContRUC"))
+        etree.SubElement(contenedor, sifen("dRUCCons")).text = ruc
+        etree.SubElement(contenedor, sifen("dRazCons")).text = self.contribuyentes[ruc]
+        etree.SubElement(contenedor, sifen("dCodEstCons")).text = "ACT"
+        etree.SubElement(contenedor, sifen("dDesEstCons")).text = "ACTIVO"
+        etree.SubElement(contenedor, sifen("dRUCFactElec")).text = "S"
+        return respuesta
+
+    async def _consultar_de(self, mensaje: etree._Element) -> etree._Element:
+        cdc = mensaje.findtext(sifen("dCDC"))
+        estado = self.documentos.get(cdc)
+        respuesta = etree.Element(sifen("rEnviConsDeResponse"), nsmap={None: SIFEN_NS})
+        etree.SubElement(respuesta, sifen("dFecProc")).text = fecha_proceso()
+        if estado is None:
+            etree.SubElement(respuesta, sifen("dCodRes")).text = "0420"
+            etree.SubElement(respuesta, sifen("dMsgRes")).text = "Documento No Existe en SIFEN o ha sido Rechazado"
+            return respuesta
+
+        etree.SubElement(respuesta, sifen("dCodRes")).text = "0422"
+        etree.SubElement(respuesta, sifen("dMsgRes")).text = "CDC encontrado"
+        # xContenDE lleva el rContDe serializado como texto
+        contenido = etree.Element(sifen("rContDe"), nsmap={None: SIFEN_NS})
+        etree.SubElement(contenido, sifen("dProtAut")).text = str(next(self._protocolos))
+        if estado == "Cancelado":
+            evento = etree.SubElement(contenido, sifen("xContEv"))
+            for tag in ("rContEv", "xEvento", "rEve", "gGroupTiEvt", "rGeVeCan"):
+                evento = etree.SubElement(evento, sifen(tag))
+            etree.SubElement(evento, sifen("Id")).text = cdc
+        etree.SubElement(respuesta, sifen("xContenDE")).text = etree.tostring(contenido, encoding="unicode")
+        return respuesta
+
+    async def _recibir_eventos(self, mensaje: etree._Element) -> etree._Element:
+        respuesta = etree.Element(sifen("rRetEnviEventoDe"), nsmap={None: SIFEN_NS})
+        etree.SubElement(respuesta, sifen("dFecProc")).text = fecha_proceso()
+        for r_eve in mensaje.iterfind(".//" + sifen("rEve")):
+            cancelado = r_eve.findtext("%s/%s/%s" % (sifen("gGroupTiEvt"), sifen("rGeVeCan"), sifen("Id")))
+            if cancelado:
+                self.documentos[cancelado] = "Cancelado"
+            self.eventos += 1
+            g_res_eve = etree.SubElement(respuesta, sifen("gResProcEVe"))
+            etree.SubElement(g_res_eve, sifen("dEstRes")).text = "Aprobado"
+            etree.SubElement(g_res_eve, sifen("dProtAut")).text = str(next(self._protocolos))
+            etree.SubElement(g_res_eve, sifen("id")).text = r_eve.get("Id")
+            g_res = etree.SubElement(g_res_eve, sifen("gResProc"))
+            etree.SubElement(g_res, sifen("dCodRes")).text = "0600"
+            etree.SubElement(g_res, sifen("dMsgRes")).text = "Evento registrado correctamente"
+        return respuesta
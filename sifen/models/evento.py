@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from typing import Union
+
+
+def _validar_motivo(motivo: str):
+    if not motivo or not 5 <= len(motivo.strip()) <= 500:
+        raise ValueError("El motivo del evento debe tener entre 5 y 500 caracteres.")
+
+
+@dataclass
+class EventoCancelacion:
+    cdc: str                # Id del DE a cancelar (44 dígitos)
+    motivo: str             # mOtEve (5 a 500 caracteres)
+
+    def validar(self):
+        if len(self.cdc) != 44 or not self.cdc.isdigit():
+            raise ValueError("El CDC a cancelar debe tener 44 dígitos.")
+        _validar_motivo(self.motivo)
+
+
+@dataclass
+class EventoInutilizacion:
+    timbrado: str           # dNumTim (8 dígitos)
+    establecimiento: str    # dEst (ej: "001")
+    punto_expedicion: str   # dPunExp (ej: "001")
+    numero_inicio: int      # dNumIn
+    numero_fin: int         # dNumFin
+    motivo: str             # mOtEve (5 a 500 caracteres)
+    tipo_documento: str = "1"  # iTiDE: 1(Factura electrónica), 5(Nota de crédito), ...
+
+    def validar(self):
+        if len(self.timbrado) != 8 or not self.timbrado.isdigit():
+            raise ValueError("El timbrado debe tener 8 dígitos.")
+        if len(self.establecimiento) != 3 or len(self.punto_expedicion) != 3:
+            raise ValueError("Establecimiento y punto de expedición deben tener 3 dígitos.")
+        if not 1 <= int(self.numero_inicio) <= int(self.numero_fin) <= 9999999:
+            raise ValueError("El rango a inutilizar debe cumplir 1 <= inicio <= fin <= 9999999.")
+        _validar_motivo(self.motivo)
+
+
+Evento = Union[EventoCancelacion, EventoInutilizacion]
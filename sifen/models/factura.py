@@ -1,17 +1,20 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from .DatosSeguros import DatosSeguros
 from .emisor import Emisor
 from .receptor import Receptor
 from .item import ItemFactura
+from .tabla_items import TablaItems
 from decimal import Decimal
 from .cuota import Cuota
 from .datos_energia import DatosEnergia
 from .datos_supermercado import DatosSupermercado
 from .datos_transporte import DatosTransporte
 from .transportista import Transportista
+from .totales import calcular_totales
+from ..utils.cdc import generar_cdc
 
 @dataclass
 class Factura:
@@ -22,7 +25,7 @@ class Factura:
     datos_transportista = Transportista
     emisor: Emisor
     receptor: Receptor
-    items: List[ItemFactura]
+    items: Union[List[ItemFactura], TablaItems]
     fecha_emision: datetime = field(default_factory=datetime.now)
     #Tipo de operacion: 1(B2B), 2(B2C), 3(B2G), 4(B2F)
     #B2B (Business to Business):Transacciones comerciales entre dos empresas o negocios.
@@ -78,13 +81,22 @@ class Factura:
     tipo_cambio_base: str = "" # hasta 9 digitos, limite de 4 digitos a decimales
     condicion_anticipo: str ="" #1 anticipo global, 2 anticipo por item
 
-    def validar(self):
-        """Valida la factura completa según reglas SIFEN."""
-        if not self.items:
-            raise ValueError("La factura debe tener al menos un ítem.")
-        
-        for item in self.items:
-            item.validar()  # Valida cada ítem
+    def validar(self, validar_items: bool = True):
+        """
+        Valida la factura completa según reglas SIFEN.
+
+        Con validar_items=False no se recorren los ítems; lo usa el modo
+        streaming del XMLBuilder, que los valida a medida que los escribe.
+        """
+        if validar_items:
+            if not self.items:
+                raise ValueError("La factura debe tener al menos un ítem.")
+
+            if isinstance(self.items, TablaItems):
+                self.items.validar()  # Valida todas las columnas de una vez
+            else:
+                for item in self.items:
+                    item.validar()  # Valida cada ítem
     
         if self.condicion_venta == "2":  # Crédito
             if not self.tipo_credito:
@@ -105,26 +117,11 @@ class Factura:
             raise ValueError("Número de factura debe tener formato XXX-XXX-XXXXXXX (numérico).")
 
     def generar_id(self) -> str:
-        """Genera el ID único para el XML según formato SIFEN (44 caracteres exactos)."""
-        partes = self.numero_factura.split("-")
-        return (
-            f"{self.tipo_operacion}"                     # 1 carácter
-            f"{self.emisor.ruc}"                         # 8 caracteres
-            f"{self.emisor.dv}"                          # 1 carácter
-            f"{self.tipo_factura.zfill(2)}"              # 2 caracteres
-            f"{partes[0].zfill(3)}"                      # 3 caracteres (Establecimiento)
-            f"{partes[1].zfill(3)}"                      # 3 caracteres (Punto expedición)
-            f"{partes[2].zfill(7)}"                      # 7 caracteres (Número)
-            f"{self.fecha_emision.strftime('%Y%m%d')}"   # 8 caracteres (AAAAMMDD)
-            "00000000001"                                   # 8 caracteres FIJOS (nro aleatorio)
-        )  # Total: 1+8+1+2+3+3+7+8+8 = 44 caracteres
+        """Genera el ID único (CDC) para el XML según formato SIFEN (44 caracteres exactos)."""
+        return generar_cdc(self)
 
     def calcular_totales(self) -> dict:
-        """Calcula totales generales de la factura."""
-        subtotal = sum(item.calcular_subtotal() for item in self.items)
-        iva = sum(item.calcular_iva() for item in self.items)
-        return {
-            "subtotal": subtotal,
-            "iva": iva,
-            "total": subtotal + iva
-        }
\ No newline at end of file
+        """Calcula totales generales de la factura en una sola pasada por los ítems."""
+        if isinstance(self.items, TablaItems):
+            return self.items.calcular_totales().to_dict()
+        return calcular_totales(self.items).to_dict()
\ No newline at end of file
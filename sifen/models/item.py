@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from typing import Optional
 import warnings
-from ..utils.constants import MONEDAS
+from .totales import TotalesItem, calcular_item
 
 @dataclass
 class ItemFactura:
@@ -74,31 +74,38 @@ class ItemFactura:
         if self.tasa_iva == 0 and (self.descuento or self.porcentaje_descuento):
             warnings.warn("Aplicando descuentos a un ítem con IVA 0%.")
 
+    def __setattr__(self, nombre, valor):
+        # Cualquier cambio en un campo invalida los montos ya calculados
+        object.__setattr__(self, nombre, valor)
+        if nombre != "_totales":
+            self.__dict__.pop("_totales", None)
+
+    @property
+    def totales(self) -> TotalesItem:
+        """Montos del ítem, calculados una vez y reutilizados hasta que cambie algún campo."""
+        totales = self.__dict__.get("_totales")
+        if totales is None:
+            totales = calcular_item(self)
+            self._totales = totales
+        return totales
+
     def calcular_subtotal(self) -> Decimal:
         """Calcula subtotal sin IVA."""
-        return (Decimal(str(self.cantidad * self.precio_unitario)).quantize(Decimal('0.01')))
+        return self.totales.subtotal
 
     def calcular_iva(self) -> Decimal:
         """Calcula monto de IVA sobre la base imponible."""
-        return (self.base_imponible * (Decimal(str(self.tasa_iva)) / Decimal("100"))).quantize(Decimal('0.01'))
-    
-
-
-
+        return self.totales.iva
 
     @property
     def base_imponible(self) -> Decimal:
         """Calcula la base imponible después de descuentos."""
-        subtotal = self.calcular_subtotal()
-        descuento = Decimal(str(self.descuento or 0))
-        descuento_porcentual = subtotal * (Decimal(str(self.porcentaje_descuento or 0)) / Decimal("100"))
-        descuento_global = Decimal(str(self.descuento_global_Item or 0))
-        return (subtotal - descuento - descuento_porcentual - descuento_global).quantize(Decimal('0.01'))
+        return self.totales.base_imponible
 
     @property
     def total(self) -> Decimal:
         """Calcula el total final del ítem (base imponible + IVA)."""
-        return (self.base_imponible + self.calcular_iva()).quantize(Decimal('0.01'))
+        return self.totales.total
 
     def to_dict(self) -> dict:
         """Devuelve una representación en diccionario del ítem."""
@@ -112,9 +119,9 @@ class ItemFactura:
             "descuento": float(self.descuento) if self.descuento else None,
             "porcentaje_descuento": float(self.porcentaje_descuento) if self.porcentaje_descuento else None,
             "descuento_global": float(self.descuento_global_Item) if self.descuento_global_Item else None,
-            "subtotal": float(self.calcular_subtotal()),
-            "base_imponible": float(self.base_imponible),
-            "total": float(self.total)
+            "subtotal": float(self.totales.subtotal),
+            "base_imponible": float(self.totales.base_imponible),
+            "total": float(self.totales.total)
         }
 
 
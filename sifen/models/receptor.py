@@ -1,6 +1,11 @@
 from dataclasses import dataclass
 import re
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+from sifen.utils.cdc import calcular_dv
+
+if TYPE_CHECKING:
+    from sifen.core.clients.consulta_ruc import DatosRUC
 
 @dataclass
 class Receptor:
@@ -23,6 +28,25 @@ class Receptor:
     c_departamento: str ="2"
     c_distrito: str = "7"
     c_ciudad: str = "1046"  # Código de ciudad (ej: 1 para Asunción)
+    datos_ruc: Optional["DatosRUC"] = None  # Resultado de siConsRUC (ver ClienteConsultaRUC)
+
+    @classmethod
+    def desde_consulta_ruc(cls, datos: "DatosRUC", **kwargs) -> "Receptor":
+        """
+        Receptor contribuyente armado a partir de una consulta de RUC; el DV
+        se calcula y el nombre es la razón social registrada en SIFEN.
+        """
+        kwargs.setdefault("dv", str(calcular_dv(datos.ruc)))
+        kwargs.setdefault("tipo_doc_sin_ruc", "")
+        kwargs.setdefault("nombre", datos.razon_social or "")
+        return cls(ruc=datos.ruc, datos_ruc=datos, **kwargs)
+
+    @property
+    def nombre_registrado(self) -> str:
+        """Razón social según SIFEN si se consultó el RUC; si no, `nombre`."""
+        if self.datos_ruc is not None and self.datos_ruc.encontrado and self.datos_ruc.razon_social:
+            return self.datos_ruc.razon_social
+        return self.nombre
 
     def validar(self):
         if not self.ruc.isdigit() or len(self.ruc) not in (6, 8):  # RUC Paraguay puede ser 6 u 8 dígitos
@@ -31,6 +55,11 @@ class Receptor:
             raise ValueError("DV debe ser un dígito (0-9).")
         if self.tipo_contribuyente not in ("1", "2"):
             raise ValueError("Tipo de contribuyente debe ser '1' (física) o '2' (jurídica).")
+        if self.datos_ruc is not None:
+            if self.datos_ruc.ruc != self.ruc:
+                raise ValueError(f"La consulta de RUC corresponde a {self.datos_ruc.ruc}, no a {self.ruc}.")
+            if not self.datos_ruc.encontrado:
+                raise ValueError(f"RUC del receptor no encontrado en SIFEN: {self.datos_ruc.mensaje}")
 
     @staticmethod
     def validar_email(email):
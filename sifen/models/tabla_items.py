@@ -0,0 +1,428 @@
+import sys
+import warnings
+from array import array
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .totales import CERO, TotalesFactura, TotalesItem
+
+# Escalas de las columnas numéricas: cada valor se guarda como entero en la
+# unidad mínima indicada (centavos para montos, diezmilésimos para cantidad).
+ESCALA_CANTIDAD = 10_000
+ESCALA_MONTO = 100
+ESCALA_PORCENTAJE = 100
+
+# Campos opcionales poco frecuentes: se guardan solo en las filas que los usan
+CAMPOS_DISPERSOS = (
+    "codigo_tipo_item",
+    "codigo_unidad_medida",
+    "codigo_producto",
+    "codigo_unidad_medida_comercial",
+    "codigo_partida_arancelaria",
+    "codigo_nandina",
+    "pais_origen",
+    "nombre_pais_origen",
+    "numero_serie",
+    "numero_lote",
+    "fecha_vencimiento",
+)
+
+_SIN_TASA = -1
+
+
+def _a_entero(valor, escala: int, campo: str) -> int:
+    """Pasa un valor a unidades mínimas sin perder precisión."""
+    if valor is None:
+        return 0
+    decimal = valor if isinstance(valor, Decimal) else Decimal(str(valor))
+    escalado = decimal * escala
+    if escalado != escalado.to_integral_value():
+        raise ValueError(f"{campo} no es representable con {len(str(escala)) - 1} decimales: {valor}")
+    return int(escalado)
+
+
+def _controlar_rango(columna: array, valor: int, campo: str):
+    """Falla si el valor no entra en el tipo de la columna (p. ej. "b": -128..127)."""
+    try:
+        array(columna.typecode, (valor,))
+    except OverflowError:
+        raise ValueError(f"{campo} fuera de rango: {valor}") from None
+
+
+def _redondear(numerador: int, divisor: int) -> int:
+    """División entera con redondeo al par, igual que Decimal.quantize."""
+    cociente, resto = divmod(numerador, divisor)
+    if 2 * resto > divisor or (2 * resto == divisor and cociente % 2):
+        cociente += 1
+    return cociente
+
+
+def _monto(centavos: int) -> Decimal:
+    """Monto calculado con dos decimales, como los de ItemFactura."""
+    return Decimal(centavos).scaleb(-2)
+
+
+def _valor(entero: int, escala: int) -> Decimal:
+    """Valor de entrada con la menor cantidad de decimales necesaria."""
+    return Decimal(entero) / escala
+
+
+class TablaItems:
+    """
+    Ítems de una factura guardados por columnas.
+
+    Cada columna numérica es un `array` de enteros en unidades mínimas, de
+    modo que una factura de 999 ítems ocupa unos pocos KB en lugar de 999
+    objetos ItemFactura. Los cálculos (subtotal, descuentos, IVA) se hacen
+    columna por columna con aritmética entera exacta y se guardan hasta que
+    se agregue otro ítem.
+
+    Factura acepta una TablaItems en lugar de List[ItemFactura]: al
+    recorrerla se obtienen vistas FilaItem que leen directamente de las
+    columnas, sin copiar datos.
+    """
+
+    def __init__(self):
+        self._codigo: List[str] = []
+        self._descripcion: List[str] = []
+        self._unidad_medida: List[str] = []
+        self._cantidad = array("q")
+        self._precio = array("q")
+        self._afectacion = array("b")
+        self._tasa = array("b")
+        self._proporcion = array("l")
+        self._liq_iva = array("q")
+        self._descuento = array("q")
+        self._porcentaje = array("l")
+        self._descuento_global = array("q")
+        self._dispersos: Dict[str, Dict[int, object]] = {campo: {} for campo in CAMPOS_DISPERSOS}
+        self._calculadas: Optional[Dict[str, array]] = None
+        self._validada = False
+
+    @classmethod
+    def desde_items(cls, items: Iterable) -> "TablaItems":
+        """Crea la tabla a partir de ítems ya existentes (p. ej. ItemFactura)."""
+        tabla = cls()
+        for item in items:
+            tabla.agregar(
+                codigo=item.codigo,
+                descripcion=item.descripcion,
+                cantidad=item.cantidad,
+                precio_unitario=item.precio_unitario,
+                afectacion_iva=item.afectacion_iva,
+                proporcion_iva=item.proporcion_iva,
+                tasa_iva=item.tasa_iva,
+                liq_IVA=item.liq_IVA,
+                unidad_medida=item.unidad_medida,
+                descuento=item.descuento,
+                porcentaje_descuento=item.porcentaje_descuento,
+                descuento_global_Item=item.descuento_global_Item,
+                **{campo: getattr(item, campo, None) for campo in CAMPOS_DISPERSOS},
+            )
+        return tabla
+
+    def agregar(
+        self,
+        codigo: str,
+        descripcion: str,
+        cantidad,
+        precio_unitario,
+        afectacion_iva: str = "1",
+        proporcion_iva: Optional[Decimal] = None,
+        tasa_iva=None,
+        liq_IVA: Optional[Decimal] = None,
+        unidad_medida: str = "77",
+        descuento: Optional[Decimal] = None,
+        porcentaje_descuento: Optional[Decimal] = None,
+        descuento_global_Item: Optional[Decimal] = None,
+        **opcionales,
+    ):
+        """
+        Agrega un ítem. Recibe los mismos campos que ItemFactura.
+
+        Raises:
+            ValueError: Si un valor numérico tiene más decimales de los que
+                admite su columna o no entra en ella.
+            TypeError: Si se indica un campo que ItemFactura no tiene.
+        """
+        desconocidos = set(opcionales) - set(CAMPOS_DISPERSOS)
+        if desconocidos:
+            raise TypeError(f"Campos de ítem desconocidos: {', '.join(sorted(desconocidos))}")
+
+        # Se convierte y se controla el rango de todo antes de tocar las
+        # columnas para que un valor inválido no deje la tabla con columnas
+        # de distinto largo
+        numericos = (
+            ("cantidad", self._cantidad, _a_entero(cantidad, ESCALA_CANTIDAD, "cantidad")),
+            ("precio_unitario", self._precio, _a_entero(precio_unitario, ESCALA_MONTO, "precio_unitario")),
+            ("afectacion_iva", self._afectacion, int(afectacion_iva or "1")),
+            ("tasa_iva", self._tasa, _SIN_TASA if tasa_iva is None else _a_entero(tasa_iva, 1, "tasa_iva")),
+            ("proporcion_iva", self._proporcion, _a_entero(proporcion_iva, ESCALA_PORCENTAJE, "proporcion_iva")),
+            ("liq_IVA", self._liq_iva, _a_entero(liq_IVA, ESCALA_MONTO, "liq_IVA")),
+            ("descuento", self._descuento, _a_entero(descuento, ESCALA_MONTO, "descuento")),
+            ("porcentaje_descuento", self._porcentaje,
+             _a_entero(porcentaje_descuento, ESCALA_PORCENTAJE, "porcentaje_descuento")),
+            ("descuento_global_Item", self._descuento_global,
+             _a_entero(descuento_global_Item, ESCALA_MONTO, "descuento_global_Item")),
+        )
+        for campo, columna, valor in numericos:
+            _controlar_rango(columna, valor, campo)
+        unidad_medida = sys.intern(unidad_medida)
+
+        indice = len(self._codigo)
+        for _, columna, valor in numericos:
+            columna.append(valor)
+        self._codigo.append(codigo)
+        self._descripcion.append(descripcion)
+        self._unidad_medida.append(unidad_medida)
+        for campo, valor in opcionales.items():
+            if valor is not None:
+                self._dispersos[campo][indice] = valor
+
+        self._calculadas = None
+        self._validada = False
+
+    def __len__(self) -> int:
+        return len(self._codigo)
+
+    def __iter__(self) -> Iterator["FilaItem"]:
+        return (FilaItem(self, indice) for indice in range(len(self._codigo)))
+
+    def __getitem__(self, indice: int) -> "FilaItem":
+        if indice < 0:
+            indice += len(self._codigo)
+        if not 0 <= indice < len(self._codigo):
+            raise IndexError("Índice de ítem fuera de rango")
+        return FilaItem(self, indice)
+
+    def validar(self):
+        """
+        Aplica las validaciones de ItemFactura a todas las filas, columna por
+        columna. Si la tabla no cambió desde la última validación no vuelve a
+        recorrerla.
+        """
+        if self._validada:
+            return
+
+        def primera(columna, condicion):
+            return next((i for i, valor in enumerate(columna) if condicion(valor)), None)
+
+        reglas = (
+            (self._codigo, lambda c: not c or len(c) > 20, "Código de ítem es obligatorio (max 20 caracteres)."),
+            (self._cantidad, lambda c: c <= 0, "La cantidad debe ser mayor a 0."),
+            (self._precio, lambda p: p <= 0, "El precio unitario debe ser positivo."),
+            (self._tasa, lambda t: t not in (0, 5, 10), "IVA debe ser 0%, 5% o 10%."),
+            (self._descuento, lambda d: d < 0, "El descuento no puede ser negativo."),
+            (self._porcentaje, lambda p: p < 0 or p > 100 * ESCALA_PORCENTAJE,
+             "El porcentaje de descuento debe estar entre 0 y 100."),
+            (self._descuento_global, lambda d: d < 0, "El descuento global no puede ser negativo."),
+        )
+        for columna, condicion, mensaje in reglas:
+            indice = primera(columna, condicion)
+            if indice is not None:
+                raise ValueError(f"Ítem {indice + 1}: {mensaje}")
+
+        for indice, codigo in self._dispersos["codigo_producto"].items():
+            if len(codigo) > 20:
+                raise ValueError(f"Ítem {indice + 1}: Código de producto (GTIN/EAN) no puede exceder 20 caracteres")
+
+        if any(t == 0 and (d or p) for t, d, p in zip(self._tasa, self._descuento, self._porcentaje)):
+            warnings.warn("Aplicando descuentos a un ítem con IVA 0%.")
+        hoy = datetime.now().date()
+        if any(f < hoy for f in self._dispersos["fecha_vencimiento"].values()):
+            warnings.warn("Fecha de vencimiento del producto es anterior a la fecha actual")
+
+        self._validada = True
+
+    def _columnas_calculadas(self) -> Dict[str, array]:
+        """Subtotal, descuentos, base imponible, IVA y total de cada fila, en centavos."""
+        if self._calculadas is not None:
+            return self._calculadas
+
+        # Descuento porcentual: subtotal * porcentaje / 100, con el porcentaje
+        # en centésimos; se trabaja en diezmilésimos de centavo para no redondear
+        factor = 100 * ESCALA_PORCENTAJE
+        subtotales = array("q", (
+            _redondear(c * p, ESCALA_CANTIDAD) for c, p in zip(self._cantidad, self._precio)
+        ))
+        descuentos = array("q", (
+            d * factor + s * p for s, d, p in zip(subtotales, self._descuento, self._porcentaje)
+        ))
+        bases = array("q", (
+            _redondear((s - g) * factor - d, factor)
+            for s, d, g in zip(subtotales, descuentos, self._descuento_global)
+        ))
+        ivas = array("q", (_redondear(b * max(t, 0), 100) for b, t in zip(bases, self._tasa)))
+        totales = array("q", map(int.__add__, bases, ivas))
+
+        self._calculadas = {
+            "subtotal": subtotales,
+            "descuento": descuentos,
+            "base_imponible": bases,
+            "iva": ivas,
+            "total": totales,
+        }
+        return self._calculadas
+
+    def subtotales(self) -> array:
+        """Cantidad x precio de cada fila, en centavos."""
+        return self._columnas_calculadas()["subtotal"]
+
+    def bases_imponibles(self) -> array:
+        """Base imponible de cada fila, en centavos."""
+        return self._columnas_calculadas()["base_imponible"]
+
+    def ivas(self) -> array:
+        """IVA de cada fila, en centavos."""
+        return self._columnas_calculadas()["iva"]
+
+    def totales_item(self, indice: int) -> TotalesItem:
+        """Montos de una fila con los mismos tipos que ItemFactura.totales."""
+        columnas = self._columnas_calculadas()
+        return TotalesItem(
+            subtotal=_monto(columnas["subtotal"][indice]),
+            descuento=_valor(columnas["descuento"][indice], ESCALA_MONTO * 100 * ESCALA_PORCENTAJE),
+            descuento_global=_valor(self._descuento_global[indice], ESCALA_MONTO),
+            base_imponible=_monto(columnas["base_imponible"][indice]),
+            iva=_monto(columnas["iva"][indice]),
+            total=_monto(columnas["total"][indice]),
+        )
+
+    def calcular_totales(self) -> TotalesFactura:
+        """Totales de gTotSub sumando columnas enteras y convirtiendo al final."""
+        columnas = self._columnas_calculadas()
+        sumas = dict.fromkeys(("exe", "exo", "sub5", "sub10", "iva5", "iva10", "base5", "base10"), 0)
+        for afectacion, tasa, subtotal, base, iva in zip(
+            self._afectacion, self._tasa, columnas["subtotal"], columnas["base_imponible"], columnas["iva"]
+        ):
+            if afectacion == 2:
+                sumas["exo"] += subtotal
+            elif afectacion == 3 or tasa <= 0:
+                sumas["exe"] += subtotal
+            elif tasa == 5:
+                sumas["sub5"] += subtotal
+                sumas["iva5"] += iva
+                sumas["base5"] += base
+            else:
+                sumas["sub10"] += subtotal
+                sumas["iva10"] += iva
+                sumas["base10"] += base
+
+        def monto(centavos):
+            return _monto(centavos) if centavos else CERO
+
+        def valor(entero, escala):
+            return _valor(entero, escala) if entero else CERO
+
+        return TotalesFactura(
+            sub_exe=monto(sumas["exe"]),
+            sub_exo=monto(sumas["exo"]),
+            sub5=monto(sumas["sub5"]),
+            sub10=monto(sumas["sub10"]),
+            tot_ope=monto(sum(columnas["subtotal"])),
+            tot_desc=valor(sum(columnas["descuento"]), ESCALA_MONTO * 100 * ESCALA_PORCENTAJE),
+            tot_desc_glo=valor(sum(self._descuento_global), ESCALA_MONTO),
+            iva5=monto(sumas["iva5"]),
+            iva10=monto(sumas["iva10"]),
+            base_grav5=monto(sumas["base5"]),
+            base_grav10=monto(sumas["base10"]),
+            cantidad_items=len(self),
+        )
+
+
+class FilaItem:
+    """
+    Vista de una fila de TablaItems con la interfaz de lectura de
+    ItemFactura. No copia datos: cada atributo se lee de su columna.
+    """
+
+    __slots__ = ("_tabla", "_indice")
+
+    def __init__(self, tabla: TablaItems, indice: int):
+        self._tabla = tabla
+        self._indice = indice
+
+    @property
+    def codigo(self) -> str:
+        return self._tabla._codigo[self._indice]
+
+    @property
+    def descripcion(self) -> str:
+        return self._tabla._descripcion[self._indice]
+
+    @property
+    def unidad_medida(self) -> str:
+        return self._tabla._unidad_medida[self._indice]
+
+    @property
+    def cantidad(self) -> Decimal:
+        return _valor(self._tabla._cantidad[self._indice], ESCALA_CANTIDAD)
+
+    @property
+    def precio_unitario(self) -> Decimal:
+        return _valor(self._tabla._precio[self._indice], ESCALA_MONTO)
+
+    @property
+    def afectacion_iva(self) -> str:
+        return str(self._tabla._afectacion[self._indice])
+
+    @property
+    def tasa_iva(self) -> Optional[int]:
+        tasa = self._tabla._tasa[self._indice]
+        return None if tasa == _SIN_TASA else tasa
+
+    def _opcional(self, columna: array, escala: int) -> Optional[Decimal]:
+        entero = columna[self._indice]
+        return _valor(entero, escala) if entero else None
+
+    @property
+    def proporcion_iva(self) -> Optional[Decimal]:
+        return self._opcional(self._tabla._proporcion, ESCALA_PORCENTAJE)
+
+    @property
+    def liq_IVA(self) -> Optional[Decimal]:
+        return self._opcional(self._tabla._liq_iva, ESCALA_MONTO)
+
+    @property
+    def descuento(self) -> Optional[Decimal]:
+        return self._opcional(self._tabla._descuento, ESCALA_MONTO)
+
+    @property
+    def porcentaje_descuento(self) -> Optional[Decimal]:
+        return self._opcional(self._tabla._porcentaje, ESCALA_PORCENTAJE)
+
+    @property
+    def descuento_global_Item(self) -> Optional[Decimal]:
+        return self._opcional(self._tabla._descuento_global, ESCALA_MONTO)
+
+    @property
+    def totales(self) -> TotalesItem:
+        return self._tabla.totales_item(self._indice)
+
+    def calcular_subtotal(self) -> Decimal:
+        return _monto(self._tabla.subtotales()[self._indice])
+
+    def calcular_iva(self) -> Decimal:
+        return _monto(self._tabla.ivas()[self._indice])
+
+    @property
+    def base_imponible(self) -> Decimal:
+        return _monto(self._tabla.bases_imponibles()[self._indice])
+
+    @property
+    def total(self) -> Decimal:
+        return _monto(self._tabla._columnas_calculadas()["total"][self._indice])
+
+    def validar(self):
+        """Valida la tabla completa (una sola vez mientras no cambie)."""
+        self._tabla.validar()
+
+
+def _propiedad_dispersa(campo: str) -> property:
+    return property(lambda fila: fila._tabla._dispersos[campo].get(fila._indice))
+
+
+for _campo in CAMPOS_DISPERSOS:
+    setattr(FilaItem, _campo, _propiedad_dispersa(_campo))
+del _campo
@@ -0,0 +1,137 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Iterable
+
+CENTAVO = Decimal("0.01")
+CIEN = Decimal("100")
+CERO = Decimal(0)
+
+# Códigos de afectación de IVA (iAfecIVA) que no van a las bases gravadas
+AFECTACION_EXONERADO = "2"
+AFECTACION_EXENTO = "3"
+
+
+def _decimal(valor) -> Decimal:
+    """Convierte a Decimal sin pasar por str cuando ya lo es."""
+    if valor is None:
+        return CERO
+    if isinstance(valor, Decimal):
+        return valor
+    return Decimal(str(valor))
+
+
+@dataclass(frozen=True)
+class TotalesItem:
+    """Montos de un ítem, calculados una sola vez."""
+    subtotal: Decimal          # Cantidad x precio unitario (dTotBruOpeItem)
+    descuento: Decimal         # Descuento particular + porcentual
+    descuento_global: Decimal  # Descuento global prorrateado al ítem
+    base_imponible: Decimal    # Subtotal menos descuentos (dBasGravIVA)
+    iva: Decimal               # IVA sobre la base imponible
+    total: Decimal             # Base imponible + IVA (dTotOpeItem)
+
+
+def calcular_item(item) -> TotalesItem:
+    """Calcula todos los montos de un ítem en una sola pasada."""
+    subtotal = _decimal(item.cantidad * item.precio_unitario).quantize(CENTAVO)
+    descuento = _decimal(item.descuento)
+    descuento_porcentual = CERO
+    if item.porcentaje_descuento:
+        descuento_porcentual = subtotal * (_decimal(item.porcentaje_descuento) / CIEN)
+    descuento_global = _decimal(item.descuento_global_Item)
+    base_imponible = (subtotal - descuento - descuento_porcentual - descuento_global).quantize(CENTAVO)
+    iva = (base_imponible * (_decimal(item.tasa_iva) / CIEN)).quantize(CENTAVO)
+    return TotalesItem(
+        subtotal=subtotal,
+        descuento=descuento + descuento_porcentual,
+        descuento_global=descuento_global,
+        base_imponible=base_imponible,
+        iva=iva,
+        total=(base_imponible + iva).quantize(CENTAVO),
+    )
+
+
+@dataclass
+class TotalesFactura:
+    """
+    Acumulador de los montos del grupo gTotSub.
+
+    Se alimenta ítem por ítem con `agregar`, de modo que sirve tanto para una
+    lista completa como para ítems que llegan de un generador.
+    """
+    sub_exe: Decimal = CERO        # dSubExe
+    sub_exo: Decimal = CERO        # dSubExo
+    sub5: Decimal = CERO           # dSub5
+    sub10: Decimal = CERO          # dSub10
+    tot_ope: Decimal = CERO        # dTotOpe
+    tot_desc: Decimal = CERO       # dTotDesc
+    tot_desc_glo: Decimal = CERO   # dTotDescGlotem
+    iva5: Decimal = CERO           # dIVA5
+    iva10: Decimal = CERO          # dIVA10
+    base_grav5: Decimal = CERO     # dBaseGrav5
+    base_grav10: Decimal = CERO    # dBaseGrav10
+    cantidad_items: int = field(default=0)
+
+    def agregar(self, item) -> TotalesItem:
+        """Suma un ítem a los totales y devuelve sus montos."""
+        montos = item.totales
+        self.tot_ope += montos.subtotal
+        self.tot_desc += montos.descuento
+        self.tot_desc_glo += montos.descuento_global
+        self.cantidad_items += 1
+
+        if item.afectacion_iva == AFECTACION_EXONERADO:
+            self.sub_exo += montos.subtotal
+        elif item.afectacion_iva == AFECTACION_EXENTO or not item.tasa_iva:
+            self.sub_exe += montos.subtotal
+        elif item.tasa_iva == 5:
+            self.sub5 += montos.subtotal
+            self.iva5 += montos.iva
+            self.base_grav5 += montos.base_imponible
+        else:
+            self.sub10 += montos.subtotal
+            self.iva10 += montos.iva
+            self.base_grav10 += montos.base_imponible
+        return montos
+
+    @property
+    def tot_iva(self) -> Decimal:
+        return self.iva5 + self.iva10
+
+    @property
+    def tot_bas_gra_iva(self) -> Decimal:
+        return self.base_grav5 + self.base_grav10
+
+    @property
+    def total(self) -> Decimal:
+        return self.tot_ope + self.tot_iva
+
+    def to_dict(self) -> dict:
+        """
+        Totales como diccionario. Conserva las claves históricas subtotal,
+        iva y total de Factura.calcular_totales.
+        """
+        return {
+            "subtotal": self.tot_ope,
+            "iva": self.tot_iva,
+            "total": self.total,
+            "sub_exe": self.sub_exe,
+            "sub_exo": self.sub_exo,
+            "sub5": self.sub5,
+            "sub10": self.sub10,
+            "total_descuentos": self.tot_desc,
+            "total_descuentos_globales": self.tot_desc_glo,
+            "iva5": self.iva5,
+            "iva10": self.iva10,
+            "base_grav5": self.base_grav5,
+            "base_grav10": self.base_grav10,
+            "base_gravada": self.tot_bas_gra_iva,
+        }
+
+
+def calcular_totales(items: Iterable) -> TotalesFactura:
+    """Recorre los ítems una sola vez y devuelve los totales de la factura."""
+    totales = TotalesFactura()
+    for item in items:
+        totales.agregar(item)
+    return totales
@@ -1,1070 +1,36 @@
-# Códigos de actividad económica según SET (Paraguay)
-ACTIVIDADES_ECONOMICAS = {
-    "01110": "Cultivo De Arroz",
-    "01121": "Cultivo De Soja",
-    "01122": "Cultivo De Maíz",
-    "01123": "Cultivo De Trigo",
-    "01124": "Cultivo De Girasol",
-    "01125": "Cultivo De Sesamo",
-    "01126": "Cultivo De Legumbres",
-    "01129": "Cultivo De Otros Cereales Y Otras Semillas Oleaginosas N.C.P.",
-    "01131": "Cultivo De Mandioca, Papa Y Batata",
-    "01132": "Cultivo De Bulbos, Brotes, Raíces Y Hortalizas De Fruto",
-    "01133": "Cultivo De Hortalizas De Hoja Y De Otras Hortalizas Frescas",
-    "01140": "Cultivo De Caña De Azúcar",
-    "01150": "Cultivo De Tabaco",
-    "01161": "Cultivo De Algodón",
-    "01169": "Cultivo De Otras Fibras Vegetales",
-    "01191": "Cultivo De Forrajes",
-    "01192": "Cultivo De Flores",
-    "01199": "Cultivo De Otras Cosechas No Perennes N.C.P.",
-    "01210": "Cultivo De Uvas",
-    "01221": "Cultivo De Piña",
-    "01222": "Cultivo De Banana",
-    "01223": "Cultivo De Mango",
-    "01224": "Cultivo De Mburucuya",
-    "01229": "Cultivo De Otras Frutas Tropicales Y Subtropicales N.C.P.",
-    "01231": "Cultivo De Naranja",
-    "01232": "Cultivo De Mandarina",
-    "01233": "Cultivo De Limón",
-    "01234": "Cultivo De Pomelo",
-    "01235": "Cultivo De Naranjo Agrio",
-    "01239": "Cultivo De Otras Frutas Cítricas N.C.P.",
-    "01240": "Cultivo De Fr utas Con Pepita Y Con Hueso",
-    "01250": "Cultivo De Otras Frutas Y Frutos Secos Arbóreos Y De Arbustos",
-    "01260": "Cultivo De Frutos Oleaginosos",
-    "01271": "Cultivo De Yerba Mate",
-    "01272": "Cultivo De Té",
-    "01273": "Cultivo De Café",
-    "01279": "Cultivo De Cacao Y De Otras Plantas Para Elaboración De Bebidas N.C.P.",
-    "01280": "Cultivo De Especias Y Plantas Aromáticas, Medicinales Y Farmacéuticas",
-    "01299": "Cultivo De Otras Cosechas Perennes N.C.P.    013 - Propagación De Plantas",
-    "01300": "Propagación De Plantas",
-    "01411": "Cría De Ganado Vacuno Con Destino A La Producción De Carne",
-    "01412": "Cría De Ganado Vacuno Lechero",
-    "01419": "Otras Producciones De Ganados Vacunos N.C.P",
-    "01420": "Cría De Ganado Equino",
-    "01430": "Cría De Camellos Y Camélidos",
-    "01440": "Cría De Ganado Ovino Y Caprino",
-    "01450": "Cría De Ganado Porcino",
-    "01461": "Cría De Aves De Corral",
-    "01462": "Producción De Huevos",
-    "01491": "Apicultura",
-    "01492": "Cunicultura",
-    "01499": "Cría De Otros Animal es N.C.P.",
-    "01500": "Cultivo De Productos Agrícolas En Combinación Con La Cría De Animales",
-    "01611": "Servicios De Fumigación Y Riego",
-    "01612": "Servicios De Provisión De Maquinaria Agrícola Con Operarios Y Personal",
-    "01613": "Actividades Posteriores A La Cosecha",
-    "01614": "Procesamiento De Semillas Para La Propagación",
-    "01619": "Otros Servicios De Apoyo A La Agricultura N.C.P",
-    "01621": "Servicios De Esquila",
-    "01622": "Servicios De Inseminación Artifi cial",
-    "01629": "Otros Servicios De Apoyo A La Ganadería N.C.P.",
-    "01700": "Caza Ordinaria Y Mediante Trampas Y Servicios Conexos",
-    "01901": "Cooperativa De Produccion Agropecuaria.",
-    "01909": "Otras Actividades De Agricultura, Ganadería Y Caza N.C.P.",
-    "02101": "Viveros De Árboles Forestales",
-    "02102": "Explotación De Bosques",
-    "02103": "Actividades De Forestación Y Reforestación",
-    "02201": "Producción De Leña",
-    "02209": "Extracción De Madera Para La Producción De Otros Artículos N.C.P.",
-    "02300": "Recolección De Productos Forestales Diferentes A La Madera",
-    "02400": "Servicios De Apoyo A La Silvicultura",
-    "05100": "Extracción Y Aglomeración De Hulla",
-    "05200": "Extracción Y Aglomeración De Lignito",
-    "06100": "Extracción De Petróleo Crudo",
-    "06200": "Extracción De Gas Natural",
-    "07100": "Extracción De Minerales De Hierro",
-    "07210": "Extracción De Minerales De Uranio Y Torio",
-    "07290": "Extracción De Otros Minerales Metalíferos No Ferrosos N.C.P.",
-    "08101": "Extracción De Arena, Piedra Triturada Y Canto Rodado",
-    "08102": "Extracción De Arcilla Y Caolín",
-    "08103": "Extracción De Piedra Caliza Y Yeso",
-    "08104": "Extracción De Rocas Ornamentales",
-    "08910": "Extracción De Minerales Para La Fabricación De Abonos Y Productos Químicos",
-    "08920": "Extracción Y Aglomeración De Turba",
-    "08930": "Extracción De Sal",
-    "08990": "Explotación De Otras Minas Y Canteras N.C.P.",
-    "09100": "Actividades De Apoyo A La Extracción De Petróleo Y Gas Natural",
-    "09900": "Actividades De Apoyo A La Explotación De Otras Minas Y Canteras N.C.P",
-    "10101": "Matanza De Ganado Vacuno Y Procesamiento De Su Carne",
-    "10102": "Matanza Y Procesamiento De Carne De Aves",
-    "10103": "Elaboración De Fiambres Y Embutidos",
-    "10104": "Matanza De Ganado Porcino Y Procesamiento De Su Ca rne",
-    "10109": "Matanza De Animales N.C.P. Y Procesamiento De Su Carne; Elaboración De Subproductos",
-    "10200": "Procesamiento Y Conservación De Pescado, Crustáceos Y Mo luscos",
-    "10302": "Elaboración De Jugos",
-    "10400": "Elaboración De Aceites Y Grasas De Origen Vegetal Y Animal",
-    "10501": "Elaboración De Leches Y Productos Lácteos",
-    "10502": "Elaboración Industrial De Helados",
-    "10611": "Molienda De Arroz Y Fabricación De Productos De Arroz",
-    "10612": "Molienda De Trigo Y Fabricación De Productos De Trigo",
-    "10613": "Molienda De Maíz Y Fabricación De Productos De Maíz",
-    "10619": "Elaboración De Otros Productos De Molinería N.C.P.",
-    "10620": "Elaboración De Almidones Y Productos Derivados Del Al midón",
-    "10700": "Elaboración De Alimentos Preparados Para Animales",
-    "10911": "Elaboració n De Galletitas Y Bizcochos",
-    "10912": "Elaboración De Chipas",
-    "10919": "Elaboración De Otros Productos De Panadería N.C.P.",
-    "10920": "Elaboración De Azúcar",
-    "10930": "Elaboración De Cacao, Chocolate Y De Productos Confitados",
-    "10940": "Elaboración D e Pastas Alimenticias Y Productos Farináceos Similares",
-    "10950": "Tostado Y Molido De Café Y Elaboración De Productos De Café",
-    "10961": "Elaboración De Té",
-    "10962": "Elaboración De Yerba Mate",
-    "10970": "Elabor ación De Comidas Y Platos Preparados",
-    "10991": "Elaboración De Hielo",
-    "10999": "Elaboración De Otros Productos Alimenticios N.C.P.",
-    "11110": "Destilación, Rectificación Y Mezcla De Bebidas Alcohólicas",
-    "11120": "Elaboración De Vinos",
-    "11130": "Elaboración De Bebidas Malteadas Y De Malta",
-    "11210": "Producción De Aguas Minerales Y Sodas",
-    "11290": "Elaboración De Otras Bebidas No Alcohólicas",
-    "12000": "Elaboración De Productos De Tabaco",
-    "13111": "Preparación E Hilandería De Fibras De Algodón",
-    "13119": "Preparación E Hilander ía De Otras Fibras Textiles Naturales",
-    "13120": "Tejeduría De Productos Textiles",
-    "13130": "Acabado De Productos Textiles",
-    "13910": "Fabricación De Tejidos De Punto Y Ganc hillo     13920 - Fabricación De Artículos Confeccionados Con Materiales Textiles, Excepto Prendas De Vestir",
-    "13930": "Fabricación De Tapices Y Alfombras",
-    "13940": "Fabricación De Cuerdas, Cordeles, Bramantes Y Redes",
-    "13990": "Fabricación De Otros Pro ductos Textiles N.C.P.",
-    "14101": "Confección De Prendas De Vestir Exterior, Excepto Prendas De Cuero Y Piel",
-    "14102": "Confección De Prendas De Vestir Interior",
-    "14103": "Confección De Prendas De Vestir De Cuero, Excepto Prendas De Piel",
-    "14200": "Fabricación De Artículos De Piel",
-    "14300": "Fabricación De Prendas De Vestir De Punto Y Ganchillo",
-    "15110": "Curtido Y Terminación De Cueros; Teñido De Pieles",
-    "15121": "Fabricación De Maletas, Bolsos De Mano Y Artículos Similares",
-    "15129": "Fabricación De Otros Artículos De Cuero N.C.P.",
-    "15201": "Fabricación De Calzado De Cuero",
-    "15202": "Fabricación De Partes De Cuero Para Calzado",
-    "15209": "Fabricación De Calzado De Otros Materiales Y Sus Partes",
-    "16100": "Aserrado Y Cepillado De Madera",
-    "16210": "Fabricación De Hojas De Mad era Para Enchapado; Fabricación De Tableros Contrachapados,",
-    "16220": "Fabricación De Partes Y Piezas De Carpintería Para Edificios Y Construcciones",
-    "16230": "Fabricación De Recipient es De Madera",
-    "16290": "Fabricación De Otros Productos De Madera N.C.P.; Fabricación De Artículos De Corcho, Paja Y",
-    "17010": "Fabricación De Pasta De Madera, Papel Y Cartón",
-    "17020": "Fabricación De Papel Y Cartón Ondulado Y De Envases De Papel Y Cartón",
-    "17090": "Fabricación De Otros Artículos De Papel Y Cartón",
-    "18111": "Actividades De Imprenta",
-    "18119": "Actividades De Impresión N.C.P.",
-    "18120": "Servicios Relacionados Con La Impresión",
-    "18200": "Reproducción De Grabaciones",
-    "19201": "Elaboración De Combustibles",
-    "19209": "Fabricación De Otros Productos De La Refinación De Petróleo N.Cp.",
-    "20110": "Fabricación De Sustancias Químicas Básicas",
-    "20120": "Fabricación De Abonos Y Compuestos De Nitrógeno",
-    "20130": "Fabricación De Plásticos Y Caucho Sintético En Formas Primarias",
-    "20201": "Fabricación De Alcohol",
-    "20202": "Elaboración De Carbón Vegetal Por Destilación De La Madera",
-    "20209": "Frabricación De Biocombustibles N.C.P",
-    "20300": "Fabricación De Fibras Manufacturadas",
-    "20910": "Fabricación De Plaguicidas Y Productos Químicos De Uso Agropecuario",
-    "20920": "Fabricación De Pinturas, Barnices Y Productos De Revestimiento Similares, Tintas De Imprenta Y",
-    "20931": "Fabricación De Jabones, Detergentes Y Preparados De Limpieza",
-    "20932": "Fabricación De Cosméticos, Perfumes Y Artículos De Tocador",
-    "20939": "Fabricación De Otros Prepara dos Para Limpiar Y Pulir N.C.P.",
-    "20990": "Fabricación De Otros Productos Químicos N.C.P.",
-    "21001": "Fabricación De Medicamentos De Uso Humano",
-    "21002": "Fabricación De Medicamentos De Uso Veterinario",
-    "21003": "Fabricación De Productos Farmaceuticos",
-    "21004": "Fabricación De Productos Botánicos",
-    "22111": "Fabricación De Cubiertas Y Cámaras De Caucho",
-    "22112": "Recauchutaje Y Renovación De Cubiertas De Caucho",
-    "22190": "Fabricación De Otros Productos De Caucho",
-    "22210": "Fabricación De Envases De Plástico",
-    "22290": "Fabricación De Otros Productos De Plástico",
-    "23101": "Fabricación De Vidrio Plano",
-    "23102": "Fabricación De Envases De Vidrio",
-    "23109": "Fabricación De Otros Productos De Vidrio N.C.P.",
-    "23910": "Fabri cación De Productos De Cerámica Refractaria     23920 - Fabricación De Materiales De Arcilla Para La Construcción",
-    "23930": "Fabricación De Otros Productos De Cerámica Y Porcelana",
-    "23940": "Fabricación De Cemento, Cal Y Yeso",
-    "23950": "Fabricación De A rtículos De Hormigón, Cemento Y Yeso",
-    "23960": "Corte, Tallado Y Acabado De La Piedra",
-    "23990": "Fabricación De Otros Productos De Minerales No Metálicos N.C.P.",
-    "24100": "Fabrica ción Básica De Hierro Y Acero",
-    "24200": "Fabricación De Productos Primarios De Metales Preciosos Y Otros Metales No Ferrosos",
-    "24310": "Fundición De Hierro Y Acero",
-    "24320": "Fundición De Metales No Ferrosos",
-    "25110": "Fabricación De Productos Metálicos Para Uso Estructural",
-    "25120": "Fabricación De Tanques, Depósitos Y Recipientes De Metal",
-    "25130": "Fabricación De Generadores De Vapor, Excepto Calderas Para Calefacción Central",
-    "25200": "Fabricación De Armas Y Municiones",
-    "25910": "Forja, Prensado, Estampado Y Laminado De Metales; Pulvimetalurgia",
-    "25920": "Mecanizado; Tratamiento Y Revestimiento De Metales",
-    "25930": "Fabricación De Artículos De Cuchillería, Herramientas De Mano Y Artículos De Ferretería",
-    "25991": "Fabricación De Productos De Alambre Y Otros Artículos Para La Construcción",
-    "25992": "Fabricación De Artículos De Metal De Uso Doméstico",
-    "25993": "Fabricación De Envases Metálicos",
-    "25999": "Fabricación De Otros Productos Elaborados De Metal N.C.P.",
-    "26100": "Fabricación De Componentes Electrónicos",
-    "26200": "Fabricación De Equipos Informáticos  Y Periféricos",
-    "26300": "Fabricación De Equipos De Comunicaciones",
-    "26400": "Fabricación De Aparatos Electrónicos De Consumo",
-    "26510": "Fabricación De Equipos Para Medir, Verificar, Ensayar, Navegar Y De Control",
-    "26520": "Fabricación De Artículos De Relojería",
-    "26600": "Fabricación De Equipos De Irradiación, Electromédicos Y Electroterapéuticos",
-    "26700": "Fabricación De Instrumentos Ópticos Y Equipo Fotográfico",
-    "26800": "Fabricación De Soportes Magnéticos Y Ópticos",
-    "27200": "Fabricación De Pilas, Baterías Y Acumuladores Eléctricos",
-    "27310": "Fabricación De Cables De Fibra Óptica",
-    "27320": "Fabricación De Otros Cables Eléctricos Y Electrónicos",
-    "27330": "Fabric ación De Aparatos De Cableado",
-    "27400": "Fabricación De Equipos De Iluminación Eléctricos",
-    "27500": "Fabricación De Aparatos De Uso Doméstico, Excepto De Audio Y Video",
-    "27900": "Fabricación De Otros Equipos Eléctricos N.C.P.",
-    "28110": "Fabricación De Motores Y Turbinas, Excepto Motores Para Aeronaves, Vehículos Automotores Y",
-    "28120": "Fabricación De Equipos Hidráulicos",
-    "28130": "Fabricación De Otras Bombas, Compresores, Grifo s Y Válvulas",
-    "28140": "Fabricación De Cojinetes, Engranajes, Trenes De Engranajes Y Piezas De Transmisión",
-    "28150": "Fabricación De Hornos Y Quemadores",
-    "28160": "Fabricación De Equipos De Elevación Y Manipulación",
-    "28170": "Fabricación De Maquinaria Y Equipo De Oficina",
-    "28180": "Fabricación De Herramientas Manuales Con Motor",
-    "28190": "Fabricación De Otros Tipos De Maquinaria De Uso General N.C.P.",
-    "28210": "Fabricación De Maquinaria Agropecuaria Y Forestal",
-    "28220": "Fabricación De Máquinas Herramienta",
-    "28230": "Fabricación De Maquinaria Metalúrgica",
-    "28240": "Fabricación De Maquinaria Para Explotación De Minas Y Canteras Y Para Obras De Construcc ión",
-    "28250": "Fabricación De Maquinaria Para La Elaboración De Alimentos, Bebidas Y Tabaco",
-    "28260": "Fabricación De Maquinaria Para La Elaboración De Productos Textiles, Prendas De Vestir Y Cueros",
-    "28290": "Fabricación De Otros Tipos De Maquinaria De  Uso Especial N.C.P.",
-    "29101": "Fabricación De Vehículos Automotores",
-    "29102": "Rectific acion De Motores De Vehiculos Automotores",
-    "29200": "Fabricación De Carrocerías Para Vehículos Automotores; Fabricación De Remolques Y",
-    "29300": "Fabricación De Piezas Y Accesorios Para Vehículos Automotores",
-    "30110": "Construcción De Buques Y Estructuras Flotantes",
-    "30120": "Construcción De Embarcaciones De Recreo Y Deporte",
-    "30200": "Fabricación De Locomotoras Y De Materia l Rodante Para Ferrocarriles Y Tranvías",
-    "30300": "Fabricación De Aeronaves    304 - Fabricación De  Vehículos Militares De Combate",
-    "30400": "Fabricación De Vehículos Militares De Combate",
-    "30910": "Fabricación De Motocicletas",
-    "30920": "Fabricación De Bicicletas Y Sillas De Ruedas",
-    "30990": "Fabricación De Otros Equipos De Transporte N.C.P.",
-    "31001": "Fabricación De Muebles De Madera",
-    "31002": "Fabricación De Muebles De Metal",
-    "31009": "Fabricación De Muebles De Otros Materiales N.C.P., Incluso Colchones",
-    "32110": "Fabricación De Joyas Y Artículos Conexos",
-    "32120": "Fabricación De Bijouterie Y Artículos Conexos",
-    "32200": "Fabricación De Instrumentos Musicales",
-    "32300": "Fabricación De Artículos De Deporte",
-    "32400": "Fabricación De Juegos Y Juguetes",
-    "32500": "Fabricación De Instrumentos Y Suministros Médicos Y Dentales",
-    "32901": "Fabricación De Escobas, Cepillos, Plu meros Y Pinceles",
-    "32902": "Fabricación De Ataúdes",
-    "32908": "Actividades De Impresión N.C.P.",
-    "32909": "Otras Industrias Manufactureras N.C.P.",
-    "33110": "Mantenimiento Y Reparación De Productos Elaborados De Metal",
-    "33120": "Mantenimiento Y Reparación De Máquinas Y Equipos De Uso General Y Especial",
-    "33130": "Mantenimiento Y Reparación De Equipos Electrónicos Y Ópticos",
-    "33140": "Mantenimiento Y Reparación De Equipos Eléctricos",
-    "33150": "Mantenimiento Y Reparación De Equipos De Transporte, Excepto Los Vehículos Automotores",
-    "33190": "Mantenimiento Y Repara ción De Otros Equipos N.C.P.",
-    "33200": "Instalación De Máquinas Y Equipos",
-    "35101": "Generación De Energía Eléctrica",
-    "35102": "Transmisión Y Distribución De Energía Eléctrica",
-    "35200": "Fabricación De Gas; Distribución De Combustibles Gaseosos Por Tuberías",
-    "35300": "Suministro De Vapor Y Aire Acondicionado",
-    "37000": "Alcantarillado",
-    "38110": "Recolección De Desechos Inocuos",
-    "38120": "Recolección De Desechos Peligrosos",
-    "38210": "Tratamiento Y Eliminación De Desechos Inocuos",
-    "38220": "Tratamiento Y Eliminación De Desechos Peligrosos",
-    "38301": "Recupera ción De Materiales Metálicos",
-    "38302": "Recuperación De Materiales No Metálicos",
-    "39000": "Actividade s De Saneamiento Y Otros Servicios De Gestión De Desechos",
-    "41001": "Inversores De Emprendimientos Inmobiliarios",
-    "41002": "Construcción De Edificios",
-    "42100": "Construcción De Carreteras Y Vías Férreas, Puentes Y Túneles",
-    "42200": "Construcción De Proyectos De Servicios Públicos",
-    "42900": "Construcción De Otros Proyectos De Ingeniería Civil N.C.P.",
-    "43110": "Demolición",
-    "43120": "Preparación Del Terreno",
-    "43210": "Instalaciones Eléctricas, Electromecánicas Y Electrónicas",
-    "43221": "Fontanería E Instalaciones Sanitarias",
-    "43222": "Instalación De Calefacción Y Aire Acondicionado",
-    "43229": "Otras Instalaciones De Fontanería, Calefacción Y Aire Acondicionado",
-    "43290": "Otras Instalaciones De Construcción",
-    "43301": "Pintado Y Empapelado De Edifi cios",
-    "43302": "Colocación De Revestimientos De Pisos Y Paredes",
-    "43309": "Otras Tareas De Terminación De Edificios",
-    "43901": "Actividades De Impermeabilización De Edificios",
-    "43902": "Levantamiento Y Desmantelamiento De Plataformas Y Andamios",
-    "43903": "Construcción De Pilotajes Para La Edificación",
-    "43909": "Otras Actividades Especializadas De Construcción N.C.P  G - Comercio Al Por Mayor Y Al Por Menor; Reparación De Vehículos Automotores Y",
-    "45101": "Comercio Al Por Mayor De Vehículos Automotores Nuevos",
-    "45102": "Comercio Al Por Mayor De Vehículos Automotores Usados",
-    "45103": "Comercio Al Por Menor De Vehículos Automotores Nuevos",
-    "45104": "Comercio Al Por Menor De Vehículos Automotores Usados",
-    "45105": "Agentes Comisionistas Por Venta De Vehículos Automotores",
-    "45201": "Mantenimiento Y Reparación Mecánica De Vehículos",
-    "45202": "Mantenimiento Y Reparación Eléctrica Y Electrónica De Vehículos",
-    "45203": "Talleres De Chapería Y Pintura",
-    "45204": "Talleres De Gome ría",
-    "45205": "Talleres De Alineación Y Balanceo",
-    "45206": "Lavaderos De Autos",
-    "45209": "Otros Tipos De Reparaciones De Vehículos Automotores N.C.P.",
-    "45301": "Comercio De Partes, Piezas Y Accesorios Nuevos Para Vehículos Automotores",
-    "45302": "Comercio De Partes, Piezas Y Accesorios Usados Para Vehículos Automotores",
-    "45303": "Comercio De Partes, Piezas Y Accesorios Nuevos Y Usados Para Vehículos Automotores",
-    "45401": "Comercio De Motocicletas Y De Sus Piezas Y Accesorios",
-    "45402": "Mantenimiento Y Reparación Mecánica Y Eléctrica De Motocicletas",
-    "45403": "Talleres D e Gomería De Motocicletas",
-    "45404": "Lavaderos De Motocicletas",
-    "45409": "Otros Tipos De Reparaciones De Motocicletas N.C.P",
-    "46101": "Comercio Al Por Mayor De Productos Agrícolas A Cambio De Una Retribución O Por Contrata",
-    "46102": "Comercio Al Por Mayor De Productos Pecuarios A Cambio De Una Retribución O Por Contrata",
-    "46103": "Comercio Al Por Mayor De Alimentos, Bebidas Y Tabaco A Cambio De Una Retribución O Por",
-    "46104": "Comercio Al Por Mayor De Combustibles,  Minerales, Productos Siderúrgicos Y Químicos A",
-    "46109": "Comercio Al Por Mayor De Mercancías N.C.P. A Cambio De Una Retribución O Por Contrata",
-    "46201": "Comercio Al Por Mayor De Materias Primas Agrícolas",
-    "46202": "Comercio Al Por Mayor De Materias Primas Pecuarias Y Animales Vivos",
-    "46301": "Comercio Al Por Mayor De Carne, Menudencias Y Productos Derivados",
-    "46302": "Comercio Al Por Mayor De Comestibles, Excepto Carnes",
-    "46303": "Comercio Al Por Mayor De Alimentos Para Mascotas",
-    "46304": "Comercio Al Por Mayor De Bebidas",
-    "46305": "Comercio Al Por Mayor De Tabaco Y Cigarrillos",
-    "46420": "Comercio Al Por Mayor De Productos Farmacéuticos Y Veterinarios",
-    "46430": "Comercio Al Por Mayor De Productos Cosméticos Y De Perf umería",
-    "46440": "Comercio Al Por Mayor De Libros, Revistas, Periódicos, Papel, Cartón, Materiales De Embalaje Y",
-    "46450": "Comercio Al Por Mayor De Artículos De Óptica, Fotografía, Relojería, Joyería Y Fantasías",
-    "46460": "Comerci o Al Por Mayor De Muebles Y Artículos De Iluminación",
-    "46490": "Comercio Al Por Mayor De Otros Enseres Domésticos N.C.P.",
-    "46510": "Comercio Al Por Mayor De Equipos Informáticos Y Softwar e",
-    "46520": "Comercio Al Por Mayor De Componentes Electrónicos Y Equipos De Comunicaciones",
-    "46530": "Comercio Al Por Mayor De Maquinaria, Equipo Y Suministros Agrícolas",
-    "46540": "Comercio Al Por Mayor De Maquinaria Y Equipo Para Uso Industrial",
-    "46550": "Comercio Al Por Mayor De Maquinaria Y Equipo Para Uso Médico Y Hospitalario",
-    "46590": "Comercio Al Por Mayor De Otras Maquinarias Y Equipos N.C.P.",
-    "46610": "Comercio Al Por Mayor De  Combustibles Sólidos, Líquidos Y Gaseosos Y De Productos Conexos",
-    "46620": "Comercio Al Por Mayor De Metales Y Minerales Metalíferos",
-    "46631": "Comercio Al Por Mayor De Madera",
-    "46632": "Comercio Al Por Mayor De Materiales De Construcción",
-    "46633": "Comercio Al Por Mayor De Pinturas, Barnices, Papel De Empapelar Y Revestimiento De Pisos",
-    "46634": "Comercio Al P or Mayor De Vidrio",
-    "46635": "Comercio Al Por Mayor De Artículos Sanitarios",
-    "46636": "Comercio Al Por Mayor De Artículos De Ferretería Y Calefacción",
-    "46691": "Comer cio Al Por Mayor De Productos Químicos Industriales",
-    "46692": "Comercio Al Por Mayor De Fertilizantes Y Agroquímicos",
-    "46693": "Comercio Al Por Mayor De Desechos Y Materiales Para Reciclar",
-    "46699": "Comercio Al Por Mayor De Otros Productos N.C.P.",
-    "46900": "Comercio Al Por Mayor No Especializada",
-    "47111": "Comercio Al Por Menor En Hipermercados Y Supermercados",
-    "47112": "Comercio Al Por Menor En Mini Mercados Y Despensas",
-    "47113": "Comercio Al Por Menor  Realizado Por Los Free Shops",
-    "47114": "Comercio Al Por Menor Realizado Por Las Cooperativas De Consumo",
-    "47190": "Comercio Al Por Menor De Otros Productos En Comercios No Especializados",
-    "47211": "Comercio Al Por Menor De Frutas Y Verduras",
-    "47212": "Comercio Al Por Menor De Carnes Y Pescados",
-    "47213": "Comercio Al Por Menor De Productos De Panadería, Confitería Y Pastelería",
-    "47219": "Comercio Al Por Menor De Otros Alimentos N.C.P.",
-    "47220": "Comercio Al Por Menor De Bebidas",
-    "47230": "Comercio Al Por Menor De Tabaco",
-    "47300": "Comercio Al Por Menor De Combustible Para Vehículos Automotores En Comercios Especializados    474 - Comercio Al Por Menor De Equipos De Información Y Comunicaciones En Comer cios Especializados",
-    "47411": "Comercio Al Por Menor De Equipos Informáticos Y Software",
-    "47412": "Comercio Al Por Menor De Equipos De Telecomunicac iones",
-    "47420": "Comercio Al Por Menor De Equipos De Audio Y Vídeo",
-    "47511": "Comercio Al Por Menor De Tela En Almacenes Especializados",
-    "47512": "Comercio Al Por Menor De Hilos Y Artículos De Mercería En Almacenes Especializados",
-    "47521": "Comercio Al Por Menor De Artículos De Ferretería",
-    "47522": "Comercio Al Por Menor De Pinturas Y Revestimientos Sim ilares",
-    "47523": "Comercio Al Por Menor De Otros Materiales De Construcción Tales Como Ladrillos, Madera,",
-    "47524": "Comercio Al Por Menor De Vidrio",
-    "47529": "Comercio Al Por Menor De Otros Artículos N.C.P.",
-    "47530": "Comercio Al P or Menor De Alfombras, Cubiertas De Pared Y Piso En Almacenes Especializados",
-    "47591": "Comercio Al Por Menor De Electrodomésticos Y Accesorios",
-    "47592": "Comercio Al Por Menor De Muebles Y Accesorios Para El Hogar",
-    "47593": "Comercio Al Por Menor De Cristalería Y Menage",
-    "47594": "Comercio Al Por Menor De Instrumentos Musicales  Y Partituras",
-    "47595": "Comercio Al Por Menor De Sistemas De Seguridad",
-    "47599": "Comercio Al Por Menor De Otros Artículos Y Equipos De Uso Doméstico N.C.P.",
-    "47610": "Comercio Al Por Menor De Libros, Periódicos Y Artículos De Papelería",
-    "47620": "Comercio Al Por Menor De Grabaciones De Audio Y Video; Cintas Y Discos Vírgenes, En Comercios",
-    "47631": "Comercio Al Por Menor De Bicicletas",
-    "47639": "Comercio Al Por Menor De Otros Artículos Deportivos N.C.P.",
-    "47640": "Comercio Al Por Menor De Juegos Y Juguetes",
-    "47711": "Comercio Al Por Menor De Prendas De Vestir",
-    "47712": "Comercio Al Por Menor De Calzado",
-    "47713": "Comercio Al Por Menor De Accesorios De Cuero, Pieles Y Ma teriales Similares",
-    "47721": "Comercio Al Por Menor De Productos Farmacéuticos De Uso Humano",
-    "47722": "Comercio Al  Por Menor De Productos Farmacéuticos De Uso Veterinario",
-    "47723": "Comercio Al Por Menor De Cosméticos Y Artículos De Tocador",
-    "47724": "Comercio Al Por Menor De Productos Médicos Y Ortopédicos",
-    "47731": "Comercio Al Por Menor De Equipo Fotográfico, Óptico Y De Precisión",
-    "47732": "Comercio Al Por Menor De Relojes Y Joyas",
-    "47733": "Comercio Al Por Menor De Flores, Plantas, Semillas, Fertilizantes Y Artículos Para Jardín",
-    "47734": "Comercio Al Por Menor De Artesanías, Fantasías Y Souvenirs",
-    "47735": "Comercio Al Por Menor De Combustibles De Uso Doméstico, Gas Envasado, Leñ a Y Carbón",
-    "47736": "Comercio Al Por Menor De Objetos De Galerías De Arte Comerciales      47739 - Otros Comercios Al Por Menor De Productos Nuevos N.C.P. En Almacenes Especializados",
-    "47742": "Comercio Al Por Menor De Antiguedades",
-    "47749": "Comercio Al Por Menor De Otras Mercancías De Segunda Mano N.C.P",
-    "47810": "Comercio Al  Por Menor De Alimentos, Bebidas Y Tabaco En Puestos De Venta Y Mercados",
-    "47820": "Comercio Al Por Menor De Productos Textiles, Prendas De Vestir Y Calzado En Puestos De Venta Y",
-    "47890": "Comercio Al Por Menor De Otros Artículos En Puestos De Venta Y Mercados",
-    "47910": "Comercio Al Por Menor A Través De Empresas De Comercio Por Correo O Internet",
-    "47990": "Otros Tipos De Comercio Al Por Menor No Realizada En  Almacenes, Puestos Y Mercados",
-    "49110": "Transporte De Pasajeros Por Vía Férrea, Incluso Subterráneos",
-    "49120": "Transporte De Carga Por Vía Fé rrea",
-    "49210": "Transporte Urbano O Suburbano De Pasajeros Por Vía Terrestre",
-    "49221": "Transporte En Taxímetros Y Remises",
-    "49222": "Transporte En Buses Escolares",
-    "49223": "Transporte Buses De Media Y Larga Distancia Regulares",
-    "49229": "Otros Tipos De Transporte De Pasajeros Por Vía Terrestre N.C.P.",
-    "49231": "Transporte Terre stre Local De Carga",
-    "49232": "Transporte Terrestre De Carga Interdepartamental E Internacional",
-    "49239": "Otros Tipos De Transporte Terrestre Por Carreteras N.C.P.",
-    "49300": "Transporte Por Tuberías",
-    "50110": "Transporte De Pasajeros Marítimo Y De Cabotaje",
-    "50120": "Transporte De Carga Marítimo Y De Cabotaje",
-    "50210": "Transporte De Pas ajeros Por Vías Fluviales",
-    "50220": "Transporte De Carga Por Vías Fluviales",
-    "51100": "Transporte Aéreo De Pasajeros",
-    "51200": "Transporte Aéreo De Carga",
-    "52100": "Depósito Y Almacenamiento",
-    "52210": "Actividades Auxiliares Al Transporte Terrestre",
-    "52220": "Actividades Auxiliares Al Transporte Acuático",
-    "52230": "Actividades Auxiliares Al Transporte Aéreo",
-    "52240": "Manipulación De La Carga",
-    "52291": "Actividades De Los Agentes De Transp orte Aéreo      52292 - Actividades De Los Agentes De Transporte Terrestre",
-    "52293": "Actividades De Los Despachantes De Aduana",
-    "52294": "Otras Actividades De Los Agentes De Transporte Marítimo Y Fluvial",
-    "52299": "Operación De Manipulación De Produ ctos Y Otras Actividades Complementarias Al Transporte",
-    "53100": "Correo",
-    "53200": "Servicios De Mensajería",
-    "55101": "Actividades De Alojamiento En Hoteles",
-    "55102": "Actividades De Alojamiento En Casas De Huéspedes Y Moteles",
-    "55109": "Otros Alojamientos De Corto Plazo N.C.P.",
-    "55200": "Parques De Caravanas, Parques De Remol ques, Campamentos De Recreo Y Camping",
-    "55901": "Actividades De Alojamiento En Pensiones Familiares Sin Servicios",
-    "55909": "Otras Actividades De Alojamientos N.C.P.",
-    "56101": "Restaurantes Y Parrilladas",
-    "56102": "Rotiserías",
-    "56103": "Heladerías Que No Elaboran El Producto",
-    "56109": "Otros Se rvicios De Suministro De Alimento Para Consumo Inmediato N.C.P.",
-    "56210": "Abastecimiento De Eventos",
-    "56290": "Otros Servicios De Comida N.C.P.",
-    "56300": "Actividades Vinculadas Al Servicio De Bebidas",
-    "58110": "Edición De Libros, Incluso Integrada A La Impresión",
-    "58120": "Publicación De Directorios Y Listas De Direcciones, Incluso Integrada A La Impresión",
-    "58130": "Edición De Periódicos, Diarios Y Revistas, Incluso Integrada A La Impresión",
-    "58190": "Otras Actividades De Edición N.C.P., Incluso Integrada A La Impresión",
-    "58200": "Edición De Software",
-    "59110": "Actividades De Producción Y Post Producción De Películas, Vídeos Y Programas De Televisión",
-    "59120": "Actividades De Distribución De Películas, Vídeos Y Programas De  Televisión",
-    "59130": "Actividades De Proyección De Películas",
-    "59200": "Actividades De Grabación Sonora Y Edición De Música",
-    "60201": "Actividades De Televisión Abierta",
-    "60202": "Programadoras Y Actividades Relacionadas Con La Televisión Por Suscripción",
-    "61001": "Telecomunicaciones",
-    "61002": "Otros Servicios Relacionados C on Las Telecomunicaciones N.C.P.",
-    "62010": "Actividades De Programación Informática",
-    "62020": "Actividades De Consultoría Y Gestión De Servicios Informáticos",
-    "62090": "Otras Actividades De Tecnología De La Información Y Servicios Informáticos",
-    "63110": "Procesamiento De Datos, Hospedaje Y Servicios Conexos",
-    "63120": "Portales Web",
-    "63910": "Actividades De Agencias De Noticias",
-    "63990": "Otras Actividades De Servicios De Información N.C.P.",
-    "64110": "Banca Central",
-    "64190": "Otros Tipos De Intermediación Monetaria",
-    "64200": "Actividades De Sociedades De Cartera",
-    "64300": "Inversión Colectiva, Fondos Y Otros Instrumentos Financieros Similares",
-    "64911": "Otorg amiento De Crédito Sin Aval Bancario",
-    "64912": "Actividad De Las Casas De Empeño",
-    "64913": "Actividad De Los Prestamistas",
-    "64914": "Actividad De Los Círculos De Ahorro",
-    "64990": "Otras Actividades De Servicios Financieros, Excepto La Financiación D e Planes De Seguros Y De",
-    "65110": "Seguros De Vida",
-    "65126": "Seguros Médicos Y Odontológicos",
-    "65127": "Seguros Patrimoniales",
-    "65128": "Seguros De Sepelio",
-    "65129": "Otros Seguros Generales N.C.P.",
-    "65200": "Planes De Reaseguros",
-    "65300": "Fondos De Pensiones   66 - Actividades Auxiliares A Los Servicios Financieros Y A Los Seguros",
-    "66100": "Actividades Auxiliares De La Intermediación Financiera, Excepto La Financiación De Planes De",
-    "66210": "Evaluación De Riesgos Y Daños",
-    "66220": "Actividades De Los A gentes Y Corredores De Seguro",
-    "66290": "Otras Actividades Auxiliares De Seguros Y Fondos De Pensiones N.C.P",
-    "66300": "Actividades De Administración De Fondos",
-    "68100": "Actividades Inmobiliarias Realizadas Con Bienes Propios O Arrendados",
-    "68201": "Intermediación En La Compra, Venta Y Arrendamiento De Inmuebles",
-    "68202": "Avalúos De Inmuebles",
-    "68203": "Arrendamiento De Inmuebles Rur ales",
-    "68209": "Otras Actividades Inmobiliarias Realizadas A Cambio De Una Retribución O Por Contrata N.C.P",
-    "69107": "Actividades Jurídicas (Abogado)",
-    "69108": "Actividades Notariales",
-    "69109": "Otras Actividades Jurídicas Y Notariales N.C.P.",
-    "69201": "Actividades De Contabilidad, Teneduría De Libros (Contador)",
-    "69202": "Servicios De Auditoria Y Asesoramiento En Materia De Impuestos (Auditor -Asesor Impositivo)",
-    "69207": "Servicios De Auditoria Externa Impositiva (Art. 33º Ley 2421/04)",
-    "69208": "Otros Servicios Autorizados",
-    "69209": "Actividades De Contabilidad, Te neduría De Libros, Auditoria Y Asesoria Fiscal N.C.P.",
-    "70100": "Actividades De Las Oficinas Centrales",
-    "70201": "Servicios De Contabilidad, Administración Y Asesoramiento De Empresas, Excepto Los Prestados",
-    "70209": "Otras Actividades De Administración Y Consultoría De Administración De Empresas N.C.P.",
-    "71101": "Actividades De Servicios De Arquitectura",
-    "71102": "Actividades De Servicios De Diseño De Pais ajes",
-    "71103": "Actividades De Servicios De Ingeniería",
-    "71109": "Otras Actividades De Servicios De Arquitectura E Ingeniería N.C.P",
-    "72100": "Investigación Y Desarrollo Experimental En Ciencias Naturales E Ingeniería",
-    "72200": "Investigación Y Desarrollo Experimental En Ciencias Sociales Y Las Humanidades",
-    "73100": "Actividades Publicitarias",
-    "73200": "Investigación De Mercados Y Encuestas De Opinión Pública",
-    "74100": "Actividades De Diseño Especializado",
-    "74200": "Actividades De Fotografía",
-    "74901": "Actividades De Traducción E Interpret ación",
-    "74902": "Actividades De Consultoría En Agronomía",
-    "74903": "Actividades De Servicios De Consultoría Ambiental",
-    "74904": "Actividades De Meteorología",
-    "74909": "Otras Actividades Profesionales, Científicas Y Técnicas N.C.P.",
-    "75000": "Actividades Veterinarias",
-    "77100": "Actividades De Alquiler Y Arrendamiento De Vehículos Automotores Sin Conductor",
-    "77210": "Alquiler De Cintas De Vídeo Y Discos",
-    "77290": "Alquiler Y Arrendamiento De Otros Efectos Personales Y Enseres Domésticos N.C.P.",
-    "77301": "Alquiler Y Arrendamiento De Maquinaria Agropecuaria Sin Operario",
-    "77302": "Alquiler Y Arrendamiento De Maquinaria Para La Construcción Sin Operario",
-    "77309": "Alquiler Y Arrendamiento De Otros Tipos De Maquinaria, Equipo Y Bienes Materiales N.C.P. Sin",
-    "77400": "Arrendamiento De Activos Intangibles No  Financieros",
-    "78000": "Actividades Relacionadas Con El Suministro De Empleo",
-    "79110": "Actividades De Las Agencias De Viajes",
-    "79120": "Actividades De Los Operadores Turísticos",
-    "79900": "Otros Servicios De Turismo N.C.P.   80 - Actividad es De Investigación Y Seguridad",
-    "80000": "Actividades De Investigación Y Seguridad",
-    "81100": "Actividades De Servicios De Mantenimiento A Edifícios E Instalaciones",
-    "81210": "Limpieza General De Edificios",
-    "81290": "Otras Actividades De Limpieza De Edificios E Industrial",
-    "81300": "Servicios De Paisajismo Y Jardinería",
-    "82110": "Servicios De Administración De Oficinas",
-    "82190": "Fotocopiado, Preparación De Documentos Y Otras Actividades Especializadas De Apoyo",
-    "82200": "Actividades De Las Centrales De Llamadas",
-    "82300": "Organización De Convenciones Y Ferias De Negocios",
-    "82910": "Actividades De Agencias De Cobro Y Oficinas De Crédito",
-    "82920": "Actividades De Envase Y Empaque",
-    "82997": "Actividades De Usuario Zona Franca",
-    "82998": "Actividades De Concesionario Zona Franca",
-    "82999": "Otras Actividades De Servicios De Apoyo A Empresas N.C.P.",
-    "84110": "Actividades De La Administración Pública En General",
-    "84120": "Regulación De Las Actividades De Organismos Que Prestan Servicios Sanitarios, Educativos,",
-    "84130": "Regulación Y Facilitación De La Actividad Económica",
-    "84210": "Relaciones Exteriores",
-    "84220": "Actividades De Defensa",
-    "84230": "Actividades De Mantenimiento Del Orden Público Y De Seguridad",
-    "84300": "Actividades De Planes De Seguro Social Obligatorio",
-    "85101": "Guarderías Y Jardines Maternales",
-    "85102": "Enseñanza Prescolar, Primaria",
-    "85210": "Enseñanza Secundar ia De Formación General",
-    "85220": "Enseñanza Secundaria De Formación Técnica Y Profesional",
-    "85300": "Enseñanza Superior",
-    "85420": "Educación Cultural",
-    "85490": "Otros Tipos De Enseñanza N.C.P.",
-    "85500": "Servicios De Apoyo A La Enseñanza",
-    "86100": "Actividades De Hospitales",
-    "86200": "Actividades De Médicos Y Odontólogos",
-    "86901": "Actividades De Laboratorios De Análisis Clínicos Y Centros De Diagnósticos",
-    "86909": "Otras Actividades Relacionadas Con La Salud Humana",
-    "87000": "Asistencia Social Relacionada Con La Atenciõn A La Salud",
-    "88000": "Servicios Sociales Sin Alojamiento",
-    "90000": "Actividades Artísticas Y De Espectáculos",
-    "91010": "Actividades De Bibliotecas Y Archivos",
-    "91020": "Actividades De Museos Y Pres ervación De Lugares Y Edificios Históricos",
-    "91030": "Actividades De Jardines Botánicos Y Zoológicos Y De Reservas Naturales",
-    "92000": "Actividades De Juego s De Azar Y Apuestas",
-    "93110": "Administración De Instalaciones Deportivas",
-    "93120": "Actividades De Clubes Deportivos",
-    "93190": "Actividades Deporti vas",
-    "93210": "Actividades De Parques De Atracciones Y Parques Temáticos",
-    "93290": "Otras Actividades De Diversión Y Entretenimiento N.C.P.",
-    "94110": "Actividades De Organizaciones Empresariales Y De Empleadores",
-    "94120": "Actividades De Organizaciones Profesionales",
-    "94200": "Actividades De Sindicatos",
-    "94910": "Actividades De Organizaciones Religiosas",
-    "94920": "Actividades De Organizaciones Políticas",
-    "94999": "Actividades De Las Sociedades Literarias, Cívicas Y Sociales Y Otras Organizaciones N.C.P.",
-    "95110": "Reparación De Equipos Informáticos Y Periféricos",
-    "95120": "Reparación De Equipos De Comunicaciones",
-    "95210": "Reparación De Aparatos Eléctricos De Consumo",
-    "95220": "Reparación De Aparatos Domésticos Y Equipamiento De Hogar Y Jardín",
-    "95230": "Reparación De Calzado Y Artículos De Cuero",
-    "95240": "Reparación De Muebles Y Accesorios Para El Hogar",
-    "95291": "Reparación De Bicicletas Y Similares",
-    "95292": "Reparación De Relojes, Joyas Y Cronómetros",
-    "95293": "Reparación Y  Modificación De Ropa",
-    "95299": "Reparación De Otros Bienes Personales Y Domésticos N.C.P.",
-    "96011": "Servicios De Lavaderías De Ropa",
-    "96012": "Servicios De Tintorerías Y Limpieza A Seco",
-    "96019": "Otros Servicios De Limpieza De Prendas Y De Otros Artículos N.C.P.",
-    "96020": "Peluquería Y Otros Tratamientos De Belleza",
-    "96030": "Pompas Fúnebres Y Actividades Conexas",
-    "96091": "Servicios De Baños De Vapor Y De Sol (Solarios)",
-    "96092": "Servicios De Agencias  Matrimoniales Y Similares",
-    "96093": "Actividades De Quiromancia, Astrología, Espiritismo, Tarot, Etc.",
-    "96094": "Servicios De Masajes Reductores Y De Adelgazamiento",
-    "96095": "Actividades De Prostíbulos Y Similares",
-    "96098": "Servicios Personales Para El Sector Público",
-    "96099": "Otras Actividades De Servicios Personales N.C.P.",
-    "97000": "Actividades De Los Hogares Como Empleadores De Personal Domestico",
-    "99000": "Actividades De Organizaciones Y Organismos Extraterritoriales",
-    "99999": "Sin Código Equivalente"
-}
+import json
+import os
 
-# Códigos de países según ISO 3166 (XSD Paises_v100.xsd)
-PAISES = {
-    "DZA": "Argelia",
-    "EGY": "Egipto",
-    "LBY": "Libia",
-    "MAR": "Marruecos",
-    "SDN": "Sudán",
-    "TUN": "Túnez",
-    "ESH": "Sáhara Occidental",
-    "IOT": "Territorio Británico del Océano Índico",
-    "BDI": "Burundi",
-    "COM": "Comoras",
-    "DJI": "Djibouti",
-    "ERI": "Eritrea",
-    "ETH": "Etiopía",
-    "ATF": "Territorio de las Tierras Australes Francesas",
-    "KEN": "Kenya",
-    "MDG": "Madagascar",
-    "MWI": "Malawi",
-    "MUS": "Mauricio",
-    "MYT": "Mayotte",
-    "MOZ": "Mozambique",
-    "REU": "Reunión",
-    "RWA": "Rwanda",
-    "SYC": "Seychelles",
-    "SOM": "Somalia",
-    "SSD": "Sudán del Sur",
-    "UGA": "Uganda",
-    "TZA": "República Unida de Tanzanía",
-    "ZMB": "Zambia",
-    "ZWE": "Zimbabwe",
-    "AGO": "Angola",
-    "CMR": "Camerún",
-    "CAF": "República Centroafricana",
-    "TCD": "Chad",
-    "COG": "Congo",
-    "COD": "República Democrática del Congo",
-    "GNQ": "Guinea Ecuatorial",
-    "GAB": "Gabón",
-    "STP": "Santo Tomé y Príncipe",
-    "BWA": "Botswana",
-    "LSO": "Lesotho",
-    "NAM": "Namibia",
-    "ZAF": "Sudáfrica",
-    "SWZ": "Swazilandia",
-    "BEN": "Benin",
-    "BFA": "Burkina Faso",
-    "CPV": "Cabo Verde",
-    "CIV": "Côte d'Ivoire",
-    "GMB": "Gambia",
-    "GHA": "Ghana",
-    "GIN": "Guinea",
-    "GNB": "Guinea-Bissau",
-    "LBR": "Liberia",
-    "MLI": "Malí",
-    "MRT": "Mauritania",
-    "NER": "Níger",
-    "NGA": "Nigeria",
-    "SHN": "Santa Elena",
-    "SEN": "Senegal",
-    "SLE": "Sierra Leona",
-    "TGO": "Togo",
-    "AIA": "Anguila",
-    "ATG": "Antigua y Barbuda",
-    "ABW": "Aruba",
-    "BHS": "Bahamas",
-    "BRB": "Barbados",
-    "BES": "Bonaire, San Eustaquio y Saba",
-    "VGB": "Islas Vírgenes Británicas",
-    "CYM": "Islas Caimán",
-    "CUB": "CUBA",
-    "CUW": "Curaçao",
-    "DMA": "Dominica",
-    "DOM": "República Dominicana",
-    "GRD": "Granada",
-    "GLP": "Guadalupe",
-    "HTI": "Haití",
-    "JAM": "Jamaica",
-    "MTQ": "Martinica",
-    "MSR": "Montserrat",
-    "PRI": "Puerto Rico",
-    "BLM": "San Bartolomé",
-    "KNA": "Saint Kitts y Nevis",
-    "LCA": "Santa Lucía",
-    "MAF": "San Martín (parte francesa)",
-    "VCT": "San Vicente y las Granadinas",
-    "SXM": "San Martín (parte holandés)",
-    "TTO": "Trinidad y Tabago",
-    "TCA": "Islas Turcas y Caicos",
-    "VIR": "Islas Vírgenes de los Estados Unidos",
-    "BLZ": "Belice",
-    "CRI": "Costa Rica",
-    "SLV": "El Salvador",
-    "GTM": "Guatemala",
-    "HND": "Honduras",
-    "MEX": "México",
-    "NIC": "Nicaragua",
-    "PAN": "Panamá",
-    "ARG": "Argentina",
-    "BOL": "Bolivia (Estado Plurinacional de)",
-    "BRA": "Brasil",
-    "CHL": "Chile",
-    "COL": "Colombia",
-    "ECU": "Ecuador",
-    "FLK": "Islas Malvinas (Falkland)",
-    "GUF": "Guayana Francesa",
-    "GUY": "Guyana",
-    "PRY": "Paraguay",
-    "PER": "Perú",
-    "SGS": "Georgia del Sur y las Islas Sandwich del Sur",
-    "SUR": "Suriname",
-    "URY": "Uruguay",
-    "VEN": "Venezuela (República Bolivariana de)",
-    "BMU": "Bermuda",
-    "CAN": "Canadá",
-    "GRL": "Groenlandia",
-    "SPM": "Saint Pierre y Miquelon",
-    "USA": "Estados Unidos de América",
-    "ATA": "Antártida",
-    "KAZ": "Kazajstán",
-    "KGZ": "Kirguistán",
-    "TJK": "Tayikistán",
-    "TKM": "Turkmenistán",
-    "UZB": "Uzbekistán",
-    "CHN": "China",
-    "HKG": "China, región administrativa especial de Hong Kong",
-    "MAC": "China, región administrativa especial de Macao",
-    "PRK": "República Popular Democrática de Corea",
-    "JPN": "Japón",
-    "MNG": "Mongolia",
-    "KOR": "República de Corea",
-    "BRN": "Brunei Darussalam",
-    "KHM": "Camboya",
-    "IDN": "Indonesia",
-    "LAO": "República Democrática Popular Lao",
-    "MYS": "Malasia",
-    "MMR": "Myanmar",
-    "PHL": "Filipinas",
-    "SGP": "Singapur",
-    "THA": "Tailandia",
-    "TLS": "Timor-Leste",
-    "VNM": "Viet Nam",
-    "AFG": "Afganistán",
-    "BGD": "Bangladesh",
-    "BTN": "Bhután",
-    "IND": "India",
-    "IRN": "Irán (República Islámica del)",
-    "MDV": "Maldivas",
-    "NPL": "Nepal",
-    "PAK": "Pakistán",
-    "LKA": "Sri Lanka",
-    "ARM": "Armenia",
-    "AZE": "Azerbaiyán",
-    "BHR": "Bahrein",
-    "CYP": "Chipre",
-    "GEO": "Georgia",
-    "IRQ": "Iraq",
-    "ISR": "Israel",
-    "JOR": "Jordania",
-    "KWT": "Kuwait",
-    "LBN": "Líbano",
-    "OMN": "Omán",
-    "QAT": "Qatar",
-    "SAU": "Arabia Saudita",
-    "PSE": "Estado de Palestina",
-    "SYR": "República Árabe Siria",
-    "TUR": "Turquía",
-    "ARE": "Emiratos Árabes Unidos",
-    "YEM": "Yemen",
-    "BLR": "Belarús",
-    "BGR": "Bulgaria",
-    "CZE": "Chequia",
-    "HUN": "Hungría",
-    "POL": "Polonia",
-    "MDA": "República de Moldova",
-    "ROU": "Rumania",
-    "RUS": "Federación de Rusia",
-    "SVK": "Eslovaquia",
-    "UKR": "Ucrania",
-    "ALA": "Islas Åland",
-    "GGY": "Guernsey",
-    "JEY": "Jersey",
-    "DNK": "Dinamarca",
-    "EST": "Estonia",
-    "FRO": "Islas Feroe",
-    "FIN": "Finlandia",
-    "ISL": "Islandia",
-    "IRL": "Irlanda",
-    "IMN": "Isla de Man",
-    "LVA": "Letonia",
-    "LTU": "Lituania",
-    "NOR": "Noruega",
-    "SJM": "Islas Svalbard y Jan Mayen",
-    "SWE": "Suecia",
-    "GBR": "Reino Unido de Gran Bretaña e Irlanda del Norte",
-    "ALB": "Albania",
-    "AND": "Andorra",
-    "BIH": "Bosnia y Herzegovina",
-    "HRV": "Croacia",
-    "GIB": "Gibraltar",
-    "GRC": "Grecia",
-    "VAT": "Santa Sede",
-    "ITA": "Italia",
-    "MLT": "Malta",
-    "MNE": "Montenegro",
-    "PRT": "Portugal",
-    "SMR": "San Marino",
-    "SRB": "Serbia",
-    "SVN": "Eslovenia",
-    "ESP": "España",
-    "MKD": "ex República Yugoslava de Macedonia",
-    "AUT": "Austria",
-    "BEL": "Bélgica",
-    "FRA": "Francia",
-    "DEU": "Alemania",
-    "LIE": "Liechtenstein",
-    "LUX": "Luxemburgo",
-    "MCO": "Mónaco",
-    "NLD": "Países Bajos",
-    "CHE": "Suiza",
-    "AUS": "Australia",
-    "CXR": "Isla de Navidad",
-    "CCK": "Islas Cocos (Keeling)",
-    "HMD": "Islas Heard y McDonald",
-    "NZL": "Nueva Zelandia",
-    "NFK": "Islas Norfolk",
-    "FJI": "Fiji",
-    "NCL": "Nueva Caledonia",
-    "PNG": "Papua Nueva Guinea",
-    "SLB": "Islas Salomón",
-    "VUT": "Vanuatu",
-    "GUM": "Guam",
-    "KIR": "Kiribati",
-    "MHL": "Islas Marshall",
-    "FSM": "Micronesia (Estados Federados de)",
-    "NRU": "Nauru",
-    "MNP": "Islas Marianas Septentrionales",
-    "PLW": "Palau",
-    "UMI": "Islas menores alejadas de Estados Unidos",
-    "ASM": "Samoa Americana",
-    "COK": "Islas Cook",
-    "PYF": "Polinesia Francesa",
-    "NIU": "Niue",
-    "PCN": "Pitcairn",
-    "WSM": "Samoa",
-    "TKL": "Tokelau",
-    "TON": "Tonga",
-    "TUV": "Tuvalu",
-    "WLF": "Islas Wallis y Futuna",
-    "NN": "NO EXISTE"
-}
+# Los catálogos grandes (actividades económicas, países, monedas, distritos y
+# ciudades) viven en sifen/utils/catalogos/<NOMBRE>.json y se cargan recién la
+# primera vez que se accede a constants.<NOMBRE>; importar este módulo no los
+# lee. Una vez cargados quedan como atributos normales del módulo.
+CATALOGOS_DIR = os.path.join(os.path.dirname(__file__), "catalogos")
+CATALOGOS_DIFERIDOS = (
+    "ACTIVIDADES_ECONOMICAS",  # Códigos de actividad económica según SET
+    "PAISES",                  # ISO 3166 (XSD Paises_v100.xsd)
+    "MONEDAS",                 # ISO 4217 (XSD Monedas_v150.xsd)
+    "DISTRITOS_PARAGUAY",
+    "CIUDADES_PARAGUAY",
+)
+
+
+def _cargar_catalogo(nombre: str) -> dict:
+    with open(os.path.join(CATALOGOS_DIR, f"{nombre}.json"), encoding="utf-8") as archivo:
+        return json.load(archivo)
+
+
+def __getattr__(nombre: str):
+    if nombre in CATALOGOS_DIFERIDOS:
+        catalogo = _cargar_catalogo(nombre)
+        globals()[nombre] = catalogo  # Los accesos siguientes ya no pasan por aquí
+        return catalogo
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(CATALOGOS_DIFERIDOS))
 
-# Monedas según ISO 4217 (XSD Monedas_v150.xsd)
-MONEDAS = {
-    "AED": "Dirham",
-    "AFN": "Afghani",
-    "ALL": "Lek",
-    "AMD": "Dram",
-    "ANG": "Netherlands Antillian Guilder",
-    "AOA": "Kwanza",
-    "ARS": "Argentine Peso",
-    "AUD": "Australian Dollar",
-    "AWG": "Aruban Guilder",
-    "AZM": "Azerbaijanian Manat",
-    "BAM": "Convertible Mark",
-    "BBD": "Barbados Dollar",
-    "BYN": "Belarusian Ruble",
-    "BDT": "Taka",
-    "BGN": "Bulgarian Lev",
-    "BHD": "Bahraini Dinar",
-    "BIF": "Burundi Franc",
-    "BMD": "Bermudian Dollar",
-    "BND": "Brunei Dollar",
-    "BOB": "Boliviano",
-    "BOV": "Mvdol",
-    "BRL": "Brazilian Real",
-    "BSD": "Bahamian Dollar",
-    "BTN": "Ngultrum",
-    "BWP": "Pula",
-    "BYR": "Belarussian Ruble",
-    "BZD": "Belize Dollar",
-    "CAD": "Canadian Dollar",
-    "CDF": "Franc Congolais",
-    "CHF": "Swiss Franc",
-    "CHE": "WIR Euro",
-    "CHW": "WIR Franc",
-    "CLP": "Chilean Peso",
-    "CLF": "Unidad de Fomento",
-    "CNY": "Yuan Renminbi",
-    "COP": "Colombian Peso",
-    "COU": "Unidad de Valor Real",
-    "CRC": "Costa Rican Colon",
-    "CUP": "Cuban Peso",
-    "CUC": "Peso Convertible",
-    "CVE": "Cape Verde Escudo",
-    "CYP": "Cyprus Pound",
-    "CZK": "Czech Koruna",
-    "DJF": "Djibouti Franc",
-    "DKK": "Danish Krone",
-    "DOP": "Dominican Peso",
-    "DZD": "Algerian Dinar",
-    "EEK": "Kroon",
-    "EGP": "Egyptian Pound",
-    "ERN": "Nakfa",
-    "ETB": "Ethopian Birr",
-    "EUR": "Euro",
-    "FJD": "Fiji Dollar",
-    "FKP": "Falkland Islands Pound",
-    "GBP": "Pound Sterling",
-    "GEL": "Lari",
-    "GHS": "Ghana Cedi",
-    "GHC": "Cedi",
-    "GIP": "Gibraltar Pound",
-    "GMD": "Dalasi",
-    "GNF": "Guinea Franc",
-    "GTQ": "Quetzal",
-    "GYD": "Guyana Dollar",
-    "HKD": "Honk Kong Dollar",
-    "HNL": "Lempira",
-    "HRK": "Kuna",
-    "HTG": "Gourde",
-    "HUF": "Forint",
-    "IDR": "Rupiah",
-    "ILS": "New Israeli Sheqel",
-    "INR": "Indian Rupee",
-    "IQD": "Iraqi Dinar",
-    "IRR": "Iranian Rial",
-    "ISK": "Iceland Krona",
-    "JMD": "Jamaican Dollar",
-    "JOD": "Jordanian Dinar",
-    "JPY": "Yen",
-    "KES": "Kenyan Shilling",
-    "KGS": "Som",
-    "KHR": "Riel",
-    "KMF": "Comoro Franc",
-    "KPW": "North Korean Won",
-    "KRW": "Won",
-    "KWD": "Kuwaiti Dinar",
-    "KYD": "Cayman Islands Dollar",
-    "KZT": "Tenge",
-    "LAK": "Kip",
-    "LBP": "Lebanese Pound",
-    "LKR": "Sri Lanka Rupee",
-    "LRD": "Liberian Dollar",
-    "LSL": "Loti",
-    "LTL": "Lithuanian Litas",
-    "LVL": "Latvian Lats",
-    "LYD": "Libyan Dinar",
-    "MAD": "Morrocan Dirham",
-    "MZN": "Mozambique Metical",
-    "MDL": "Moldovan Leu",
-    "MGF": "Malagasy Franc",
-    "MKD": "Denar",
-    "MGA": "Malagasy Ariary",
-    "MMK": "Kyat",
-    "MNT": "Tugrik",
-    "MOP": "Pataca",
-    "MRO": "Ouguiya",
-    "MTL": "Maltese Lira",
-    "MUR": "Mauritius Rupee",
-    "XUA": "ADB Unit of Account",
-    "MVR": "Rufiyaa",
-    "MRU": "Ouguiya",
-    "MWK": "Kwacha",
-    "MXN": "Mexican Peso",
-    "MXV": "Mexican Unidad de Inversion",
-    "MYR": "Malaysian Ringgit",
-    "MZM": "Metical",
-    "NAD": "Namibia Dollar",
-    "NGN": "Naira",
-    "NIO": "Cordoba Oro",
-    "NOK": "Norwegian Krone",
-    "NPR": "Nepalese Rupee",
-    "NZD": "New Zealand Dollar",
-    "OMR": "Rial Omani",
-    "PAB": "Balboa",
-    "PEN": "Nuevo Sol",
-    "PGK": "Kina",
-    "PHP": "Philippine Peso",
-    "PKR": "Pakistan Rupee",
-    "PLN": "Zloty",
-    "PYG": "Guarani",
-    "QAR": "Qatari Rial",
-    "RON": "Romanian Leu",
-    "ROL": "Leu",
-    "RUB": "Russian Ruble",
-    "RWF": "Rwanda Franc",
-    "SAR": "Saudi Riyal",
-    "RSD": "Serbian Dinar",
-    "SBD": "Solomon Islands Dollar",
-    "SCR": "Seychelles Rupee",
-    "SDD": "Sudanese Dinar",
-    "SDG": "Sudanese Pound",
-    "SRD": "Surinam Dollar",
-    "SEK": "Swedish Krona",
-    "SGD": "Singapore Dollar",
-    "SHP": "St. Helena Pound",
-    "SIT": "Tolar",
-    "SKK": "Slovak Koruna",
-    "SLL": "Leone",
-    "SOS": "Somali Shilling",
-    "SRG": "Suriname Guilder",
-    "SSP": "South Sudanese Pound",
-    "STD": "Dobra",
-    "SVC": "El Salvador Colon",
-    "SYP": "Syrian Pound",
-    "SZL": "Lilangeni",
-    "THB": "Baht",
-    "TJS": "Somoni",
-    "TMM": "Manat",
-    "TND": "Tunisian Dinar",
-    "TRY": "Turkish Lira",
-    "TMT": "Turkmenistan New Manat",
-    "TOP": "Pa'anga",
-    "TRL": "Turkish Lira",
-    "TTD": "Trinidad and Tobago Dollar",
-    "TWD": "New Taiwan Dollar",
-    "TZS": "Tanzanian Shilling",
-    "UAH": "Hryvnia",
-    "UGX": "Uganda Shilling",
-    "USD": "US Dollar",
-    "USN": "US Dollar(Next day)",
-    "UYU": "Peso Uruguayo",
-    "UYI": "Uruguay Peso en Unidades Indexadas(UI)",
-    "UYW": "Unidad Previsional",
-    "UZS": "Uzbekistan Sum",
-    "VEB": "Bolivar",
-    "VND": "Dong",
-    "VUV": "Vatu",
-    "VES": "Bolivar Soberano",
-    "WST": "Tala",
-    "STN": "Dobra",
-    "XAF": "CFA Franc",
-    "XAG": "Silver",
-    "XAU": "Gold",
-    "XCD": "East Carribean Dollar",
-    "XDR": "SDR",
-    "XOF": "CFA Franc",
-    "XPD": "Palladium",
-    "XPF": "CFP Franc",
-    "XPT": "Platinum",
-    "XSU": "Sucre",
-    "XBA": "Bond Markets Unit European Composite Unit(EURCO)",
-    "XBB": "Bond Markets Unit European Monetary Unit(E.M.U.-6)",
-    "XBC": "Bond Markets Unit European Unit of Account 17 (E.U.A.-17)",
-    "XTS": "Codes specifically reserved for testing purposes",
-    "XXX": "The codes assigned for transactions where no currency is involved",
-    "YER": "Yemeni Rial",
-    "YUM": "New Dinar",
-    "ZMW": "Zambian Kwacha",
-    "ZWL": "Zimbabwe Dollar",
-    "ZAR": "Rand",
-    "ZMK": "Kwacha",
-    "ZWD": "Zimbabwe Dollar"
-}
 
 UNIDADES_MEDIDA = {
     "77": "UNI",       # Unidad
@@ -1189,6701 +155,6 @@ DEPARTAMENTOS_PARAGUAY = {
     "20": "NUEVA ASUNCION"
 }
 
-DISTRITOS_PARAGUAY = {
-    "1": "ASUNCION (DISTRITO)",
-    "2": "CONCEPCION (MUNICIPIO)",
-    "3": "SAN LAZARO",
-    "4": "SAN CARLOS",
-    "5": "BELEN",
-    "6": "LORETO",
-    "7": "HORQUETA",
-    "8": "SAN SALVADOR",
-    "9": "YBY YA'U",
-    "267": "SAN CARLOS DEL APA",
-    "270": "SARGENTO JOSE FELIX LOPEZ",
-    "280": "PASO BARRETO (MUNICIPIO)",
-    "281": "SAN ALFREDO (MUNICIPIO)",
-    "282": "AZOTE¿Y (MUNICIPIO)",
-    "286": "ARROYITO",
-    "10": "SAN PEDRO DE YCUAMANDYYU",
-    "11": "ANTEQUERA",
-    "12": "GRAL. E.AQUINO",
-    "13": "ITACURUBI DEL ROSARIO",
-    "14": "SAN ESTANISLAO (SANTANI)",
-    "15": "LIMA",
-    "16": "NUEVA GERMANIA",
-    "17": "TACUATI",
-    "18": "UNION",
-    "19": "25 DE DICIEMBRE",
-    "20": "VILLA DEL ROSARIO",
-    "21": "YATAITY DEL NORTE",
-    "22": "ISIDORO RESQUIN",
-    "23": "CHORE",
-    "24": "SAN PABLO",
-    "25": "SAN JOSE DEL ROSARIO",
-    "220": "GUAYAIBI",
-    "226": "CAPIIBARY",
-    "245": "YRYBUCUA",
-    "263": "SANTA ROSA DEL AGUARAY",
-    "268": "LIBERACIÓN",
-    "285": "SAN VICENTE PANCHOLO",
-    "26": "CAACUPE",
-    "27": "ALTOS",
-    "28": "ARROYOS Y ESTEROS",
-    "29": "ATYRA",
-    "30": "CARAGUATAY",
-    "31": "EMBOSCADA",
-    "32": "EUSEBIO AYALA",
-    "33": "ISLA PUCU",
-    "34": "ITACURUBI DE LA CORDILLERA",
-    "35": "JUAN DE MENA",
-    "36": "NUEVA COLOMBIA",
-    "37": "PIRIBEBUY",
-    "38": "1RO.DE MARZO",
-    "39": "SAN BERNARDINO",
-    "40": "SANTA ELENA",
-    "41": "TOBATI",
-    "42": "VALENZUELA",
-    "43": "LOMA GRANDE",
-    "44": "SAN JOSE OBRERO",
-    "214": "MBOCAYATY DEL YHAGUY",
-    "45": "VILLARRICA",
-    "46": "SAN SALVADOR",
-    "47": "BORJA",
-    "48": "INDEPENDENCIA (R.D.MELGAREJO)",
-    "49": "GRAL.EUGENIO A. GARAY",
-    "50": "CNEL. MARTINEZ",
-    "51": "JOSE FASSARDI",
-    "52": "FELIX PEREZ CARDOZO",
-    "53": "MAURICIO JOSE TROCHE",
-    "54": "ITAPE",
-    "55": "ITURBE",
-    "56": "MBOCAYATY",
-    "57": "NATALICIO TALAVERA",
-    "58": "ÑUMI",
-    "59": "YATAITY",
-    "60": "DR. BOTREL",
-    "225": "PASO YOBAY",
-    "246": "SIN EQUIVALENCIA",
-    "265": "TEBICUARY",
-    "61": "CNEL. OVIEDO",
-    "62": "CAAGUAZU",
-    "63": "CARAYAO",
-    "64": "CECILIO BAEZ",
-    "65": "NUEVA LONDRES",
-    "66": "SAN JOAQUIN",
-    "67": "SAN JOSE DE LOS ARROYOS",
-    "68": "YHU",
-    "69": "JUAN MANUEL FRUTOS",
-    "70": "REPATRIACION",
-    "71": "SANTA ROSA DEL MBUTUY",
-    "72": "J. EULOGIO ESTIGARRIBIA",
-    "73": "JOSE D. OCAMPOS",
-    "74": "R.I.3 CORRALES",
-    "75": "RAUL A. OVIEDO",
-    "76": "MCAL.F.SOLANO LOPEZ",
-    "227": "3 DE FEBRERO",
-    "228": "SIMON BOLIVAR",
-    "229": "LA PASTORA",
-    "237": "VAQUERIA",
-    "244": "ESCULIES",
-    "275": "TEMBIAPORA",
-    "276": "NUEVA TOLEDO",
-    "77": "CAAZAPA",
-    "78": "BUENA VISTA",
-    "79": "GRAL. H. MORINIGO",
-    "80": "MACIEL",
-    "81": "MOISES BERTONI",
-    "82": "SAN JUAN NEPOMUCENO",
-    "83": "ABAI",
-    "84": "TAVAI",
-    "85": "YEGROS",
-    "86": "YUTY",
-    "272": "3 DE MAYO",
-    "87": "ENCARNACION",
-    "88": "BELLA VISTA",
-    "89": "CAMBYRETA",
-    "90": "CAPITAN MEZA",
-    "91": "CARMEN DEL PARANA",
-    "92": "CAPITAN MIRANDA",
-    "93": "CORONEL BOGADO",
-    "94": "FRAM",
-    "95": "GRAL. ARTIGAS",
-    "96": "GRAL. DELGADO",
-    "97": "HOHENAU",
-    "98": "JESUS",
-    "99": "OBLIGADO",
-    "100": "SAN COSME Y DAMIAN",
-    "101": "SAN PEDRO DEL PARANA",
-    "102": "NUEVA ALBORADA",
-    "103": "TRINIDAD",
-    "104": "NATALIO",
-    "105": "JOSE LEANDRO OVIEDO",
-    "106": "SAN RAFAEL DEL PARANA",
-    "107": "CARLOS A. LOPEZ",
-    "108": "JULIO D. OTAÑO",
-    "109": "EDELIRA",
-    "110": "SAN JUAN DEL PARANA",
-    "111": "LA PAZ",
-    "112": "TOMAS R. PEREIRA",
-    "113": "YATYTAY",
-    "114": "HERIBERTA S.DE IGLESIAS",
-    "221": "PIRAPO",
-    "232": "ITAPUA POTY",
-    "243": "FEDERICO CHAVEZ",
-    "262": "ALTO VERA",
-    "115": "SAN JUAN BAUTISTA",
-    "116": "AYOLAS",
-    "117": "SAN IGNACIO",
-    "118": "SAN MIGUEL",
-    "119": "SAN PATRICIO",
-    "120": "SANTIAGO",
-    "121": "SANTA MARIA",
-    "122": "SANTA ROSA",
-    "123": "VILLA FLORIDA",
-    "124": "YABEBYRY",
-    "125": "PARAGUARI",
-    "126": "ACAHAY",
-    "127": "CAAPUCU",
-    "128": "CABALLERO",
-    "129": "CARAPEGUA",
-    "130": "LA COLMENA",
-    "131": "ESCOBAR",
-    "132": "MBUYAPEY",
-    "133": "PIRAYU",
-    "134": "QUIINDY",
-    "135": "ROQUE GONZALEZ",
-    "136": "SAPUCAI",
-    "137": "YBYCUI",
-    "138": "QUYQUYHO",
-    "139": "YBYTYMI",
-    "140": "TEBICUARY MI",
-    "141": "YAGUARON",
-    "142": "HERNANDARIAS",
-    "143": "DOMINGO MARTINEZ DE IRALA",
-    "144": "ÑACUNDAY",
-    "145": "CIUDAD DEL ESTE",
-    "146": "JUAN LEON MALLORQUIN",
-    "147": "ITAKYRY",
-    "148": "JUAN E.O'LEARY",
-    "149": "PRESIDENTE FRANCO",
-    "150": "YGUAZU",
-    "151": "SAN CRISTOBAL",
-    "209": "SANTA RITA",
-    "210": "MINGA GUAZU",
-    "211": "LOS CEDRALES",
-    "212": "SAN ALBERTO",
-    "213": "MINGA PORA",
-    "215": "NARANJAL",
-    "216": "SANTA ROSA DEL MONDAY",
-    "217": "IRUÑA",
-    "219": "MBARACAYU",
-    "239": "SANTA FE DEL PARANA",
-    "240": "NUEVA ESPERANZA",
-    "269": "TAVAPY",
-    "273": "DR. RAUL PEÑA",
-    "152": "AREGUA",
-    "153": "CAPIATA",
-    "154": "FERNANDO DE LA MORA",
-    "155": "GUARAMBARE",
-    "156": "ITA",
-    "157": "ITAUGUA",
-    "158": "LIMPIO",
-    "159": "LUQUE",
-    "160": "MARIANO ROQUE ALONSO",
-    "161": "ÑEMBY",
-    "162": "NUEVA ITALIA",
-    "163": "SAN ANTONIO",
-    "164": "SAN LORENZO",
-    "165": "VILLA ELISA",
-    "166": "VILLETA",
-    "167": "YPACARAI",
-    "168": "YPANE",
-    "169": "LAMBARE",
-    "170": "J.AUGUSTO SALDIVAR",
-    "277": "LOMA PYTA",
-    "171": "PILAR",
-    "172": "ALBERDI",
-    "173": "CERRITO",
-    "174": "DESMOCHADOS",
-    "175": "GUAZU CUA",
-    "176": "HUMAITA",
-    "177": "ISLA UMBU",
-    "178": "LAURELES",
-    "179": "PASO DE PATRIA",
-    "180": "MAYOR J.D.MARTINEZ",
-    "181": "SAN JUAN DE ÑEEMBUCU",
-    "182": "TACUARAS",
-    "183": "VILLA OLIVA",
-    "184": "VILLALBIN",
-    "203": "GRAL.JOSE EDUVIGIS DIAZ",
-    "205": "VILLA FRANCA",
-    "230": "VILLA FRANCA",
-    "231": "VILLALBIN",
-    "185": "PEDRO JUAN CABALLERO",
-    "186": "BELLA VISTA",
-    "187": "CAPITAN BADO",
-    "278": "KARAPAI",
-    "279": "ZANJA PYTA",
-    "188": "VILLA HAYES",
-    "189": "BENJAMIN ACEVAL(MONTE SOCIEDAD",
-    "190": "PTO.PINAZCO",
-    "191": "NANAWA",
-    "206": "POZO COLORADO",
-    "242": "JOSE FALCON",
-    "261": "TTE. 1RO. IRALA FERNANDEZ",
-    "264": "TENIENTE ESTEBAN MARTINEZ",
-    "192": "MCAL.ESTIGARRIBIA",
-    "193": "BOQUERON",
-    "194": "PEDRO P.PEÑA",
-    "234": "GRAL. EUGENIO A. GARAY",
-    "259": "FILADELFIA",
-    "260": "LOMA PLATA",
-    "195": "FUERTE OLIMPO",
-    "196": "BAHIA NEGRA",
-    "218": "PUERTO CASADO",
-    "223": "PUERTO GUARANI",
-    "233": "MAYOR PABLO LAGERENZA",
-    "266": "CARMELO PERALTA",
-    "197": "SAN ISIDRO DEL CURUGUATY",
-    "198": "VILLA YGATIMI",
-    "199": "YPEJHU",
-    "200": "CORPUS CHRISTI",
-    "201": "ITANARA",
-    "202": "FRANCISCO CABALLERO ALVAREZ",
-    "207": "SALTO DEL GUAIRA",
-    "235": "LA PALOMA",
-    "236": "KATUETE",
-    "238": "NUEVA ESPERANZA",
-    "241": "YASY KAÑY",
-    "271": "YBYRAROBANA",
-    "274": "YBY PYTA",
-    "283": "MARACANA",
-    "284": "PUERTO ADELA",
-}
-
-CIUDADES_PARAGUAY = {
-    "1": "ASUNCION (DISTRITO)",
-    "3": "CONCEPCION (MUNICIPIO)",
-    "4": "ABASTO CUE",
-    "5": "AGUA FRIA",
-    "6": "AGUARA",
-    "7": "AGUERO CUE",
-    "8": "ALBASTI",
-    "9": "ALBERTO CUE",
-    "10": "ANEGADIZO",
-    "11": "AQUIDABAN",
-    "12": "AQUINO CUE",
-    "13": "ARCE CUE",
-    "14": "ARMANDIA",
-    "15": "ARRECIFE",
-    "16": "ARROYITO",
-    "17": "BARRERO CUA",
-    "18": "BARRERO SAY-YU",
-    "19": "BARRIO INMACULADA",
-    "20": "BARRIO NORTE",
-    "21": "BARRIO SAN ANTONIO",
-    "22": "BELLA LOMA",
-    "23": "BELEN",
-    "24": "BLAS CUE",
-    "25": "BOGADO CUE",
-    "26": "BOQUERON",
-    "27": "C.EPOPEYA NACIONAL",
-    "28": "C.EMIL. ROMERO PEREIRA",
-    "29": "C. JORGE MIRANDA",
-    "30": "C.RECONSTRUCCION",
-    "31": "C.N.GONZALEZ",
-    "32": "CABO CUE",
-    "33": "CAMBA CUA",
-    "34": "CAMPO HERMOSO",
-    "35": "CAMPOS RAFAEL",
-    "36": "CANCHA CUE",
-    "37": "CAPILLA",
-    "38": "CAPILLA LORETO",
-    "39": "CARRETA PASO",
-    "40": "CAZAL BOQUERON",
-    "41": "CAZAL CUE",
-    "42": "CAÑETE CUE",
-    "43": "COL.CNEL MONGELOS",
-    "44": "COL.COE PORA",
-    "45": "COL.E.R. PEREIRA",
-    "46": "COL.EXCOMBATIENTES",
-    "47": "COL.F.C.C. NORTE",
-    "48": "COL.FERNANDO DE LA MORA",
-    "49": "COL. GRAL.DIAZ",
-    "50": "COL. HERNANDARIAS",
-    "51": "COL. JUGADILLA",
-    "52": "COL. MARIA AUXILIADORA",
-    "53": "COL. PORA",
-    "54": "COL. SAN CARLOS",
-    "55": "COL. SARGENTO",
-    "56": "COL. YBAGOTY",
-    "57": "COL. ZONA OLEROS",
-    "58": "COSTA DE SEDA",
-    "59": "COE PORA",
-    "60": "CUENCA CUE",
-    "61": "CUETO POTRERO",
-    "62": "CURUZU ÑU",
-    "63": "CURUÑI",
-    "64": "CANDIDO SILVA",
-    "65": "DIEGO CUE",
-    "66": "DUARTE CUE",
-    "67": "ECHAGUE CUE",
-    "68": "ESTABLECIMIENTO",
-    "69": "ESTRIBO DE PALTA",
-    "70": "F. DE PINEDO",
-    "71": "FERROCARRIL C. NORTE",
-    "72": "FUERTE RISSO",
-    "73": "GAONA CUE",
-    "74": "GARAY CUE",
-    "75": "GRAL. DIAZ",
-    "76": "HEROES DEL CHACO",
-    "77": "INMACULADA",
-    "78": "ISLA NOVILLO",
-    "79": "ISLA R.",
-    "80": "ISLA REAL",
-    "81": "ISLA VALDEZ",
-    "82": "ISLA YBATE",
-    "83": "ITA PUCU MI",
-    "84": "ITACURUBI",
-    "85": "JARDIN EUROPA",
-    "86": "JHUGUA CANTERO",
-    "87": "JHUGUA CHOJA",
-    "88": "JHUGUA CUE",
-    "89": "JHUGUA GUAZU",
-    "90": "JHUGUA RIVAS",
-    "91": "JHUGUA TIMBO",
-    "92": "JHUGUA TORALES",
-    "93": "LA CANELA",
-    "94": "LA CONCHA",
-    "95": "LABITA",
-    "96": "LAGUNA",
-    "97": "LAGUNA ÑARO",
-    "98": "LLANO",
-    "99": "LOMA",
-    "100": "LOMA PYTA",
-    "101": "MALDONADO",
-    "102": "MANCUELLO CUE",
-    "103": "MBATOVI",
-    "104": "MBOCAYATY",
-    "105": "MBOREBI YCUA",
-    "106": "MONTAÑAS",
-    "107": "OCAMPOS",
-    "108": "OJEDA CUE",
-    "109": "PASO BARRETO",
-    "110": "PASO URUNDEY",
-    "111": "PASO ITA",
-    "112": "PEGUAJHO",
-    "113": "PEGUAJHO MI",
-    "114": "PEROY",
-    "115": "PICADA GUY",
-    "116": "PLANAS",
-    "117": "POTRERITO",
-    "118": "POTRERO ESTRELLA",
-    "119": "POTRERO ROMERO",
-    "120": "PROSPERIDAD",
-    "121": "PUENTE CAÑON",
-    "122": "PUERTO ABENTE",
-    "123": "PUERTO DOS",
-    "124": "QUINTA ALICELICA",
-    "125": "REQUEJO",
-    "126": "RINCON",
-    "127": "RINCON CIERVO",
-    "128": "RINCON CUE",
-    "129": "RINCON ZARZA",
-    "130": "RINCON DE LUNA",
-    "131": "RIVAS CUE",
-    "132": "ROJAS MI",
-    "133": "ROSALIA",
-    "134": "RURAL",
-    "135": "S. ISABEL",
-    "136": "SAGRADA FAMILIA",
-    "137": "SALADERO RISSO",
-    "138": "SALEITA",
-    "139": "SALINARES",
-    "140": "SALINARES CUE",
-    "141": "SAN ANTONIO",
-    "142": "SAN LORENZO",
-    "143": "SAN MIGUEL",
-    "144": "SAN NICOLAS",
-    "145": "SAN RAFAEL",
-    "146": "SAN SALVADOR",
-    "147": "SANCHEZ CUE",
-    "148": "SANTA CUE",
-    "149": "SANTA MARIA DE LA S.",
-    "150": "SIERVO POTRERO",
-    "934": "SOLALINDE",
-    "935": "STA. TOMASA",
-    "936": "BUBURBANA",
-    "937": "TABATINGA",
-    "938": "TACUATI",
-    "939": "TAGATIVO MI",
-    "940": "TATAYYUA",
-    "941": "TAYATY MI",
-    "942": "TEODORO CUE",
-    "943": "TOLDO CUE",
-    "944": "TOLEDO CUE",
-    "945": "TORALES",
-    "946": "TRANQUERA",
-    "947": "TRES ALTAS",
-    "948": "VILLA ARMANDO",
-    "949": "VILLA FERNANDO",
-    "950": "VILLA LOMA",
-    "951": "VILLA NUEVA",
-    "952": "YAGUARETE POTRERO",
-    "953": "YAPEPO",
-    "954": "YBACUMI",
-    "955": "IBAÑEZ ÑU",
-    "956": "YBYRATY",
-    "957": "YCUA CARANDA",
-    "958": "YCUA GUAZU",
-    "959": "YCUA PORA",
-    "960": "YPANE",
-    "961": "YPANE CUE",
-    "962": "YPANE JHU",
-    "963": "YUIY",
-    "964": "YUTY",
-    "965": "ZANJA CUE",
-    "966": "ZAPATERO CUE",
-    "967": "ÑU APUA",
-    "968": "ÑUMI",
-    "6154": "PINDURA",
-    "6155": "POTRERO FRENTE Y OTRO",
-    "6156": "RECALDE CUE",
-    "6157": "RINCON LOMA",
-    "6158": "ROMERO PATIÑO",
-    "6159": "SALADILLO",
-    "6160": "SAN ANTONIO DE LA SIERRA",
-    "6161": "SANJITA",
-    "6216": "VILLA SANA",
-    "6217": "YBYRAIPETY",
-    "6218": "YGATIGO",
-    "6219": "YUQUERI",
-    "6220": "ÑA VENTURA CUE",
-    "969": "SAN LAZARO",
-    "970": "COL. SAN LAZARO",
-    "971": "CONFLUENCIA",
-    "972": "PUERTO RISSO",
-    "973": "SALADERO R.",
-    "974": "VALLE MI",
-    "6221": "LOMA SAN MIGUEL",
-    "975": "SAN CARLOS",
-    "976": "ARRECIFE",
-    "977": "CERRO PAIVA",
-    "978": "CONCEPCION",
-    "979": "GAONA CUE",
-    "980": "INVERNADA VIEJO",
-    "981": "OJEDA CUE",
-    "982": "PONCIERRE",
-    "983": "POTRERO",
-    "984": "POTRERO ESTRELLA",
-    "985": "PUERTO MAX Y OTRO",
-    "986": "RECALDE CUE",
-    "987": "SAN BLAS",
-    "988": "SAN CARLOS",
-    "989": "SAN FERNANDO",
-    "990": "SANTA ROSA",
-    "991": "VILLAMAYOR CUE",
-    "992": "UGARTE CUE",
-    "993": "URAN CUE Y OTRO",
-    "6222": "CABALLERO CUE",
-    "6223": "LOMA PORA",
-    "6224": "POTRERO MBAREGUI",
-    "6225": "SAN RAFAEL",
-    "6226": "ÑU PYHAJHU",
-    "994": "BELEN",
-    "995": "BELEN COSTA",
-    "996": "COL.E.R.GONZALEZ",
-    "997": "E.R.PEREIRA",
-    "998": "COL.GRAL.DIAZ",
-    "999": "CULI LOMA",
-    "1000": "FDO.DE LA MORA",
-    "1001": "FERROCARRIL NORTE",
-    "1002": "ITA CORA",
-    "1003": "LEMO",
-    "1004": "LOMA PYTA",
-    "1005": "PASO URUNDEY",
-    "1006": "PEGUAJHO LOMA",
-    "1007": "PEGUAJHO MI",
-    "1008": "REQUEJO",
-    "1009": "TORALES CUE",
-    "1010": "TORRES CUE",
-    "1011": "TORIN CUE",
-    "1012": "URUNDEY",
-    "1013": "YBYRA PETEI",
-    "6227": "COL.F.DE LA MORA",
-    "1014": "LORETO",
-    "1015": "AQUIDABAN",
-    "1016": "C. MARIA AUXILIADORA",
-    "1017": "C.SAN ALFREDO",
-    "1018": "CAÑADA",
-    "1019": "CNEL.EDUARDO SANCHEZ",
-    "1020": "COL.CNEL.MARTINEZ",
-    "1021": "COL.COE PORA",
-    "1022": "COL.GRAL.DIAZ",
-    "1023": "COL.R.L.PETTIT",
-    "1024": "COL.RECONSTRUCCION",
-    "1025": "COE PORA",
-    "1026": "DOMINGO NIGO",
-    "1027": "DOMINGO VIEJO",
-    "1028": "DOMINGUEZ",
-    "1029": "ESTANCIA AGUAI",
-    "1030": "FDO.DE LA MORA",
-    "1031": "GRAL.DIAZ",
-    "1032": "ISLERIA",
-    "1033": "JHUGUA BARRETO",
-    "1034": "JHUGUA MARIN",
-    "1035": "JHUGUA RIVAS",
-    "1036": "JHUGUA TORALES",
-    "1037": "JOSE BERGES",
-    "1038": "LAGUNA",
-    "1039": "PASO VEGA",
-    "1040": "POTRERO LAGUNA",
-    "1041": "SAN ALFONSO",
-    "1042": "TACUARITA",
-    "1043": "UGARTE CUE",
-    "1044": "YCUA PORA",
-    "1045": "YCUA SARA",
-    "1046": "HORQUETA",
-    "1047": "AGA GUYJHO",
-    "1048": "AGAGUIGO",
-    "1049": "AGUARA",
-    "1050": "AGUSTIN DE PINEDO",
-    "1051": "AGUERITO",
-    "1052": "ALAZAN",
-    "1053": "ANGELITO",
-    "1054": "ANGUA RUGUA",
-    "1055": "ARROYITO",
-    "1056": "ARROYO BLANCO",
-    "1057": "ARROYO CALE",
-    "1058": "ARROYO PRIMOR",
-    "1059": "ARROYO DE ORO",
-    "1060": "AZOTEY",
-    "1061": "BALAS CUE",
-    "1062": "BARRERITO",
-    "1063": "BELEN CUE",
-    "1064": "BONETE VILLALBA CUE",
-    "1065": "BONITA",
-    "1066": "BUENA VISTA",
-    "1067": "C.EXCOMBATIENTES",
-    "1068": "CAAGATA",
-    "1069": "CAPIIBARY",
-    "1070": "CAPUSY SARY",
-    "1071": "CARAGUATAY",
-    "1072": "CAROLINA",
-    "1073": "CAROVENI VIEJO",
-    "1074": "CAA YATA",
-    "1075": "CAÑADA",
-    "1076": "CERRITO",
-    "1077": "CERRO MEMBY",
-    "1078": "CERRO SARAMBY",
-    "1079": "COL.CUARTELERO",
-    "1080": "COL.H.MENDOZA",
-    "1081": "COL.J. M. FRUTOS",
-    "1082": "COL. JOSE BERGES",
-    "1083": "COMPAÑIA AGAGUIGO",
-    "1084": "COSTA CLAVEL",
-    "1085": "CUERO FRESCO",
-    "1086": "CURUZU",
-    "1087": "DOMINGO NIGO",
-    "1088": "ESTERO COSTA",
-    "1089": "FRACCION SIETE",
-    "1090": "FRACCION STEFANO",
-    "1091": "JHUGUA CARE",
-    "1092": "JHUGUA ÑU",
-    "1093": "JHUGUA KYA",
-    "1094": "JHYATY",
-    "1095": "JOSE BERGES",
-    "1096": "LAGUNA JHETA",
-    "1097": "LAGUNA PERE",
-    "1098": "LIMEÑO CUE",
-    "1099": "LOPE CUE Y OTRO",
-    "1100": "LUCERO CUE",
-    "1101": "MANZANILLA",
-    "1102": "MBUTU ÑU",
-    "1103": "MBY JHOBY",
-    "1104": "MOJON VUELTA",
-    "1105": "NARANJA TY",
-    "1106": "PALACIOS CUE",
-    "1107": "PASO CORA",
-    "1108": "PASO PYKY",
-    "1109": "PASO TITY",
-    "1110": "PASO TRANQUERA",
-    "1111": "PASO TYPY",
-    "1112": "PEGUAJHO TY",
-    "1113": "PEGUAJHO TYPY",
-    "1114": "PLANCHADA OCHO",
-    "1115": "PRIMAVERA",
-    "1116": "PUERTO TACUARA",
-    "1117": "PUNTA",
-    "1118": "RECALDE CUE",
-    "1119": "SOCIO CUE",
-    "1120": "T. GUAZU",
-    "1121": "TABACUE",
-    "1122": "TACUATI LOMA",
-    "1123": "TAPY TAGUA",
-    "1124": "TARUMA",
-    "1125": "TAVY LOMA",
-    "1126": "TUCURU",
-    "1127": "TOTORA",
-    "1128": "YACARE",
-    "1129": "YAGUARETE CUA",
-    "1130": "YBYCUI ÑU",
-    "1131": "YERBAL GUARAYABY",
-    "1132": "YPUCU",
-    "1133": "ZANGUINA CUE",
-    "1134": "ZONA A.",
-    "6228": "SALINAS",
-    "6229": "TAJHYI",
-    "6230": "TOPYTANGUA",
-    "6231": "YBY YAU",
-    "6232": "ZANJA CUE",
-    "1135": "SAN SALVADOR",
-    "1136": "YBY YA'U",
-    "1137": "ANGELITO",
-    "1138": "ARROYO 7",
-    "1139": "BONETE",
-    "1140": "RETIRO ZELEY",
-    "1141": "CAAGATA",
-    "1142": "CAROLINA",
-    "1143": "CERRO ANGELITO",
-    "1144": "COL. EPOE. NAL.",
-    "1145": "ESTACION SAN ANTONIO",
-    "1146": "JHYATY",
-    "1147": "LAGUNA JHU",
-    "1148": "MBOCAYA",
-    "1149": "POCITO CUE",
-    "1150": "PRIMAVERA",
-    "1151": "RETIRO SANJITA",
-    "1152": "RETIRO TAPYTA GUA",
-    "1153": "RETIRO ZELEY",
-    "1154": "RETIRO ÑANDUCUA",
-    "1155": "SAN PEDRO",
-    "1156": "SANZA RECADO",
-    "6233": "ALAMBRE GUAJHA",
-    "6234": "CAMPANARIO",
-    "6235": "ESTACION SANGUINA",
-    "6236": "RAYA VAI",
-    "6237": "RUBIO CUE",
-    "6423": "SARGENTO JOSE FELIX LOPEZ",
-    "6434": "ARROYITO",
-    "151": "TACURUTY",
-    "152": "TAPE CAAGUY",
-    "153": "TAYI CARE",
-    "154": "TORO PASO",
-    "155": "TUPI JHU",
-    "156": "TUYU JHU",
-    "157": "VALIENTE - CUE",
-    "158": "VALLE - I",
-    "159": "YACARE - ÑU",
-    "160": "YACARE - E",
-    "161": "YAPEPO",
-    "162": "YCUA - PORA",
-    "163": "YCUA CURUZU",
-    "164": "YGATYMI",
-    "165": "YPANE",
-    "166": "YPAYERE",
-    "167": "YUQUYTY",
-    "168": "YUQUYRY GUAZU",
-    "169": "ZANJITA",
-    "170": "ZOLABARRIENTA",
-    "171": "ÑANDUCUA",
-    "172": "ÑANDUROCAY",
-    "173": "ÑU - PORA",
-    "1157": "SAN PEDRO DE YCUAMANDYYU",
-    "1158": "AGUARAY - MI",
-    "1159": "ARAZA",
-    "1160": "ARROYO BLANCO",
-    "1161": "BARRANQUERITA",
-    "1162": "BUENA QUEMADA",
-    "1163": "CACHITO - CUE",
-    "1164": "CAMPO GRANDE",
-    "1165": "CARANDAYTY",
-    "1166": "CARRETILLA",
-    "1167": "CAYE LOMA",
-    "1168": "CAÑADA",
-    "1169": "CENIZAL",
-    "1170": "CERRITO",
-    "1171": "CHACO - I",
-    "1172": "CHALO - CUE",
-    "1173": "CHAURIA",
-    "1174": "CIERVO BARRERO",
-    "1175": "COL. SAN BLAS",
-    "1176": "COL. SAN PABLO",
-    "1177": "COL. SUSANA",
-    "1178": "CORREA RUGUA",
-    "1179": "COSTA PUCU",
-    "1180": "CURUPAYTY",
-    "1181": "CABAYU CARUJHA",
-    "1182": "DIEGO LOMA",
-    "1183": "DOME - CUE",
-    "1184": "DOMINGUEZ - CUE",
-    "1185": "ESTACION ITACURUBI",
-    "1186": "GIMENEZ - CUE",
-    "1187": "ISLA ALTA",
-    "1188": "ISLA CUBA Y OTRO",
-    "1189": "ISLA CUÑA",
-    "1190": "ITACURU",
-    "1191": "JEJUI",
-    "1192": "JHUGUA I",
-    "1193": "JHUGUA - GUAZU",
-    "1194": "JHUGUA COSTA",
-    "1195": "LA NIÑA",
-    "1196": "LAGUNA VERA",
-    "1197": "LOMA TACUARA",
-    "1198": "MBOIY",
-    "1199": "MBOPICUA",
-    "1200": "MBOREBI COSTA",
-    "1201": "MERCADO LOMA",
-    "1202": "MONTANIA RUGUA",
-    "1203": "MONTE CAAGUY",
-    "1204": "MONTE GRANDE",
-    "1205": "MONTIEL LOMA",
-    "1206": "MONTIEL - CUE",
-    "1207": "MORALES - CUE",
-    "1208": "NARANJA TY",
-    "1209": "PAVON - CUE",
-    "1210": "PETRONITA",
-    "1211": "PINOZA",
-    "1212": "PIRIPUCU",
-    "1213": "POTRERO NOVILLO",
-    "1214": "POTRERO PORA",
-    "1215": "POTRERO PUCU",
-    "1216": "POTRERO PY",
-    "1217": "PUERTO CAAGUY",
-    "1218": "PUERTO JEJUI",
-    "1219": "PUERTO MI",
-    "1220": "PUERTO YBAPOBO",
-    "1221": "QUIÑONEZ - CUE",
-    "1222": "ROSARIO LOMA",
-    "1223": "RUGUA",
-    "1224": "SAN ANTONIO",
-    "1225": "SAN DIEGO LOMA",
-    "1226": "SAN MIGUEL",
-    "1227": "SANTA ROSA",
-    "6162": "SARGENTO LOMA",
-    "6163": "TUPI PYTA",
-    "6164": "YACARE ÑEE",
-    "6165": "YCUA MANDIYU",
-    "6166": "YVAJHAI",
-    "6238": "AGUARAY SECO",
-    "6239": "CAAPUCU - MI",
-    "6240": "CASTILLO - CUE",
-    "174": "ANTEQUERA",
-    "175": "COL. ANTEQUERA",
-    "176": "PINOZA",
-    "177": "GRAL. E.AQUINO",
-    "178": "1RO. DE MARZO",
-    "179": "AGUILERA CUE",
-    "180": "ARAZA",
-    "181": "ARAZAPETY",
-    "182": "CHAMORRO CUE",
-    "183": "COL. GRAL. AQUINO",
-    "184": "COL. MBATETE",
-    "185": "COL. SAN JOSE",
-    "186": "COL. TRANQUERA",
-    "187": "COL. TRINAQUIA",
-    "188": "COL. YURUHEI",
-    "189": "JHUGUA POI",
-    "190": "MANDIYUTY CUE",
-    "191": "MUNICIPIO",
-    "192": "OCIOSO",
-    "193": "PARAY",
-    "194": "PINDOTY",
-    "195": "POLENTO CUE",
-    "196": "POTRERO - CUE",
-    "197": "REDONDO",
-    "198": "SAN FRANCISCO",
-    "199": "SAN PEDRO",
-    "200": "SANTA CLARA",
-    "201": "VALLE - MI",
-    "202": "YCUA PINDO",
-    "203": "YURUJHEI",
-    "204": "ÑANDEYARA",
-    "205": "ÑANDUEVA - I",
-    "206": "ITACURUBI DEL ROSARIO",
-    "207": "AGUAPEY",
-    "208": "AGUAY - CUE",
-    "209": "AMANECER",
-    "210": "AZCURRA",
-    "211": "BARRERO",
-    "212": "BOLAS - CUA",
-    "213": "BOQUERON",
-    "214": "CABAYU RAY CARAJHU",
-    "215": "CABAYU ROY",
-    "216": "CAPILLA JHUGUA",
-    "217": "CAPILLA LOMA",
-    "218": "CAPILLA RUGUA",
-    "219": "CARIY",
-    "220": "CAROLINA",
-    "221": "COL. A. CATIGLIONI",
-    "222": "COL. CHORE",
-    "223": "COL. COSTA GALVAN",
-    "224": "COL. FRIESLAND",
-    "225": "COL. GUERRA DEL CHACO",
-    "226": "COL. JHUGUA",
-    "227": "COL. LIBERACION",
-    "228": "COL. SAN ROQUE",
-    "229": "COL. TUYANGO",
-    "230": "COL. VALLEMI",
-    "231": "CORRALES",
-    "232": "CURUZU - ÑU",
-    "233": "FRANCO - CUE",
-    "234": "GUARIA RUGUA",
-    "235": "GUYRATY",
-    "236": "ISLA CARAYA",
-    "237": "ISLA CURUZU",
-    "238": "ISLA GUAZU",
-    "239": "ISLERIAS",
-    "240": "ITA PORA",
-    "241": "JHUGUA REY",
-    "242": "LAGUNA MOJON",
-    "243": "LAS DOS MARIAS",
-    "244": "MARTINEZ - CUE",
-    "245": "MBARETE",
-    "246": "MBOCAYATY",
-    "247": "MBOCAYA",
-    "248": "NAVIDAD",
-    "249": "NEGRO - CUE",
-    "250": "OCIOSO",
-    "251": "OVECHA RETA",
-    "252": "PEGUAJHO",
-    "253": "PICADA",
-    "254": "PICADA DEL PUEBLO",
-    "255": "PIRAY",
-    "256": "PIRAYUI",
-    "257": "PLATERO - CUE",
-    "258": "QUIRAITY",
-    "259": "QUIRATY Y OTROS",
-    "260": "RIO RUGUA",
-    "261": "RIVEROS - CUE",
-    "262": "RODEO TAYI",
-    "263": "SAN PEDRO",
-    "264": "SANTA LUCIA",
-    "265": "TAPARI",
-    "266": "TAPIRACUAI",
-    "267": "VACA JHU",
-    "2149": "VENTURA - CUE",
-    "2150": "YURUJHEI",
-    "6307": "YTATY",
-    "334": "ARROYO SAN JOSE",
-    "335": "BARRIENTOS - CUE",
-    "336": "BOGADO - CUE",
-    "337": "CABEZADA",
-    "338": "CAIVO",
-    "339": "CAMPO DE ITAPEY",
-    "340": "CANGUERY",
-    "341": "CAPIIBARY",
-    "342": "CARABIY",
-    "343": "CARANDY POTRERO",
-    "344": "CARAPICUA",
-    "345": "CAÑADA DE LOURDES",
-    "346": "CENIZAL",
-    "347": "CERRITO",
-    "348": "CERRITO APEPU",
-    "349": "PERRO PAU",
-    "350": "COE POTI",
-    "351": "COE PYTA",
-    "352": "COL. CARPA - CUE",
-    "353": "COL. DEFENSORES DEL CHACO",
-    "354": "COL. J.R. CHAVEZ",
-    "355": "COL. NATIVIDAD",
-    "356": "COL. REP. DEL NORTE",
-    "357": "COL. REPATRIADOS",
-    "358": "COL. COE POTY",
-    "359": "COSTA PUCU",
-    "360": "CUPI - I",
-    "361": "CARDENAS",
-    "362": "ESCALERA - CUE",
-    "363": "ESTERO PEGUAJHO",
-    "364": "GIMENEZ",
-    "365": "GUAICA",
-    "366": "GUAY CURUGUA",
-    "367": "GUAZURETA",
-    "368": "GUAZU RETA",
-    "369": "HACHITA",
-    "370": "INDALECIO - CUE",
-    "371": "INDUSTRIAL - CUE",
-    "372": "ISLA GUAZU",
-    "373": "ISLA YATEBU",
-    "374": "ITA BEBU",
-    "375": "ITAPEY",
-    "376": "ITAY",
-    "377": "JARDIN",
-    "378": "JHU",
-    "379": "JUSTO - CUE",
-    "380": "LAGUNA PYTA",
-    "381": "LOMA FLORIDA",
-    "382": "MARTINEZ - CUE",
-    "383": "MBARIGUI",
-    "384": "MBOY",
-    "385": "MBURICA POTRERO",
-    "386": "MBUTUY",
-    "387": "MOIY LOMA",
-    "388": "MOJON",
-    "389": "MONTE",
-    "390": "MONTE ALTO",
-    "391": "MOVIRE TOQUE",
-    "392": "MUNICIPIO",
-    "393": "NARANJATY APUA",
-    "394": "NAVIDAD",
-    "395": "NOGUEIRE - CUE",
-    "396": "NOVIRETA - CUE",
-    "397": "NOVIRETA",
-    "398": "OCULTO",
-    "399": "ORTELLADO - CUE",
-    "400": "ORUE - CUE",
-    "401": "OVANDO - CUE",
-    "402": "PANAMBI",
-    "403": "PARAJE CARABY",
-    "404": "PARAJE GUAICA",
-    "405": "PARAJE YBU",
-    "406": "PEREZ - CUE",
-    "407": "PETY DY",
-    "408": "PINDOSA",
-    "409": "PINDOTI",
-    "410": "PINDURA",
-    "411": "POTRERO",
-    "412": "POTRERO OSUNA",
-    "413": "POTRERO POI",
-    "414": "POTRERO YBATE",
-    "415": "PUESTO LAUREL",
-    "416": "QUIÑONEZ - CUE",
-    "417": "RIO CORRIENTES",
-    "418": "RUA",
-    "419": "SAMUHU",
-    "420": "SAN ANTONIO",
-    "421": "SAN CARLOS",
-    "422": "SAN ISIDRO",
-    "423": "SAN JOAQUIN",
-    "424": "SAN JUAN",
-    "425": "SAN RAFAEL",
-    "426": "SANTA ANA",
-    "427": "SANTA BARBARA",
-    "428": "SANTA ROSA",
-    "429": "SANTA TERESA",
-    "430": "SIRA TY",
-    "431": "SOMURIO",
-    "432": "SYRATY",
-    "433": "TABAI",
-    "434": "TACUAPI-I",
-    "435": "TACUARAS",
-    "436": "TACURUTY",
-    "437": "TANARA",
-    "438": "TOBAY",
-    "439": "TORIN - CUE",
-    "440": "TORO PIRU",
-    "441": "VACA JHU",
-    "442": "VACA RETA",
-    "443": "VILLAR - CUE",
-    "444": "YACAREY",
-    "445": "YAGUARETA",
-    "446": "YATAITY",
-    "447": "YBAREG",
-    "448": "YBARUNDY",
-    "449": "YBYRAYU",
-    "450": "YBYRA",
-    "451": "YBU",
-    "452": "YCUA RUGUA",
-    "453": "YERBAL",
-    "454": "YERBAL LAUREL",
-    "455": "YERBAL PINDO",
-    "456": "YERBAL POTRERITO",
-    "457": "YSATY TUYA",
-    "458": "YTAPEBY",
-    "459": "YTAPY",
-    "460": "ZANJA JHU",
-    "461": "ZONA A",
-    "462": "ZONA YACARE",
-    "463": "ÑANDY PA",
-    "464": "ÑATIURYMI",
-    "465": "ÑU PYHAJHU",
-    "466": "ÑUMI",
-    "467": "ÑU POI",
-    "2151": "SAN ESTANISLAO",
-    "2152": "12 DE DICIEMBRE",
-    "2153": "APARAU",
-    "6178": "YBYRABY",
-    "6179": "YCYA POI",
-    "6180": "YHU",
-    "6181": "YURU CAI",
-    "6182": "ZONA Y SAN JOSE",
-    "468": "AGUARAY GUAZU",
-    "469": "ASTIGARRAGA - CUE",
-    "470": "AÑARETA",
-    "471": "CAPIITINDY",
-    "472": "CARAI  TUYA",
-    "473": "CEDRON - CUE",
-    "474": "COL. MAYOR HERMOSA",
-    "475": "COL. SUSANA",
-    "476": "COL. YBYPE",
-    "477": "COSTA PUCU",
-    "478": "ISLA SALE",
-    "479": "ITANARA",
-    "480": "LIMA - TUYA",
-    "481": "MARTINEZ - CUE",
-    "482": "MBOCAYATY",
-    "483": "ORQUETA",
-    "484": "REDUCCION - CUE",
-    "485": "RINCONADA",
-    "486": "ROSA DE AGUARA",
-    "487": "SAN JOSE",
-    "488": "SANTA MARIA",
-    "489": "SANTA ROSA",
-    "490": "SEP. CUAPE CUAPUCU",
-    "491": "SEPULTURA",
-    "492": "YUQUERY",
-    "6183": "LIMA",
-    "6184": "BOCA - CUE",
-    "6185": "COL. NARANJITO",
-    "6186": "LAGUNA - CUE",
-    "6187": "PASO TUNA",
-    "6188": "SAN RAMON Y OTROS",
-    "6189": "ÑUAY",
-    "493": "NUEVA GERMANIA",
-    "494": "CHACO-I",
-    "495": "CHAMORRO CUE",
-    "496": "COL. NUEVA ITALIA",
-    "497": "COSTA NORTE",
-    "498": "LAGUNA BLANCA",
-    "499": "RINCON",
-    "500": "SANTA ROSA",
-    "6190": "COL. NUEVA GERMANIA",
-    "6191": "TACURUTY",
-    "501": "TACUATI",
-    "502": "8 DE DICIEMBRE",
-    "503": "ACA POI",
-    "504": "AGUARA RUGUAY",
-    "505": "AGUERITO",
-    "506": "APAREJO",
-    "507": "ARROYO ITA",
-    "508": "BARRERITO",
-    "509": "CACHITO - CUE",
-    "510": "CARAGUATAY",
-    "511": "CAÑADA",
-    "512": "CAÑADA APAREJO",
-    "513": "CAÑADA A. CORDRO",
-    "514": "COL. SAN JUAN",
-    "515": "CORORO",
-    "516": "COSTA POI",
-    "517": "DIANA",
-    "518": "JHUGERIYLOVY",
-    "519": "JHUGUA JHOBY",
-    "520": "JIMENEZ",
-    "521": "JUGUA FELIPE",
-    "522": "JUGUA SAN FELIPE",
-    "523": "LAGUNA SAN JOSE",
-    "524": "LOMA PYTA",
-    "1228": "MARCIA CUE",
-    "1229": "MINGUE VUELTA",
-    "1230": "MUNICIPIO",
-    "1231": "PASO ITA",
-    "1232": "PATRIA - CUE",
-    "1233": "PAVON CUE",
-    "1234": "PIRIPUCU",
-    "1235": "POSITOS",
-    "1236": "POTRERO NARANJO",
-    "1237": "PUNTA RIEL",
-    "1238": "PYCUCU",
-    "1239": "QUEVEDO - CUE",
-    "1240": "RINCON CHAQUEÑO",
-    "1241": "SAN ILDELFONSO",
-    "1242": "SANTA ROSA DE AGUAIMI",
-    "1243": "SANTA ROSA DEL AGUARAY",
-    "1244": "TACUARA",
-    "1245": "TACUARITA",
-    "1246": "TAPIRACUAY",
-    "1247": "TORO - ÑU",
-    "1248": "YACARAY YERBAL",
-    "1249": "YAGUARETE",
-    "1250": "YAGUARETE JHU",
-    "1251": "YAPEPO",
-    "1252": "YBAPOBO",
-    "1253": "YEGUA ÑU",
-    "1254": "YERBAL CABEZADA",
-    "1255": "YPANE",
-    "6192": "AGUARA BEBE",
-    "1256": "UNION",
-    "1257": "BARRERO",
-    "1258": "BUEN RODEO",
-    "1259": "CAÑADA",
-    "1260": "CHAVES - CUE",
-    "1261": "CHUMI",
-    "1262": "COL. 12 DE JUNIO",
-    "1263": "COL. CORA - CUE",
-    "1264": "COL. POTRERO JARDIN",
-    "1265": "COL. SAN ANTONIO",
-    "1266": "COL. SAN JORGE",
-    "1267": "COL. SAN MIGUEL",
-    "1268": "COL. STA. CATALINA",
-    "1269": "EDGAR INSFRAN",
-    "1270": "GUAVIRA",
-    "1271": "ITACURUBI",
-    "1272": "LAGUNA JHU",
-    "1273": "MAYOR HERMOSA",
-    "1274": "MUNICIPIO",
-    "1275": "NARANJA JHAITY",
-    "1276": "PASO NARANJO A",
-    "1277": "POTRERITO",
-    "1278": "PURGATORIO",
-    "1279": "SAN MIGUEL",
-    "1280": "SANTA MARIA",
-    "1281": "SOTO - CUE",
-    "1282": "TACUARY",
-    "1283": "TOBA - CUE",
-    "1284": "TOVAR - CUE",
-    "1285": "URUNDEY",
-    "1286": "YATAYTY",
-    "6241": "ZONA A Y OTROS",
-    "1287": "25 DE DICIEMBRE",
-    "1288": "AZCURRIN",
-    "1289": "CARABIY",
-    "1290": "CAÑADA LOURDES",
-    "1291": "CELADA - CUE",
-    "1292": "CELADOS",
-    "1293": "CIRATI",
-    "1294": "COL. 25 DE DICIEMBRE",
-    "1295": "COL. MADRINA DE GUERRA",
-    "1296": "CURUZU",
-    "1297": "ESTACION AEREA",
-    "1298": "ESTANCIA CARMEN",
-    "1299": "ITAPEBY",
-    "1300": "MBOIY",
-    "1301": "MBUTUY",
-    "1302": "MOLAS - CUE",
-    "1303": "MONTE ALTO",
-    "1304": "PERU MARTIN CUE",
-    "1305": "POTRERO YBATE",
-    "1306": "SAN ISIDRO",
-    "1307": "SAN JUAN BOSCO",
-    "1308": "SANTA MARIA",
-    "1309": "SANTA ROSA",
-    "1310": "TAVAI - I",
-    "1311": "VACA JHU",
-    "6242": "CELADOR CUE",
-    "6243": "COL. NAVIDAD",
-    "6244": "LAGUNA",
-    "6245": "PARAJE CARABIY",
-    "6246": "SAN PEDRO",
-    "6247": "YBYRAYU",
-    "1312": "VILLA DEL ROSARIO",
-    "1313": "2DA. RECONSTRUCCION",
-    "1314": "ANDUCUA - I",
-    "1315": "ANDU CRIA",
-    "1316": "ARAZA PETY",
-    "1317": "ARAZA TY",
-    "1318": "BARRANQUERITA",
-    "1319": "BURRO YGUA",
-    "1320": "CABALLERO - CUE",
-    "1321": "CACAO CUE",
-    "1322": "CAMBA CORA",
-    "1323": "CANANDAYTY",
-    "1324": "CARANDAYTY",
-    "1325": "CARRACELA - CUE",
-    "1326": "CARRILLO",
-    "1327": "CAZAL - CUE",
-    "1328": "CHALO - CUE",
-    "1329": "CHORE",
-    "1330": "COL. COCUERE",
-    "1331": "COL. GRAL. AQUINO",
-    "1332": "COL. J. DEL ROSARIO",
-    "1333": "COL. LIBERACION",
-    "1334": "COL. LISIADOS DE GUERRA",
-    "1335": "COL. PEGUAJHO",
-    "1336": "COL. SAN PABLO",
-    "1337": "COL. TRINAGUIA",
-    "1338": "COL. YURUJHEY",
-    "1339": "COL. JHUGUA GUAZU",
-    "1340": "COSTA PIRU",
-    "1341": "COSTA PUCU",
-    "1342": "CURUGUATY",
-    "1343": "ESTANCIA LOMAS",
-    "1344": "ESTEFANA - CUE",
-    "1345": "FELICIA - CUE",
-    "1346": "FRANCO - CUE",
-    "1347": "GARCIA",
-    "1348": "GONZALES - CUE",
-    "1349": "GUAPEPOTY",
-    "1350": "HAEDO - CUE",
-    "1351": "ICUA TIMBO",
-    "1352": "ISLA SACA",
-    "1353": "ISLA TIMBO",
-    "1354": "JUGUA POI",
-    "1355": "JURUJEY",
-    "1356": "LA NIÑA",
-    "1357": "LAGUNA MOJON",
-    "1358": "LIOPICEMI",
-    "1359": "MANDYYUTY - CUE",
-    "1360": "MANDYYUTI",
-    "1361": "MARTINEZ - CUE",
-    "1362": "MBOCAYA",
-    "1363": "MBOPICUA",
-    "1364": "MENDIETA - CUE",
-    "1365": "MEREQUI - CUE",
-    "1366": "MESA",
-    "1367": "MEZA - CUE",
-    "1368": "MOÑAI CUARE",
-    "1643": "MUNICIPIO",
-    "1644": "MUÑAG - CUA",
-    "1645": "PASO RIVEROS",
-    "1646": "PIRAY",
-    "1647": "PIRITI - CUE",
-    "1648": "POTRERO - PUCU",
-    "1649": "POTRERO CAAPIIPOBO",
-    "1650": "POTRERO CARRILLO",
-    "1651": "POTRERO CAZAL",
-    "1652": "PUERTO - MI",
-    "1653": "PUERTO CUE",
-    "1654": "PUERTO ROSARIO",
-    "1655": "STA. CATALINA",
-    "1656": "TACURU",
-    "1657": "TAPERE",
-    "1658": "TAYI CARE",
-    "1659": "URUCUY",
-    "1660": "VALLE MI",
-    "1661": "VOLENDAM",
-    "1662": "YCUA PORA",
-    "1663": "YCUA RETA",
-    "1664": "YECOREY",
-    "1665": "YETYTY",
-    "1666": "YAHACA GUAZU",
-    "1667": "YRUCUY",
-    "1668": "ÑAMBUE",
-    "1669": "ÑANDEYARA",
-    "1670": "ÑANDUA -CUA",
-    "1671": "ÑANDUCUAI",
-    "1672": "ÑEEMBUCU",
-    "1673": "ÑUAMBUA",
-    "6248": "ARAZA",
-    "6249": "BARRIOS  CUE",
-    "6250": "CAMPO CIERVO",
-    "6251": "CAÑADA AREVALOS",
-    "6252": "COL. INDEPENDENCIA",
-    "6270": "MOÑO MI CUE",
-    "6271": "PIRAYU - CUE",
-    "6272": "PUERTO",
-    "6273": "REDONDO Y ÑANDUA",
-    "6274": "URUNDEY",
-    "1674": "YATAITY DEL NORTE",
-    "1675": "CALLE SAN ANTONIO",
-    "1676": "CALLE SAN FELIPE",
-    "1677": "COL. YATAYTY",
-    "1678": "COLONIA",
-    "1679": "F. MATIAUDA",
-    "1680": "GUAVIRA",
-    "1681": "GUAZU RETA",
-    "1682": "YATAYTY CORA",
-    "1683": "ZONA A",
-    "1684": "ISIDORO RESQUIN",
-    "1685": "COL. NARANJITO",
-    "1686": "COL. PALOMA",
-    "1687": "COL. RADIO URBANO",
-    "1688": "COL. SUSANA",
-    "1689": "COL. YBYPE",
-    "1690": "COL.AÑARETA",
-    "1691": "ORQUETA",
-    "1692": "CHORE",
-    "1693": "COLONIA",
-    "1694": "SAN ANTONIO",
-    "1695": "SAN PABLO",
-    "1696": "SAN PABLO",
-    "1697": "COLONIA",
-    "1698": "SAN ANTONIO",
-    "1699": "SAN JOSE DEL ROSARIO",
-    "1700": "ALFONSO CENTRAL",
-    "1701": "ALFONSO TRANQUERA",
-    "1702": "ESTANCIA SAN JOSE",
-    "1703": "ESTANCIA GAZORY",
-    "1704": "SAN ANTONIO",
-    "1705": "SAN JOSE OBRERO",
-    "1706": "SAN JUAN",
-    "1707": "SAN ISIDRO",
-    "1708": "SANTO DOMINGO",
-    "1709": "TRES REYES",
-    "5700": "COL. SAN PEDRO",
-    "5701": "COL. DEFENSORES DEL CHACO",
-    "5702": "TAVAI",
-    "5712": "GUAYAIBI",
-    "5703": "APY A",
-    "5713": "CAPII VARY",
-    "5893": "COL. NRO. 2",
-    "5496": "YRYBUCUA",
-    "6432": "LIBERACION",
-    "6433": "SAN VICENTE PANCHOLO",
-    "1710": "CAACUPE",
-    "1711": "ALMADA",
-    "1712": "AQUINO CAÑADA",
-    "1713": "ARAZATY",
-    "1714": "AZCURRA",
-    "1715": "BARRIO DANIEL SCURRA",
-    "1716": "BARRIO SAN FRANCISCO",
-    "1717": "CAACUPE",
-    "1718": "CABAÑAS",
-    "1719": "CERRO REAL",
-    "1720": "COL. CNEL. MARTINEZ",
-    "1721": "COSTA PUCU",
-    "1722": "DANIEL SCURRA 2DA.",
-    "1723": "ISLA YOBAY",
-    "1724": "ITA YBU GUAZU",
-    "1725": "ITA YBU MI",
-    "1726": "JHACA ROYSA",
-    "1727": "LOMA GUAZU",
-    "1728": "POTRERO POI",
-    "1729": "YPUCU",
-    "1730": "YTA GUAZU",
-    "1731": "YTU MI",
-    "1732": "ALTOS",
-    "1733": "ACUÑA DE FIGUEROA",
-    "1734": "AGAI HY",
-    "1735": "AGUARA",
-    "1736": "ALTOS ( MUNICIPIO )",
-    "1737": "CHOCHI",
-    "1738": "ESTANCIA CLEMENTINA",
-    "1739": "ITA GUAZU",
-    "1740": "ITA YGAZA",
-    "1741": "LOMA GRANDE",
-    "1742": "PARARU",
-    "1743": "RETIRO RIO NEGRO",
-    "1744": "TUKUNGA CORDILLERA",
-    "1745": "TUKUNGA CAÑADA",
-    "1746": "VILLA FLOR",
-    "1747": "YACARE",
-    "1748": "YAYI CAÑADA",
-    "1749": "YBU",
-    "1750": "ARROYOS Y ESTEROS",
-    "1751": "ACEVEDO",
-    "1752": "ARROYOS Y ESTEROS",
-    "1753": "BOQUERON",
-    "1754": "CAMP. H. MATIAUDA",
-    "1755": "CAÑADA",
-    "1756": "CAÑADA DOMINGUEZ",
-    "1757": "CERRITO",
-    "1758": "COSTA PUCU",
-    "1759": "CURUPAYTY",
-    "1760": "CYRATY",
-    "1761": "EL CARMEN",
-    "1762": "ESTACION GONZALES CUE",
-    "1763": "ESTACION YPE CUE",
-    "1764": "ESTANCIA 4 VIENTOS",
-    "1765": "ESTANCIA CATIGUA",
-    "1766": "ESTANCIA JUAN DE MENA",
-    "1767": "ESTANCIA LOPEZ CUE",
-    "1768": "ESTANCIA MANDUVIRA",
-    "1769": "ESTANCIA SANJA JHU",
-    "1770": "GRAL. DIAZ",
-    "1771": "INGLON CUE",
-    "1772": "ISLA ALTA",
-    "1773": "ISLA GUAZU",
-    "1774": "ISLA TACUARA",
-    "1775": "ITA PIRU",
-    "1776": "KIRAYTY",
-    "1777": "LAGUNA VERA",
-    "1778": "MAINUMBY",
-    "1779": "MAINUMBYI",
-    "1780": "NUEVA COLOMBIA",
-    "1781": "PUERTO OLIVARES",
-    "1782": "RETIRO CARBONERIA - CUE",
-    "1783": "RETIRO DONKI CUE",
-    "1784": "RETIRO ILDEFONSO - CUE",
-    "1785": "SAN ANTONIO",
-    "1786": "URUNDEY",
-    "1787": "YUASY ITA",
-    "6275": "LOPEZ CUE",
-    "6276": "PUESTO ELVIRA",
-    "6277": "TACUARINDY",
-    "1788": "ATYRA",
-    "1789": "ATYRA ( MUNICIPIO )",
-    "1790": "CANDIA",
-    "1791": "CARUMBY",
-    "1792": "COL. BERNARDINO CABALLERO",
-    "1793": "GRANJA LADONESA",
-    "1794": "MOÑAIRY",
-    "1795": "POTRERO",
-    "1796": "SAN VICENTE",
-    "1797": "SANJA JHU",
-    "6278": "CAACUPEMI",
-    "6279": "MBURURU",
-    "1798": "ALFONSO LOMA",
-    "1799": "BOQUERON",
-    "1800": "CAPELLANIA",
-    "1801": "CARAGUATAY ( MUNICIPIO )",
-    "1802": "ESTANCIA LOBO CUA",
-    "1803": "ESTANCIA SALADILLO",
-    "1804": "ESTANCIA SAN MARCO",
-    "1805": "FULGENCIO YEGROS",
-    "1806": "ISLA GUAZU",
-    "1807": "ISLA PAU",
-    "1808": "JHUGUA GUAZU",
-    "1809": "JHUGUA POI",
-    "1810": "ROLON",
-    "1811": "RIO NEGRO ENSENADA",
-    "1812": "RIO NEGRO LLANE",
-    "1813": "RIO NEGRO POTRERO",
-    "1814": "SAN MIGUEL",
-    "1815": "SAN PEDRO",
-    "1816": "SANTA LUCIA",
-    "1817": "TACUARY",
-    "1818": "TENIENTE GONZALES",
-    "1819": "VERA COSTA",
-    "6280": "CARAGUATAY",
-    "6281": "COSTA YBATE",
-    "6282": "GRAL. GENES",
-    "6283": "LA INMACULADA",
-    "6284": "SAN JOSE OBRERO",
-    "6285": "VALLE I",
-    "1820": "EMBOSCADA",
-    "1821": "4TA. COMP. COCUE GUAZU",
-    "1822": "CHOCHI",
-    "1823": "EMBOSCADA ( MUNICIPIO )",
-    "1824": "ESTANCIA CARANDAYTY",
-    "1825": "ESTANCIA CAREAGA",
-    "1826": "ESTANCIA CLEMENTINA",
-    "1827": "ESTANCIA LA CARMINA",
-    "1828": "ESTANCIA PERALTA",
-    "1829": "ISLA ALTA",
-    "1830": "ISLA JOVAI",
-    "1831": "MINAS CUE",
-    "1832": "PASO PE",
-    "1833": "PUERTO ARECUATACUA",
-    "1834": "RETIRO FATIMA",
-    "1835": "RETIRO NARANJAL",
-    "1836": "RETIRO YUGO PENGUE",
-    "1837": "TACURUTY",
-    "1838": "TUCANGUA CAÑADA",
-    "6286": "CORDILLERA GUY",
-    "268": "ESTACION SANTA ANA GRAL.ROLON",
-    "269": "ESTANCIA STORM",
-    "270": "EUSEBIO AYALA (MUNICIPIO)",
-    "271": "ISLA",
-    "272": "ITA YGASA",
-    "273": "JHUY BATY",
-    "274": "LA INDIA",
-    "275": "POTRERO SAN JOSE",
-    "276": "POTRERO DEL CARMEN",
-    "277": "PUNTA",
-    "278": "RUBIO ÑU",
-    "279": "TUYUCUA",
-    "280": "YACAREY",
-    "281": "ÑU-AI",
-    "1839": "EUSEBIO AYALA",
-    "1840": "ACOSTA ÑU",
-    "1841": "AGUAITY",
-    "1842": "BARRETO ÑU",
-    "1843": "BARRIO SAN BLAS",
-    "1844": "BARRIO SANTA TERESITA",
-    "1845": "BOQUERON",
-    "1846": "BOQUERON 2DA.",
-    "1847": "CABAÑA CUE",
-    "1848": "CAHUNDY",
-    "1849": "CAPIIPE",
-    "1850": "CAPILLA LOMA",
-    "1851": "CERRO GUY",
-    "1852": "CERRO PORTEÑO",
-    "1853": "COL.CURUGUYTY",
-    "1854": "COSTA",
-    "282": "ISLA PUCU",
-    "283": "AGUARAY",
-    "284": "AGUARAY RIO",
-    "285": "ARROYO PORA",
-    "286": "CAACUPE MI",
-    "287": "CHOCHI",
-    "288": "ITA YBATE",
-    "289": "LOMA",
-    "290": "PINDOTY",
-    "291": "TAPE GUAZU",
-    "292": "TAPE POI",
-    "293": "TUCUNGA CAÑADA",
-    "6167": "AGUARAY ROLON",
-    "6168": "ISLA PUCU (MUNICIPIO)",
-    "6169": "VILLA SAN JUAN",
-    "294": "ITACURUBI DE LA CORDILLERA",
-    "295": "CAAGUY CUPE",
-    "296": "CARAY POTRERO",
-    "297": "COL.MENNONITA",
-    "298": "ESTANCIA BUENAVENTURA",
-    "299": "GARIY LOMA",
-    "300": "ITAC.DE LA CORDILLERA (MUNIC)",
-    "301": "JHUGUA POI",
-    "302": "LOMA MEDINA",
-    "303": "MINAS-CUE",
-    "304": "PIRAYU-I",
-    "305": "RUBIO ÑU",
-    "306": "SANTA LUCIA",
-    "307": "TACUARA APUAIL",
-    "308": "TACUARA NERHOT",
-    "309": "YAGUARETE CUA",
-    "6170": "ESTANCIA MARIA AUXILIADORA",
-    "6171": "POTERO ANGELITO",
-    "310": "8 DE DICIEMBRE",
-    "311": "ARROZAL ACEVAL",
-    "312": "BUENA VISTA",
-    "313": "COL.FIDEL MAIZ",
-    "314": "ESTACION CRISTAL CUE",
-    "315": "ESTACION FRANCA-I",
-    "316": "ESTACION GASORY",
-    "317": "ESTACION GONZALEZ CUE(V.DEL R)",
-    "318": "ESTACION GUAZU PYTA (V.DEL R)",
-    "319": "ESTACION JOSEFINA",
-    "320": "ESTACION LEON CUE",
-    "321": "ESTACION MAIZ CUE",
-    "322": "ESTACION MOLINAS CUE",
-    "323": "ESTACION PRIMAVERA",
-    "324": "ESTACION SAN FILIPO",
-    "325": "ESTACION SAN JOSE",
-    "326": "ESTACION SANJITA",
-    "327": "ESTACION SANTA ELENA",
-    "328": "ESTACION YASYRETA",
-    "329": "ESTANCIA ISLA ROSARIO",
-    "330": "ESTANCIA TORO PASO",
-    "331": "ISLERIA",
-    "332": "JUAN DE MENA (MUNICIPIO)",
-    "333": "LA UNION",
-    "832": "PUESTO CABALLERO CUE",
-    "833": "PUESTO GUAJHO",
-    "834": "PUESTO ROJAS CUE",
-    "835": "RETIRO MAYOR CUE",
-    "836": "RETIRO DE LA ESTANCIA GASORY",
-    "837": "RIVAROLA CUE",
-    "838": "SAN ANTONIO",
-    "839": "SAN RAFAEL",
-    "840": "SANTO DOMINGO",
-    "841": "WUIENGER",
-    "842": "YAGUARETE",
-    "6172": "JUAN DE MENA",
-    "6173": "ESTACION CARACOL",
-    "6174": "ESTACION ISENCIO",
-    "6175": "ESTACION SAN ANTONIO",
-    "6176": "ESTANCIA EMILIO",
-    "6177": "PUENTE YBYAVEBO (V.DEL R.)",
-    "843": "NUEVA COLOMBIA",
-    "844": "BOQUERON",
-    "845": "CIRATY",
-    "846": "COMPAÑIA N.MATIAUDA",
-    "847": "INGLES CUE",
-    "848": "ISLA ALTA",
-    "849": "KIRAITY",
-    "850": "NUEVA COLOMBIA (MUNICIPIO)",
-    "851": "PIRIBEBUY",
-    "852": "4 DE JULIO",
-    "853": "BARRIO SANTA ANA",
-    "854": "BARRIO VIRGEN DEL ROSARIO",
-    "855": "CAPILLA CUE",
-    "856": "CAÑADA",
-    "857": "CHOLOLO",
-    "858": "COL.PIRARETA",
-    "859": "CORDILLERA",
-    "860": "ESTACION JHAGY-SI",
-    "861": "FRANCO ISLA",
-    "862": "GUAZU MOCOI",
-    "863": "ITA GUYRA",
-    "864": "ITA MOROTI-I",
-    "865": "ITA MOROTI GUAZU",
-    "866": "ITA YBU",
-    "867": "JHAGUY-MI",
-    "868": "JHUGUA GUAZU",
-    "869": "MCAL.LOPEZ",
-    "870": "NARANJO",
-    "871": "PACIFICO",
-    "872": "PASO JHU",
-    "873": "PIRIBEBUY (MUNICIPIO)",
-    "874": "PTE.FRA",
-    "875": "TAPE GUAZU",
-    "876": "VIRGEN DE FATIMA",
-    "877": "YACAREY",
-    "878": "YATAITY",
-    "879": "YRUGUE",
-    "880": "1RO.DE MARZO",
-    "881": "1RO.DE MARZO (MUNICIPIO)",
-    "882": "BOQUERON",
-    "883": "CAAGUY CUPE",
-    "884": "CAÑADA DEL CARMEN",
-    "885": "GARAYO",
-    "886": "GRAL.DIAZ",
-    "887": "LOMA",
-    "888": "MCAL.ESTIGARRIBIA",
-    "889": "POTRERITO3",
-    "890": "PUESTO CARRITO",
-    "891": "ROJAS SILVA",
-    "892": "SAN ANTONIO",
-    "893": "SAN BLAS",
-    "894": "SAN ISIDRO",
-    "895": "SARGENTO BAEZ",
-    "896": "SARGENTO CABALLERO",
-    "897": "TAPE POI",
-    "898": "SAN BERNARDINO",
-    "899": "CIERVO CUA",
-    "900": "COCUERE",
-    "901": "CRISTOBAL COLON",
-    "902": "MINAS CUE",
-    "903": "PIRAYU-I",
-    "904": "SAN BERNARDINO(MUNICIPIO)",
-    "905": "YBYHANGUY",
-    "906": "YBYHANGUY 1RO.",
-    "907": "YBU",
-    "908": "SANTA ELENA",
-    "909": "AGUARA RINCON",
-    "910": "BARRIO SAN ANTONIO",
-    "911": "COL.ESPERANZA",
-    "912": "COL.SAN BLAS",
-    "913": "COOP.BELLA HORIZONTE",
-    "914": "COSTA ELENA",
-    "915": "ESTANCIA ZENDA I",
-    "916": "FRANCO COSTA",
-    "917": "JHAGUE COSTA",
-    "918": "JUGUA CIMIENTO",
-    "919": "LAGUNA",
-    "920": "LALA",
-    "921": "LOMA CLAVEL",
-    "922": "LOMA VALENTINA",
-    "923": "MBOCAYATY",
-    "924": "MONTIEL",
-    "925": "PASO TRANQUERA",
-    "926": "PIRATY",
-    "927": "PUENTE YACA",
-    "928": "PUESTO MONTIEL",
-    "929": "PUESTO SAC",
-    "930": "SAN MARCOS",
-    "931": "SAN ROQUE",
-    "932": "SANTA ELENA (MUNICIPIO)",
-    "933": "TOROPI HUGUA",
-    "2059": "TOROPI LOMA",
-    "2060": "YBYRAGUY ESTERO",
-    "2061": "YCUPA PORA",
-    "2062": "TOBATI",
-    "2063": "21 DE JUNIO",
-    "2064": "APARYPY",
-    "2065": "ARROZAL 21",
-    "2066": "COSTA ALEGRE",
-    "2067": "ENSENADA",
-    "2068": "ESTANCIA AMARILLA",
-    "2069": "ESTANCIA FLORIDA",
-    "2070": "ESTANCIA INVERNADA",
-    "2071": "ESTANCIA LOZA",
-    "2072": "ESTANCIA MORAGA CUE",
-    "2073": "ESTANCIA SANTA MARIA",
-    "2074": "ISLA FLORIDA",
-    "2075": "ISLA GUAZU",
-    "2076": "JHOYBATY",
-    "2077": "LOMA VERDE",
-    "2078": "MOMPOX",
-    "2079": "PEDRO JUAN CABALLERO",
-    "2080": "POTRERO",
-    "2081": "RETIRO SIMEON",
-    "2082": "ROSADO RUGUA",
-    "2083": "SAN JOSE",
-    "2084": "SANTA RECALIA",
-    "2085": "SANTA ROSA",
-    "2086": "VILLA LAS MERCEDES",
-    "2087": "VALENZUELA",
-    "2088": "CANGIO FLECHA",
-    "2089": "CERRO",
-    "2090": "CERRO PER",
-    "2091": "COL.STICA",
-    "2092": "COL.TTE.E.MONTANIA",
-    "2093": "CURUPAYTY",
-    "2094": "ESTANCIA LLAMOSAS",
-    "2095": "GRAL.DIAZ",
-    "2096": "GUAZU CUA",
-    "2097": "ITA MOROTI",
-    "2098": "LOMA JHOVY",
-    "2099": "LOMA VERDE",
-    "2100": "MCAL.LOPEZ",
-    "2101": "POTRERITO",
-    "2102": "POTRERO COCULTO",
-    "2103": "POTRERO PUCU",
-    "2104": "POTRERO YACAREY",
-    "2105": "ROA CUE",
-    "2106": "ROSADO CARAPE",
-    "2107": "ROSADO YBATE",
-    "2108": "SAN  FRANCISCO",
-    "2109": "TACUATY",
-    "2110": "VALENZUELA (MUNICIPIO)",
-    "6298": "ÑU GUAZU",
-    "2111": "LOMA GRANDE",
-    "2112": "ALFONSO CENTRAL",
-    "2113": "ALFONSO TRANQUERA",
-    "2114": "ESTANCIA GAZORY",
-    "2115": "SAN ANTONIO",
-    "2116": "SAN ISIDRO",
-    "2117": "SAN JOSE OBRERO",
-    "2118": "SAN JUAN",
-    "2119": "SANTO DOMINGO",
-    "6299": "ESTANCIA SAN JOSE",
-    "6300": "TRES REYES",
-    "2132": "SAN JOSE OBRERO",
-    "2133": "CIA. ALFONSO TRANQUERA",
-    "2134": "EST. GAZORY",
-    "2135": "EST. LA JOSEFINA",
-    "2136": "EST. NANDY-PAY",
-    "2137": "ESTERO TOBATIRY",
-    "6303": "CIA. ALFONSO CENTRAL",
-    "2120": "BARRIO DEL CARMEN",
-    "2121": "CAMPO SMITH - KENNEDY",
-    "2122": "COL. ESPERANZA",
-    "2123": "COL. PIRAY",
-    "2124": "COL. SAN MARCOS",
-    "2125": "CIA.LLANES",
-    "2126": "CIA. RIO NEGRO",
-    "2127": "EST.KENNEDY",
-    "2128": "EST.SAN MARCOS",
-    "2129": "ESTERO LAGUNA PERO",
-    "2130": "ESTERO PE",
-    "2131": "ESTERO YHAGUY",
-    "5891": "MBOCAYATY",
-    "6301": "COL. SAN BLAS",
-    "6302": "EST.SANTA LUCIA",
-    "2138": "BARRIO ESTACION",
-    "2139": "CAAZAPAMI",
-    "2140": "CAROVENI NUEVO",
-    "2141": "CAROVENI VIEJO",
-    "2142": "CAÑADA",
-    "2143": "CERRO PELADO",
-    "2144": "COL. 14 DE MAYO",
-    "2145": "COSTA ESPINILLO",
-    "2146": "DOÑA JUANA",
-    "2147": "ESTACION STA.MARIA Y SAN PABLO",
-    "2148": "ESTACION STORN",
-    "2637": "ITA YBU",
-    "2638": "LEMOS",
-    "2639": "LOMA SAN FRANCISCO",
-    "2640": "LOMA VALENTINA",
-    "2641": "MBOPICUA",
-    "2642": "PERULERO",
-    "2643": "PISADERA",
-    "2644": "POLILLA",
-    "2645": "POTRERITO",
-    "2646": "POTRERO BAEZ",
-    "2647": "POTRERO ISLA",
-    "2648": "PUNTA CUPE",
-    "2649": "RINCON",
-    "2650": "ROSADO",
-    "2651": "SAMBARI",
-    "2652": "SAN FRANCISCO POTRERO",
-    "2653": "SAN MIGUEL",
-    "2654": "SANTA LUCIA",
-    "2655": "TUYUTI GUAZU",
-    "2656": "TUYUTI MI",
-    "2657": "VILLARRICA",
-    "2658": "YBAROTY",
-    "2659": "YJHOBY",
-    "2660": "YTORORO",
-    "2661": "ÑU MBYTE",
-    "6304": "VILLARRICA",
-    "6305": "CASCO RINCON",
-    "6306": "ESPINILLO",
-    "2662": "SAN SALVADOR",
-    "2663": "ESTACION LOS PINOS",
-    "2664": "ESTACION VERTOLO",
-    "2665": "ISLA VALLE",
-    "2666": "ITACURUBI",
-    "2667": "LOMA GUAZU",
-    "2668": "POTRERO ROBLEDO",
-    "2669": "SAN RAFAEL",
-    "2670": "SAN SALVADOR",
-    "2671": "TRANQUERA CUE",
-    "2672": "YHACA MI",
-    "2673": "YUQUERY",
-    "2674": "BORJA",
-    "2675": "20 DE JUNIO",
-    "2676": "BOQUERON",
-    "2677": "BORJA",
-    "2678": "COL. SAN ANTONIO",
-    "2679": "CORDILLERA",
-    "2680": "COSTA JHU",
-    "2681": "COSTEADA ÑU PUAJHU",
-    "2682": "ESTACION ARTURO OVIEDO",
-    "2683": "ESTACION ACOSTA",
-    "2684": "ESTACION PAI SANTA CRUZ",
-    "2685": "ESTACION SAN ANTONIO",
-    "2686": "ESTANCIA HORTENSIS",
-    "2687": "ESTANCION FERNANDEZ",
-    "2688": "ISLA ALTA",
-    "2689": "ISLA GUAZU",
-    "2690": "LOMAI",
-    "2691": "MACARRO",
-    "2692": "PADRE A. MOLAS",
-    "2693": "PASO CUE",
-    "2694": "RINCON",
-    "2695": "ROJAS JUGUA",
-    "2696": "TEBICUARY COSTA",
-    "2697": "TEY-I CUE",
-    "2698": "VALLE PE",
-    "2699": "VALLE - I",
-    "2700": "YEGUARIZO",
-    "2701": "YHACA GUAZU",
-    "2702": "ZACARIAS - I",
-    "2703": "ZACARIAS GUAZU",
-    "2704": "ÑU PUAJHU",
-    "2705": "INDEPENDENCIA (R.D.MELGAREJO)",
-    "2706": "ARROYO ARA",
-    "2707": "CALLE ALTA",
-    "2708": "CALLE DOS MIL",
-    "2709": "CALLE MIL",
-    "2710": "CAMPITO",
-    "2711": "CAMPO LEGAL",
-    "2712": "CAPII",
-    "2713": "CARLOS PFANNLL",
-    "2714": "CERRITO",
-    "2715": "CERRO CORA",
-    "2716": "CERRO LEON",
-    "2717": "COL. INDEPENDENCIA",
-    "2718": "CURUZUPE",
-    "2719": "GUAJHO",
-    "2720": "ITA AZUL",
-    "2721": "MAINUMBY",
-    "2722": "MAYOR CUE",
-    "2723": "PALÑETEY",
-    "2724": "PFANNLL",
-    "2725": "PLANTA",
-    "2726": "PLANTA URBANA",
-    "2727": "POT.BLANCO-2,3,4,5,6,7,8 LINEA",
-    "2728": "PRIMAVERA",
-    "2729": "PUNTA",
-    "2730": "PUNTA CHACHI",
-    "2731": "RANCHO CAZADOR",
-    "2732": "SAN ANTONIO",
-    "2733": "SAN GERVASIO",
-    "2734": "SAN ROQUE ( CALLE )",
-    "2735": "SANTA CATALINA",
-    "2736": "SANTA CECILIA",
-    "2737": "SANTO DOMINGO",
-    "2738": "TERCERA FRACCION",
-    "2739": "VISTA ALEGRE",
-    "2740": "ZORRILLA",
-    "2741": "GRAL.EUGENIO A. GARAY",
-    "2742": "BENITO CUE",
-    "2743": "CIERVO CUA GUAZU",
-    "2744": "CIERVO CUA MI",
-    "2745": "FLORIDO",
-    "2746": "GRAL. E. A. GARAY",
-    "2747": "KILOMETRO 26",
-    "2748": "KILOMETRO 29",
-    "2749": "KYRAYTY",
-    "2750": "POTRERO JHU",
-    "2751": "ROQUE G. DE SANTA CRUZ",
-    "2752": "SAN BLAS",
-    "2753": "SAN JOSE",
-    "2754": "SAN PATRICIO",
-    "2755": "SANTA CATALINA",
-    "2756": "YATE - I",
-    "2757": "YOHERE",
-    "2758": "ÑANDU CUA - I",
-    "2759": "ÑU PUAJHU - MI",
-    "6334": "POTRERO YBATE",
-    "6335": "SAN ROQUE",
-    "6336": "ÑANDU CUA",
-    "2760": "CNEL. MARTINEZ",
-    "2761": "ARECO",
-    "2762": "ARROYITO",
-    "2763": "CAPELLAN CARDOZO",
-    "2764": "CHACRA NORTE",
-    "2765": "CHACRA SUR",
-    "2766": "CORONEL MARTINEZ",
-    "2767": "COSTA - I",
-    "2768": "COSTA BARRIOS",
-    "2769": "ESTACION COLONIA - I",
-    "2770": "ESTANCIA FORTEZA",
-    "2771": "ESTANCIA JESUS",
-    "2772": "FERREIRAS",
-    "2773": "LOMA PINDO",
-    "2774": "MONGES JHUGUA",
-    "2775": "POTRERO VILLER",
-    "2776": "TTE. BOGADO",
-    "6337": "AZUC.PARAG.(AZUCARERA PARANA)",
-    "6338": "ESTACION FORTALEZA",
-    "6339": "MONGES PASO",
-    "2777": "JOSE FASSARDI",
-    "2778": "1RO. DE MARZO",
-    "2779": "CAGUARE-I",
-    "2780": "CAÑADA TAPY-I",
-    "2781": "FASSARDI",
-    "2782": "KILOMETRO 13",
-    "2783": "KILOMETRO 3",
-    "2784": "KILOMETRO 31",
-    "2785": "KILOMETRO 35",
-    "2786": "KILOMETRO 36",
-    "2787": "PALMITO",
-    "2788": "SAN AGUSTIN",
-    "2789": "SAN ANTONIO",
-    "2790": "SAN ROQUE",
-    "2791": "SANTA ANA",
-    "2792": "SANTA ROSA",
-    "2793": "TAJHY-I",
-    "2794": "ÑU PUAJHU - MI",
-    "6340": "AMAMBAY",
-    "6341": "KILOMETRO 17",
-    "6342": "LOTE-I",
-    "6343": "SAN PABLO",
-    "6344": "ÑU PUAJHU",
-    "2795": "FELIX PEREZ CARDOZO",
-    "2796": "AQUINO COSTA",
-    "2797": "BOMBILLA",
-    "2798": "CERRITO",
-    "2799": "COCUERE GUAZU",
-    "2800": "COSTA MERCADO",
-    "2801": "CUNDY",
-    "2802": "ESTACION COSTA",
-    "2803": "FELIX PEREZ CARDOZO",
-    "2804": "JHUGUA",
-    "2805": "POTRERO BENITEZ",
-    "2806": "POTRERO MELGAREJO",
-    "2807": "RANCHO SAN ANTONIO",
-    "2808": "TABAI",
-    "2809": "TORO",
-    "6345": "CAPILLA COSTA",
-    "2810": "MAURICIO JOSE TROCHE",
-    "2811": "C. FASSARDI",
-    "2812": "CERRO PUNTA",
-    "2813": "CIERVO CUA",
-    "2814": "COLEGIO COOPERATIVA",
-    "2815": "CORA GUAZU-1RA-2DA. CALLES",
-    "2816": "COSTA CABALLERO",
-    "2817": "COSTA PUCU",
-    "2818": "ITACURUBI",
-    "2819": "MAURICIO JOSE TROCHE",
-    "2820": "SAN SALVADOR ( BALANZA 1 )",
-    "2821": "ITAPE",
-    "2822": "ESTACION DEMATTEI",
-    "2823": "ESTACION ELISA ( MUSSI )",
-    "2824": "ESTACION ELISA ( RETIRO )",
-    "2825": "ESTACION MBOJHAPHY(SACARRELLO)",
-    "2826": "ÑUMI",
-    "2827": "ITURBE",
-    "2828": "CAAGUY CUPE",
-    "2829": "CAPILLA TUYA",
-    "2830": "LOMA BARRETO",
-    "2831": "POTRERO BENEGAS",
-    "2832": "PUESTO CAAGUY",
-    "2833": "TEBICUARY COSTA",
-    "2834": "VALLE PYTA",
-    "2835": "MBOCAYATY",
-    "2836": "CAP. SAMUDIO",
-    "2837": "CARANDAY",
-    "2838": "CARANDAYTY RUGUA",
-    "2839": "COL. NAVILLE (CAPIITINDY)",
-    "2840": "COSTA MBOCAYATY",
-    "2841": "COSTA PISADERA",
-    "2842": "ESTANCIA NAVILLE",
-    "2843": "ESTANCIA SAN FELIPE",
-    "2844": "LOMA BARRETO",
-    "2845": "MBOCAYATY ( MUNICIPIO )",
-    "2846": "M. GONDRA",
-    "2847": "PIRITY",
-    "2848": "PTO. FRANCO",
-    "2849": "STA. BARBARA",
-    "2850": "TACUARITA",
-    "2851": "NATALICIO TALAVERA",
-    "2852": "1RA. LINEA BARRERA JHU",
-    "2853": "2DA. LINEA",
-    "2854": "3RA. LINEA",
-    "2855": "ARROYO COSTA",
-    "2856": "CARO ISLA",
-    "2857": "ISLA",
-    "2858": "JHUGUA",
-    "2859": "LOTE PUCU",
-    "2860": "NATALICIO TALAVERA",
-    "2861": "POZO ITA",
-    "2862": "POTRERITO",
-    "2863": "ZANJA PYTA 4TA. LINEA",
-    "2864": "SAN JOSE",
-    "2865": "SANTA ROSA",
-    "2866": "ÑUMI",
-    "2867": "CAAGUY CUPE",
-    "2868": "CAPILLA TUYA",
-    "2869": "LOMA BARRETO",
-    "2870": "POTRERO BENEGAS",
-    "2871": "PUESTO CAAGUY",
-    "2872": "TEBICUARY COSTA",
-    "2873": "VALLE PYTA",
-    "2874": "YATAITY ( MUNICIPIO )",
-    "2875": "YATAITY",
-    "2876": "EST. DEMATEI",
-    "2877": "EST. ELISA ( MUSSI )",
-    "2878": "EST. ELISA ( RETIRO )",
-    "2879": "EST. MBOJHAPY ( SACCARELLO )",
-    "2880": "ÑUMI",
-    "2881": "DR. BOTREL",
-    "2882": "B.GOROSTIAGA",
-    "2883": "COL.DR.BOTREL",
-    "2884": "TACUAPITY",
-    "2885": "ÑUMI",
-    "4595": "PASO YOBAY",
-    "6388": "BARRERO NARANJA",
-    "6389": "CERRO CORA",
-    "6390": "CONCEPCION-MI",
-    "6391": "EST. ACOSTA",
-    "6392": "EST. SAN MIGUEL",
-    "6393": "FLORIDA",
-    "6394": "PERULERO",
-    "6395": "POTRERITO",
-    "6396": "STA. ELENA",
-    "6397": "SAN LUIS",
-    "6398": "STA. ROSA",
-    "6416": "CHACRA NORTE",
-    "6417": "CHACRA SUR",
-    "6418": "AVIACION",
-    "6419": "LOMA PINDO",
-    "6420": "URBANIZACION",
-    "2886": "CNEL. OVIEDO",
-    "2887": "12 DE JUNIO 1RA.",
-    "2888": "12 DE JUNIO 2DA.",
-    "2889": "1RO DE JUNIO",
-    "2890": "1RO. DE MARZO",
-    "2891": "3 DE MAYO ( CALLE )",
-    "2892": "AGUAPETY",
-    "2893": "AZUCENA",
-    "2894": "B. FATIMA",
-    "2895": "BOQUERON",
-    "2896": "C. BORDENAVE",
-    "2897": "CAAGUY CUPE",
-    "2898": "CAITA",
-    "2899": "CALLE 1  BLAS GARAY",
-    "2900": "CALLE 10 TACUA CORA",
-    "2901": "CALLE 12 TAYAO",
-    "2902": "CALLE 124 TAYAO",
-    "2903": "CALLE 13 TAYAO",
-    "2904": "CALLE 14 TAYAO",
-    "2905": "CALLE 16 TAYAO",
-    "2906": "CALLE 18 TAYAO",
-    "2907": "CALLE 2 BLAS GARAY",
-    "2908": "CALLE 2 TACUA CORA",
-    "2909": "CALLE 20 TAYAO",
-    "2910": "CALLE 20 TAYAO ZONA NORTE",
-    "2911": "CALLE 22 TAYAO",
-    "2912": "CALLE 24 TAYAO",
-    "2913": "CALLE 26 TAYAO",
-    "2914": "CALLE 3 BLAS GARAY",
-    "2915": "CALLE 4 TACUA CORA",
-    "2916": "CALLE 6 TACUA CORA",
-    "2917": "CALLE 8 TACUA CORA",
-    "2918": "CALLE A TACUA CORA",
-    "2919": "CALLE ARENA",
-    "2920": "CALLE ARROZ",
-    "2921": "CALLE FLORICA",
-    "2922": "COL. GENARO ROMERO",
-    "2923": "CALLE GUAZU",
-    "2924": "CALLE ITACURUBI",
-    "2925": "CALLE JIMENEZ",
-    "2926": "CALLE MOREIRA",
-    "2927": "CALLE PYAJHU",
-    "2928": "CALLE SAN FRANCISCO",
-    "2929": "CANGAI",
-    "2930": "CAPILLITA",
-    "2931": "CAPITAN ROA",
-    "2932": "CARAGUATAY MI",
-    "2933": "CARANDAYTY",
-    "2934": "CERRITO",
-    "2935": "CHASE CUE",
-    "2936": "CHIRCA TY",
-    "2937": "CNEL. OVIEDO",
-    "2938": "COL. SANTA MARIA",
-    "2939": "COSTA JHU",
-    "2940": "COSTA VARELA",
-    "2941": "CUARTO POTRERO",
-    "2942": "CURUCAU",
-    "2943": "ESPINILLO",
-    "2944": "ESTANCIA BALANZA",
-    "2945": "ESTANCIA ISLA NEGRA",
-    "2946": "ESTANCIA JOSEFINA",
-    "2947": "ESTANCIA LOMA",
-    "2948": "ESTANCIA ORTIZ",
-    "2949": "ESTANCIA PACURI",
-    "2950": "ESTANCIA SAMUDIO",
-    "2951": "ESTANCIA VEGA",
-    "2952": "FRANCO CUE",
-    "2953": "JHUGUA GUAZU",
-    "2954": "LA BARREREÑA",
-    "2955": "LEIVA I",
-    "2956": "MBURURU OCA",
-    "2957": "OLEGARIO",
-    "2958": "OVANDO",
-    "2959": "PINDO TY",
-    "2960": "PIQUETE CUE",
-    "2961": "POTRERITO",
-    "2962": "POTRERITO OCULTO",
-    "2963": "POTRERO BALBINA",
-    "2964": "POTRERO CERCADO",
-    "2965": "POTRERO CUE",
-    "2966": "POTRERO SAN ROQUE",
-    "2967": "PUESTO CAAGUY RORY",
-    "2968": "QUELITA",
-    "2969": "SAN ANTONIO",
-    "2970": "SAN AGUSTIN",
-    "2971": "SAN MIGUEL",
-    "2972": "SAN PEDRO",
-    "2973": "SAN ROQUE",
-    "2974": "SANTA LIBRADA",
-    "2975": "SANTA MARIA",
-    "2976": "SARO CARO",
-    "2977": "SETECIENTOS",
-    "2978": "TACURUTY ( CALLE )",
-    "2979": "TAMBO ( TAMBOR ) ( TAMBORIL )",
-    "2980": "TAVY",
-    "2981": "TUYU PACU",
-    "2982": "VOLCAN CUE",
-    "2983": "YCUA CAAGUY",
-    "2984": "YCUA PORA",
-    "2985": "YPORA",
-    "2986": "YUQUYTY",
-    "2987": "ÑU RUGUA",
-    "6346": "CALLE 4 BLAS GARAY",
-    "6347": "DON BOSCO",
-    "6348": "CALLE INFANTIL",
-    "6349": "CALLE SANTO DOMINGO",
-    "6350": "CAYGUA COCUE",
-    "6351": "COSTA ALEGRE",
-    "6352": "ESCALADA CUE",
-    "6353": "ESTANCIA LA QUERENCIA",
-    "6354": "ISLA PUCU",
-    "6355": "MBURURU PY",
-    "6356": "PLACIDO",
-    "2988": "CAAGUAZU",
-    "2989": "1 Y 3 LINEA ( ISAU )",
-    "2990": "1,2,3,4 LINEA(B.EUGEN.A.GARAY)",
-    "2991": "1,2,3,4,5,6 LINEA(C.EX-COMBAT)",
-    "2992": "1,2,3,4,5,8,10 LINEA (BALANZA)",
-    "2993": "1RA. Y 2DA.LINEA(SAN SALVADOR)",
-    "2994": "2DA.LINEA ( INDIGENA )",
-    "2995": "2DA.LINEA (TACURU PYTA)",
-    "2996": "2DA. LINEA GUAJHO",
-    "2997": "3 DE MAYO - I",
-    "2998": "3 DE MAYO-GUAZU (INDIGENA)",
-    "2999": "3,4,5,6 LINEA AGUA GUAZU",
-    "3000": "3RA. Y 4TA. LINEA (SAN MIGUEL)",
-    "3001": "4TA. Y 5TA. LINEA (LA FABRIL)",
-    "3002": "5TA.LINEA(COL. CABALLERO A.)",
-    "3003": "6 DE ENERO",
-    "3004": "AGUA-I",
-    "3005": "AMBAHY",
-    "3006": "APY - A",
-    "3007": "ARROYITO",
-    "3008": "ARROYO ANGUA",
-    "3009": "ARROYO GUAVIRA",
-    "3010": "ARROYO GUAZU",
-    "3011": "ARROYO JHU",
-    "3012": "ARROYO MOROTI",
-    "3013": "ARROYO TERERE",
-    "3014": "BAEZ CUE",
-    "3015": "BARRIO E. A. GARAY",
-    "3016": "BARRIO E.A.GARAY 3RA. LINEA A",
-    "3017": "BARRIO GRAL.F.CABALLERO A.",
-    "3018": "BARRIO INMIGRANTE",
-    "3019": "BARRIO SAN LORENZO",
-    "3020": "BARRIO SAN ROQUE",
-    "3021": "BARRIO SANTA ISABEL",
-    "3022": "BRASILERO CUE",
-    "3023": "BRAZIL CUE",
-    "3024": "CAACHIRI (LOC. INDIGENA)",
-    "3025": "CAAGUAZU ( MUNICIPIO )",
-    "3026": "CAAMINDY",
-    "3027": "CABAYU - Y",
-    "3028": "CACHIMBO",
-    "3029": "CALLE 1 BLAS GARAY",
-    "3030": "CALLE 1,2,3 Y 4 CACHIMBO",
-    "3031": "CALLE 2 BLAS GARAY",
-    "3032": "CALLE 3 BLAS GARAY",
-    "3033": "CALLE 4 BLAS GARAY",
-    "3034": "CALLE 5",
-    "3035": "CALLE SAN ISIDRO",
-    "3036": "CALLE SAN MIGUEL",
-    "3037": "CAMBAY",
-    "3038": "CAMPO 1 COL.SOMMERFELD",
-    "3039": "CAOMPO 10 ( COL. SOMMERFELD )",
-    "3040": "CAMPO 11 COL. SOMMERFELD",
-    "3041": "CAMPO 2 SOMMERFELD",
-    "3042": "CAMPO 3 ) COL. SOMMERFELD )",
-    "3043": "CAMPO 4 SOMMERFELD",
-    "3044": "CAMPO 5 - I",
-    "3045": "CAMPO 5 COL. SOMMERFELD",
-    "3046": "CAMPO 7",
-    "3047": "CAMPO 8",
-    "3048": "CAMPO 9 ( COL. SOMMERFELD )",
-    "3049": "CAMPO G.(COL. SOMMERFELD )",
-    "3050": "CAMPO NUEVO",
-    "3051": "CAPITAN CUE",
-    "3052": "CARRERIA CUE",
-    "3053": "CAI",
-    "3054": "CAÑADA",
-    "3055": "CAÑADA DEL MONTE(J.E.OCAMPOS)",
-    "3056": "CERRITO",
-    "3057": "CERRO CAACUPE",
-    "3058": "CERRO PERO",
-    "3059": "CHACO-I",
-    "3060": "CIERVO CUA",
-    "3061": "COL. GRAL. DELGADO",
-    "3062": "COL. LUIS IRRAZABAL",
-    "3063": "COL. MARIA AUXILIADORA",
-    "3064": "COL. SUDESIA",
-    "3065": "COL. W. INSFRAN",
-    "3066": "COL.JOSE OCAMPOS 1,2,3,4 LINEA",
-    "3067": "COMPAÑIA FINAGRAI",
-    "3068": "COSTA",
-    "3069": "CULANTRILLO",
-    "3070": "CURUPAY",
-    "3071": "CURUZU",
-    "3072": "CURUZU ( TAPY-I )",
-    "3073": "CURUPI CUA",
-    "3074": "DESGRACIA CUE",
-    "3075": "DR. DOMINGO MONTANARO",
-    "3076": "EMPALADO ARI",
-    "3077": "GUARRAUNGUA 1RA.",
-    "3078": "GUAYAKI CUA",
-    "3079": "GUAYAKI CAAGUY",
-    "3080": "IPAU",
-    "3081": "IPYTA",
-    "3082": "ITA ( INDIGENA )",
-    "3083": "LA VIRGINIA",
-    "3084": "LAGUNA PYTA",
-    "3085": "LUCHI CUE",
-    "3086": "MANGRULLO",
-    "3087": "MAXIMINA",
-    "3088": "MBOCAYA I",
-    "3089": "MBOI CAE-GUAZU",
-    "3090": "MBOI CAE-I",
-    "3091": "MBURURU OCA",
-    "3092": "MOJON 7",
-    "3093": "NACIENTE ( LOC. INDIGENA )",
-    "3094": "O. BARTON CUE",
-    "3095": "OCULTO",
-    "3096": "PABLITO CUA",
-    "3097": "PAIJHA",
-    "3098": "PALMETA",
-    "3099": "PARAJE GUAZU",
-    "3100": "PARAJE-I ( 7MA. LINEA )",
-    "3101": "PIQUETE CUE",
-    "3102": "POTRERO",
-    "3103": "POTRERO GARAY",
-    "3104": "POTRERO GARAY (1RA.LINEA)",
-    "3105": "POTRERO TATU",
-    "3106": "PUESTO CAMBAY",
-    "3107": "PUESTO NAVIDAD",
-    "3108": "PUESTO PORTILLO CUE",
-    "3109": "PIKYRY",
-    "3110": "RAMCHO CUÑA",
-    "3111": "S.GOMEZ",
-    "3112": "SAN ANTONIO MI",
-    "3113": "SAN ANTONIO DE PADUA",
-    "3114": "SAN JORGE",
-    "3115": "SAN MIGUEL",
-    "3116": "SAN ROQUE",
-    "3117": "SAN SALVADOR",
-    "3118": "SANJA CORA (LA FABRIL)",
-    "3119": "SANTIAGO CUE",
-    "3120": "SAPIRO",
-    "3121": "TACUARE (COL.INDIGENA)",
-    "3122": "TACURU",
-    "3123": "TAGUATO",
-    "3124": "TAYTETA",
-    "3125": "TAYI",
-    "3126": "TIMBO",
-    "3127": "TORO BLANCO",
-    "3128": "TORIN",
-    "3129": "VILLA SAN JUAN",
-    "3130": "VOLCAN CUA",
-    "3131": "Y-ROYUÑA",
-    "3132": "YACARE",
-    "3133": "YAGUATAI",
-    "3134": "YURUNI",
-    "3135": "YAYBY",
-    "3136": "YPECUA",
-    "3137": "ZANJA JHU",
-    "3138": "ZANJA PYTA (CAPI-I)",
-    "3139": "ÑURUNDIAY",
-    "6357": "GUARRAUNGUA 2DA",
-    "6358": "LA FABRIL",
-    "6359": "MANZANA E ( YBAJAHI )",
-    "6360": "MBURURU PY",
-    "6361": "OVEÑA 2DA. LINEA",
-    "6362": "PASO YOBAY",
-    "6363": "POTRERO SAN JUAN",
-    "6364": "RAMONITA",
-    "6365": "SAN ISIDRO (COL.J.D.OCAMPOS)",
-    "3140": "CARAYAO",
-    "3141": "17 MIL",
-    "3142": "4 MIL",
-    "3143": "ALEMAN CUE",
-    "3144": "AMANBAY",
-    "3145": "APYA",
-    "3146": "ARROYITO",
-    "3147": "ARROYO GUAZU",
-    "3148": "ARROYO HONDO",
-    "3149": "CAFETAL",
-    "3150": "CAMPO REDONDO",
-    "3151": "CARAYAO (MUNICIPIO)",
-    "3152": "CARRO SAINGO",
-    "3153": "CARUGUA",
-    "3154": "CATALDO CAÑADA",
-    "3155": "CERRO CORA",
-    "3156": "COL. UNIDA PARAGUAYA",
-    "3157": "COMISARIA CUE",
-    "3158": "COSTA LOMA",
-    "3159": "COSTA ROMERO",
-    "3160": "DOCE MIL",
-    "3161": "DIAZ CUE",
-    "3162": "DISTANCIA MORALES",
-    "3163": "ESTANCIA SARAMBI",
-    "3164": "ISLERIA",
-    "3165": "ITA CORA",
-    "3166": "LIMPIO",
-    "3167": "OCHO MIL",
-    "3168": "PARA GUAZU",
-    "3169": "PEGUAJHO",
-    "3170": "PINDO CORA",
-    "3171": "POTRERITO",
-    "3172": "POTRERO GUAZU",
-    "3173": "POTRERO GUAZU (I.N.D.)",
-    "3174": "POTRERO STA.CATALINA",
-    "3175": "PUNTA GUAZU",
-    "3176": "RETIRO ESTANCIA MORALES",
-    "3177": "TAPYI",
-    "3178": "TIQUINE",
-    "3179": "YAGUA PETYNDY CUE",
-    "3180": "YEIBY",
-    "3181": "CECILIO BAEZ",
-    "3182": "ARROYO PORA",
-    "3183": "BOLA CUA",
-    "3184": "BOZARQUIZ",
-    "3185": "CAATY",
-    "3186": "CAATY MI",
-    "3187": "CAATY MI GUAZU",
-    "3188": "CALLE 1RO. DE MAYO",
-    "3189": "CARRO GUY",
-    "3190": "CAÑADA",
-    "3191": "CECILIO BAEZ",
-    "3192": "CERRO SANTA ANA",
-    "3193": "COSTA VILLALBA",
-    "3194": "CUÑANDAYTY",
-    "3195": "EMPALADO",
-    "3196": "ESTANCIA SAN IGNACIO",
-    "3197": "ESTANCIA SANTA ANA",
-    "3198": "GUAVIRATY",
-    "3199": "JHUGUA GUAZU",
-    "3200": "JHUGUA POI",
-    "3201": "KIRAY",
-    "3202": "OCULTO (POTRERO)",
-    "3203": "PASO ITA",
-    "3204": "POTRERO",
-    "3205": "POTRERO ACEVAL",
-    "3206": "POTRERO VILLALBA",
-    "3207": "PUESTO GARRIDO",
-    "3208": "SAN AGUSTIN",
-    "3209": "SAROBY",
-    "3210": "TORORO",
-    "3211": "URUCUTIY",
-    "3212": "YCUA RUGUA",
-    "3213": "ÑUPY",
-    "3214": "HUGO STROESSNER",
-    "3215": "BOQUERON",
-    "3216": "BOTREL (ESTERO)",
-    "3217": "CARACHI",
-    "3218": "COL. NUEVA AUSTRALIA",
-    "3219": "ESTANCIA ELIZABETH",
-    "3220": "ESTANCIA SACIAIN",
-    "3221": "GUAVIRA",
-    "3222": "H. STROESSNER (N.LONDRES-MUNI)",
-    "3223": "JHUGUA",
-    "3224": "JHUGUA YERE",
-    "3225": "LA NOVIA",
-    "3226": "LA PASTORA ESTANCIA",
-    "3227": "LA VOGUI",
-    "3228": "LEIVA",
-    "3229": "LEÑA CUE",
-    "3230": "LOMA RUGUA",
-    "3231": "MARIA AUXILIADORA",
-    "3232": "MBOBERA JHAGUA",
-    "3233": "POTRERO ITACURUBI",
-    "3234": "SAN ANTONIO",
-    "3235": "SAN ISIDRO 1RA. Y 2DA.",
-    "3236": "SAN MIGUEL",
-    "3237": "SAN MIGUEL",
-    "3238": "SANTA ROSA",
-    "3239": "SANTO DOMINGO",
-    "3240": "TAPE TUYA",
-    "3241": "TEYU RUGUAI",
-    "3242": "VISTA ALEGRE",
-    "3243": "YUKYRY",
-    "3244": "ÑANDU CUA",
-    "6366": "POTRERO TUYA",
-    "6367": "SANTA LIBRADA",
-    "6368": "YTEU ITA",
-    "525": "TORIN INDIGENA 2DA.",
-    "526": "TRAPICHE",
-    "527": "TUCU CANGUE",
-    "528": "UNION",
-    "529": "YBU",
-    "530": "YOIBY",
-    "531": "YUKYRY",
-    "532": "YUKYRY (COMPAÑIA)",
-    "533": "YUKYRY 2DA.",
-    "534": "YUKYRY INDIGENA",
-    "535": "ZELANO",
-    "536": "ÑATIURY 1RO.",
-    "537": "ÑATIURY GUAZU",
-    "538": "ÑATIURY MI",
-    "539": "ÑATIURY-MI 2DA.LINEA",
-    "540": "ÑUPY",
-    "2154": "R.I.6 2DA.LINEA",
-    "2155": "R.I.6 BOQUERON",
-    "2156": "SAN AGUSTIN",
-    "2157": "SAN JOAQUIN (MUNICIPIO)",
-    "2158": "SAN MIGUEL",
-    "2159": "TACUAPI",
-    "2160": "TAPIRACUAI",
-    "2161": "TAPIRACUAI LOMA",
-    "2162": "TARUMA-I",
-    "2163": "TEJAS CUE",
-    "2164": "TEYU PA",
-    "2165": "TORO ACA",
-    "2166": "TORIN 2DA.",
-    "2167": "TORIN CUE",
-    "2168": "TORIN CUE INDIGENA",
-    "3245": "SAN JOAQUIN",
-    "3246": "2DA.LINEA AÑARETANGUE",
-    "3247": "ACARETANGUE CALLE 2DA.",
-    "3248": "ADMINISTRACION FINAY",
-    "3249": "ARROYO ACARETANGUE",
-    "3250": "CABAYU RAY",
-    "3251": "CALLE 20",
-    "3252": "CAPIITINDY",
-    "3253": "CARPA CUE",
-    "3254": "CARPA CUE 1RA.LINEA",
-    "3255": "CERRITO",
-    "3256": "CERRITO FINAY",
-    "3257": "CERRO CUE",
-    "3258": "CHACHI",
-    "3259": "CHOLOLO",
-    "3260": "COL.JUAN R. CHAVEZ(SANTA ROSA)",
-    "3261": "COSTA ALEGRE",
-    "3262": "COSTA GUAJHA",
-    "3263": "COSTA GUAJHA",
-    "3264": "GUAJHO",
-    "3265": "INDUSTRIA CUE",
-    "3266": "INVERNADA",
-    "3267": "ITA CUATIA",
-    "3268": "JHUGUA POI",
-    "3269": "JHU-YBARA",
-    "3270": "L. TAMBOR",
-    "3271": "LAGUNA PYTA",
-    "3272": "MANDYYUTYCUE",
-    "3273": "MBUTYY MI",
-    "3274": "MBUYUI CUA",
-    "3275": "MONTE ALTO",
-    "3276": "NOGUEIRO 2DA.",
-    "3277": "OLLA RUGUA",
-    "3278": "OMBU CUA",
-    "3279": "PASO ITA",
-    "3280": "PINDO",
-    "3281": "POTRERITO",
-    "3282": "POTRERITO 1RA.",
-    "3283": "POTRERO APUA",
-    "3284": "POTRERO GUAYAKI",
-    "3285": "POTRERO PUCU",
-    "3286": "POTRERO VERDE",
-    "6369": "3RA.LINEA",
-    "6370": "ARROYO PANAMBI",
-    "6371": "CAÑADA SAN BLAS",
-    "6372": "COL.JUAN E.BOGARIN",
-    "6373": "GUARDIA CUE",
-    "6374": "JHUGUA VERDE",
-    "6375": "MBUTYY",
-    "6376": "NOGUEIRO CUE",
-    "6377": "PIRI POTY",
-    "6378": "POTRERO JARDIN",
-    "541": "SAN JOSE",
-    "542": "CACHINDY",
-    "543": "CARIY CAÑADA",
-    "544": "COL.PTE. FRANCO",
-    "545": "COSTA POI",
-    "546": "COSTA PUCU",
-    "547": "ESTANCIA BELLA VISTA",
-    "548": "ESTANCIA CABRAL",
-    "549": "ESTANCIA CABUREI",
-    "550": "ESTANCIA H.",
-    "551": "ESTANCIA SAN PATRICIO",
-    "552": "ESTANCIA YUKERY",
-    "553": "LAGUNA VERDE",
-    "554": "MANDIO",
-    "555": "MELLO",
-    "556": "MONTE ALTO",
-    "557": "POTRERITO",
-    "558": "POTRERO IRALA",
-    "559": "ROAS",
-    "560": "SAN ISIDRO",
-    "561": "SAN JOSE (MUNICIPIO)",
-    "562": "SAN LUIS",
-    "563": "SAN PATRICIO",
-    "564": "TTE.DAKAC",
-    "565": "U PAU",
-    "566": "YACU BARRETO",
-    "567": "YCUA PORA",
-    "568": "YHACA",
-    "569": "ÑA CUALI CUE",
-    "570": "ÑANDU CUA",
-    "571": "YHU",
-    "572": "ADMINISTRACION KM.8",
-    "573": "AGUADA",
-    "574": "ARROYO PALOMARES",
-    "575": "BAQUERIA",
-    "576": "BELLA VISTA",
-    "577": "BLANCARA",
-    "578": "BUENA VISTA (YHU)",
-    "579": "BUEY CANGUE",
-    "580": "CAMPANARIO",
-    "581": "CANO CUE",
-    "582": "CARRENTINA (SAN MIGUEL)",
-    "583": "CARRERIAS",
-    "584": "CAÑADA MONDAY",
-    "585": "CAÑADITA",
-    "586": "CEDRO TY",
-    "587": "COL.JUAN L. MALLORQUIN",
-    "588": "JUAN S. BOGARIN",
-    "589": "COL.PABRAS",
-    "590": "COL. RUSSEL SMITH",
-    "591": "CORRENTINA GUAZU",
-    "592": "COSTA BARRIOS",
-    "593": "CURUPAY CARAPE",
-    "594": "CURURU",
-    "595": "CURURU LONONES",
-    "596": "CURUZU KAA",
-    "597": "CASILLA 2",
-    "598": "DONCELLA",
-    "599": "EPI-CUE",
-    "600": "ESTANCIA MARGARITA",
-    "601": "ESTANCIA PALOMARES",
-    "602": "GUA A CUA",
-    "603": "GUILLERMINA",
-    "604": "GULLON POTRERO",
-    "605": "HORNALLA CUE",
-    "606": "IGAMI",
-    "607": "INDIGENA ACARAY",
-    "608": "ISLA TACUARA",
-    "609": "ISLA YACU",
-    "610": "LAGUNA",
-    "611": "LAGUNA PYTA",
-    "612": "LAGUNA VERA",
-    "613": "MACHAIN CUE",
-    "614": "MARACANA",
-    "615": "MBARACAYU",
-    "616": "MBARACAYU FLORIDO",
-    "617": "MBOI-Y",
-    "618": "NARVAEZ CUE",
-    "619": "NDUN CUE",
-    "620": "OBRAJE MBOCAYA-I",
-    "621": "PALOMARES",
-    "622": "PANAMBI",
-    "623": "PASO CADENA",
-    "624": "PASO ITA",
-    "625": "PASTOREO-MI",
-    "626": "PINDO",
-    "627": "PIQUETE-CUE",
-    "628": "PIRA-ÑARO",
-    "629": "PLANCHADA TALAVERA",
-    "630": "POTRERITO",
-    "631": "POTRERO ALVAREZ",
-    "632": "POTRERO CORA",
-    "633": "POTRERO GUAZU",
-    "634": "PUENTECITA",
-    "635": "PUERTO JULIA",
-    "636": "PUERTO MAMORA",
-    "637": "PUERTO MANCUELLO",
-    "638": "PUERTO MOROTI",
-    "639": "PUESTO ALOJA",
-    "640": "PUESTO INDIGENA",
-    "641": "RANCHO CAPULLO",
-    "642": "RANCHO ARENA",
-    "643": "ROMERO CUE",
-    "644": "RIOS CUE",
-    "645": "SALMENA CUE",
-    "646": "SAN ANTONIO",
-    "647": "SAN  RAFAEL",
-    "648": "SANJA MOROTI",
-    "649": "SANTA ANA",
-    "650": "SANTA LIBRADA",
-    "651": "SANTA TERESA",
-    "652": "SATI",
-    "653": "SYRYCA",
-    "654": "SANCHEZ CUE",
-    "655": "TARUMA-I",
-    "656": "TARUMA 1RA. Y 2DA. LINEA",
-    "657": "TARUMA BOLSA",
-    "658": "TOBATI",
-    "659": "TURCO CUE",
-    "660": "VALLE-I",
-    "661": "VILLA MARIA BONITA",
-    "662": "YACARE CAI",
-    "663": "YAJHAPE-O",
-    "664": "YAJHAPE-O 2DO.",
-    "665": "YATAITY",
-    "666": "YBYPYTA",
-    "667": "YBYRACATU",
-    "668": "YHU (MUNICIPIO)",
-    "669": "YOIBY",
-    "670": "ZAPALLO",
-    "671": "ZAYAS CUE",
-    "672": "ÑEMBIARA",
-    "673": "ÑURAVIYU",
-    "674": "ÑU PUCU",
-    "6193": "OBRAJE SANTA CATALINA",
-    "6194": "PATRIMONIO",
-    "6195": "POROMBO JHE",
-    "6196": "PUERTO ESPINOZA",
-    "6197": "PUERTO PORVENIR",
-    "6198": "ROSILLO",
-    "6199": "SANJA JHU",
-    "6200": "SANTA ROSA",
-    "6201": "TARUMA",
-    "6202": "TORO",
-    "6203": "VILLALBA CUE",
-    "6204": "YATAI",
-    "6205": "YUQUYRY",
-    "6206": "ÑUMBUCU",
-    "675": "JUAN MANUEL FRUTOS",
-    "676": "1,2 LINEA (COL.PTE.STROESSNER)",
-    "677": "1A.LINEA YTU",
-    "678": "2A. LINEA YTU",
-    "679": "B. VISTA",
-    "680": "CA.AY",
-    "681": "CAIBO",
-    "682": "CALLE 1 (COL.PTE.STROESSNER)",
-    "683": "CALLE 2 (PTE.STROESNER)",
-    "684": "CALLE 3 (PTE.STROESSNER)",
-    "685": "CALLE 4 SAN AGUSTIN",
-    "686": "CALLE 5 YSAU",
-    "687": "CAMPO 1 COL.BERTHAL",
-    "688": "CAMPO 10 COL.BERTHAL",
-    "689": "CAMPO 11 COL.BERTHAL",
-    "690": "CAMPO 12 COL.BERTHAL",
-    "691": "CAMPO 2 COL.BERTHAL",
-    "692": "CAMPO 3 COL.BERTHAL",
-    "693": "CAMPO 4 COL.BERTHAL",
-    "694": "CAMPO 5 COL.BERTHAL",
-    "695": "CAMPO 5 COL.BERTHAL",
-    "696": "CAMPO 7 COL.BERTHAL",
-    "697": "CAMPO 8 COL.BERTHAL",
-    "698": "CAMPO 9 COL.BERTHAL",
-    "699": "CARRERIA-I",
-    "700": "COL.JUAN M. FRUTOS (MUNICIPIO)",
-    "701": "COL.STO.DOMINGO GUZMAN",
-    "702": "CRUCE PASTOREO",
-    "703": "ESTANCIA AQUINO",
-    "704": "ESTANCIA FLEITAS",
-    "705": "ESTANCIA GUGGIARI",
-    "706": "ESTANCIA VERBENA",
-    "707": "GRINGO CUE",
-    "708": "ISLA VERA",
-    "709": "LOPEZ-I",
-    "710": "PUENTE VAVA",
-    "711": "PUENTECITA",
-    "712": "PUESTO CARMEN",
-    "713": "PUESTO CURUPICAY",
-    "714": "PUESTO ISIDRO FLEITAS.",
-    "715": "PUESTO LAGUNITA (POTRERO)",
-    "716": "SAN AGUSTIN",
-    "717": "SANJA PE",
-    "718": "SANTA CARMEN",
-    "719": "TATACUA-I",
-    "720": "TEMBETARY",
-    "721": "TORO CAI",
-    "722": "TORIN",
-    "723": "VALLE CUE",
-    "724": "YACARE",
-    "725": "YBYJHU",
-    "726": "YBYRA POCA",
-    "727": "YBU",
-    "728": "YPANARA",
-    "729": "YUKYRY",
-    "730": "ÑURUNDIAY",
-    "731": "REPATRIACION",
-    "732": "3 DE NOVIEMBRE",
-    "733": "AVALOS A.JOSE (COLONIA)",
-    "734": "CHACO-RE (COLONIA)",
-    "735": "COL. REPATRIACION",
-    "736": "COL.SAN MIGUEL",
-    "737": "JUAN R. CHAVEZ",
-    "738": "CIA. CERRO PYTA",
-    "739": "CIA. COSTA CHAJHA",
-    "740": "CIA.GUARDIA CUE",
-    "741": "CIA. GUAZU RETA",
-    "742": "CIA. JHUGUA GRANDE",
-    "743": "CIA. POTRERITO",
-    "744": "CIA. POTRERO",
-    "745": "CIA. POTRERO JABON",
-    "746": "CIA. SAN AGUSTIN",
-    "747": "CIA. SANTA LUCIA",
-    "748": "CIA. TRAPICHE",
-    "749": "CIA. VIRGEN DE FATIMA",
-    "750": "CIA. ÑATIURUGUAZU",
-    "751": "ESTACION CABAYU RAY",
-    "752": "J. EULOGIO ESTIGARRIBIA",
-    "753": "CAMPO  9",
-    "754": "COL.BERZTHAL",
-    "755": "COL.GRAL.STROESSNER",
-    "756": "CIA.MARACAGUA",
-    "757": "JOSE D. OCAMPOS",
-    "758": "CHARIDE",
-    "759": "CIA. HILARIO CUE",
-    "760": "ESTACION SAN LUIS",
-    "761": "LA VIRGINIA",
-    "762": "PASTOREO MI",
-    "763": "SANTA CARMEN",
-    "764": "TORIN",
-    "765": "ZAPALLO",
-    "766": "R.I.3 CORRALES",
-    "767": "1ER. POTRERO",
-    "768": "2DO. POTRERO",
-    "769": "3R.POTRERO",
-    "770": "CALLE 10",
-    "771": "CALLE 12",
-    "772": "CALLE 2",
-    "773": "CALLE 4",
-    "774": "CALLE 6",
-    "775": "CALLE 8",
-    "776": "PASO ITA",
-    "777": "POTRERO BIYU",
-    "778": "RAUL A. OVIEDO",
-    "779": "BUENA VISTA",
-    "780": "COL.CNEL TOLEDO",
-    "781": "COL. GUAJHORY",
-    "782": "COL. PANAMBI",
-    "783": "COL. TEMBIAPORA",
-    "784": "COL. TRES PALMAS",
-    "785": "COL. CEDROTY",
-    "786": "COMPAÑIA",
-    "787": "COMPAÑIA LUCERO",
-    "788": "COMPAÑIA PIRAY",
-    "789": "COMPAÑIA SANCHEZ CUE",
-    "790": "CIA. DONCELLA",
-    "791": "ZAYAS CUE",
-    "6207": "COMPAÑIA ÑUABIYU",
-    "792": "MCAL.F.SOLANO LOPEZ",
-    "793": "COL.SANTA TERESA",
-    "794": "CIA. BUENA VISTA",
-    "795": "CIA. PASO BOLI",
-    "796": "CIA. POTRERO BULLON",
-    "797": "CIA. MACHAIN CUE",
-    "798": "CIA. MACHIAN CUE",
-    "799": "CIA. PALOMARES",
-    "800": "PUESTO YUKERI",
-    "6208": "COL. PASO CADENA",
-    "6209": "CURUZU LORENZO",
-    "5704": "COL. BERTAL",
-    "5705": "SANCHE CUE",
-    "5714": "3 DE FEBRERO",
-    "5706": "COL. HONDA",
-    "5707": "COL. MONSE|OR BOGARIN",
-    "5892": "SIMON BOLIVAR",
-    "5708": "CIA. YBU",
-    "5709": "CIA. PUENTECITO",
-    "5710": "CIA. CHACO I",
-    "5715": "LA PASTORA",
-    "5894": "CIA. RAMONITA",
-    "4600": "VAQUERIA",
-    "4610": "ESCULIES",
-    "6427": "TEMBIAPORA",
-    "6435": "NUEVA TOLEDO",
-    "4321": "CAAZAPA",
-    "4322": "20 DE JULIO (BOQUERON)",
-    "4323": "ARROYO PORA",
-    "4324": "BOQUERON",
-    "4325": "CAAZAPA",
-    "4326": "CABAYU RETA",
-    "4327": "COL. COSME",
-    "4328": "COL. SARUBBI",
-    "4329": "ESTANCIA LA MILAGROSA",
-    "4330": "ESTANCIA MARISOL BERTOLO",
-    "4331": "ESTANCIA RIACHUELO",
-    "4332": "ESTANCIA ROSARIO",
-    "4333": "ESTANCIA SAN AGUSTIN",
-    "4334": "ESTANCIA SAN ISIDRO",
-    "4335": "ESTANCIA SAN NICOLAS",
-    "4336": "ESTANCIA SAPARA",
-    "4337": "ESTANCIA SARITA",
-    "4338": "GALEANO CUE",
-    "4339": "GUAVIRA",
-    "4340": "ISLA GUAZU",
-    "4341": "JHUGUA GUAZU",
-    "4342": "PASO PINDO",
-    "4343": "POTRERO GUAZU",
-    "4344": "POTRERO TATUY",
-    "4345": "ROJAS SILVA",
-    "4346": "ROSARIO TATUY",
-    "4347": "SAN AGUSTIN",
-    "4348": "SAN ANTONIO",
-    "4349": "SAN IGNACIO (BOQUERON)",
-    "4350": "SAN JOSE",
-    "4351": "SAN MIGUEL",
-    "4352": "SAN PEDRO-MI",
-    "4353": "SAN ROQUE",
-    "4354": "SANTA CATALINA",
-    "4355": "SANTA LUCIA",
-    "4356": "SANTA TERESITA",
-    "4357": "SARANDI",
-    "4358": "VISCAINO CUE",
-    "4359": "YAJHAPETY",
-    "4360": "ÑANDUCUA",
-    "4361": "ÑAUMBY",
-    "4362": "ÑAUMBYTA",
-    "4363": "ÑU PYAJHU-MI",
-    "4364": "ÑU PYAJHU GUAZU",
-    "4365": "BUENA VISTA",
-    "4366": "BUENA VISTA",
-    "4367": "COCUERE",
-    "4368": "COSTEADA",
-    "4369": "GUAJHO",
-    "4370": "LOMA",
-    "4371": "SAN ISIDRO",
-    "4372": "SAN RAMON",
-    "4373": "SANTA ROSA",
-    "4374": "YAPEPO ISLA",
-    "4375": "YUI CUE",
-    "4376": "GRAL. H. MORINIGO",
-    "4377": "CAAGUY JHOVY",
-    "4378": "COSTA ESPERANZA",
-    "4379": "COSTA PIRAPO",
-    "4380": "DURAZNO",
-    "4381": "ESTANCIA SAN SIMON",
-    "4382": "ESTANCIA VALLE APUA",
-    "4383": "ESTANCIA YBA PYTA (PUESTO)",
-    "4384": "GRAAL.H. MORINIGO (MUNIC.)",
-    "4385": "GUYRA KEJHA",
-    "4386": "ISLA FLORIDO",
-    "4387": "MBARACAYA CUA",
-    "4388": "PATIÑO",
-    "4389": "PINDOYU",
-    "4390": "PIQUETE",
-    "4391": "SAN ESTANISLAO",
-    "4392": "SAN WENCESLAO",
-    "4393": "SANTA MARIA CHICA",
-    "4394": "SANTA MARIA GRANDE",
-    "5801": "KILOMETRO 50",
-    "5802": "SAN ANTONIO",
-    "5803": "SANTA MARIA JHUGUA",
-    "4395": "MACIEL",
-    "4396": "CARA CARA-I",
-    "4397": "COSTA DULCE",
-    "4398": "CURUZU PUCU",
-    "4399": "ESTANCIA ISLA PUCU",
-    "4400": "ESTANCIA SAN JUAN",
-    "4401": "ESTANCIA SAN LORENZO",
-    "4402": "ÑACANGUA",
-    "4403": "ISLA FLORIDO",
-    "4404": "MACIEL (MUNICIPIO)",
-    "4405": "RETIRO ESTANCIA SAN JUAN",
-    "4406": "SAN FRANCISCO",
-    "4407": "SAN MIGUEL",
-    "4408": "SAN MIGUEL ISLA",
-    "4409": "SAN PABLO",
-    "4410": "VALOIS RIVAROLA",
-    "5804": "ESTANCIA LAGUNA CARE",
-    "5805": "RETIRO SIETE ISLAS",
-    "5806": "YBYRA CAIGUE",
-    "4411": "MOISES BERTONI",
-    "4412": "CORRALITO",
-    "4413": "ESTANCIA ALGARROBO",
-    "4414": "ESTANCIA BELEN",
-    "4415": "ESTANCIA GUAVIRA",
-    "4416": "ESTANCIA JUANA MARTA",
-    "4417": "ESTANCIA MARIA STELLA",
-    "4418": "ESTANCIA S. ROJAS",
-    "4419": "ESTANCIA SANTO DOMINGO",
-    "4420": "ESTANCIA YBY RUGUA",
-    "4421": "GRAL.ROGELIO BENITEZ",
-    "4422": "LOMA-I",
-    "4423": "MOISES S.BERTONI (SOSA-MUNIC)",
-    "4424": "RETIRO SANTA ANA",
-    "4425": "SAN VENTURA",
-    "4426": "SANTA CECILIA",
-    "4427": "SANTA TERESA",
-    "5807": "ESTANCIA CASACCIA",
-    "5808": "ESTANCIA TYPYCHA",
-    "5809": "SAN CARLOS",
-    "4428": "SAN JUAN NEPOMUCENO",
-    "4429": "11 DE SETIEMBRE",
-    "4430": "ARACANGUY",
-    "4431": "BARRIO SAN VICENTE",
-    "4432": "BIYU",
-    "4433": "CARIDAD",
-    "4434": "CAUNDY",
-    "4435": "CAUNDY-I",
-    "4436": "CIERVO CUA PUESTO",
-    "4437": "COL. NUEVA",
-    "4438": "CRISTAL",
-    "4439": "DOMINGO MARTINEZ DE IRALA",
-    "4440": "EMPALADO",
-    "4441": "ENGELBERTO",
-    "4442": "ESTANCIA L.RODRIGUEZ",
-    "4443": "ESTANCIA R. SILVERO",
-    "4444": "ESTANCIA TAPYTA",
-    "4445": "ESTANCIA ÑU PYAJHU",
-    "4446": "FRANCO-I",
-    "4447": "FRANCO POTRERO",
-    "4448": "ISLA FLORIDO",
-    "4449": "ISLA YOBAI",
-    "4450": "JHUGUA PUCU",
-    "4451": "KERAY",
-    "4452": "LOMA JHOVY",
-    "4453": "MRICA POTRERO",
-    "4454": "MONTE-CUE",
-    "4455": "OCULTO",
-    "4456": "PINDO-I",
-    "4457": "PINDO POTRERO",
-    "4458": "PIO CUE",
-    "4459": "POTRERO",
-    "4460": "POTRERO SANTIAGO",
-    "4461": "POTRERO YBATE",
-    "4462": "POTRERO YBATE 1RO.",
-    "4463": "POTRERO YBATE 2DO.",
-    "4464": "PUESTO CLAVEL",
-    "4465": "PUESTO FRANCO CUE",
-    "4466": "PUESTO NARANJO",
-    "4467": "PUESTO TIMBO",
-    "4468": "POTRERO AGUARA",
-    "4469": "ROQUE GONZALES ( BEATO )",
-    "4470": "RIO SAN LUIS",
-    "4471": "SAN CARLOS",
-    "4472": "SAN FRANCISCO",
-    "4473": "SAN J. NEPOMUCENO (MUNICIPIO)",
-    "4474": "SAN LUIS (X)",
-    "4475": "SAN MIGUEL (POTRERITO)",
-    "4476": "SAN RAFAEL (TAPUY CUE )",
-    "4477": "SAN RAMON",
-    "4478": "SANTA ROSA (X)",
-    "4479": "TATUCUA - I",
-    "4480": "TEBICUARY MI",
-    "4481": "TORRE CUE",
-    "4482": "TUYUTI",
-    "4483": "URRUTIA",
-    "4484": "YBYRATY",
-    "4485": "YHU",
-    "4486": "YPANE",
-    "4487": "ZANJA CORA (SAN GERARDO)",
-    "4488": "ZANJA PYTA",
-    "4489": "ÑA'U",
-    "4490": "ÑUMI",
-    "4491": "ÑURUNDIAY",
-    "4492": "ÑU - CAÑY",
-    "4493": "ÑU PYAJHU POTRERO",
-    "4494": "ABAI",
-    "4495": "3 DE MAYO",
-    "4496": "ABAI",
-    "4497": "ARROYO MOROTI",
-    "4498": "BARROSO",
-    "4499": "BORDA I ( SAN VALENTIN )",
-    "4500": "BORDA GUAZU",
-    "4501": "CAGUARE - I",
-    "4502": "CAMBA - I",
-    "4503": "CAMPITO",
-    "4504": "CAPI ITINDY",
-    "4505": "CAPIIBARY (X)",
-    "4506": "CAÑADA (X)",
-    "4507": "CECINA",
-    "4508": "CERRITO TAPYI - I",
-    "4509": "COL. ROGELIO BENITEZ",
-    "4510": "CUATI",
-    "4511": "CUATI - I",
-    "4512": "ITACURUBI",
-    "4513": "KILOMETRO 17 ( X )",
-    "4514": "LIMA GUAZU (X)",
-    "4515": "MANGRULLO - I (X)",
-    "4516": "MBAYA",
-    "4517": "MBOCAYA",
-    "4518": "MBOIY",
-    "4519": "MELGAREJO - CUE",
-    "4520": "MONDAY",
-    "4521": "NARANJA - JHAI",
-    "4522": "OB. GOLONDRINA",
-    "4523": "PARAJE NARANJA",
-    "4524": "PINDOYU",
-    "4525": "PIRAY (SAN ISIDRO)",
-    "4526": "PLANTACION",
-    "4527": "PUNTA PORA",
-    "4528": "ROSARIO PASTOREO",
-    "4529": "ROSARIO POTRERO",
-    "4530": "SAN AGUSTIN",
-    "4531": "SAN ANTONIO (TORIN)",
-    "4532": "SAN CARLOS (NUEVE)",
-    "4533": "SAN LUIS (TARUMA)",
-    "4534": "SAN PABLO",
-    "4535": "SAN PABLO (TORIN)",
-    "4536": "SAN VICENTE",
-    "4537": "SANTA CATALINA",
-    "4538": "SANTA ROSA",
-    "4539": "SANTA TERESA",
-    "4540": "SANTO TOME",
-    "4541": "TACUARA",
-    "4542": "TACUARITA",
-    "4543": "TAJHYI-I",
-    "4544": "TUNA",
-    "4545": "VALLEI-CUE",
-    "4546": "VILLA PASTOREO",
-    "4547": "YATA-I",
-    "4548": "ÑU GUAZU",
-    "5810": "Y JHOVY",
-    "4549": "TAVAI",
-    "4550": "ATONGUE",
-    "4551": "BIYU",
-    "4552": "CASTOR CUE",
-    "4553": "CERRO-I",
-    "4554": "ENRAMADITA",
-    "4555": "ITANGUA",
-    "4556": "MBOPI REVI",
-    "4557": "RIVAS CUE",
-    "4558": "SAN GABRIEL",
-    "4559": "TAVAI (MUNICIPIO)",
-    "4560": "TORO BLANCO GUAZU",
-    "4561": "TORO BLANCO-I",
-    "4562": "VALLE-MI",
-    "4563": "YBYTY CORA",
-    "4564": "ÑU CAÑY",
-    "5811": "CAAZAPA-MI",
-    "5812": "MBOI CHINI",
-    "5813": "TORANZO",
-    "5814": "YBY ATY",
-    "4565": "YEGROS",
-    "4566": "COSTA LIMA",
-    "4567": "ESTACION JESUS MARIA",
-    "4568": "ESTACION SAN LUIS CARMEJAN",
-    "4569": "ESTACION SOLANO (LA RUAL DE Y)",
-    "4570": "ESTACION SOLEI",
-    "4571": "FULGENCIO YEGROS (MUNICIPIO)",
-    "4572": "ISLA SACA",
-    "4573": "MBARIGUI",
-    "4574": "PINDOYU",
-    "4575": "PIRAPO",
-    "4576": "PUESTO CAÑETE",
-    "4577": "PUESTO MBOCAYA",
-    "4578": "PUESTO NARANJO",
-    "4579": "PUNTA GUAZU",
-    "4580": "RETIRO CAÑETE",
-    "4581": "RETIRO REVENTON",
-    "4582": "RETIRO TIMBO",
-    "4583": "SAN RAFAEL",
-    "4584": "YBYRA CATU",
-    "5815": "ESTACION ELISA REAL",
-    "5816": "GRAL.COLMAN",
-    "5817": "PUESTO CAMBAY",
-    "5818": "RETIRO ISLA GUAZU",
-    "2169": "ESTANCIA LAS PERLAS",
-    "2170": "ESTANCIA LIMA",
-    "2171": "ESTANCIA PYTERE",
-    "2172": "ESTANCIA SAN ANTONIO",
-    "2173": "ESTANCIA SAN LORENZO",
-    "2174": "ESTANCIA SANABRIA",
-    "2175": "ESTANCIA TARUMA",
-    "2176": "ESTANCIA TRES HERMANAS",
-    "2177": "ESTANCIA YPUCU",
-    "2178": "ESTANCIA YUTY",
-    "2179": "GANADERA PIRAPO (ESTANCIA)",
-    "2180": "GUAZU CAI",
-    "2181": "ISLA FLORIDO",
-    "2182": "ITA ANGU-A",
-    "2183": "LOMA JHOVY",
-    "2184": "LOMITA",
-    "2185": "MANDYYU TYGUE",
-    "2186": "MBOCAYA TY",
-    "2187": "MENDEZ PUESTO",
-    "2188": "POTRERO ANTEOJO",
-    "2189": "POTRERO YBATE",
-    "2190": "PUESTO TARUTI 1RO.",
-    "2191": "PUESTO TARUTI 2DO.",
-    "2192": "PUESTO TERUTI 3RO.",
-    "2193": "PUESTO YACAREY",
-    "2194": "PUESTO Y-JHOVY",
-    "2195": "PYTERE GUAZU",
-    "2196": "PYTERE-MI",
-    "2197": "RINCON ALEGRE",
-    "2198": "ROA RUGUA",
-    "2199": "SAN ANTONIO",
-    "2200": "SAN GERONIMO",
-    "2201": "SAN ISIDRO",
-    "2202": "SAN JUAN",
-    "2203": "SAN JUAN LOMA",
-    "2204": "SAN MIGUEL",
-    "2205": "SAN VICENTE",
-    "2206": "SANTA BARBARA",
-    "2207": "SANTA LUCIA",
-    "2208": "SANTA ROSA DE LIMA",
-    "2209": "SANTA URSULA",
-    "2210": "SARGENTO POTRERO",
-    "2211": "TACUAREMBOI-Y",
-    "2212": "TATU-CUA",
-    "2213": "TIRI",
-    "2214": "TYPYCHA-TY",
-    "2215": "URUGUY-Y",
-    "2216": "VAZQUEZ POTRERO",
-    "2217": "VERA-CUE",
-    "2218": "YACUARA-A",
-    "2219": "YAGUARETE CORA",
-    "2220": "TARATI-I",
-    "2221": "YATAI-TY",
-    "2222": "YU-I (CERRO)",
-    "2223": "YUTY (MUNICIPIO)",
-    "2224": "ZURUGUAY",
-    "2225": "ÑU PYAJHU MI",
-    "3287": "CAA CARAPA",
-    "3288": "CAÑADA",
-    "3289": "CAÑADA (SANTA TERESITA)",
-    "3290": "COLORES",
-    "3291": "COMBATE CUE",
-    "3292": "CURUPI",
-    "3293": "ESTANCIA BOQUERON",
-    "3294": "ESTANCIA CARAYA",
-    "3295": "ESTANCIA DOLORES",
-    "3296": "ESTANCIA DOS MARIAS",
-    "3297": "ESTANCIA ITACURUBI DEL CARMEN",
-    "4585": "YUTY",
-    "4586": "ABAI",
-    "4587": "AGUARAY GUAZU",
-    "4588": "AGUARAY-MI",
-    "4589": "ARARUPE",
-    "4590": "ARROYO MACA",
-    "4591": "AYALA CUE",
-    "4592": "AZAME CUE",
-    "4593": "BOLAS CUE",
-    "4594": "CAPIITINDY",
-    "5819": "3 DE MAYO",
-    "5820": "ARGAÑA CUE",
-    "5821": "CABAÑA LA CHIQUILLA",
-    "6425": "3 DE MAYO",
-    "2226": "ENCARNACION",
-    "2227": "3 POTRERO",
-    "2228": "4 POTRERO",
-    "2229": "AGUIRRE CUE",
-    "2230": "ARROYO PORA",
-    "2231": "BARRIO POTI Y (ISLA)",
-    "2232": "BARRIO VIUDITA",
-    "2233": "BARRIO YBYCUI 1A.(ISLA)",
-    "2234": "BARRIO YBYCUI 2DA.(ISLA)",
-    "2235": "BARRIO BEATO ROQUE",
-    "2236": "BARRIO ESTACION",
-    "2237": "BARRIO FABRIL",
-    "2238": "BARRIO LOMA CLAVEL",
-    "2239": "BARRIO SANTA MARIA",
-    "2240": "BARRIO SANTA ROSA 2DA.",
-    "2241": "C.5,6,7 COL.DR.F.ESCULIES",
-    "2242": "CAAGUY COL.SANTO DOMINGO",
-    "2243": "CALLE 1 COL.DR.F.ESCULIES",
-    "2244": "CALLE 2 COL.DR.F.ESCULIES",
-    "2245": "CALLE 3 COL.DR.F.ESCULIES",
-    "2246": "CALLE 4 DR.F.ESCULIES",
-    "2247": "CALLE 6 Y 7 (CERRITO)",
-    "2248": "CAMPO SANTO DOMINGO",
-    "2249": "CHAIPE",
-    "2250": "CURUPAYTY",
-    "2251": "CURUZU TOMAS",
-    "2252": "ENCARNACION (MUNICIPIO)",
-    "2253": "ESTANCIA MATIAUDA",
-    "2254": "FATIMA",
-    "2255": "ISLA B.DEL MEDIO",
-    "2256": "ISLA B.TATAINDY",
-    "2257": "ISLA MBOREVI",
-    "2258": "ISLA PANAMBI",
-    "2259": "ISLA PARANA 1RO.",
-    "2260": "ISLA VICTORIA",
-    "2261": "ITA ANGUA GUAZU",
-    "2262": "ITA ANGUA I",
-    "2263": "ITA CUA",
-    "2264": "ITA PASO (SANTO DOMINGO)",
-    "2265": "MBOI CAE",
-    "2266": "PACU CUA (BARRIO)",
-    "2267": "PACU CUA 3RO.",
-    "2268": "PICADA PYTA",
-    "2269": "PLANTA URBANA (COL.ESCULIES)",
-    "2270": "QUITERIO",
-    "2271": "RETIRO CARAGUATA",
-    "2272": "SAN BLAS (COL.INDEPENDENCIA)",
-    "2273": "SAN CARLOS",
-    "2274": "SAN ISIDRO (COL.INDEPENDENCIA)",
-    "2275": "SAN JUAN DEL PARANA",
-    "2276": "SAN MIGUEL",
-    "2277": "SAN MIGUEL (COL.STO.DOMINGO)",
-    "2278": "SAN NICOLAS",
-    "2279": "SANTA LUCIA (COL.C.A.LOPEZ)",
-    "2280": "SANTA MARIA",
-    "2281": "SANTA ROSA 1RO.",
-    "2282": "SANTA ROSA DEL PARANA",
-    "2283": "TACUARI",
-    "2284": "TATU CUA 3RO.",
-    "2285": "VILLA CRISTINA",
-    "2286": "YPE CURU 2DO.",
-    "4601": "NUEVA AURORA",
-    "6308": "SAN ANTONIO",
-    "6309": "SAN LUIS DEL PARANA",
-    "6310": "SANTA ROSA 2DO.",
-    "6311": "YPE CURU 1RO.",
-    "2287": "BELLA VISTA",
-    "2288": "ACA CARAYA KM.20",
-    "2289": "ACA CARAYA KM.22",
-    "2290": "BELLA VISTA (MUNICIPIO)",
-    "2291": "CALLE 1RO.PIRAPO",
-    "2292": "CAARENDY",
-    "2293": "COL.FORDI-I",
-    "2294": "COL.PIRAPO KM.13",
-    "2295": "COL.PIRAPO KM.15",
-    "2296": "COL.SANTA CLARA",
-    "2297": "COL.UNION",
-    "2298": "COL.URUGUAYA",
-    "2299": "COL.VACAY",
-    "2300": "FISCO KM.25",
-    "2301": "KILOMETRO 19 COL.PIRAPO",
-    "2302": "LA TRINIDAD",
-    "2303": "PIRAPO (PLANTA URBANA)",
-    "2304": "PIRAPO KM.17",
-    "2305": "PIRAPO KM.25",
-    "2593": "PUERTO ACA CARAYA",
-    "2594": "PUERTO BELLA VISTA",
-    "2595": "PUERTO CAARENDY",
-    "2596": "PUERTO FORDI-I",
-    "2597": "PUERTO PIRAPO",
-    "2598": "PUERTO VACAY",
-    "2599": "VILLA CAPSA",
-    "6312": "CALLE 1RO. ACA CARAYA",
-    "6313": "COL.PIRAPO KM.22",
-    "6314": "KILOMETRO 23 COL.PIRAPO",
-    "6327": "PUERTO ITALIA",
-    "2600": "CAMBYRETA",
-    "2601": "BARRERO GUAZU",
-    "2602": "CALLE A CAMBYRETA",
-    "2603": "CAMBYRETA (MUNICIPIO)",
-    "2604": "COL.CAMPICHUELO",
-    "2605": "COL.PARANA",
-    "2606": "PUERTO CAMPICHUELO",
-    "2607": "SAN MIGUEL CURUZU",
-    "2608": "TRES PALMITOS",
-    "6328": "ARROYO VERDE",
-    "6329": "COL.PARANA A (CALLE)",
-    "2609": "CAPITAN MEZA",
-    "2610": "CAPITAN MEZA (MUNICIPIO)",
-    "2611": "COL. CARLOS A.LOPEZ",
-    "2612": "COL.EDELIRA",
-    "2613": "COL. INDIGENA",
-    "2614": "COL. NATALICIO 5A. LINEA",
-    "2615": "COL. NUEVA",
-    "2616": "COL. TEMBEY",
-    "2617": "COL. MAYOR OTAÑO 1,2,3,4,5,LIN",
-    "2618": "COL. REPATRIACION 2A. LINEA",
-    "2619": "COL. REPATRIACION 3RA. LINEA",
-    "2620": "EDELIRA-I",
-    "2621": "EDELIRA KM.12",
-    "2622": "EDELIRA KM.16",
-    "2623": "EDELIRA KM.26",
-    "2624": "ISLA PARAJHA",
-    "2625": "KILOMETRO 49 -OBRAJE MANSON",
-    "2626": "KILOMETRO 54 OBRAJE BARANA",
-    "2627": "OBRAJE KM. 15",
-    "2628": "PALOMA",
-    "2629": "PARAJHA",
-    "2630": "PIRAYU-I",
-    "2631": "PUERTO 15 DE AGOSTO (C.APE-AI)",
-    "2632": "PUERTO 3 DE MAYO",
-    "3949": "PUERTO CARLOS A. LOPEZ",
-    "3950": "PUERTO MAINUMBY",
-    "3951": "PUERTO NATALICIO",
-    "3952": "PUERTO PALOMA",
-    "3953": "PUERTO PORVENIR",
-    "3954": "PUERTO SAN LORENZO",
-    "3955": "PUERTO SAN RAFAEL",
-    "3956": "PUERTO YACUY",
-    "3957": "PUERTO YAGUA RASAPA",
-    "3958": "SAN JUAN",
-    "3959": "TOLDERIA KM. 9",
-    "3960": "TOLDERIA PIRAYU (PTO.CADENA)",
-    "3961": "TOLDERIA YAGUA RASAPA",
-    "3962": "TRIUNFO KM. 25",
-    "3963": "URUTAU KM. 40",
-    "6330": "COL. APE-AIME",
-    "6331": "COL. SANTA ROSA",
-    "6332": "EDELIRA 1RO.Y 2DA. LINEA",
-    "6333": "KILOMETRO 72 OBRAJE KATUPYRY",
-    "3964": "CARMEN DEL PARANA",
-    "3965": "CALLE A ESTE",
-    "3966": "CALLE 1 OESTE",
-    "3967": "CALLE 2 OESTE",
-    "3968": "CALLE 3 OESTE",
-    "3969": "CALLE 4 OESTE",
-    "3970": "CALLE 5 OESTE",
-    "3971": "CALLE 6 OESTE",
-    "3972": "CALLE 7",
-    "3973": "CALLE 7 (A-B)OESTE",
-    "3974": "CALLE A-B-C-",
-    "3975": "CALLE AUXILIAR",
-    "3976": "CALLE B ESTE",
-    "3977": "CALLE B OESTE",
-    "3978": "CALLE C ESTE",
-    "3979": "CALLE C OESTE",
-    "3980": "CALLE D ESTE",
-    "3981": "CALLE D OESTE",
-    "3982": "CALLE E ESTE",
-    "3983": "CALLE E OESTE",
-    "3984": "CAMPAÑA COHTCF",
-    "3985": "CARAGUATA",
-    "3986": "CARMEN DEL PARANA (MUNICIPIO)",
-    "3987": "CERRITO",
-    "3988": "ESTANCIA WILKE",
-    "3989": "PUESTO WILKE (WILKIN)",
-    "3990": "SAN MARTIN",
-    "3991": "YACAREY",
-    "3992": "YBYRAITY",
-    "3993": "CAPITAN MIRANDA",
-    "3994": "CALLE 13 CAPITAN MIRANDA",
-    "3995": "CALLE 7 CAPITAN MIRANDA",
-    "3996": "CALLE A CAPITAN MIRANDA",
-    "3997": "CALLE A SUR CAPITAN MIRANDA",
-    "3998": "CALLE B 2DA. CAPITAN MIRANDA",
-    "3999": "CALLE B CAPITAN MIRANDA",
-    "4000": "CALLE B SUR CAPITAN MIRANDA",
-    "4001": "CALLE C SUR CAPITAN MIRANDA",
-    "4002": "CALLE C CAPITAN MIRANDA",
-    "4003": "CALLE JESUS CAPITAN MIRANDA",
-    "4004": "CAP. MIRANDA (MUNICIPIO)",
-    "4005": "COL. ALBORADA 1 CAP. MIRANDA",
-    "4006": "COL. ALBORADA 2 CAP. MIRANDA",
-    "4007": "YTORORO CAP. MIRANDA",
-    "4008": "CORONEL BOGADO",
-    "4009": "AGUARA",
-    "4010": "ANTEQUERA 1RO.",
-    "4011": "ANTEQUERA 2DO.",
-    "4012": "BONETE",
-    "4013": "CABAYU-I",
-    "4014": "CAMBAY",
-    "4015": "CAMBA RUGUA",
-    "4016": "CARUÑAI",
-    "4017": "CAUCASIA",
-    "4018": "CERRITO",
-    "4019": "CNEL.JOSE F.BOGADO (MUNICIPIO)",
-    "4020": "COL. CAP.BADO",
-    "4021": "COL. SIBERIA",
-    "4022": "COSTA TACUARY",
-    "4023": "CRISTO REY",
-    "4024": "ESTANCIA EL PROGRESO",
-    "4025": "ESTANCIA FERNANDEZ",
-    "4026": "ESTANCIA MEFFER",
-    "4027": "MBUTUY",
-    "4028": "PICADA TUNA",
-    "4029": "POTRERITO",
-    "4030": "PUESTO GUAICURU",
-    "4031": "RESQUIN CUE",
-    "4032": "SAN ANTONIO",
-    "4033": "SAN FRANCISCO",
-    "4034": "SAN ISIDRO",
-    "4035": "SAN JUAN JHUGUA-I",
-    "4036": "SAN MIGUEL POTRERO",
-    "4037": "SAN RAFAEL",
-    "4038": "SAN ROQUE",
-    "4039": "SANTA RITA",
-    "4040": "SATI",
-    "4041": "TACUARY",
-    "4042": "TACUATY",
-    "4043": "TYMACA",
-    "4044": "TELLEZ - I",
-    "4045": "TELLEZ CUE",
-    "4046": "YPYTA",
-    "4047": "FRAM",
-    "4048": "CALLE AUXILIAR T",
-    "4049": "CALLE E ESTE",
-    "4050": "CALLE E OESTE",
-    "4051": "CALLE F ESTE",
-    "4052": "CALLE F OESTE",
-    "4053": "CALLE G ESTE",
-    "4054": "CALLE G OESTE",
-    "4055": "CALLE H ESTE",
-    "4056": "CALLE H OESTE",
-    "4057": "CALLE I ESTE",
-    "4058": "CALLE I OESTE",
-    "4059": "CALLE J ESTE",
-    "4060": "CALLE J OESTE",
-    "4061": "CALLE K ESTE",
-    "4062": "CALLE K OESTE",
-    "4063": "CALLE I OESTE",
-    "4064": "CALLE M ESTE",
-    "4065": "CALLE M OESTE",
-    "4066": "CALLE N ESTE",
-    "4067": "CALLE N OESTE",
-    "4068": "CALLE P ESTE",
-    "4069": "CALLE P OESTE",
-    "4070": "CALLE Q ESTE",
-    "4071": "CALLE Q OESTE",
-    "4072": "CALLE S ESTE",
-    "4073": "CALLE S OESTE",
-    "4074": "CALLE T ESTE",
-    "4075": "CAALE T OESTE",
-    "4076": "CALLE U ESTE",
-    "4077": "CALLE V OESTE",
-    "4078": "FRAM ( MUNICIPIO )",
-    "5783": "CALLE O ESTE",
-    "5784": "CALLE R OESTE",
-    "5785": "CALLE U OESTE",
-    "1855": "ESTANCIA SALTO",
-    "1856": "ESTANCIA SAN ANTONIO",
-    "1857": "ESTANCIA SANTA TERESA",
-    "1858": "ESTANCIA YBYRA PIRU",
-    "1859": "ESTNACIA ÑEEMBUCU",
-    "1860": "GANADERA SALITRE CUE",
-    "1861": "GRAL.GERVACIO ARTIGAS (MUNIC.)",
-    "1862": "HURTADO CUE",
-    "1863": "ISLA ALTA",
-    "1864": "ITACURUBI",
-    "1865": "COL.SANTA MARIA",
-    "1866": "PICADA PYTA",
-    "1867": "POTRERITO",
-    "1868": "POTRERO DUARTE",
-    "1869": "PUESTO AGUADA",
-    "1870": "PUESTO CAAGUAZU",
-    "1871": "PUESTO IRALA PINDO",
-    "1872": "PUESTO SOLEDAD",
-    "1873": "PUESTO TAYY",
-    "1874": "SAN BLAS",
-    "1875": "SAN IDIDRO",
-    "1876": "SAN MIGUEL",
-    "1877": "SAN MIGUL POTRERO",
-    "1878": "SYRYRYCA",
-    "1879": "TOROPE",
-    "1880": "YPAYERE",
-    "1881": "YUKYRAYI",
-    "1882": "ZANJA HONDO",
-    "1883": "ÑU GUAZU",
-    "1884": "ÑU PYAJHU",
-    "4079": "GRAL. ARGTIGAS",
-    "4080": "ALBARDON",
-    "4081": "BOBI PUCU",
-    "4082": "BUENA VISTA",
-    "4083": "CAMBAY",
-    "4084": "CERRITO",
-    "4085": "COL. INDEPENDENCIA",
-    "4086": "CURUPAYTYUAYA",
-    "4087": "ERATY",
-    "4088": "ESTANCIA AREQUITA",
-    "4089": "ESANCIA BADO ISLA PE H",
-    "4090": "ESTANCIA CABALLERO GATTI",
-    "4091": "ESTANCIA ISLA CAMBA",
-    "4092": "ESTANCIA LOMA",
-    "4093": "ESTANCIA PIRITY",
-    "5786": "ARROYO VUELTA",
-    "5787": "COL. URUGUAYA",
-    "5788": "ESTANCIA BADO ISLA PE L",
-    "1885": "GRAL. DELGADO",
-    "1886": "BOQUERON",
-    "1887": "CAA-TY",
-    "1888": "COSTA JHU",
-    "1889": "ESTANCIA FRANCO CUE",
-    "1890": "ESTANCIA LAUREL",
-    "1891": "ESTANCIA SAN ANTONIO",
-    "1892": "ESTANCIA SAN MIGUELITO",
-    "1893": "ESTANCIA SANTA MARIA",
-    "1894": "ESTANCIA YCUA ÑU",
-    "1895": "GRAL. DELGADO (MUNICIPIO)",
-    "1896": "ISLA GUAZU",
-    "1897": "ISLA PERU",
-    "1898": "JHUGUA GUAZU",
-    "1899": "JHUGUA-I",
-    "1900": "LOMITA",
-    "1901": "MANDYYU-TYGUE",
-    "1902": "PASO LAUREL",
-    "1903": "POSTA CUE",
-    "1904": "PUNTA PORA",
-    "1905": "SAN ANTONIO (JHUGUA-MI)",
-    "1906": "SAN BLAS",
-    "1907": "SAN DIONISIO",
-    "1908": "SAN ESTANISLAO",
-    "1909": "SAN ISIDRO",
-    "1910": "SAN PEDRO",
-    "1911": "SANTA MARIA",
-    "1912": "TAVA-I",
-    "1913": "YBYRATY",
-    "1914": "YHACA",
-    "1915": "HOHENAU",
-    "1916": "CABAYU-Y",
-    "1917": "CAMPO ANGEL",
-    "1918": "FISCO HOHENAU",
-    "1919": "HOHENAU 1",
-    "1920": "HOHENAU 2 (MUNICIPIO)",
-    "1921": "HOHENAU 3",
-    "1922": "HOHENAU 4",
-    "1923": "ITAPE SYI",
-    "1924": "LA MORENA",
-    "1925": "PUERTO HOHENAU",
-    "1926": "PUERTO SANTA ROSA",
-    "1927": "SANTA MARIA 1RO.",
-    "1928": "SANTA MARIA 2A.(COLONIA)",
-    "1929": "JESUS",
-    "1930": "CAAGUAZU (C.FEDERICO CHAVEZ)",
-    "1931": "CAMBAY",
-    "1932": "CAMPOS TERWINDT",
-    "1933": "CAPIIBARY (PASO CARLIN)",
-    "1934": "CARUMBEY",
-    "1935": "COL.JESUS",
-    "1936": "JESUS (MUNICIPIO)",
-    "1937": "MADISOVY (CAMPO TOMAS)",
-    "1938": "SAN ANTONIO",
-    "1939": "SAN JUSTO",
-    "1940": "SAN LUIS",
-    "1941": "SANTA TERESA",
-    "1942": "OBLIGADO",
-    "1943": "ARROYO GUAZU",
-    "1944": "COL.OBLIGADO KM. 10",
-    "1945": "KILOMETRO 10",
-    "1946": "KILOMETRO 25",
-    "1947": "KILOMETRO 26",
-    "1948": "OBLIGADO (MUNICIPIO)",
-    "1949": "OBLIGADO 3RO.",
-    "1950": "PASTOREO",
-    "1951": "PUERTO OBLIGADO",
-    "1952": "VILLA ALEGRE",
-    "6287": "CAMPO ANGEL",
-    "6288": "LAPACHAL",
-    "6289": "VACAY",
-    "1953": "SAN COSME",
-    "1954": "ARROCERA BOLF",
-    "1955": "CHACO-I",
-    "1956": "COL.TIBURCIO BOGADO..........",
-    "1957": "COL.YBYCUI (CERRO)",
-    "1958": "CURUPAY CARE",
-    "1959": "ESTANCIA BAEZ",
-    "1960": "ESTANCIA JORGE BOLF",
-    "1961": "ESTANCIA MALAY",
-    "1962": "ESTANCIA MORA",
-    "1963": "GUACURU CUA",
-    "1964": "ISLA BUENA VISTA",
-    "1965": "ISLA FLORES",
-    "1966": "ISLA JUPITER",
-    "1967": "ISLA MBOREVI II",
-    "1968": "ISLA MYTU-I",
-    "1969": "ISLA PUCU",
-    "1970": "ISLA SAUCE",
-    "1971": "ISLA TALAVERA",
-    "1972": "ISLA YACY RETA",
-    "1973": "ISLA YPYTA",
-    "1974": "LOMA SAN ANTONIO",
-    "1975": "MISERICORDIA",
-    "1976": "PIRITY",
-    "1977": "POTRERO YBATE",
-    "1978": "POTRERO ÑA'U",
-    "1979": "PUERTO BARRANQUERITA",
-    "1980": "PUERTO PICARDIA",
-    "1981": "PUESTO",
-    "1982": "SAN COSME Y DAMIAN (MUNICIPIO)",
-    "1983": "SAN LORENZO",
-    "1984": "SAN MAURICIO",
-    "1985": "SANTA LUCIA",
-    "1986": "SANTO TOMAS",
-    "1987": "TAMBURA",
-    "6290": "CAMBYRETA",
-    "6291": "ESTANCIA ABELARDA (ABELANDRA)",
-    "6292": "ISLA GARZALITO",
-    "6293": "ISLA RICA",
-    "6294": "LOMA",
-    "6295": "POTRERO CARDOZO",
-    "6296": "PUESTO MBERU (TOMBERU)",
-    "1369": "SAN JUAN POI",
-    "1370": "SAN LORENZO",
-    "1371": "SAN LUIS",
-    "1372": "SAN NICOLAS",
-    "1373": "SAN PABLO (ESTANCIA)",
-    "1374": "SAN PEDRO DEL PARANA (MUNICIP)",
-    "1375": "SAN PEDRO MI (SAN PEDRO)",
-    "1376": "SAN PEDRO ÑU",
-    "1377": "SAN RAFAEL",
-    "1378": "SAN SOLANO",
-    "1379": "SAN SOLANO MI",
-    "1380": "SAN VICENTE",
-    "1381": "SANTA BRIGIDA",
-    "1382": "SANTA TERESA (ESTANCIA)",
-    "1383": "SANTA TERESA FLORIDO",
-    "1384": "SANTIAGO CUE",
-    "1385": "TACHARUZU",
-    "1386": "TACUARA",
-    "1387": "TARUMA",
-    "1388": "TAVY",
-    "1389": "TIMBO-I",
-    "1390": "VALLE TEBICUARY",
-    "1391": "YABEBYRY",
-    "1392": "YACARE-CUA",
-    "1393": "YACUA RUZU",
-    "1394": "YAGUA CUA",
-    "1395": "YAGUA CUA GUAZU",
-    "1396": "INAMBU (YNAMBU-I)",
-    "1397": "YSYPO YU",
-    "1398": "ZANZA CORA3",
-    "1988": "CAMPAMENTO CUE (ESTANCIA)",
-    "1989": "ALTO VERA",
-    "1990": "APEPU TY",
-    "1991": "ARROYO FRAZADA",
-    "1992": "BARRIO SAN FRANCISCO",
-    "1993": "BARRIO SAN MIGUEL",
-    "1994": "BARRIO SANTA CATALINA",
-    "1995": "BOGADO CUE",
-    "1996": "CAAZAPA - MI",
-    "1997": "CAMPO FLORIDO",
-    "1998": "CANGUE CUA",
-    "1999": "CARACHA",
-    "2000": "CARAGUATAY",
-    "2001": "CARAGUATA I",
-    "2002": "CATAGUATA II",
-    "2003": "CARIÑO",
-    "2004": "CAÑADA LOMA JHOVY",
-    "2005": "CAÑADA OCULTO",
-    "2006": "CAÑADA TEBICUARY (COSTA)",
-    "2007": "CAÑADITA",
-    "2008": "COL.CAPITAN LEGUIZAMON",
-    "2009": "CRONA Y",
-    "2010": "CHUCHI'I",
-    "2011": "CURUPICA'Y",
-    "2012": "CURUZU ESTEBAN",
-    "2013": "CURE BARRERO",
-    "2014": "DESGRACIA CUE",
-    "2015": "ESTANCIA CARISSIMO",
-    "2016": "ESTANCIA GUBETICH",
-    "2017": "ESTANCIA MENDEZ",
-    "2018": "ESTANCIA NISQUE",
-    "2019": "ESTANCIA SANTA ROSA",
-    "2020": "ESTANCIA TACUAPI",
-    "2021": "ESTANCIA YSYPOYU (YSYPOJHU)",
-    "2022": "FLEITAS CUE",
-    "2023": "GAONA CUE",
-    "2024": "GUAZU CORA",
-    "2025": "GUAZU YGUA",
-    "2026": "IBARRA CUE",
-    "2027": "ITA ANGU'A",
-    "2028": "KY'YI",
-    "2029": "LOM JHOVY",
-    "2030": "MANDYYU TYNGUE",
-    "2031": "MBOCA PIRAY (ESTANCIA)",
-    "2032": "MBOCAYA",
-    "2033": "MBURUCUYA",
-    "2034": "MOROTINGUE",
-    "2035": "NOVIRETA",
-    "2036": "PASTOREO",
-    "2037": "PIKY",
-    "2038": "PINDOYU",
-    "2039": "PIRITY",
-    "2040": "POTRERITO",
-    "2041": "POTRERO BENITEZ",
-    "2042": "POTRERO GOMEZ",
-    "2043": "POTRERO SAN JOSE",
-    "2044": "POTRERO YAPEPO",
-    "2045": "POTRERO YBATE",
-    "2046": "POTRERO ÑEMBOTY",
-    "2047": "PUNTA PORA",
-    "2048": "PUNTA RATI",
-    "2049": "RINCON DE LUNA",
-    "2050": "SALITRE CUE",
-    "2051": "SAN AGUSTIN",
-    "2052": "SAN ANTONIO (ESTANCIA)",
-    "2053": "SAN ANTONIO GUAZU",
-    "2054": "SAN ANTONIO MI",
-    "2055": "SAN CLEMENTE",
-    "2056": "SAN ISIDRO (YHU ESTANCIA)",
-    "2057": "SAN JUAN GUAZU",
-    "2058": "SAN JUAN GUAZU",
-    "6297": "SAN PEDRO DEL PARANA",
-    "1399": "CAP. VICENTE MATIAUDA",
-    "1400": "CALLE D",
-    "1401": "CALLE E",
-    "1402": "CALLE 14",
-    "1403": "CALLE 15",
-    "1404": "CALLE 16",
-    "1405": "CALLE 17",
-    "1406": "CAP.MATIAUDA (MUNICIPIO)",
-    "1407": "COL.ALBORADA A",
-    "1408": "COL.ALBORADA B",
-    "1409": "COL. ALBORADA C",
-    "1410": "COL. ALBORADA B",
-    "1411": "COL. ALBORADA E",
-    "1412": "COL. TRINIDAD",
-    "1413": "ITA CAJON",
-    "1414": "PUERTO CANTERAS",
-    "1415": "PUERTO PARAISO",
-    "1416": "PUERTO SAMU-U",
-    "1417": "PUERTO TEYU CUARE",
-    "1418": "PUERTO 3 PALMITOS",
-    "1419": "VILLA ALBORADA",
-    "1420": "TRINIDAD",
-    "1421": "CERRO ITA MBARACA",
-    "1422": "COL.FEDERICO CHAVEZ",
-    "1423": "COL.PTO.TRINIDAD",
-    "1424": "COL.SAN ANTONIO",
-    "1425": "CORRAL",
-    "1426": "ITA MBARACA",
-    "1427": "NATALIO",
-    "1428": "ADMINISTRACION",
-    "1429": "BARRIO NUEVO HORIZONTE",
-    "1430": "BARRIO STO.DOMINGO",
-    "1431": "COL.REPATRIACION SUR",
-    "1432": "NATALICIO",
-    "1433": "PALOMA",
-    "1434": "PUERTO MAINUMBY",
-    "1435": "PUERTO PALOMA",
-    "1436": "PUERTO TRIUNFO",
-    "1437": "PUERTO YATAITY",
-    "1438": "RAFAEL MONZON",
-    "1439": "YACARE CUE",
-    "1440": "JOSE LEANDRO OVIEDO",
-    "1441": "ESTANCIA BARBOZA",
-    "1442": "GANADERIA SALITRE CUE",
-    "1443": "MUNICIPIO",
-    "1444": "PUESTO AGUADA",
-    "1445": "PUESTO YATAI",
-    "1446": "VICENTE MATIAUDA",
-    "1447": "ALBORADA 1",
-    "1448": "CERRO PORTEÑO",
-    "1449": "CIA.SAMUHU",
-    "1450": "COL.VICENTE MATIAUDA",
-    "1451": "PTO.CANTERA",
-    "1452": "PTO.PARAISO",
-    "1453": "PTO.SAMUHU",
-    "1454": "PTO.TRES PALMITOS",
-    "1455": "VILLA ALBORADA",
-    "6253": "PTO.YBYCUI ÑARO",
-    "1456": "CARLOS A. LOPEZ",
-    "1457": "22 DE MAYO",
-    "1458": "CALLE 7 DE AGOSTO",
-    "1459": "COL.ALBORADA",
-    "1460": "COL.PORVENIR",
-    "1461": "COL.SAN LORENZO",
-    "1462": "COL.TEMBEY",
-    "1463": "KILOMETRO 4,8,17,14 Y 21",
-    "1464": "NARANJITO",
-    "1465": "PLANCHADA MARGARITA",
-    "1466": "PLANCHADA SAN JOSE",
-    "1467": "PUERTO  DE AGOSTO",
-    "1468": "PUERTO CARLOS A.LOPEZ",
-    "1469": "PUERTO PORVENIR",
-    "1470": "PUERTO SAN RAFAEL",
-    "6254": "COL. APE AIME",
-    "6255": "NACIENTE DEL TEMBEY",
-    "6256": "PUERTO SAN LORENZO",
-    "1471": "JULIO D. OTAÑO",
-    "1472": "1A.LINEA",
-    "1473": "2ALINEA",
-    "1474": "3ALINEA",
-    "1475": "5ALINEA",
-    "1476": "COL.REPATRIACION",
-    "1477": "RANCHO CABRERA",
-    "6257": "4ALINEA",
-    "1478": "COL.REPATRIACION DEL SUR",
-    "1479": "CRUCE GUAVIRA",
-    "1480": "KILOMETRO 32 EDELIRA",
-    "1481": "KILOMETRO 32 YAGUARAZAPA",
-    "1482": "MONZON",
-    "6258": "ANTIDIA MATIAUDA",
-    "6259": "POTRERO PIRAPO",
-    "6400": "EDELIRA 60",
-    "1483": "SAN JUAN DEL PARANA",
-    "1484": "LA PAZ",
-    "1485": "CALLE 3",
-    "1486": "CALLE 4",
-    "1487": "CALLE 5",
-    "1488": "CALLE 7",
-    "1489": "CALLE A",
-    "1490": "CALLE D",
-    "1491": "CALLE P",
-    "1492": "CALLE Q",
-    "1493": "CALLE R",
-    "1494": "CALLE T",
-    "1495": "CIA.SANTA ROSA",
-    "1496": "CIA.AGRIC.LTDA. LA PAZ",
-    "1497": "CIA.SAN CARLOS",
-    "1498": "CALLE 2",
-    "6260": "CALLE 6",
-    "6261": "CALLE N",
-    "6262": "CIA. CAAGUAZU",
-    "6263": "NACIENTE DEL TEMBEY",
-    "1499": "MARIA AUXILIADORA",
-    "1500": "KILOMETRO 51 TRIUNFO",
-    "1501": "PUENTE SAN BRULLO CUE",
-    "1502": "YATAITY",
-    "1503": "YATYTAY",
-    "1504": "HERIBERTA S.DE IGLESIAS",
-    "1505": "CERRO BARRERO",
-    "1506": "CERRO BERTA",
-    "1507": "CERRO MBATOVY",
-    "1508": "CERRO PABLA",
-    "1509": "CERRO SAN RAFAEL",
-    "1510": "CERRO TACUARY",
-    "1511": "CERRO VIOLETA",
-    "1512": "CERRO YAGUA CUA",
-    "1513": "CERRO YAGUA GUAZU",
-    "1514": "COCHI",
-    "1515": "COL.ALTO VERA",
-    "1516": "CRUCE GUAVIRA",
-    "1517": "POTRERO PASTOREO",
-    "1518": "POTRERO PIRAPO",
-    "1519": "POTRERO SAN PABLO",
-    "1520": "POTRERO SAN PEDRO MI",
-    "1521": "POTRERO TAGUATO",
-    "1522": "POTRERO YUQUERI",
-    "1523": "TAYI POTRERO",
-    "5698": "PIRAPO",
-    "5711": "COL. CARANDAY",
-    "5895": "CIA. VACA I",
-    "4606": "ITAPUA POTY",
-    "4609": "FEDERICO CHAVEZ",
-    "1524": "SAN JUAN BAUTISTA",
-    "1525": "CERRO PERO",
-    "1526": "COCHI-Y",
-    "1527": "COL.SAN JUAN",
-    "1528": "GARAY",
-    "1529": "ISLA TOBATI",
-    "1530": "SAN CRISTOBAL",
-    "1531": "SAN JUAN BAUTISTA (MUNICIPIO)",
-    "1532": "SAN ROQUE",
-    "1533": "TRISTEN SALAZAR",
-    "1534": "AYOLAS",
-    "1535": "3 COQUEROS",
-    "1536": "ATINGUY",
-    "1537": "AVILA CUE",
-    "1538": "AYOLAS (MUNICIPIO)",
-    "1539": "BASE AEREA YACYRETA",
-    "1540": "BOQUERON",
-    "1541": "CHACO-I",
-    "1542": "COCHI-Y",
-    "1543": "COL.ALEJO GARCIA 1A.",
-    "1544": "COL.CO'EYU",
-    "1545": "COSTA YABEBYRY",
-    "1546": "COL.ALEJO GARCIA 2A.",
-    "1547": "ISLA CURE'I",
-    "1548": "ISLA PAJARO",
-    "1549": "ISLA TRES HERMANAS",
-    "1550": "LIMA",
-    "1551": "MBOCAYA",
-    "1552": "MBURAJHEY",
-    "1553": "MEDIO DIA",
-    "1554": "POTRERO",
-    "1555": "PUERTO CORATEI",
-    "1556": "PUERTO GUARDIA CUE",
-    "1557": "PUERTO TURI",
-    "1558": "SALTO YASYRETA",
-    "1559": "SAN IGNACIO CUE(I.IGNACIO CUE)",
-    "1560": "SAN RAFAEL",
-    "1561": "YAGUARY",
-    "1562": "YASYRETA PUNTA",
-    "1563": "YATAITY",
-    "1564": "SAN IGNACIO",
-    "1565": "ARROYO VERDE",
-    "1566": "COL.CA'A YOJHA",
-    "1567": "COL.MANZANA D",
-    "1568": "COSTA BRASIL",
-    "1569": "COSTA PUCU",
-    "1570": "ESTANCIA AGRO SAN JUAN",
-    "1571": "ESTANCIA PARAGUAY",
-    "1572": "ISLA GUAZU",
-    "1573": "PLATERO",
-    "1574": "SAN BENTO",
-    "1575": "SAN IGNACIO (MUNICIPIO)",
-    "1576": "SAN JAVIER",
-    "1577": "SAN JUAN",
-    "1578": "SAN PABLO",
-    "1579": "SANGRE DE DRAGON",
-    "1580": "SANTA RITA",
-    "1581": "TAJHYI-TY",
-    "1582": "TAYY",
-    "1583": "TAÑERENDY",
-    "1584": "SAN MIGUEL",
-    "1585": "ARAZAPE",
-    "1586": "COL.YSYPO POTRERO",
-    "1587": "COSTA JHU",
-    "1588": "ESTANCIA CAPII BEBE",
-    "1589": "ESTANCIA LOMA POTY",
-    "1590": "ESTANCIA MEZA",
-    "1591": "ESTANCIA ROSARIO",
-    "1592": "ESTANCIA SAN JUAN",
-    "1593": "ESTANCIA SAN ROQUE",
-    "1594": "ESTANCIA SANTA NINA",
-    "1595": "ESTANCIA SANTA TERESA",
-    "1596": "ESTANCIA SANTO TOMAS",
-    "1597": "ESTANCIA TEBICUARY",
-    "1598": "ESTANCIA YGAU",
-    "1599": "ESTANCIA Z.BARRIOS",
-    "1600": "ISLA TACUARA",
-    "1601": "ITA YURU",
-    "1602": "JHUGUA",
-    "1603": "PUESTO CAACUPE MI",
-    "1604": "PUESTO CANGUERY",
-    "1605": "PUESTO ESTANCIA BELLA ITALIA",
-    "1606": "PUESTO RANCHO DEL MEDIO",
-    "1607": "SAN MAURICIO",
-    "1608": "SAN MIGUEL (MUNICIPIO)",
-    "1609": "SAN PEDRO",
-    "1610": "SAN ROQUE",
-    "1611": "YSYPO",
-    "1612": "SAN PATRICIO",
-    "1613": "ARROCERA ISLA GUAZU",
-    "1614": "ESTANCIA ISLA TIMBO",
-    "1615": "SANTO ANGEL",
-    "1616": "ÑACUTI",
-    "6264": "SAN PATRICIO (MUNICIPIO)",
-    "1617": "SANTIAGO",
-    "1618": "CAAGUAZU",
-    "1619": "CAAGUY PO I",
-    "1620": "CAAGUY GUAZU",
-    "1621": "POTRERO YBATE",
-    "1622": "SAN ANTONIO",
-    "1623": "SAN FELIPE",
-    "1624": "SAN RAMON",
-    "1625": "SANTIAGO (MUNICIPIO)",
-    "1626": "TAMBORY",
-    "6265": "CONCEPCION",
-    "6266": "SANTA TERESITA",
-    "801": "SAN FERNANDO",
-    "802": "SAN GERONIMO",
-    "803": "SANTA MARIA (MUNICIPIO)",
-    "804": "TRINIDAD CUE",
-    "805": "YACAREY MI",
-    "806": "ZANJA CORA",
-    "1627": "SANTA MARIA",
-    "1628": "ARROYO CARE",
-    "1629": "CERRO COSTA",
-    "1630": "ESTANCIA ARNOL CUE",
-    "1631": "ESTANCIA CA'A CORA",
-    "1632": "ESTANCIA CAPURRO",
-    "1633": "ESTANCIA MARIA HORTENCIA",
-    "1634": "ESTANCIA RAMIREZ CUE",
-    "1635": "ESTANCIA SAN BORJA",
-    "1636": "ESTANCIA TORORO 1A.",
-    "1637": "ESTANCIA TORORO 2A.",
-    "1638": "ESTANCIA LA ARMONIA",
-    "1639": "ITACURUBI",
-    "1640": "PARACAU",
-    "1641": "PUERTO ROAS CUE",
-    "1642": "SAN ANTONIO",
-    "6210": "SAN JUAN BERGMAN",
-    "6267": "CURUPAYTY",
-    "6268": "ESTANCIA FERLONI",
-    "6269": "ESTANCIA V.ALEGRE",
-    "807": "SANTA ROSA",
-    "808": "BARRIO SAN JOSE",
-    "809": "CERRO COSTA",
-    "810": "COL.E ACEVEDO",
-    "811": "COL.POTRERO GUAZU",
-    "812": "ESTANCIA CAA TYGUE",
-    "813": "ESTANCIA ISLA ALTA",
-    "814": "ESTANCIA ISLA CHAJHA",
-    "815": "ESTANCIA JHUGUA GUAZU",
-    "816": "ESTANCIA JHUGUA POI",
-    "817": "ESTANCIA LA NEGRA",
-    "818": "ESTANCIA SAN GABRIEL",
-    "819": "ESTANCIA SAN JOSE",
-    "820": "ESTANCIA SAN TADEO",
-    "821": "ESTANCIA SANTA",
-    "822": "ESTANCIA SEGOVIA",
-    "823": "ITA JHUGUA",
-    "824": "POTRERO ALTO",
-    "825": "POTRERO MBYYUI",
-    "826": "POTRERO SAN ANTONIO",
-    "827": "PUESTO TOLEDO CUE",
-    "828": "SAN FRANCISCO CUE",
-    "829": "SAN GABRIEL",
-    "830": "SAN JOSE",
-    "831": "SAN RAFAEL",
-    "2633": "SAN SOLANO",
-    "2634": "SANTA CRUZ",
-    "2635": "SANTA ELENA",
-    "2636": "SANTA ROSA (MUNICIPIO)",
-    "3873": "YACAREY",
-    "3874": "YPUCU",
-    "3875": "ZAPATERO CUE",
-    "6211": "BARRIO CRISTO REY",
-    "6212": "ESTANCIA CONCEPCION",
-    "6213": "ESTANCIA MARTA ESTHER",
-    "6214": "ESTANCIA VANNI",
-    "6215": "SAN FRANCISCO",
-    "3876": "VILLA FLORIDA",
-    "3877": "ESTANCIA CENTU CUE",
-    "3878": "ESTANCIA SAN AGUSTIN",
-    "3879": "MATOS CUE",
-    "3880": "PUERTO PARAISO",
-    "3881": "VILLA FLORIDA (MUNICIPIO)",
-    "3882": "YABEBYRY",
-    "3883": "BOULES (ISLA MBURUCUYA",
-    "3884": "GALEANO CUE",
-    "3885": "GUARDIA CUE",
-    "3886": "POTRERO FORTUNA",
-    "3887": "RORY POTRERO",
-    "3888": "YABEBYRY (MUNICIPIO)",
-    "3889": "PARAGUARI",
-    "3890": "BARRIO ESTACION",
-    "3891": "BARRIO OESTE",
-    "3892": "CALLE",
-    "3893": "CERRO LEON",
-    "3894": "CHOLOLO",
-    "3895": "CHOLOLO Y",
-    "3896": "COSTA 1A.Y 2A.",
-    "3897": "ESTANCIA ALFONSO XIII",
-    "3898": "ESTANCIA ARCA DE NOE",
-    "3899": "ESTANCIA CNEL.MARTINEZ",
-    "3900": "ESTANCIA DELIA CLARA",
-    "3901": "ESTANCIA HERRERA",
-    "3902": "ESTANCIA LA NORMA",
-    "3903": "ESTANCIA MARIA AUXIADORA",
-    "3904": "ESTANCIA PARAISO",
-    "3905": "ESTANCIA PRIMAVERA",
-    "3906": "ESTANCIA NARANJA JHAI",
-    "3907": "ESTANCIA SAN ANDRES",
-    "3908": "GUARNICION MILITAR",
-    "3909": "MBATOVI",
-    "3910": "PARAGUARI (MUNICIPIO)",
-    "3911": "PUERTO REAL",
-    "3912": "PUESTO SALINAS",
-    "3913": "SOTE",
-    "5772": "ESTANCIA LAS ROSAS",
-    "5773": "JORGE LOPEZ MOREIRA",
-    "3914": "ARROYO VERDE",
-    "3915": "BARRIO 15 DE AGOSTO 1A.",
-    "3916": "BARRIO 15 DE AGOSTO 2A.",
-    "3917": "BARRIO M.CARD",
-    "3918": "BARRIO SAN BLAS",
-    "3919": "CARAGUATAY",
-    "3920": "CARAGUATAY MI",
-    "3921": "CERRO GUY",
-    "3922": "COSTA BAEZ CAAGUY",
-    "3923": "COSTA BAEZ YUKYTY",
-    "3924": "COSTA PEÑA",
-    "3925": "ESTACION BUENA VISTA",
-    "3926": "ISLERIA",
-    "3927": "LAGUNA PYTA",
-    "3928": "PINTO",
-    "3929": "POTRERO ARCE",
-    "3930": "RINCON",
-    "3931": "SANJITA",
-    "3932": "TAPYTANGUA",
-    "3933": "VALOIS RIVAROLA",
-    "3934": "YAGUARIZO",
-    "3935": "ÑUHAI",
-    "5774": "ACAHAY",
-    "5775": "BARRIO N. BOGARIN",
-    "5776": "CERROI CUE",
-    "5777": "ISLA BAEZ",
-    "5778": "RECOLETA",
-    "5779": "YBYRAI TY",
-    "3936": "CAAPUCU",
-    "3937": "CAAPUCU (MUNICIPIO)",
-    "3938": "CAPILLA TUYA",
-    "3939": "CERRITO (M. POTRERO)",
-    "3940": "CERRO GUY (M.POTRERO)",
-    "3941": "CHARARA",
-    "3942": "COL.CNEL MONGELOS",
-    "3943": "ESTANCIA BARRERITO",
-    "3944": "ESTANCIA BRUYN",
-    "3945": "ESTANCIA CONGO I",
-    "3946": "ESTANCIA DA SILVA",
-    "3947": "ESTANCIA MARTINEZ Y OTRO",
-    "3948": "ESTANCIA RAMIREZ",
-    "5082": "ESTANCIA SANTA TERESA",
-    "5083": "ISLERIA",
-    "5084": "ITAPE",
-    "5085": "MANUELA CUE",
-    "5086": "MBOI CUATIA",
-    "5087": "PUEBLO JIMENEZ",
-    "5088": "PUESTO SANTA GERTRUDIS",
-    "5089": "PUESTO ARROYITO (LISBIGE)",
-    "5090": "PUESTO CONGO GUAZU",
-    "5091": "PUESTO LATA",
-    "5092": "RETIRO ISLA ITA (M.P.)",
-    "5093": "TAPE GUAZU",
-    "5094": "YAGUARETE CUA",
-    "5095": "YERE",
-    "5096": "YPUCU",
-    "5780": "CAMALOTE (M.POTRERO)",
-    "5781": "COSTA POI (M.POTRERO)",
-    "5782": "ESTANCIA ROMERO",
-    "5097": "CABALLERO",
-    "5098": "CABALLERO (MUNICIPIO)",
-    "5099": "CATALAN",
-    "5100": "CERRO ÑU",
-    "5101": "CHAURIA",
-    "5102": "COSTA JHU",
-    "5103": "COSTA PUCU",
-    "5104": "FRANCO I",
-    "5105": "FRANCO ÑU",
-    "5106": "GUAVIRA",
-    "5107": "HORQUETA",
-    "5108": "IRIARTE",
-    "5109": "IRIARTE 2A.",
-    "5110": "ISLA SEGURA",
-    "5111": "ISLA SEGURA 2A.",
-    "5112": "LINDERO",
-    "5113": "LOMA PYTA",
-    "5114": "PIRAYUBY",
-    "5115": "POTRERO NARANJA TY",
-    "5116": "POTRERO PUCU",
-    "5117": "POTRERO YBATE",
-    "5118": "PUERTO FRUTOS",
-    "5119": "RETIRO LA HERRADURA",
-    "5120": "SAN ANTONIO",
-    "5121": "SAN CRISTOBAL",
-    "5122": "TTE. MARTINEZ",
-    "5123": "ZORRILLA CUE",
-    "5124": "CARAPEGUA",
-    "5125": "AGUAI Y",
-    "5126": "BARRIO MCAL.LOPEZ",
-    "5127": "BARRIO STO.DOMINGO",
-    "5128": "BENI LOMA",
-    "5129": "CAAZAPA",
-    "5130": "CALIXTRO",
-    "5131": "CARAPEGUA (MUNICIPIO)",
-    "5132": "CASA YBATE",
-    "5133": "CAÑETE CUE",
-    "5134": "CERRITO",
-    "5135": "ESPARTILLAR",
-    "5136": "FRANCO ISLA",
-    "5137": "ISLA YBATE",
-    "5138": "NDABARU",
-    "5139": "PACHECO",
-    "5140": "POTRERO",
-    "5141": "TAYY LOMA",
-    "5142": "LA COLMENA",
-    "5143": "BARRERO AZUL",
-    "5144": "CERRITO",
-    "5145": "FATIMA",
-    "5146": "KAATYMI",
-    "5147": "LA COLMENA (MUNICIPIO)",
-    "5148": "MBOCAYATY",
-    "5149": "PINDOTY",
-    "5150": "POTRERO ALTO",
-    "5151": "RORY",
-    "5152": "SOL NACIENTE",
-    "5153": "YAHAPETY",
-    "5154": "YBYRA PEPE",
-    "5155": "YBAROTY",
-    "5156": "ESCOBAR",
-    "5157": "ARROYO PORA",
-    "5158": "CERRO CUPE",
-    "5159": "CHIRCAL",
-    "5160": "ESCOBAR (MUNICIPIO)",
-    "5161": "ESTANCIA ABELENDA",
-    "5162": "ESTANCIA ALONSO",
-    "5163": "ESTANCIA CERRITO",
-    "5164": "ESTANCIA MEDINA",
-    "5165": "ESTANCIA TOÑANEZ",
-    "5166": "GRAL.AQUINO",
-    "5167": "GUAZU CUA",
-    "5168": "MBOCAYATY",
-    "5169": "MBOPI CUA",
-    "5170": "POTRERO",
-    "5171": "RETIRO FRANCIA CUE",
-    "5172": "YBYRATY",
-    "5173": "YPAU",
-    "5174": "MBUYAPEY",
-    "5175": "ARROYO COSTA",
-    "5176": "BOQUERON",
-    "5177": "CERRITO",
-    "5178": "COSTA CAPILLA CUE",
-    "5179": "COSTA PUCU",
-    "5180": "CAAGUY GUAZU",
-    "5181": "ELIGIO AYALA",
-    "5182": "ESTACION LOMITA",
-    "5183": "ESTANCIA ZAPUTOVICH",
-    "5184": "GUAVIRA",
-    "5185": "ISLA ALTA",
-    "5186": "KIMITA",
-    "5187": "LA BARU",
-    "5188": "LA ROSA",
-    "5189": "LOMA GUAZU",
-    "5190": "LOMA I",
-    "5191": "MBUYAPEY (MUNICIPIO)",
-    "5192": "PUERTO FELIPE",
-    "5193": "ROA RUGUA",
-    "5194": "SOLIS CUE",
-    "5195": "TUNA",
-    "5196": "ÑANDU RUA",
-    "5197": "ÑU AHI",
-    "5198": "ÑU APUA",
-    "5855": "ÑU APUA MI",
-    "5199": "PIRAYU",
-    "5200": "ARROYO SERVIN",
-    "5201": "ASCURRA",
-    "5202": "CAAGUY POTI",
-    "5203": "CERRO LEON",
-    "5204": "CERRO VERA",
-    "5205": "COSTA JHU",
-    "5206": "ESTACION CERRO LEON",
-    "5207": "PASO MALO",
-    "5208": "PIRAYU (MUNICIPIO)",
-    "5209": "POTRERO AVENDANA",
-    "5210": "PUESTO PALMEROLA",
-    "5211": "SANJA JHU",
-    "5212": "TUYU CUE",
-    "5213": "TUYU CUA COCUE",
-    "5214": "YAGUARON YURU",
-    "5215": "YCUA CAHU",
-    "5856": "CERRO CUPE",
-    "5857": "LAS MERCEDES",
-    "5858": "TABAI",
-    "5859": "YAGUARON YURU RUGUA",
-    "5216": "QUIINDY",
-    "5217": "ACHOTE I",
-    "5218": "BUENA VISTA",
-    "5219": "CALLEJON",
-    "5220": "CMTE.PERALTA",
-    "5221": "COCUERE",
-    "5222": "COSTA GAONA",
-    "5223": "COSTA IRALA",
-    "5224": "CURUCAU",
-    "5225": "ESTANCIA R.I.ACHOTEI",
-    "5226": "ESTANCIA EGUSQUIZA",
-    "5227": "ESTANCIA LUJAN",
-    "5228": "ESTANCIA MARIA JULIANA",
-    "5229": "ESTANCIA PROSPERIDAD",
-    "5230": "ESTANCIA SAN ANTONIO",
-    "5231": "ESTANCIA SAN GERONIMO",
-    "5232": "ESTANCIA SANJA JHU",
-    "5233": "ESTANCIA SILVA",
-    "5234": "ESTANCIA VARGAS",
-    "5235": "ESTANCIA VARGAS (OJEDA CUE)",
-    "5236": "FISCAL (ACHOTEI)",
-    "5237": "ISLA CUPE (ACHOTEI)",
-    "5238": "ITA CAJON",
-    "5239": "LOMA PYTA",
-    "5240": "QUIINDY MUNICIPIO",
-    "5241": "SAN LORENZO",
-    "5242": "VALLE APUA",
-    "5243": "TOBATY CUA",
-    "5860": "CAÑADA",
-    "5861": "COSTA JHU",
-    "5862": "ESTANCIA LAS MERCEDES",
-    "5863": "ESTANCIA SANTA ISABEL",
-    "5864": "LAUREL TY",
-    "5865": "TACUARY",
-    "5244": "ROQUE GONZALEZ",
-    "5245": "ARAZA TY",
-    "5246": "CERRITO",
-    "5247": "ESTANCIA CARANDAYTY",
-    "5248": "ESTANCIA CARAYA",
-    "5249": "ESTANCIA CARAYA RUGUA",
-    "5250": "ESTANCIA ISLA LEON",
-    "5251": "ESTANCIA MARTINEZ",
-    "5252": "ESTANCIA VARGAS",
-    "5253": "MATACHI",
-    "5254": "MBOCAYATY",
-    "5255": "MOQUETA",
-    "5256": "PORTILLO",
-    "5257": "POTRERO",
-    "5258": "PUESTO BERUJA",
-    "5259": "RINCON",
-    "5260": "ROQUE GONZALEZ (MUNICIPIO)",
-    "5261": "SIMBRON",
-    "5866": "CAÑADA",
-    "5262": "SAPUCAI",
-    "5263": "ARROYO PORA",
-    "5264": "BOLAS CUE",
-    "5265": "CERRO ROQUE",
-    "5266": "CERRO VERDE",
-    "5267": "CHIRCAL",
-    "5268": "COL.A. IRALA",
-    "5269": "COL.SANTA ISABEL",
-    "5270": "COSTA IRALA",
-    "5271": "LOMA",
-    "5272": "MBOCAYA",
-    "5273": "MBOPI CUA",
-    "5274": "POTRERO GUAYAIBI",
-    "5275": "POTRERO VILLALBA",
-    "5276": "SAPUCAI (MUNICIPIO)",
-    "5277": "YARIGUA-A",
-    "5278": "YBYRATY",
-    "5279": "YBYCUI",
-    "5280": "ARAZA TY",
-    "5281": "BARRIO SAN JOSE",
-    "5282": "BARRIO SAN LEON",
-    "5283": "BARRIO SAN MIGUEL",
-    "5284": "CAAGUY CUPE",
-    "5285": "CABALLERO PUNTA",
-    "5286": "CAPILLA LOMA",
-    "5287": "CAPILLITA",
-    "5288": "CARAGUATA RUA",
-    "5289": "CARAI MI",
-    "5290": "CARBON CUE",
-    "5291": "CERRO ACHON",
-    "5292": "CERRO CARAPE",
-    "5293": "CARRO CORA",
-    "5294": "CERRO SAUCE",
-    "5295": "COL. GOIBURU",
-    "5296": "CORDILLERA",
-    "5297": "COSTA",
-    "5298": "ENTRE RIOS",
-    "5299": "ESTANCIA BENITEZ",
-    "5300": "ISLA P.",
-    "5301": "MBOCARUZU",
-    "5302": "MBOCAYA PUCU",
-    "5303": "MBOPI CUA",
-    "5304": "MINAS CUE",
-    "5305": "NARANJA JHEENDY",
-    "5306": "PALACIOS CUE",
-    "5307": "PASO PARED",
-    "5308": "PASO PINDO",
-    "5309": "PEREIRA PEREIRA CUE",
-    "5310": "POTRERO ALTO",
-    "5311": "PUESTO LA VIRGEN DE LA PAZ",
-    "5312": "RINCON GUAZU",
-    "5313": "RINCON I",
-    "5314": "SANTA ANGELA",
-    "5315": "SANTA TERESITA",
-    "5316": "TACUAPITY",
-    "5317": "TACUARY",
-    "5318": "VARGAS LOMA",
-    "5319": "YATAITY",
-    "5320": "YBYCUI PUNTA",
-    "5321": "QUYQUYHO",
-    "5322": "CERRO FRENTE",
-    "5323": "CERRO GUY",
-    "5324": "COL.FULGENCIO YEGROS (COSTA)",
-    "5325": "COL.FULGENCIO YEGROS (LOMA)",
-    "5326": "COSTA OLAZAR",
-    "5327": "CURUZU LACU",
-    "5328": "ESPINILLAR",
-    "5329": "ESTANCIA BARRIOS",
-    "5330": "ESTANCIA ISLA PORA YAGUARY",
-    "5331": "ESTANCIA N.CANO DEBERNARDI",
-    "5332": "ESTANCIA NARANJITO",
-    "5333": "ESTANCIA YTORORO",
-    "5334": "GUAZU CORA",
-    "5335": "ISLA VALLE",
-    "5336": "LOMA GUAZU",
-    "5337": "MBOI CAE",
-    "5338": "PUERTO LIZZA",
-    "5339": "QUYQUYHO (MUNICIPIO)",
-    "5340": "SAN JOSE (IBAÑEZ)",
-    "5341": "SAN LUIS",
-    "5342": "YAGUARY",
-    "5343": "YBYTYMI",
-    "5344": "AÑAZCO",
-    "5345": "BARRIO ESTACION",
-    "5346": "BARRIO POTRERITO",
-    "5347": "CAÑADA",
-    "5348": "CERRO GUY",
-    "5349": "CERRO SAN ANTONIO",
-    "5350": "CHINI",
-    "5351": "COL. NESTOR L. VERA",
-    "5352": "ESTANCIA BASEDAU",
-    "5353": "ISLA",
-    "5354": "JHUGUA GUAZU",
-    "5355": "LOTE NUEVO",
-    "5356": "M.VARGAS CUE",
-    "5357": "MARTINEZ CUE",
-    "5358": "PINDOTY",
-    "5359": "POTRERITO",
-    "5360": "POTRERO GARAY",
-    "5361": "PUERTO MEZA",
-    "5362": "PUERTO OVIEDO",
-    "5363": "RINCON",
-    "5364": "RIVAROLAS CUE",
-    "5365": "SOLA ESCOBAR",
-    "5366": "YBYTYMI (MUNICIPIO)",
-    "5867": "TUCUMAN PARAGUAYO",
-    "5367": "TEBICUARY MI",
-    "5368": "CAPINARI",
-    "5369": "CHACRA SUR",
-    "5370": "LOMA PINDO",
-    "5371": "CAAGUY POTI",
-    "5372": "CALLE POI",
-    "5373": "CARAUGUA",
-    "5374": "CERRO GUY",
-    "5375": "ESTANCIA TALAVERA",
-    "5376": "GUARAPI",
-    "5377": "GUAYAIBI TY",
-    "5378": "ITA POTRERO",
-    "5379": "PEGUAJHO",
-    "5380": "PIRAYU CALLE",
-    "5381": "PORORO",
-    "5382": "POTRERO YBATE",
-    "5383": "PUESTO PRIMERA VISTA",
-    "5384": "PUESTO I",
-    "5385": "SAMBRONNI",
-    "5386": "TACUMBU",
-    "5387": "YAGUARON (MUNICIPIO)",
-    "5388": "ZAGUAZU",
-    "5389": "ZAYAS",
-    "5390": "ÑUATI JHUA POI",
-    "5391": "ÑUATI",
-    "5392": "ÑUATI CALLE",
-    "5868": "YAGUARON",
-    "5869": "CURUPAYTY",
-    "5870": "MBARITY",
-    "5871": "POTRERO",
-    "5872": "TACUARINDY",
-    "5873": "ÑANDUA",
-    "5874": "ÑUATI GUAZU",
-    "3298": "PUERTO STAMATO",
-    "3299": "PUERTO TACURUPUCU",
-    "3300": "PUERTO TRES TIMBO",
-    "3301": "RANCHO POTRERO",
-    "3302": "ROMERO CUE",
-    "3303": "SALVADORA",
-    "3304": "SAN ISIDRO",
-    "3305": "SAN JUAN RUGUA",
-    "3306": "SEGUNDA REPRESA TATI-YUPI",
-    "3307": "SOCORRO",
-    "3308": "TAPE PUCU GRAL.DIAZ",
-    "3309": "TATI YUPI",
-    "3310": "TATI YUPI (RESIDENCIAL)",
-    "3311": "VILLA SAN FRANCISCO",
-    "3312": "VIRGEN DE FATIMA",
-    "3313": "VIUDA CUE",
-    "3314": "YBYTU ROCAI",
-    "4605": "NUEVA ESPERANZA",
-    "5393": "HERNANDARIAS",
-    "5394": "COL. ACARAY",
-    "5395": "FAZENDA DE LICO",
-    "5396": "FORTUNA",
-    "5397": "GRAL.DIAZ (TAPYI)",
-    "5398": "GRANJA M. CRISTINA",
-    "5399": "GRANJA NUEVA COREA",
-    "5400": "HERNANDARIAS (MUNICIPIO)",
-    "5401": "HIDROELECTRICA ACARAY",
-    "5402": "KILOMETRO 10 GUARANI",
-    "5403": "KILOMETRO 16",
-    "5404": "KILOMETRO 2",
-    "5405": "KILOMETRO 20 SAN MANUEL",
-    "5406": "KILOMETRO 4",
-    "5407": "LINEA GRAL.DIAZ",
-    "5408": "MBARACA RUA",
-    "5409": "MBOI CUA",
-    "5410": "OCAMPO CUE",
-    "5411": "ORLANDO CUE",
-    "5412": "PALMITAL CELSO PARINI",
-    "5413": "PASO FALSO",
-    "5414": "PASO ITA",
-    "5415": "PATRIMONIO PARAGUAZIL",
-    "5416": "PENGO HERNANDARIAS (HERU)",
-    "5417": "PIKYRY",
-    "5418": "PIRA PYTA",
-    "5419": "PLANCHADA TALAVERA",
-    "5420": "PRIMERA REPRESA TATI-YUPI",
-    "5421": "PUERTO ARMITICIO",
-    "5422": "PUERTO CARMEN",
-    "5423": "PUERTO CURUPAYTY",
-    "5424": "PUERTO DORITA",
-    "5425": "PUERTO GRAL.DIAZ",
-    "5426": "PUERTO INDIO",
-    "5427": "PUERTO IRENE",
-    "5428": "PUERTO ITABO",
-    "5429": "PUERTO ITAIPYTE",
-    "5430": "PUERTO LAURA",
-    "5431": "PUERTO LIMOY",
-    "5432": "PUERTO PALMA",
-    "5433": "PUERTO SANTA TERESA",
-    "5434": "PUERTO SAUCE",
-    "5875": "FELIX DE AZARA",
-    "5876": "INDARTE CUE",
-    "5877": "KILOMETRO 3",
-    "5878": "MISION VERBO DIVINO",
-    "3315": "DOMINGO MARTINEZ DE IRALA",
-    "3316": "ANGELITO CUE",
-    "3317": "ARROYO GUAYAQUI",
-    "3318": "ASERRADERO YTUTI",
-    "3319": "BUENA VISTA",
-    "3320": "CAA YOBAI SUR",
-    "3321": "CAMPO ALEGRE",
-    "3322": "CAMPO MBOI",
-    "3323": "CAPILLA",
-    "3324": "CUCHU I",
-    "3325": "CUÑA PIRU",
-    "3326": "DOLORES",
-    "3327": "DOMINGO M.DE IRALA (MUNICIPIO)",
-    "3328": "ESTANCIA LAGARZA",
-    "3329": "FILE CUE",
-    "3330": "GUEMBE TY GUAZU",
-    "3331": "GUEMBETY",
-    "3332": "ITA PYTA",
-    "3333": "ITA VERA",
-    "3334": "KILOMETRO 11 - MAROMA",
-    "3335": "KILOMETRO 17 - DOLORES",
-    "3336": "KILOMETRO 19 - PARANAMBU",
-    "3337": "KILOMETRO 28 - PARANAMBU",
-    "3338": "KILOMETRO 6 - PUERTO FLORES",
-    "3339": "LOMA PYTA",
-    "3340": "LOS CEDRALES",
-    "3341": "MAROMA",
-    "3342": "PARANAMBU",
-    "3343": "PASO BABA",
-    "3344": "PASO ITA (INDIGENA)",
-    "3345": "PENINSULA",
-    "3346": "PUERTO 22 DE MAYO",
-    "3347": "PUERTO BERTONI",
-    "3348": "PUERTO DOLORES",
-    "3349": "PUERTO FLORES",
-    "3350": "PUERTO JIBAJA",
-    "3351": "PUERTO JIMENEZ",
-    "3352": "PUERTO MARGARITA",
-    "3353": "PUERTO MARTIN ORDOÑEZ",
-    "3354": "PUERTO PIRA PYTA MI",
-    "3355": "PUERTO SAB ANTONIO",
-    "3356": "PUERTO SAN PEDRO",
-    "3357": "PUERTO SARITA",
-    "3358": "PUERTO SIRENA",
-    "3359": "PUERTO TABUCAI",
-    "3360": "PUERTO YBAROTY",
-    "3361": "PUERTO YTUTI",
-    "3362": "PUESTO CUE (INDIGENA)",
-    "3363": "RELOJ CUE",
-    "3364": "SAN MIGUEL",
-    "3365": "SANTA LIBRADA",
-    "3366": "SAPIRE",
-    "3367": "TACUA PENDE",
-    "3368": "TOMAS CUE (INDIGENA)",
-    "3369": "VILLA SAN FRANCISCO",
-    "3370": "YBAROTY",
-    "3371": "ÑACUNDAY",
-    "3372": "ISLA PARANAMBU",
-    "3373": "ITAIPYTE",
-    "3374": "LOMA VALENTINA",
-    "3375": "OBRAJE BARRA",
-    "3376": "PARANA I",
-    "3377": "PUERTO PARANAMBU",
-    "3378": "SAN ALFREDO",
-    "3379": "TORO CUA",
-    "3380": "TORO CUA I",
-    "3381": "YARARA",
-    "3382": "ÑACUNDAY (MUNICIPIO)",
-    "3383": "CIUDAD DEL ESTE",
-    "3384": "2A. REPRESA YGUAZU",
-    "3385": "5A.REGION MILITAR",
-    "3386": "AMAMBAY",
-    "3387": "ARROYO MBY'A",
-    "3388": "ARROYO MBY'A C-4",
-    "3389": "BARRIO OBRERO",
-    "3390": "CALLE 10 ACARAY",
-    "3391": "CALLE 10 MONDAY",
-    "3392": "CALLE 12 ACARAY",
-    "3393": "CALLE 12 MONDAY",
-    "3394": "CALLE 14 ACARAY",
-    "3395": "CALLE 14 MONDAY",
-    "3396": "CALLE 16 ACARAY (RURAL)",
-    "3397": "CALLE 16 MONDAY (URBANA)",
-    "3398": "CALLE 18 ACARAY",
-    "3399": "CALLE 18 MONDAY",
-    "3400": "CALLE 20 ACARAY",
-    "3401": "CALLE 20 MONDAY",
-    "3402": "CALLE 22 ACARAY",
-    "3403": "CALLE 24 ACARAY",
-    "3404": "CALLE 24 MONDAY",
-    "3405": "CALLE 26 ACARAY",
-    "3406": "CALLE 26 MONDAY",
-    "3407": "CALLE 28 ACARAY",
-    "3408": "CALLE 30 ACARAY",
-    "3409": "CALLE 30 MONDAY",
-    "3410": "CALLE 8 MONDAY",
-    "3411": "CALLE 9 ACARAY",
-    "3412": "CALLE MONDAY",
-    "3413": "CAMINO 1",
-    "3414": "CAMINO 15",
-    "3415": "CAMINO 19",
-    "3416": "CAMINO 2",
-    "3417": "CAMINO 6",
-    "3418": "CAMINO 61",
-    "3419": "COL.YGUAZU (URBANA)",
-    "3420": "DON BOSCO",
-    "3421": "FELIX DE AZARA I",
-    "3422": "KILOMETRO 31 MBUTUY",
-    "3423": "KILOMETRO 39 YGUAZU",
-    "3424": "KILOMETRO 5 (R.I.)",
-    "3425": "LOMA PIRO Y",
-    "3426": "MARIO CUE",
-    "3427": "PENGO STROESSNER",
-    "3428": "CIUDAD DEL ESTE(PLANTA URBANA)",
-    "3429": "PUERTO ESPERANZA",
-    "3430": "PUERTO LEGUIZA",
-    "3431": "PUERTO PTE. FRANCO",
-    "3432": "PUERTO PTE.STROESSNER (MUNIC)",
-    "3433": "SAN RAFAEL",
-    "3434": "SANTA TERESITA",
-    "6379": "CALLE 22 MONDAY",
-    "6380": "CALLE 28 MONDAY",
-    "6381": "CALLE 9 MONDAY",
-    "6382": "CAMINO 4",
-    "6383": "FLOR DE LIZ",
-    "6384": "KILOMETRO 6 MONDAY",
-    "6385": "PUERTO LEGUIZAMON",
-    "6386": "VILLA 23 DE OCTUBRE",
-    "3435": "JUAN LEON MALLORQUIN",
-    "3436": "3 DE MAYO",
-    "3437": "8 DE DICIEMBRE",
-    "3438": "AHOYU",
-    "3439": "ASERRADERO MONDAY",
-    "3440": "CAMINO 20",
-    "3441": "CAMINO 23",
-    "3442": "CARANDAYTY",
-    "3443": "COL. JUAN L. MALLORQUIN",
-    "3444": "JHYECUE YERE",
-    "3445": "LA VICTORIA-MONDAY",
-    "3446": "LA VICTORIA YGUAZU",
-    "3447": "LOMA TAVY",
-    "3448": "PUESTO LEGUIZA",
-    "3449": "PUESTO SAN LUIS",
-    "3450": "ROJAS SILVA",
-    "3451": "SAN MIGUEL",
-    "3452": "SAN VICENTE",
-    "3453": "SANTO DOMINGO",
-    "3454": "SANTO DOMINGO I",
-    "3455": "TATA RE",
-    "3456": "VENECIA",
-    "3457": "VENECIA GUAZU",
-    "3458": "VENECIA I",
-    "3459": "Y JHOVY",
-    "3460": "YUQUERI",
-    "5744": "JUAN L.MALLORQUIN CAARENDY.MUN",
-    "6387": "CAARENDY GUAZU",
-    "3461": "ITAQUYRY",
-    "3462": "AGUA-PE",
-    "3463": "AGUADA",
-    "3464": "AGUARA",
-    "3465": "ARAUJO -CUE",
-    "3466": "ARROYO 1A.",
-    "3467": "ARROYO CARUMBEY",
-    "3468": "ARROYO DOS HERMANAS",
-    "3469": "ARROYO GRACIELA",
-    "3470": "ARROYO MARCELINA",
-    "3471": "ARROYO MOROTI",
-    "3472": "ARROYO YARARA",
-    "3473": "BARRO NEGRO",
-    "3474": "BOCA ARROYO ITAQUYRY",
-    "3475": "CAAGUAZU",
-    "3476": "CACIQUE",
-    "3477": "CACIQUE TUYA",
-    "3478": "CAMPO LIMPIO",
-    "3479": "CAMPO REDONDO",
-    "3480": "CAPIIBARY",
-    "3481": "PUESTO YBYRA PIRU",
-    "3482": "RANCHO DORITA",
-    "3483": "RANCHO GUAYAKI",
-    "3484": "ROBLEDO CUE",
-    "3485": "ROLON CUE",
-    "3486": "SAN JUAN (EX 3A.)",
-    "3487": "SANTA TERESA (EX JHUGUAI)",
-    "3488": "SECADERO KILOMETRO 3",
-    "3489": "TACUARA",
-    "3490": "TATU PIRE",
-    "3491": "TORORO",
-    "3492": "TUNA",
-    "3493": "TUNI CUE",
-    "3494": "VILLAR CUE",
-    "3495": "YAGUARETE CANGUE",
-    "3496": "YAGUARETE MANSO",
-    "3497": "YAGUATIYMI",
-    "3498": "YAJHAPE",
-    "3499": "YAIBE CUE",
-    "3500": "YARARA",
-    "3501": "YATE I",
-    "3502": "YAYBERE CUE",
-    "3503": "Y B U",
-    "3504": "Y T U",
-    "3505": "ZANJA JHU",
-    "3506": "ZONA GRAL.DIAZ",
-    "3507": "JUAN E.O'LEARY",
-    "3508": "BARRIO MARIA AUXILIADORA",
-    "3509": "BARRIO VIRGEN DEL ROSARIO",
-    "3510": "CA'A YOVAI",
-    "3511": "COSTA GUAZU",
-    "3512": "J.E.O'LEARY CHEIRO CUE(MUNIC.)",
-    "3513": "PUESTO LEGUIZA",
-    "3514": "SAN AGUSTIN",
-    "3515": "SAN FRANCISCO",
-    "3516": "SAN ISIDRO",
-    "3517": "SAN PABLO",
-    "3518": "TACUARO",
-    "3519": "TOCAI",
-    "3520": "VILLA LAS MERCEDES",
-    "3521": "PRESIDENTE FRANCO",
-    "3522": "ARROYO ITA COTY",
-    "3523": "ARROYO SALTITO",
-    "3524": "ARROYO YACARE",
-    "3525": "BARRIO SAN MIGUEL",
-    "3526": "CAPILLA SANTA INES",
-    "3527": "CORAZON DE JESUS",
-    "3528": "ESCUELA",
-    "3529": "PENINSULA",
-    "3530": "PTO.BERTONI",
-    "3531": "PTO.FLORES",
-    "3532": "PTO.GIMENEZ",
-    "3533": "PTO.ORDONEZ",
-    "3534": "TRES FRONTERAS",
-    "3535": "YGUAZU",
-    "3536": "COL.YGUAZU",
-    "3537": "COLONIA",
-    "3538": "MUNICIPIO",
-    "3539": "NUEVA  ESPERANZA",
-    "3540": "SAN CRISTOBAL",
-    "3541": "CAMPO ALEGRE",
-    "3542": "COL.SAN ANTONIO",
-    "3543": "COLONIA",
-    "3544": "CRUCE SAPIRE",
-    "3545": "CURUZU",
-    "3546": "KILOMETRO 56",
-    "3547": "LA ESPERANZA",
-    "3548": "MUNICIPIO",
-    "3549": "PALMITAL",
-    "3550": "PTO.CA'A YOBAI",
-    "3551": "PTO.SAN MIGUEL",
-    "3552": "SAN MIGUEL",
-    "3553": "SAPIRE",
-    "3554": "TATU CUA",
-    "3555": "TUYUTI",
-    "3556": "SANTA RITA",
-    "5734": "CURUPAYTY",
-    "5735": "JOEL ESTIGARRIBIA",
-    "5736": "PATRICIO COLMAN",
-    "5737": "SANTA LUCIA",
-    "3557": "MINGA GUAZU",
-    "5695": "LOS CEDRALES",
-    "5716": "CIA. ITA",
-    "5717": "PUERTO 22 DE MAYO",
-    "5896": "CIA. YTUTI",
-    "5692": "SAN ALBERTO",
-    "5742": "AGROPECO",
-    "5743": "SILO",
-    "5696": "MINGA PORA",
-    "5718": "COL. SANTA MARIA",
-    "5719": "COL. SAN FRANCISCO",
-    "5720": "SAN RAMON",
-    "5694": "NARANJAL",
-    "5741": "PALMITAL",
-    "5902": "3 DE MAYO",
-    "5693": "TAVAPY",
-    "5738": "TAVAPY II",
-    "5739": "TAVAPY III",
-    "5740": "TAVAPY IV",
-    "5901": "TAVAPY I",
-    "6421": "SANTA ROSA DEL MONDAY NORTE",
-    "6422": "SANTA ROSA DEL MONDAY SUR",
-    "5699": "COLONIA IRUÑA",
-    "5724": "CONSUELO",
-    "5725": "JUAN PABLO II",
-    "5726": "SAN CARLOS",
-    "5727": "SAN JOSE",
-    "5728": "SAN ROQUE",
-    "5729": "SAN JUAN",
-    "5730": "SAN PEDRO",
-    "5731": "SAN MIGUEL",
-    "5732": "SANTA LUCIA",
-    "5733": "SAN MARCOS",
-    "5898": "DOS HERMANOS",
-    "5899": "SANTA TERESITA",
-    "5900": "PARINVEST",
-    "5697": "MBARACAYU",
-    "5721": "CIA. CABAYU",
-    "5722": "CIA. GRAL. DIAZ",
-    "5723": "CIA. ITALO",
-    "5897": "BARRIO BLANCO",
-    "4604": "SANTA FE DEL PARANA",
-    "5497": "NUEVA ESPERANZA",
-    "3558": "AREGUA",
-    "3559": "AREGUA (MUNICIPIO)",
-    "3560": "CAACUPE MI",
-    "3561": "COCUE GUAZU 1A.",
-    "3562": "COCUE GUAZU 2A",
-    "3563": "ESTACION YUQUYRY",
-    "3564": "ESTANZUELA",
-    "3565": "ISLA VALLE",
-    "3566": "PINDOLO",
-    "3567": "VALLE PUCU",
-    "5745": "COSTA FLEITAS",
-    "5746": "YUQUYTY",
-    "3568": "CAPIATA",
-    "3569": "ALDANA CAÑADA",
-    "3570": "COSTA SALINAS",
-    "3571": "COLONIA MILITAR",
-    "3572": "COMPAÑIA 14",
-    "3573": "COMPAÑIA 15",
-    "3574": "COSTA POI",
-    "3575": "LOMA BARRETO",
-    "3576": "NARANJA TY",
-    "3577": "POSTA YBYCUA",
-    "3578": "YBYCUA",
-    "3579": "ROJAS CAÑADA",
-    "3580": "SALINARES",
-    "3581": "TOLEDO CAÑADA",
-    "3582": "YBYRARO 2A.",
-    "3583": "YBYRARO 4A.",
-    "3584": "YATAITY",
-    "3585": "YUQUYRY",
-    "5747": "CAÑADITA",
-    "5748": "LAURELTY",
-    "5749": "POSTA YBYRARO",
-    "5750": "YBYRARO 3A.",
-    "5044": "FERNANDO DE LA MORA",
-    "5045": "4 VIENTOS",
-    "5046": "CALLE PUCU",
-    "5047": "CALLE ULTIMA",
-    "5048": "CAPIIPERY",
-    "5049": "COCUE GUAZU",
-    "5050": "GRAL.CABALLERO",
-    "5051": "LAGUNA GRANDE",
-    "5052": "ORILLA DEL CAMPO GRANDE",
-    "5053": "PITIANTUTA",
-    "5846": "BARRIO STA.MARIA",
-    "5847": "ITA CAAGUY",
-    "5054": "GUARAMBARE",
-    "5055": "CAYGUA",
-    "5056": "RINCON LOMA",
-    "5057": "TYPYCHATY",
-    "5058": "TYPYRATY",
-    "5848": "RINCON",
-    "5059": "ARAÑA 1",
-    "5060": "AVEIRO",
-    "5061": "BARRIO PARANAMBU",
-    "5062": "CAAGUAZU (TAVY YOVAI)",
-    "5063": "CALLE YVATE",
-    "5064": "CARAGUATAITY",
-    "5065": "CURUPICAYTY 1A.",
-    "5066": "CURUPICAYTY",
-    "5067": "ITA POTRERO",
-    "5068": "LAS PIEDRAS 1A.",
-    "5069": "LAS PIEDRAS 2A.",
-    "5070": "OCULTO",
-    "5071": "POSTA GAONA",
-    "5072": "POSTA GAONA 1A.",
-    "5073": "POTRERO POI",
-    "5074": "POTRERO POI 2A.",
-    "5075": "Y JHOVY 2A.",
-    "5076": "YAGUA ÑARO",
-    "5077": "YAGUA ÑARO 1A.",
-    "5849": "ITA",
-    "5850": "CAAGUZU",
-    "5851": "CHIRCATY (AVEIRO)",
-    "5852": "PEGUAJHO",
-    "5853": "Y JHOVY",
-    "5078": "ALDANA CAÑADA",
-    "5079": "ALDANA CAÑADA 2A.",
-    "5080": "ARROYO ESTRELLA",
-    "5081": "CAÑADITA",
-    "5854": "ITAUGUA",
-    "5914": "CERRITO",
-    "5915": "ESTANZUELA",
-    "5916": "GUAYAYVITY",
-    "5917": "GUAZU VIRA",
-    "5918": "ITAUGUA GUAZU",
-    "5919": "ITAUGUA GUAZU 1A.",
-    "5920": "JHUGUA JHU",
-    "5921": "JHUGUA POTI",
-    "5922": "MBOI Y",
-    "5923": "MBOCAYATY DEL NORTE",
-    "5924": "MBOCAYATY DEL SUR",
-    "5925": "PATIÑO",
-    "5926": "POTRERO",
-    "5927": "POTRERO GUAZU",
-    "5928": "PUENTE",
-    "5929": "PUENTE ALEGRE",
-    "5930": "VALLE CARE",
-    "5931": "VILLA ALTA",
-    "5932": "YBYRA TY",
-    "5933": "ÑU POI",
-    "5934": "LIMPIO",
-    "5935": "AGUAPEY",
-    "5936": "COL.J.DE ZALAZAR",
-    "5937": "COSTA I",
-    "5938": "ISLA ARANDA",
-    "5939": "ISLA AVEIRO",
-    "5940": "LIMPIO (MUNICIPIO)",
-    "5941": "MBAYU'E",
-    "5942": "MONTAÑA ALTA",
-    "5943": "PIQUETE CUE",
-    "5944": "RINCON DEL PEÑON",
-    "5945": "SALADO 1",
-    "5946": "LUQUE",
-    "5947": "AGUAPEY",
-    "5948": "AEROPUERTO",
-    "5949": "CAMPO GRANDE",
-    "5950": "CIA.AGUADEY",
-    "5951": "CIA.COSTA RUGUA",
-    "5952": "CIA.DIAZ MARIN CAAGUY",
-    "5953": "CIA.ITA ANGUA",
-    "5954": "CIA.ISLA ARANDA",
-    "5955": "CIA.ISLA BOGADO",
-    "5956": "CIA.MACA'I",
-    "5957": "CIA.SAN RAFAEL",
-    "5958": "CIA.SAN ROQUE",
-    "5959": "CIA.TARUMANDY",
-    "5960": "CIA.Y CA'A",
-    "5961": "CIA.YCUA CARANDAY",
-    "5962": "JHUGUA DE SEDA",
-    "5963": "LAURELTY",
-    "5964": "ZARATE ISLA",
-    "5965": "MARIANO ROQUE ALONSO",
-    "5966": "ARECAYA (MUNICIPIO)",
-    "5967": "CAAGUY CUPE",
-    "5968": "CORUMBA CUE (MUNICIPIO)",
-    "5969": "LA INMACULADA",
-    "5970": "MARIANO R.ALONSO (MUNICIPIO)",
-    "5971": "ROJAS CUE (MUNICIPIO)",
-    "5972": "ROJAS CUE 2A.(MUNICIPIO)",
-    "5973": "SAN BLAS (MUNICIPIO)",
-    "5974": "SAN RAMON (MUNICIPIO)",
-    "5975": "ÑEMBY",
-    "5976": "ARROYO SECO",
-    "5977": "CERRO ÑEMBY",
-    "5978": "CIA.RINCON",
-    "5979": "PA'I ÑU",
-    "5980": "NUEVA ITALIA",
-    "5981": "BARRIO LAS MERCEDES",
-    "5982": "BARRIO SAN ANTONIO",
-    "5983": "BARRIO SAN LORENZO",
-    "5984": "BARRIO SAN ROQUE",
-    "5985": "CALLE 1A.TACUARAS",
-    "5986": "CALLE 2A.TACUARAS",
-    "5987": "CALLE 3",
-    "5988": "CALLE 3A.TACUARAS",
-    "5989": "CALLE 4",
-    "5990": "CALLE 4A.TACUARAS",
-    "5991": "CALLE 5",
-    "5992": "CALLE 5A.TACUARAS",
-    "5993": "CALLE 6",
-    "5994": "CALLE 8",
-    "5995": "CALLE CORAZON DE JESUS",
-    "5996": "CERRO PE (ISLA GUAVIRA)",
-    "5997": "ESTANCIA CASTOR CUE",
-    "5998": "ISLA GUAVIRA",
-    "5999": "NUEVA ITALIA (MUNICIPIO)",
-    "6000": "SAN ANTONIO",
-    "6001": "SANTA LIBRADA",
-    "6002": "SANTA ROSA",
-    "6003": "SAN ANTONIO",
-    "6004": "ACHUCARRO MUNICIPIO",
-    "6005": "BANCO SAN ANTONIO (MUNICIPIO)",
-    "6006": "MBOCAYATY (MUNICIPIO)",
-    "6007": "OLMEDO (MUNICIPIO)",
-    "6008": "SAN ANTONIO (MUNICIPIO)",
-    "6009": "SAN ANTONIO I (MUNICIPIO)",
-    "5903": "KILOMETRO 9",
-    "5904": "ORILLA DEL CAMPO GRANDE",
-    "5905": "SAN ISIDRO",
-    "5906": "TAYASUAPE",
-    "5907": "YSATY",
-    "6010": "SAN LORENZO",
-    "6011": "ARECO PAU",
-    "6012": "BAJADA CUE",
-    "6013": "BARCEQUILLO",
-    "6014": "BARRIO DOROTEA C. CAMPOS",
-    "6015": "BOGADO",
-    "6016": "CAMPAMENTO",
-    "6017": "CAMPO GRANDE",
-    "6018": "CAMPO CERVERA",
-    "6019": "CAPELLANIA",
-    "6020": "CAPI'I PE RY",
-    "6021": "CAPILLA CUE",
-    "6022": "CAÑADA LAGUNA GRANDE",
-    "6023": "CAÑADA SOLINS Y OTROS",
-    "6024": "COCUERE",
-    "6025": "COLEGIO",
-    "6026": "CIA.DE LAS TRES LAGUNAS",
-    "6027": "CORDILLERITA",
-    "6028": "CURUZU MBOCAYA",
-    "6029": "LAUREL GRANDE",
-    "6030": "LAGUNA MBOIJHAPY",
-    "6031": "LAURELTY",
-    "6032": "LOMA",
-    "6033": "ORILLA DEL PUERTO",
-    "6034": "POTRERO POI",
-    "6035": "RECLUTA",
-    "6036": "REDUCTO",
-    "6037": "RINCON",
-    "6038": "SAN ANTONIO",
-    "6039": "SAN JOSE",
-    "6040": "SAN LORENZO (MUNICIPIO)",
-    "6041": "SAN MIGUEL",
-    "6042": "SUBURBIO",
-    "6043": "YATAITY",
-    "6044": "YBAPURUNDY",
-    "6045": "YCUA POI",
-    "6046": "YPE YCUA",
-    "6047": "ZABALAS CUE",
-    "6048": "ZANGUINA GRANDE",
-    "5908": "ARROYO SECO (MUNICIPIO)",
-    "6049": "VILLA ELISA",
-    "6050": "CALLE ULTIMA (MUNICIPIO)",
-    "6051": "MBOCAYATY (MUNICIPIO)",
-    "6052": "PICADA (MUNICIPIO)",
-    "6053": "REMANSO (MUNCIPIO)",
-    "6054": "VILLA ELISA (MUNCIPIO)",
-    "6055": "YPATI (MUNICIPIO)",
-    "5909": "VILLETA",
-    "5910": "BUEY RODEO",
-    "5911": "GUAZU CORA",
-    "5912": "PUERTO ANGOSTURA",
-    "5913": "SURUBI Y",
-    "6056": "AVAY",
-    "6057": "BANCO LOBATO",
-    "6058": "BANCO SANTA ROSA",
-    "6059": "TACUATY RUGUA",
-    "6060": "TACURY TY",
-    "6061": "CUMBARITY",
-    "6062": "ESTANCIA GUYRA TI",
-    "6063": "ITA YBATE",
-    "6064": "ITA YBATE 1A.",
-    "6065": "LOMA PERO",
-    "6066": "LOMAS VALENTINA",
-    "6067": "PUERTO GUYRA TI",
-    "6068": "PUERTO SANTA ROSA",
-    "6069": "PUERTO SARA",
-    "6070": "RETIRO CAMALOTAL",
-    "6071": "SANJA PYTA",
-    "6072": "SENDA",
-    "6073": "TACUATY",
-    "6074": "VILLETA (MUNICIPIO)",
-    "6075": "YPE CU",
-    "6076": "YPACARAI",
-    "6077": "ARROYO ESTRELLA",
-    "6078": "ARROYO Y PUCU",
-    "6079": "CERRO GUY",
-    "6080": "CERRO PERO",
-    "6081": "CERRITO",
-    "6082": "ITA PYTAGUA",
-    "6083": "JHUGUA JHU",
-    "6084": "JHUGUA JHU 1A.",
-    "6085": "MBOCAYATY",
-    "6086": "PASO PUENTE",
-    "6087": "PEDRO ROJAS",
-    "6088": "PEDROZO",
-    "6089": "PUENTE ACA",
-    "6090": "POTRERO GUAZU",
-    "6091": "YAGUA RESA",
-    "6092": "YSATY",
-    "6093": "YPANE",
-    "6094": "CAÑADITA",
-    "6095": "CHACO I",
-    "6096": "COLONIA THOMPSON 1A.",
-    "6097": "COSTA",
-    "6098": "PASO DE ORO",
-    "6099": "POTRERITO 1A.",
-    "6100": "POTRERITO 2A.",
-    "6101": "ROSADO GUAZU",
-    "6102": "THOMPSON 2A.",
-    "6103": "YPANE ÑU",
-    "6104": "YTORORO",
-    "6105": "YTORORO 2A.",
-    "6106": "LAMBARE",
-    "6107": "BARRIO PTE.KENNEDY 1A.",
-    "6108": "BARRIO PTE.KENNEDY 2A.",
-    "6109": "BAÑADO SUR",
-    "6110": "BARRIO SANTA ANA",
-    "6111": "CAÑADA",
-    "6112": "ITA ENRAMADA",
-    "6113": "LAMBARE (MUNICIPIO)",
-    "6114": "MBACHI0",
-    "6115": "MBACHIO BAJO",
-    "6116": "MBACHIO 2A.",
-    "6117": "PALOMAR 1A.",
-    "6118": "PALOMAR 2A.",
-    "6119": "PALOMAR 3A.",
-    "6120": "PUERTO PABLA",
-    "6121": "REPUBLICANO",
-    "6122": "RUTA JOSE FELIX BOGADO",
-    "6123": "SAN MIGUEL",
-    "6124": "SAN RAFAEL",
-    "6125": "SAN ISIDRO",
-    "6126": "VALLE APUA",
-    "6127": "VALLE APUA 2A.",
-    "6128": "VALLE APUA 3A.",
-    "6129": "VALLE YBATE",
-    "6130": "VILLA CERRO CORA",
-    "6131": "YUQUYTY 2",
-    "6132": "YUQUYTY",
-    "6133": "YSATY",
-    "6134": "J.AUGUSTO SALDIVAR",
-    "6135": "POSTA LEIVA",
-    "6428": "LOMA PYTA",
-    "5435": "YATAITY (2A.CIA)",
-    "5436": "YATAITY (3A.CIA)",
-    "6136": "PILAR",
-    "6137": "ARARA'A",
-    "6138": "AVIACION 1A.CIA.",
-    "6139": "BARRIO 12 DE OCTUBRE",
-    "6140": "BARRIO BANCO NRO.1",
-    "6141": "BARRIO LOMA CLAVEL",
-    "6142": "BARRIO OBRERO",
-    "6143": "CABALLERO PASO",
-    "6144": "ESTANCIA LUIS DELPINO",
-    "6145": "ESTANCIA MEDINA",
-    "6146": "ESTANCIA SAN MARTIN",
-    "6147": "ESTANCIA SANTA TERESA",
-    "6148": "ISLA",
-    "6149": "ISLA YUQUERI",
-    "6150": "MEDINA",
-    "6151": "PILAR (MUNICIPIO)",
-    "6152": "VALLE APUA",
-    "6153": "VILLA PASO",
-    "5437": "ALBERDI",
-    "5438": "ALBERDI (MUNICIPIO)",
-    "5439": "ALBERDI VIEJO",
-    "5440": "BANCO CURUZU",
-    "5441": "BANCO PALOMAR",
-    "5442": "ESTERO CORA",
-    "5443": "ISLA LEON",
-    "5444": "LOMA",
-    "5445": "MOÑAI CUARE",
-    "5446": "TARUMA VUELTA",
-    "5447": "CERRITO",
-    "5448": "BARRIO OBRERO 1A.",
-    "5449": "BARRIO OBRERO 2A.",
-    "5450": "CAAGUY JHOVY",
-    "5451": "CERRO ÑU",
-    "5452": "COSTA 1",
-    "5453": "COSTA 1 2A.",
-    "5454": "CURUZU ABA 1A.",
-    "5455": "CURUZU ABA 2A.",
-    "5456": "ISLA ROY",
-    "5457": "ITA PUNTA",
-    "5458": "JHUGUA YARE",
-    "5459": "POTRERO VILLALBA 1A.",
-    "5460": "POTRERO VILLALBA 2A.",
-    "5461": "TACURUTY",
-    "5462": "DESMOCHADOS",
-    "5463": "CAPILLITA",
-    "5464": "COSTA PO'I",
-    "5465": "DESMOCHADO (MUNICIPIO)",
-    "5466": "FLORA PUNTA",
-    "5467": "MANANTIALES",
-    "5468": "POTRERO",
-    "5469": "POTRERO SAN JUAN",
-    "5470": "POTRERO ZARZA",
-    "5471": "SAN ANTONIO",
-    "5472": "SAN ROQUE",
-    "5473": "SANTA MARIA",
-    "5483": "GUAZU CUA",
-    "5484": "CARANDAYTY",
-    "5485": "GUAZU CUA",
-    "5486": "PASO PINDO",
-    "5487": "PASO TYPY",
-    "5488": "POTRERO PIRU",
-    "5489": "POTRERO YBYRAI",
-    "5490": "PUNTA DIAMANTE",
-    "5491": "YBABIYU",
-    "4094": "ESTANCIA PARAISO",
-    "4095": "ESTANCIA ROMAGUERA",
-    "4096": "ISLA CURUZU",
-    "4097": "NARANJITO",
-    "4098": "PASO CORNELIO",
-    "4099": "PASO PUCU",
-    "4100": "PUERTO ARROCERA",
-    "4101": "TUYU CUE",
-    "5492": "HUMAITA",
-    "5493": "ARROYO HONDO",
-    "5494": "BOGARIN CUE",
-    "5495": "ESTANCIA CURUPAYTY",
-    "5789": "HUMAITA (MUNICIPIO)",
-    "5790": "TACURUTY",
-    "4102": "ISLA UMBU",
-    "4103": "BOQUERON",
-    "4104": "CAMBA CUA",
-    "4105": "ESTACION PEREZ",
-    "4106": "ESTACION SANTA MARIA",
-    "4107": "ISLA UMBU (MUNICIPIO)",
-    "4108": "ISLERIA",
-    "4109": "LOMA CLAVEL",
-    "4110": "NARANJITO",
-    "4111": "TACURU PYTA",
-    "4112": "VALLE POI",
-    "5791": "COSTA PUCU",
-    "4113": "LAURELES",
-    "4114": "APIPE",
-    "4115": "CAAROGUE",
-    "4116": "CASTILLO CUE",
-    "4117": "COSTA PUCU",
-    "4118": "ESPINILLO",
-    "4119": "ISLA CABRERA",
-    "4120": "ISLA LOMA",
-    "4121": "ISLA SOLA",
-    "4122": "ISLA YRYBU",
-    "4123": "ISLERIA",
-    "4124": "LAURELES",
-    "4125": "PASO FLOR",
-    "4126": "PINDURA",
-    "4127": "POTRERO ESTECHE",
-    "4128": "POTRERO POI",
-    "4129": "SAN ANTONIO",
-    "4130": "YATAITY",
-    "4131": "ÑEEMBUCU MI",
-    "4132": "PASO DE PATRIA",
-    "4133": "COSTA PARANA",
-    "4134": "ITA PIRU",
-    "4135": "PASO CANOA",
-    "4136": "PASO DE PATRIA (MUNICIPIO)",
-    "4137": "MAYOR J.D.MARTINEZ",
-    "4138": "1A.CIA.(CABRERA CUE)",
-    "4139": "ALARCON",
-    "4140": "CURUZU CUATIA GUAZU",
-    "4141": "CURUZU CUATIA I",
-    "4142": "ISLA CORA",
-    "4143": "ISLA CORA 1A.",
-    "4144": "ISLA CORA 2A.",
-    "4145": "ISLA ROY",
-    "4146": "LOMA I",
-    "4147": "MAYOR MARTINEZ (MUNICIPIO)",
-    "4148": "YATAITY",
-    "4149": "SAN JUAN DE ÑEEMBUCU",
-    "4150": "AGUIRRE",
-    "4151": "ALAMBRADO POI",
-    "4152": "CAMBA CUA",
-    "4153": "CARANDAYTY",
-    "4154": "CIUDAD NUEVA",
-    "4155": "CIA.OTAZU",
-    "4156": "COSTA PINDO",
-    "4157": "COSTA ROSADO",
-    "4158": "CUERVO BLANCO",
-    "4159": "ESTANCIA CIERVO BLANCO",
-    "4160": "ESTANCIA PIRITY (MASSEY)",
-    "4161": "ESTANCIA POTRERO PEREIRA",
-    "4162": "ESTANCIA ANGULO",
-    "4163": "ESTANCIA LOMA",
-    "4164": "ESTANCIA LOMITA",
-    "4165": "ESTANCIA SAN ANTONIO",
-    "4166": "ESTANCIA SAN FELIPE",
-    "4167": "ESTANCIA YACARE",
-    "4168": "ESTERO CAMBA",
-    "4169": "LAGUNA ITA",
-    "4170": "LOMA EIRA",
-    "4171": "PARAISO",
-    "4172": "POTRERO CABALLERO",
-    "4173": "POTRERO GONZALEZ",
-    "4174": "POTRERO TATAYYBA",
-    "4175": "PUESTO SAN JOSE",
-    "4176": "PUESTO 2A.CUE",
-    "4177": "PUESTO ALVARENGA",
-    "4178": "PUESTO BARRANQUERITA",
-    "4179": "PUESTO BENJAMIN",
-    "4180": "PUESTO CANTERO CUE",
-    "4181": "PUESTO JAVIELITO",
-    "4182": "PUESTO LIMA",
-    "4183": "PUESTO MALICHA (BLANCO CUE)",
-    "4184": "PUESTO MANDI'O",
-    "4185": "PUESTO OLAZAR",
-    "4186": "PUESTO RAMIREZ CUE",
-    "4187": "PUESTO REDONDO",
-    "4188": "PUESTO SAN BERNARDO",
-    "4189": "PUESTO SAN CARLOS",
-    "4190": "PUESTO SAN JOSE",
-    "4191": "PUESTO SANJITA",
-    "4192": "PUESTO YBAJHAI",
-    "4193": "PUESTO ÑU PYAJHU",
-    "4194": "PUESTO SAN JOSE",
-    "4195": "SAN JUAN ÑEEMBUCU (MUNICIPIO)",
-    "4196": "TACUARAS",
-    "4197": "BANCO CARRIZAL",
-    "4198": "CAMPO MARTINEZ",
-    "4199": "ESTACION CARLOS CUE",
-    "4200": "POTRERO YBYÑAI",
-    "4201": "VILLA OLIVA",
-    "4202": "ALBADON",
-    "4203": "BEDOYA",
-    "4204": "BOTERETE",
-    "4205": "CUATRO VIENTO",
-    "4206": "DERLI CUE",
-    "4207": "ESTACION ISLA GUAZU",
-    "4208": "MONTERO",
-    "4209": "PUERTO MARIANITO",
-    "4210": "PUERTO MARITE",
-    "4211": "PUERTO PARAISO",
-    "4212": "PUERTO VICTORIA",
-    "4213": "VALLE PUCU",
-    "4214": "VILLA OLIVA (MUNICIPIO)",
-    "4215": "YBY ATA",
-    "4216": "YBYRA PYTA",
-    "4239": "VILLALBIN",
-    "4240": "CIA.ISLA YRYBU",
-    "4241": "CIA.POTRERO",
-    "4242": "ESTERO BELLACO",
-    "4243": "ESTERO CENIZALES",
-    "4244": "ESTERO PIKYRY",
-    "4245": "ESTERO VACAPI",
-    "4246": "ISLA CADENA",
-    "4247": "MANANTIALES",
-    "5795": "CIA.SAN SEBASTIAN MI",
-    "5796": "ISLA LATRADERO",
-    "5474": "GRAL.JOSE EDUVIGIS DIAZ",
-    "5475": "CAMPAMENTO CUE",
-    "5476": "CARRIZAL",
-    "5477": "ESTERO BELLACO",
-    "5478": "GRAL.DIAZ (MUNICIPIO)",
-    "5479": "LOMA GUAZU",
-    "5480": "LOMA 1",
-    "5481": "PUESTO TORRES",
-    "5482": "YUQUERI",
-    "4217": "VILLA FRANCA",
-    "4218": "BANCO PARAGUAY",
-    "4219": "BANCO PIRAY",
-    "4220": "BANCO TATUCUA",
-    "4221": "ESTANCIA AGATAPE",
-    "4222": "ESTANCIA CAMBUCHI",
-    "4223": "ESTANCIA FERRARO",
-    "4224": "ESTANCIA HERRADURA",
-    "4225": "ESTANCIA LA ESPERANZA",
-    "4226": "ESTANCIA MCAL.LOPEZ",
-    "4227": "ESTANCIA PUNTA ELENA",
-    "4228": "ESTANCIA SAN JOSE",
-    "4229": "MARTA CUE",
-    "4230": "PLATERO CUE",
-    "4231": "POTRERO BANCO",
-    "4232": "POTRERO VARGAS",
-    "4233": "PUERTO VICTORIA",
-    "4234": "RETIRO CAMPINCHO CUA",
-    "4235": "ROI CUE",
-    "4236": "SANTA TERESA",
-    "4237": "VILLA FRANCA (MUNICIPIO)",
-    "4238": "VISCAYA",
-    "5792": "ISLA REAL",
-    "5793": "PUERTO TARUMA",
-    "5794": "SEBASTIAN GABOTO",
-    "4596": "CARANDAYTY",
-    "4597": "TENIENTE SANCHEZ",
-    "2306": "COL.SAN VICENTE",
-    "2307": "COL.VICTORIA GUAZU",
-    "2308": "CIA.INDUSTRIAL AQUIDABAN",
-    "2309": "CONSUELO",
-    "2310": "CORRALITO",
-    "2311": "CUCHARA",
-    "2312": "CURURU",
-    "2313": "CURUZU-I",
-    "2314": "ESTABLECIMIENTO ÑU PORA",
-    "2315": "ESTANCIA LAGUNA PORA",
-    "2316": "ESTANCIA PIRA POTRERO",
-    "2317": "ESTANCIA RUIZ",
-    "2318": "ESTANCIA SAN LUIS",
-    "2319": "ESTANCIA Y PYTA",
-    "2320": "ESTANCIA ÑANDEYARA PASO",
-    "2321": "ESTRELLA TUYA",
-    "2322": "EXCOMBATIENTE",
-    "2323": "EXCOMBATIENTE 2A.Y 3A.ZONA",
-    "2324": "FADEMA",
-    "2325": "FORTUNA GUAZU",
-    "2326": "GAZORY",
-    "2327": "GUAVIRA 3A.ZONA",
-    "2328": "GUAYAIBI",
-    "2329": "GUAYAIBI (1A.)",
-    "2330": "ITAKYRY",
-    "2331": "ITA BOZA-I",
-    "2332": "ITA POPO",
-    "2333": "KOCOE",
-    "2334": "LAGUANA PORA",
-    "2335": "LOTE 4 WEAVER",
-    "2336": "MAFUCCI I",
-    "2337": "MARANGATU",
-    "2338": "MOROTINGUE",
-    "2339": "NARANJATY",
-    "2340": "NUEVA AURORA",
-    "2341": "OCULTO",
-    "2342": "PARQUE NACIONAL CERRO CORA",
-    "2343": "PASO AQUIDABAN",
-    "2344": "PASO JHU",
-    "2345": "PASO ÑANDEYARA",
-    "2346": "PATRICIA",
-    "2347": "PEDRO JUAN CABALLERO (MUNIC.)",
-    "2348": "PIKY",
-    "2349": "PIKY CUA",
-    "2350": "PIKYSYRY",
-    "2351": "PINDOTY",
-    "2352": "PIRAY POTRERO",
-    "2353": "PORTERA ORTIZ",
-    "2354": "POTRERO-I CALLE 1A.",
-    "2355": "POTRERO-I CALLE 2A.",
-    "2356": "POTRERO CURURU",
-    "2357": "POTRERO LAGUANA PYTA",
-    "2358": "POTRERO MAFUCCI",
-    "2359": "POTRERO SANTIAGO",
-    "2360": "POTRERO SUR",
-    "2361": "PUNTA PORA ÑU",
-    "2362": "PUNTA VACAPI",
-    "2363": "REPUBLICA",
-    "2364": "RETIRO CAPIIBARY CABECERA",
-    "2365": "RETIRO",
-    "2366": "RINCON ZENON ORTIZ",
-    "2367": "RINCON DE JULIO",
-    "2368": "SAN FRANCISCO",
-    "2369": "SAN JUAN",
-    "2370": "SAN LUIS",
-    "2371": "SANTA MARIA I",
-    "2372": "SAPUCAI",
-    "2373": "SERENO",
-    "2374": "SINDICATURA",
-    "2375": "TACUARA RAPO",
-    "2376": "TABARE CUE",
-    "2377": "TAYY",
-    "2378": "TERCERA-I",
-    "2379": "TEYU POTRERO",
-    "2380": "TORORO",
-    "2381": "TRABAJADO YBY YAU",
-    "2382": "VACARAY",
-    "2383": "VICTORIA I",
-    "2384": "VICTORIA I CALLE 1A.",
-    "2385": "YAGUARY",
-    "2386": "YAGUA VARA",
-    "2387": "YAMBUE",
-    "2388": "YATEBU-I",
-    "2389": "YBY PYTA",
-    "2390": "YBY ATAI(TIMBO-I)",
-    "2391": "YBYRARAPO",
-    "2392": "YBY YAU",
-    "2393": "YBY YU",
-    "2394": "YERBAL CERRITO",
-    "2395": "YHAGUY",
-    "2396": "YSAU",
-    "2397": "YU AMBUE",
-    "2398": "ZANJA PYTA",
-    "2399": "ZENON ORTIZ",
-    "2400": "ÑANDEYARA",
-    "2401": "ÑATIA CAÑADA",
-    "4248": "PEDRO JUAN CABALLERO",
-    "4249": "1A. ADMINISTRACION",
-    "4250": "2A.(YBY YAU)",
-    "4251": "2A.ADMINISTRACION PIRE",
-    "4252": "2A.ZONA DE MOROTINGUE",
-    "4253": "2A.Y 3A.ZONA DE PYKY",
-    "4254": "4A.CERRO MOJON",
-    "4255": "5A.ADMINISTRACION TATU PIRE",
-    "4256": "5A.ZONA CALLE MOJON",
-    "4257": "ADMINISTRACION MASSON",
-    "4258": "AÑARETA",
-    "4259": "BEATO ROQUE GONZALEZ",
-    "4260": "CABECERA AQUIDABAN",
-    "4261": "CABECERA PASO JHU",
-    "4262": "CABECERITA",
-    "4263": "CAFETAL AMARO CUE",
-    "4264": "CAFETAL BRASIL",
-    "4265": "CAFETAL ESTRELLA",
-    "4266": "CAFETAL PABLISTA",
-    "4267": "CAFETAL RINCON DE JULIO",
-    "4268": "CAFETAL SAN ANTONIO",
-    "4269": "CAFETAL 3 PALOS",
-    "4270": "CAFETAL URUGUAYA (DEL NORTE)",
-    "4271": "CAFETAL VIRGINIA",
-    "4272": "CALLE 1A.",
-    "4273": "CALLEJON 1A.",
-    "4274": "CALLEJON 25",
-    "4275": "CALLEJON BRASIL",
-    "4276": "CALLEJON GRAL.GENES",
-    "4277": "CALLEJON PIKYSYRY",
-    "4278": "CALLEJON SANTA MARIA",
-    "4279": "CALLEJON SANTA ROSA",
-    "4280": "CAMPO FLOR",
-    "4281": "CANADIENSE",
-    "4282": "CAPIIBARY",
-    "4283": "CARPINTERIA CUE",
-    "4284": "CAI JHA",
-    "4285": "CAI MEMBY",
-    "4286": "CAÑADA AQUIDABAN",
-    "4287": "CAÑADA SAN ANTONIO",
-    "4288": "CERRO ACEITE B-1-4",
-    "4289": "CERRO AYGATA",
-    "4290": "CERRO BOBO",
-    "4291": "CERRO BOBO I",
-    "4292": "CERRO CORA",
-    "4293": "CERRO CUA",
-    "4294": "CERRO GUY",
-    "4295": "CERRO LIBERAL",
-    "4296": "CERRO LORITO",
-    "4297": "CERRO MEMBY",
-    "4298": "CERRO MOJON",
-    "4299": "CERRO PERO",
-    "4300": "CERRO PIKYSYRY",
-    "4301": "CHACURRU",
-    "4302": "CHIRIGUELO I 2A.ZONA",
-    "4303": "CHIRIGUELO",
-    "4304": "CHIRIGUELO I 1A.ZONA",
-    "4305": "CIERVO",
-    "4306": "COGOE-I",
-    "4307": "COL.AMARO CUE",
-    "4308": "COL.AQUIDABAN",
-    "4309": "COL.CERRO APUA",
-    "4310": "COL.CERRO CORA M-A",
-    "4311": "COL.CERRO CORA M-B-1",
-    "4312": "COL.CERRO CORA M-B-2",
-    "4313": "COL.CERRO CORA M-C",
-    "4314": "COL.EXCOMBATIENTES 2A.ZONA",
-    "4315": "COL. GUAVIRA",
-    "4316": "COL.JAPONESA",
-    "4317": "COL.NARANJA JHAI",
-    "4318": "COL.PROSPERIDAD",
-    "4319": "COL.PUNTA PORA",
-    "4320": "COL.SAN JUAN",
-    "5797": "2A.ZONA COLONIA NEA",
-    "5798": "ADMINISTRACION FORTUNA I",
-    "5799": "CACHIMBO",
-    "5800": "CAFETAL PARACANUSE",
-    "6315": "COL.VICE PTE.SANCHEZ",
-    "6316": "CUMBRE",
-    "2402": "BELLA VISTA",
-    "2403": "ARROYO CAA",
-    "2404": "ARROYO LEON",
-    "2405": "ARROYO YBYGUY",
-    "2406": "AYALA CUE",
-    "2407": "BELLA VISTA (MUNICIPIO)",
-    "2408": "CABAYU Y",
-    "2409": "CASUALIDAD",
-    "2410": "COL.CERRO POI",
-    "2411": "COL.CERRO TRANQUERITA",
-    "2412": "COL.SARGENTO DURE",
-    "2413": "ESTANCIA APAMI",
-    "2414": "ESTANCIA ARAMBURU",
-    "2415": "ESTANCIA ARROYO 1A.",
-    "2416": "ESTANCIA BARRERO",
-    "2417": "ESTANCIA BEDOYA",
-    "2418": "ESTANCIA CARMEN DE LA SIERRA",
-    "2419": "ESTANCIA CIERVO",
-    "2420": "ESTANCIA DUARTE CUE",
-    "2421": "ESTANCIA GUARANI",
-    "2422": "ESTANCIA LAS MERCEDES",
-    "2423": "ESTANCIA LOMA",
-    "2424": "ESTANCIA PINDURACUE",
-    "2425": "ESTANCIA POSITO",
-    "2426": "ESTANCIA SAN ALFREDO",
-    "2427": "ESTANCIA SAN CARLOS",
-    "2428": "ESTANCIA SAN JOSE",
-    "2429": "ESTANCIA SAN JUAN (NORTE)",
-    "2430": "ESTANCIA SAN LORENZO",
-    "2431": "ESTANCIA SAN ROQUE",
-    "2432": "ESTANCIA SAN VICTOR",
-    "2433": "ESTANCIA SANTA AMALIA",
-    "2434": "ESTANCIA SANTA LINA",
-    "2435": "ESTANCIA SANTA NIDIA",
-    "2436": "ESTANCIA YBU MI",
-    "2437": "ESTANCIA ZEPELLO",
-    "2438": "ESTANCIA ÑU POI",
-    "2439": "INVERNADA YATEBU",
-    "2440": "ISLA ALTA",
-    "2441": "OBRAJE ZUBIZARRETA",
-    "2442": "OVELAR CUE",
-    "2443": "PUENTE KYJHA",
-    "2444": "PUESTO SANTA RITA",
-    "2445": "ESTANCIA TOLDO CUE",
-    "2446": "RETIRO ALEGRIA",
-    "2447": "RETIRO APA MI",
-    "2448": "RETIRO CERRO ACANGUE",
-    "2449": "RETIRO CHAMIZO",
-    "2450": "RETIRO LOMA I",
-    "2451": "RETIRO LOMA PORA",
-    "2452": "RETIRO LOMA PORA 2A.",
-    "2453": "RETIRO MARGARITA",
-    "2454": "RETIRO NAPEGUE",
-    "2455": "RETIRO NOAGA",
-    "2456": "RETIRO OLIVA",
-    "2457": "RETIRO PAÑUELO",
-    "2458": "RETIRO PEGUAJHO",
-    "2459": "RETIRO PENSAMIENTO",
-    "2460": "RETIRO PYPUCU",
-    "2461": "RETIRO PYSYRY",
-    "2462": "RETIRO RINCONADA",
-    "2463": "RETIRO RUDA",
-    "2464": "RETIRO SAN PABLO",
-    "2465": "RETIRO SANTA LUISA",
-    "2466": "RETIRO SANTA RITA",
-    "2467": "RETIRO SUCIA",
-    "2468": "RETIRO TORO PASO",
-    "2469": "RETIRO TRANQUERITA",
-    "2470": "SAN JOSE",
-    "2471": "SANTA ELISA",
-    "2472": "SANTA TERESA",
-    "2473": "SANTO DOMINGO",
-    "2474": "SOBERANA",
-    "2475": "YARAGUA",
-    "2476": "YUGO PENGUE",
-    "6317": "ESTANCIA SAN JUAN (SUR)",
-    "6318": "ESTANCIA SANTA VICTORIA",
-    "6319": "LA MILAGROSA",
-    "6320": "RANCHO ALEGRE",
-    "6321": "RETIRO FAUSTINO CUE",
-    "6322": "RETIRO NARZISA",
-    "6323": "RETIRO PILETA",
-    "6324": "RETIRO SAN NICOLAS",
-    "6325": "RODEO TAPE",
-    "2477": "CAPITAN BADO",
-    "2478": "6 DE DICIEMBRE",
-    "2479": "ACUTI",
-    "2480": "AGUAPEY",
-    "2481": "AGUARA",
-    "2482": "ARROYITO",
-    "2483": "ASERRADERO CANECA",
-    "2484": "BONANZA",
-    "2485": "BOQUERON",
-    "2486": "CA'A POTY",
-    "2487": "CAAGUY POTY",
-    "2488": "CAAZAPAMI PARAGUAY",
-    "2489": "CABECERA CURUPAY",
-    "2490": "CABEZADITA",
-    "2491": "CAFETAL ASSAMI",
-    "2492": "CAFETAL CARRERO",
-    "2493": "CAFETAL CERRO CUATIA",
-    "2494": "CAFETAL DEL CERRO",
-    "2495": "CAMPAÑA I",
-    "2496": "CAMPO WUIS",
-    "2497": "CAPITAN BADO (MUNICIPIO)",
-    "2498": "CARAYA",
-    "2499": "CARRILLO CUE",
-    "2500": "CAI MEMBY",
-    "2501": "CERRITO ITA CORA",
-    "2502": "CERRO MBOCAVI",
-    "2503": "CHACO I",
-    "2504": "CIERVO ÑU",
-    "2505": "COCUERE",
-    "2506": "COL.DUTRA",
-    "2507": "COL.JAPONESA",
-    "2508": "COL.MARISCAL LOPEZ",
-    "2509": "COL.NACIMIENTO",
-    "2510": "COL.YPANE MI",
-    "2511": "COLO O",
-    "2512": "COLO O I",
-    "2513": "CORRALON",
-    "2514": "CRISTINO POTRERO",
-    "2515": "CUAREPOTI",
-    "2516": "CURUPAY",
-    "2517": "CURE SOBRADO",
-    "2518": "DESVIO 88",
-    "2519": "DESVIO SAN FERNANDO",
-    "2520": "ESCALANTE CUE",
-    "2521": "ESTABLECIMIENTO CARUMBEY",
-    "2522": "ESTABLECIMIENTO GUARANI",
-    "2523": "ESTABLECIMIENTO LAGUNITO",
-    "2524": "ESTABLECIMIENTO LAGUNITA",
-    "2525": "ESTABLECIMIENTO SALMO 23",
-    "2526": "ESTABLECIMIENTO SAN ANTONIO",
-    "2527": "ESTABLECIMIENTO SAN FERNANDO",
-    "2528": "ESTABLECIMIENTO TRABUCO",
-    "2529": "ESTABLECIMIENTO YUKYRY MI",
-    "2530": "ESTABLECIMIENTO ZAPALLO",
-    "2531": "ESTANCIA ITAPUA I",
-    "2532": "ESTANCIA NUEVA FRANCA",
-    "2533": "ESTANCIA PAULO",
-    "2534": "FAZENDA CHIKI MATI",
-    "2535": "FAZENDA DEL TUE",
-    "2536": "FAZENDA JOAQUINCIÑO",
-    "2537": "FAZENDA LOYIADA",
-    "2538": "FAZENDA MAGNOLIA",
-    "2539": "FAZENDA NUEVA ESPERANZA",
-    "2540": "FAZENDA SANTA ADELIA",
-    "2541": "FAZENDA SANTA FE",
-    "2542": "FAZENDA YBYPE",
-    "2543": "FRANCO CUE",
-    "2544": "GUAIGUI TAPERE",
-    "2545": "GUARANI",
-    "2546": "GUAZU ARI",
-    "2547": "GUYRA KEJHA",
-    "2548": "HACIENDA SANTA CRUZ",
-    "2549": "ITA BOZA",
-    "2550": "ITA CUI",
-    "2551": "ITA GUARANI",
-    "2552": "ITA POPO",
-    "2553": "J.S.GODOY (TORIN)",
-    "2554": "KO-E PYAJHU",
-    "2555": "KUI",
-    "2556": "LOTE-I",
-    "2557": "MARTINEZ CUE",
-    "2558": "MBOCAYATY",
-    "2559": "MECA",
-    "2560": "MIRI-I",
-    "2561": "MIRI GUAZU",
-    "2562": "MONTE POTRERO",
-    "2563": "NUEVA VIRGINIA",
-    "2564": "OBRAJE PUENDY",
-    "2565": "OBRAJE SALAMANCA",
-    "2566": "OCULTO POTY",
-    "2567": "PASO HISTORIA",
-    "2568": "PASO ITA",
-    "2569": "PASO SAN DANIEL",
-    "2570": "PASO TUNA",
-    "2571": "PASO DE LOS TOROS",
-    "2572": "PAYESA-I",
-    "2573": "PITAY",
-    "2574": "PIÑA",
-    "2575": "POTRERITO",
-    "2576": "POTRERO CIERVO ÑU",
-    "2577": "POTRERO NOVILLO",
-    "2578": "POTRERO OCULTO",
-    "2579": "POTRERO OCULTO KYHA",
-    "2580": "POTRERO OMBU",
-    "2581": "POTRERO TACUARATY",
-    "2582": "POTRERO YAJHAPEMI",
-    "2583": "POTRERO-I",
-    "2584": "PUENTE CAPI-I",
-    "2585": "PUENTE DE TABLA",
-    "2586": "PUERTO MARGARITA",
-    "2587": "PUERTO MARTITA",
-    "2588": "PUERTO PANADERO",
-    "2589": "QUINTANA CUE",
-    "2590": "RANCHO TUYUTI",
-    "2591": "RANCHO YEGUA",
-    "2592": "RETIRO MBOI YAGUA",
-    "3586": "RETIRO NA.1 BUEN AMIGO",
-    "3587": "RINCON PARAGUAY",
-    "3588": "SAN RAMON",
-    "3589": "SANTA CECILIA",
-    "3590": "SANTA ELISA",
-    "3591": "SANTA MARIA",
-    "3592": "TACUARATY",
-    "3593": "TAPYTA CURUPAY",
-    "3594": "TARACA",
-    "3595": "TOTORA",
-    "3596": "TRABUCO",
-    "3597": "TRIGAL TARACA",
-    "3598": "TUYU PE",
-    "3599": "TUYU CUE",
-    "3600": "VERON CUE",
-    "3601": "YAGUARUNDI GUAZU",
-    "3602": "YAGUA PO",
-    "3603": "YBYPE-I",
-    "3604": "YBYCUI",
-    "3605": "YUYGUY",
-    "3606": "YZOZO",
-    "3607": "ZANJA JHU",
-    "3608": "ÑU APY",
-    "5751": "RETIRO SANTA MARIA",
-    "5752": "SEÑORITA",
-    "5753": "TRABAJADO ZUZUKI",
-    "5754": "YAGUARUNDI-I",
-    "5755": "YUKY POTRERO",
-    "6326": "RETIRO CARAPA-I",
-    "6429": "KARAPAI",
-    "3609": "VILLA HAYES",
-    "3610": "14 DE MAYO",
-    "3611": "25 LEGUAS",
-    "3612": "3 DE MAYO",
-    "3613": "4",
-    "3614": "7 BOCAS",
-    "3615": "ALBORADA",
-    "3616": "ALEGRE",
-    "3617": "AMALIA",
-    "3618": "ARAZA",
-    "3619": "AVALOS SANCHEZ",
-    "3620": "BETTY",
-    "3621": "BOCA-I",
-    "3622": "BOQUERON",
-    "3623": "CABO 1RO.CANO",
-    "3624": "CADETE OTAZU",
-    "3625": "CADETE PASTOR PANDO",
-    "3626": "CAMPO 48",
-    "3627": "CAMPO ESPERANZA",
-    "3628": "CAMPO FLORES",
-    "3629": "CAMPO LATA",
-    "3630": "CAMPO LEON",
-    "3631": "CARA-U",
-    "3632": "CARAMBOLA",
-    "3633": "CARLOS SISA",
-    "3634": "CARMENCITA",
-    "3635": "CASANILLO",
-    "3636": "CASUALIDAD",
-    "3637": "CEIBO",
-    "3638": "CELADA CUE",
-    "3639": "CHACO-I",
-    "3640": "CNEL.MARTINEZ",
-    "3641": "COLONIA",
-    "3642": "CMTE.NOWAK",
-    "3643": "CORA-I",
-    "3644": "CORRALITO",
-    "3645": "CORRALON",
-    "3646": "COSTA",
-    "3647": "COE-YU",
-    "3648": "CUATRO CIERVOS",
-    "3649": "CURUPAYTY",
-    "3650": "CACERES CUE",
-    "3651": "DEL MEDIO",
-    "3652": "DR.GASPAR R.DE FRANCIA",
-    "3653": "ESTANCIA-I",
-    "3654": "ESTANCIA BUENA VISTA",
-    "3655": "ESTANCIA FORTUNA",
-    "3656": "ESTANCIA GUAJHO",
-    "3657": "ESTANCIA JOSEFINA",
-    "3658": "ESTANCIA LUIS",
-    "3659": "ESTANCIA POZO AZUL",
-    "3660": "ESTANCIA SAN JOSE",
-    "3661": "ESTANCIA SANTA MARIA",
-    "3662": "ESTANCIA SANTA ELISA",
-    "3663": "ESTRELLA",
-    "3664": "FALCON",
-    "3665": "FERNANDO SILVA MAGALLANES",
-    "3666": "GRAL.BRUGUEZ",
-    "3667": "GRAL.CABALLERO",
-    "3668": "GRAL.DELGADO",
-    "3669": "GRAL.DIAZ",
-    "3670": "GUAJHO",
-    "3671": "GUARANI",
-    "3672": "HORQUETA",
-    "3673": "HOTEL RIO NEGRO",
-    "3674": "ISLA POI (EX VILLA MILITAR)",
-    "3675": "LA ANGELICA",
-    "3676": "LA CONCEPCION",
-    "3677": "LA CUCA RUBI",
-    "3678": "LA ESPERANZA",
-    "3679": "LA GOLONDRINA",
-    "3680": "LA SELVA",
-    "3681": "LA VICTORIA",
-    "3682": "LAGUNA BELLA",
-    "3683": "LAGUNA PORA",
-    "3684": "LAGUNA REY",
-    "3685": "LANDS KRCHE",
-    "3686": "LAS ISIDORAS",
-    "3687": "LAS MELLIZAS",
-    "3688": "LAS MOCHAS",
-    "3689": "LA PALMAS",
-    "3690": "LEOPOLDINA",
-    "3691": "LINDA VISTA",
-    "3692": "LOCATTI",
-    "3693": "LOMA PORA",
-    "3694": "LOMAS",
-    "3695": "LOS GEMELOS",
-    "3696": "MICHI",
-    "3697": "MILLON",
-    "3698": "MISIONES LA ESPERANZA",
-    "3699": "MONTE LINDO",
-    "3700": "MONTIEL",
-    "3701": "NANATI",
-    "3702": "NARANJITO",
-    "3703": "NINFA",
-    "3704": "OBRAJE 49",
-    "3705": "PALCAR",
-    "3706": "PALO BLANCO",
-    "3707": "PAREDES",
-    "3708": "PEDERNAL",
-    "3709": "PILAGA",
-    "3710": "PILCOMAYO",
-    "3711": "POCITO",
-    "3712": "POLVORIN",
-    "3713": "PORVENIR",
-    "3714": "POZO AMARILLO",
-    "3715": "PRIMAVERA",
-    "3716": "PUERTO GALILEO",
-    "3717": "PUESTO CORRALON",
-    "3718": "PUESTO FORTUNA",
-    "3719": "PUESTO LUIS",
-    "3720": "PUSTO POZO AZUL",
-    "3721": "PUESTO SANTA MARIA",
-    "3722": "RIACHO G",
-    "3723": "ROJAS SILVA",
-    "3724": "SAN ANTONIO",
-    "3725": "SAN BARTOLOME",
-    "3726": "SAN BLAS",
-    "3727": "SAN JUAN",
-    "3728": "SAN LEONARDO",
-    "3729": "SAN LUIS",
-    "3730": "SAN ONOFRE",
-    "3731": "SAN PEDRO",
-    "3732": "SAN RAFAEL",
-    "3733": "SAN ROQUE",
-    "3734": "SOMBRERO JHOVY",
-    "3735": "SORPRESA",
-    "3736": "STA.ARSENIA",
-    "3737": "STA.AURELIA",
-    "3738": "STA.CATALINA",
-    "3739": "STA.MANUELA",
-    "3740": "STA.ROSA",
-    "3741": "STA.SOFIA",
-    "3742": "STA.TERESA",
-    "3743": "TACUARA",
-    "3744": "TOJA",
-    "3745": "TOLDO CUE",
-    "3746": "TOMAS CUE",
-    "3747": "TTE.ESTEBAN MARTINEZ",
-    "3748": "TTE.ROJAS SILVA",
-    "3749": "TUPARENDA",
-    "3750": "VALLEJOS",
-    "3751": "VERDE",
-    "3752": "VILLA ALEGRE",
-    "3753": "VILLA REAL",
-    "3754": "YETYTY",
-    "3755": "YUKYRY",
-    "3756": "ÑU PORA",
-    "5756": "11 DE JUNIO",
-    "5757": "SAN MIGUEL",
-    "5758": "SAN SILVESTRE",
-    "5759": "STA.EMILIA",
-    "5760": "TABLA",
-    "5761": "TOLDO GRANDE",
-    "5762": "VA Y VIENE",
-    "5763": "WINCHESTER",
-    "3757": "BENJAMIN ACEVAL(MONTE SOCIEDAD",
-    "3758": "ALINA",
-    "3759": "BELEN",
-    "3760": "CELIA",
-    "3761": "CERRITO",
-    "3762": "ELVIRA",
-    "3763": "PUERTO CARLOS PFANEL",
-    "3764": "SAN JAVIER",
-    "3765": "SAN RAFAEL",
-    "3766": "SANTA ISABEL",
-    "3767": "SUSANA",
-    "3768": "VICTORIA",
-    "5764": "ALEGRIA",
-    "5765": "CIERVO",
-    "5766": "SAN JUAN",
-    "5767": "VILLA REY",
-    "3864": "PTO.PINAZCO",
-    "3865": "BELLA VISTA",
-    "3866": "BRETONA",
-    "3867": "ESPERANZA",
-    "3868": "LA NOVIA",
-    "3869": "LOS TAMARINDOS",
-    "3870": "MAROMA",
-    "3871": "PALO SANTO",
-    "3872": "PTE.COLON",
-    "5498": "PUERTO ALEGRE.",
-    "5499": "PUERTO CARAYA VUELTA",
-    "5500": "PUERTO COOPER",
-    "5501": "PUERTO SAN JUAN",
-    "5502": "SAN JOSE",
-    "5503": "TOLDO",
-    "5504": "VISTA ALEGRE",
-    "5505": "NANAWA",
-    "3769": "POZO COLORADO",
-    "3770": "190",
-    "3771": "AGUALINDA",
-    "3772": "AGUARRICA",
-    "3773": "BONANZA",
-    "3774": "BOQUERON",
-    "3775": "BUENA SUERTE",
-    "3776": "CABEZA DE TIGRE",
-    "3777": "CAMPO VIA",
-    "3778": "CAPITAN FIGARI",
-    "3779": "CARIDAD",
-    "3780": "CERRITO AMAKERA",
-    "3781": "CHICA",
-    "3782": "COLON",
-    "3783": "DEL CARMEN",
-    "3784": "DON MANUEL",
-    "3785": "EL BUEN AMIGO",
-    "3786": "ESMERALDA",
-    "3787": "ESPERANZA",
-    "3788": "ESTANCIA AURORA",
-    "3789": "ESTANCIA FLORIDA",
-    "3790": "ESTRELLA",
-    "3791": "FALCON",
-    "3792": "FLORIDA",
-    "3793": "GONDRA",
-    "3794": "GONZALEZ",
-    "3795": "GUAZU",
-    "3796": "HAITI",
-    "3797": "HOTEL PIRAHU",
-    "3798": "INGLESA",
-    "3799": "ISLA ALTA",
-    "3800": "ISLA SOLA",
-    "3801": "LA BLANCA NAVIDAD",
-    "3802": "LA BONITA",
-    "3803": "LA DELICIA",
-    "3804": "LA NENA",
-    "3805": "LA VICTORIA",
-    "3806": "LA VISTA",
-    "3807": "LAGUNA SOLA",
-    "3808": "LAGUNA VERDE",
-    "3809": "LAS PERLAS",
-    "3810": "LOMA PYTA",
-    "3811": "LOS LAPACHOS",
-    "3812": "LOS MILAGROS",
-    "3813": "MARLENE",
-    "3814": "MCAL.F.S.LOPEZ",
-    "3815": "MISION CHICA",
-    "3816": "MONTE LINDO",
-    "3817": "MORENO",
-    "3818": "NUEVA ALEGRIA",
-    "3819": "ORIHUELA",
-    "3820": "PALERMO",
-    "3821": "PARAISO",
-    "3822": "PIRIZAL",
-    "3823": "PONDEROSA",
-    "3824": "PORONGO",
-    "3825": "POZO BLANCO",
-    "3826": "POZO COLORADO",
-    "3827": "POZO INDIO",
-    "3828": "POZO VERDE",
-    "3829": "PRIMAVERA",
-    "3830": "PTE.AYALA (EX NANAWA)",
-    "3831": "PUESTO SAN MIGUEL",
-    "3832": "LUCY",
-    "3833": "QUEBRACHO",
-    "3834": "RIACHITO",
-    "3835": "RINCON CHARRUA",
-    "3836": "RIO VERDE",
-    "3837": "SALADO",
-    "3838": "SAN CARLOS",
-    "3839": "SAN FERNANDO",
-    "3840": "SAN LORENZO",
-    "3841": "SAN LUIS",
-    "3842": "SAN MIGUEL",
-    "3843": "SAN RAFAEL",
-    "3844": "SAN RAMON",
-    "3845": "SAN TIMOTEO",
-    "3846": "STA.ANA",
-    "3847": "STA.ASUNCION",
-    "3848": "STA.CATALINA",
-    "3849": "STA.GABRIELA",
-    "3850": "STA.JUANITA",
-    "3851": "STA.MARIA",
-    "3852": "STO.DOMINGO",
-    "3853": "TALAVERA",
-    "3854": "TANCO",
-    "3855": "TATARE",
-    "3856": "TOTO BLANCO",
-    "3857": "VALINOTTI CUE",
-    "3858": "VICTORIA",
-    "3859": "YASAWATHASLA",
-    "3860": "YUI",
-    "3861": "ZALAZAR",
-    "3862": "ZENTENO",
-    "3863": "ÑU PYAJHU",
-    "5768": "ARMONIA",
-    "5769": "CABAYU",
-    "5770": "CENTRAL",
-    "5771": "CUNU-U",
-    "4608": "JOSE FALCON",
-    "5506": "MCAL.ESTIGARRIBIA",
-    "5507": "AYURA",
-    "5508": "BOQUERON",
-    "5509": "CAMPO AROMA",
-    "5510": "CAMPO LOA",
-    "5511": "CAP.DEMATTEI",
-    "5512": "CAP.O.SEREBRIAKOF",
-    "5513": "CAÑADA CALAIS",
-    "5514": "CAÑADA ELISA",
-    "5515": "CNEL.HERMOSA (CARAYA)",
-    "5516": "COL.FERNHEIN",
-    "5517": "COL.MENNO",
-    "5518": "COL.NEULAND",
-    "5519": "CORRALES",
-    "5520": "DOS BANDERAS",
-    "5521": "FILADELFIA",
-    "5522": "JARA TROCHE",
-    "5523": "LOMA PLATA",
-    "5524": "POTRERO PALMAS",
-    "5525": "POZO GRANDE",
-    "5526": "STA.TERESA",
-    "5527": "STO.DOMINGO",
-    "5528": "TOLEDO",
-    "5529": "TTE.C.A.RIVAROLA",
-    "5530": "TTE.DENIS ROA",
-    "5531": "TTE.F.DELGADO",
-    "5532": "YALVE SANGA",
-    "5879": "TTE.A.ESPINOLA",
-    "5533": "BOQUERON",
-    "4611": "SGTO.1RO.FELIX ZARACHO",
-    "4612": "STA.ROSA",
-    "4613": "TRES POZOS",
-    "4614": "TTE.1RO.ALFREDO STROESSNER",
-    "4615": "TTE.1RO.ANSELMO ESCOBAR",
-    "4616": "TTE.1RO.B.RUIZ",
-    "4617": "TTE.1RO.M.CABELLO",
-    "4618": "TTE.ACOSTA",
-    "4619": "TTE.MONTIEL",
-    "4620": "VICTORIA",
-    "4621": "VILLANUEVA",
-    "4622": "YAGUARETE",
-    "4623": "YTORORO",
-    "5534": "3 REYES",
-    "5535": "ALURRALDE",
-    "5536": "AMARILLO PERICOTE",
-    "5537": "ATAJADO",
-    "5538": "BUENOS AIRES",
-    "5539": "CAMPO AZUL",
-    "5540": "CAMPO LIMA",
-    "5541": "CAP.ESCOBAR",
-    "5542": "CAP.O.R.ORTELLADO",
-    "5543": "CAP.TORIBIO CASTRO",
-    "5544": "CASUARINA",
-    "5545": "CATAN",
-    "5546": "CODO CONONI",
-    "5547": "DOS TUCAS",
-    "5548": "EL QUEBRACHAL",
-    "5549": "EL RASTRO",
-    "5550": "ESTABLECIMIENTO MIL",
-    "5551": "FLORENTIN CUE",
-    "5552": "GANADERA PILCOMAYO",
-    "5553": "INFANTE RIVAROLA",
-    "5554": "KILOMETRO 20",
-    "5555": "LA CHAQUEÑA",
-    "5556": "LA DORADA",
-    "5557": "LAGUNA",
-    "5558": "LAS SEÑORAS",
-    "5559": "LEONARDO BRITOS",
-    "5560": "LEONIDA ESCOBAR",
-    "5561": "LOMA",
-    "5562": "LOS NARANJOS",
-    "5563": "LOS POZOS",
-    "5564": "LOS SAUCES",
-    "5565": "MARTA LIDIA",
-    "5566": "MAYOR RODRIGUEZ",
-    "5567": "MISTOLAR",
-    "5568": "PALMAR",
-    "5569": "PAMPA GRANDE",
-    "5570": "PICADA 14 DE MAYO",
-    "5571": "PIRIZAL",
-    "5572": "POZO ANTA",
-    "5573": "POZO BRILLANTE",
-    "5574": "POZO LEON",
-    "5575": "PRATTS GILL (BASE AEREA)",
-    "5576": "PUESTO POZO HONDO",
-    "5577": "RIVERA PORVENIR",
-    "5578": "SAFARI",
-    "5579": "SAN ANTONIO",
-    "5580": "SAN JOSE ESTERO",
-    "5880": "PEDRO P.PEÑA",
-    "5881": "BELLA VISTA",
-    "5882": "CAP.MAZZEI",
-    "5883": "CELINA",
-    "5884": "ESPERANZA",
-    "5885": "JABALI",
-    "5886": "LA LECHIGUANA",
-    "5887": "LINARES VIEJO",
-    "5888": "MAYOR A.GARDEL",
-    "5889": "PASO DE LOS TOBAS",
-    "5890": "POZO MILICO",
-    "5663": "GRAL.EUGENIO A.GARAY.........",
-    "5664": "10 DE OCTUBRE",
-    "5665": "AURORA",
-    "5666": "B.AEREA NVA.ASUNCION (PICUIBA)",
-    "5667": "CARLOS A.LOPEZ (PITIANTUTA)",
-    "5668": "COL.PYAJHU",
-    "5669": "CURUPAYTY",
-    "5670": "DORADO",
-    "5671": "ESTRELLAS",
-    "5672": "FARO MORO",
-    "5673": "GUARANI",
-    "5674": "HERNANDARIAS",
-    "5675": "INDEPENDENCIA",
-    "5676": "LA FAYE",
-    "5677": "MISTER LONG",
-    "5678": "NUEVA ASUNCION",
-    "5679": "PARQUE CUE",
-    "5680": "PASO 15 DE ABRIL",
-    "5681": "SGTO.B.FIGUEREDO",
-    "5682": "SGTO.RODRIGUEZ",
-    "5683": "TTE.1RO.RAMIRO ESPINOLA",
-    "5684": "TTE.AGRIPINO ENCISO",
-    "5685": "TTE.E.OCHOA",
-    "5686": "TTE.G.TROVATTO",
-    "5687": "TTE.JUAN E.LOPEZ",
-    "5688": "TTE.MONTANIA (KM.220)",
-    "5689": "TTE.R.RUEDA",
-    "5690": "VALINOTTI",
-    "5691": "YATEBU-I",
-    "6413": "COL.FERNHEIN",
-    "6430": "LOMA PLATA",
-    "4624": "FUERTE OLIMPO",
-    "4625": "14 DE MAYO",
-    "4626": "3 TORITOS",
-    "4627": "ALGARROBAL",
-    "4628": "BARRERO",
-    "4629": "BARRERO GRANDE",
-    "4630": "CAMPAMENTO",
-    "4631": "CAMPICHUELO",
-    "4632": "CAMPO TORO",
-    "4633": "CAP.BADO",
-    "4634": "CAÑADITA",
-    "4635": "COL.CARMELO",
-    "4636": "COL.MARIA AUXILIADORA",
-    "4637": "CORRALON",
-    "4638": "CUARENTA",
-    "4639": "CUÑATAI",
-    "4640": "DON FELIPE FELTES",
-    "4641": "EL TRIUNFO",
-    "4642": "ESPERANZA",
-    "4643": "ESTRELLA",
-    "4644": "GRAL.DIAZ",
-    "4645": "GOMEZ",
-    "4646": "IMAKATA",
-    "4647": "ISLA CACA",
-    "4648": "ISLA MARGARITA",
-    "4649": "JOSE ZAVAN",
-    "4650": "LA AMERICANA",
-    "4651": "LAGUNA BLANCA",
-    "4652": "M.PIRU",
-    "4653": "MANDUVIRA",
-    "4654": "MEDANO",
-    "4655": "MOREL CUE",
-    "4656": "NECESIDAD",
-    "4657": "PERALTA",
-    "4658": "PORVENIR",
-    "4659": "POTRILLO",
-    "4660": "PRIMAVERA",
-    "4661": "PUERTO ESTHER",
-    "4662": "PUERTO GUARANI",
-    "4663": "PUERTO LEDA",
-    "4664": "PUERTO LIDIA",
-    "4665": "PUERTO MARIA AUXILIADORA",
-    "4666": "PUERTO NUEVO",
-    "4667": "PUERTO ROA",
-    "4668": "PUERTO TRES PALMAS",
-    "4669": "PUERTO VOLUNTAD",
-    "4670": "PUERTO YBAPOBO",
-    "4671": "PUESTO LATA",
-    "4672": "QUEBRACHOS",
-    "4673": "RANCHO QUEMADO",
-    "4674": "RETIRO CERRITO",
-    "4675": "RETIRO GAZURIAGA",
-    "4676": "RETIRO KM.8",
-    "4677": "RETIRO MARIA",
-    "4678": "RETIRO PANTANAL",
-    "4679": "RETIRO SAN MIGUEL",
-    "4680": "RETIRO YBYCUI",
-    "4681": "RIVAROLA CUE",
-    "4682": "SAN ANTONIO",
-    "4683": "SAN CARLOS",
-    "4684": "SAN FRANCISCO",
-    "4685": "SAN JORGE",
-    "4686": "SAN JOSE",
-    "4687": "SAN JUAN",
-    "4688": "SAN MARCO",
-    "4689": "SAN SALVADOR",
-    "4690": "SOL.NACIENTE",
-    "4691": "STA.EULALIA",
-    "4692": "STA.GABRIELA",
-    "4693": "STA.ISABEL",
-    "4694": "STA.RUFINA",
-    "4695": "TAYI COTY",
-    "4696": "TIMBO",
-    "4697": "TOROVAL",
-    "4698": "TORRES",
-    "4699": "BAHIA NEGRA",
-    "4700": "14 DE MAYO",
-    "4701": "BLANQUITA",
-    "4702": "BUENA VISTA",
-    "4703": "CAACUPE",
-    "4704": "CABARA-I",
-    "4705": "CAP.CARMELO PERALTA",
-    "4706": "CAVICHUI",
-    "4707": "CERRITO JARA",
-    "4708": "CERRITOS",
-    "4709": "CERRO CORA",
-    "4710": "CURUPAYTY",
-    "4711": "GALPON",
-    "4712": "ISIRIA",
-    "4713": "LECHUZA",
-    "4714": "PALOMAR",
-    "4715": "PATRIA (EX. EN.)",
-    "4716": "PATRIA I",
-    "4717": "PORFIRIA",
-    "4718": "POZO AZUL",
-    "4719": "PUERTO 14 DE MAYO",
-    "4720": "PUERTO ALVARENGA",
-    "4721": "PUERTO CABALLO",
-    "4722": "PUERTO ESPERANZA",
-    "4723": "PUERTO MERCEDES",
-    "4724": "PUERTO RAMOS",
-    "4725": "RANCHO PALOMA",
-    "4726": "SAMUHU Y CABANILLAS",
-    "4727": "SAN LUIS",
-    "4728": "SAN PABLO",
-    "4729": "SAN SILVANO",
-    "4730": "STA.CATALINA",
-    "4731": "YUQUERI",
-    "5822": "MALDONADO",
-    "5823": "POTRERITO",
-    "5824": "PUERTO DIANA",
-    "5825": "RIACHO ALEGRE",
-    "5826": "STA.ANA",
-    "4732": "CAMPAMENTO",
-    "4733": "CAMPO SASTRE-PTO.SASTRE",
-    "4734": "JUAN CUE",
-    "4735": "MINAS CUE",
-    "4736": "PUERTO CASADO",
-    "4737": "PUERTO PAGANI CUE",
-    "5827": "CASILLA",
-    "5828": "STO.DOMINGO",
-    "4598": "PTO.GUARANI",
-    "5638": "MAYOR PABLO LAGERENZA",
-    "5639": "ALAMBIQUE",
-    "5640": "BAPTISTA",
-    "5641": "BARBARO",
-    "5642": "CABO GIMENEZ",
-    "5643": "CHOVORECA (BASE AEREA)",
-    "5644": "CNEL.BOGADO",
-    "5645": "CNEL.SANCHEZ",
-    "5646": "FLORIDA",
-    "5647": "JOSE M.LOPEZ",
-    "5648": "LAGERENZA-I",
-    "5649": "MADREJON",
-    "5650": "MADREJONCITO",
-    "5651": "MAYOR R.SANTACRUZ",
-    "5652": "NUEVA TRIBU",
-    "5653": "PALMAR DE LAS ISLAS",
-    "5654": "PIKYRENDA",
-    "5655": "SAN JOSE",
-    "5656": "TAPACARE",
-    "5657": "TRES LAGUNAS",
-    "5658": "TTE.1RO. H.MENDOZA",
-    "5659": "TTE.AMERICO PICCO",
-    "5660": "TTE.GABINO MENDOZA",
-    "5661": "TTE.MARTINEZ",
-    "5662": "TTE. R.COCO RIVEROS",
-    "4860": "SAN ISIDRO DEL CURUGUATY",
-    "4861": "5A.REGION MILITAR",
-    "4862": "8 DE DICIMBRE",
-    "4863": "AGUAHE",
-    "4864": "AGUARA",
-    "4865": "ALCARAZ CUE",
-    "4866": "ARROYO CAA-Y",
-    "4867": "ARROYO CHAPI",
-    "4868": "ARROYO GUAZU",
-    "4869": "ARROYO ITA",
-    "4870": "ARROYO PINDO",
-    "4871": "ARROYO YBYCUI",
-    "4872": "ARROYO YBYRA PYTA",
-    "4873": "ASUNCION PAIVA",
-    "4874": "AVIACION",
-    "4875": "BARRERO VILLAR (BARRERO)",
-    "4876": "CAMBA",
-    "4877": "CAMPAMENTO",
-    "4878": "CAÑADITA",
-    "4879": "CERRITO",
-    "4880": "COL.FORTUNA",
-    "4881": "CURUGUATY (MUNICIPIO)",
-    "4882": "DANIEL MARTINEZ",
-    "4883": "DESTACAMENTO PUNTO 4A.NA.1",
-    "4884": "ESTANCIA GOLONDRINA",
-    "4885": "ESTANCIA SAN BLAS",
-    "4886": "FORTUNA",
-    "4887": "GUAYAKI",
-    "4888": "GUAI-GUE PARAMI",
-    "4889": "JHUGUA GUAZU",
-    "4890": "KARUPERA",
-    "4891": "LAGUNITA",
-    "4892": "SAN JUAN MI",
-    "4893": "SANTO DOMINGO",
-    "4894": "TROCHE CUE",
-    "4895": "YATAITY",
-    "4896": "YBYCUI",
-    "4897": "YCUA PORA",
-    "4898": "YERUTI",
-    "4899": "YUQUERI",
-    "5834": "CAPII-TINDY",
-    "5835": "CURE CUA",
-    "5836": "ESTANCIA SAN ERNESTO",
-    "5837": "SAN JUAN",
-    "5838": "VARELA CAFETAL",
-    "4900": "ARROYO MOROTI",
-    "4901": "CAPIITINDY",
-    "4902": "CERRO GUACUE",
-    "4903": "CRUCE YBYRAROBANA",
-    "4904": "HORQUETA MI",
-    "4905": "ITACURUBI",
-    "4906": "ITANARA",
-    "4907": "ITANARA MI",
-    "4908": "KARUPERAMI",
-    "4909": "KILOMETRO 15 (CMIA)",
-    "4910": "LAGUNA PACOBA",
-    "4911": "LAGUNA PACOBA 2A.LINEA",
-    "4912": "LAGUNA VERA",
-    "4913": "LAGUNA YERE",
-    "4914": "LEON CUE",
-    "4915": "LOMADA",
-    "4916": "LUCIO CUE",
-    "4917": "MBOI YAGUA",
-    "4918": "MBUYTY",
-    "4919": "MONTE SINAI",
-    "4920": "NACIENTE",
-    "4921": "NARANJITO",
-    "4922": "OBRAJE 7 MONTES",
-    "4923": "OBRAJE ARROYO GUAZU",
-    "4924": "OBRAJE ARROYO MOCOI",
-    "4925": "OBRAJE CANELA",
-    "4926": "OBRAJE PAR-Y",
-    "4927": "OBRAJE PINDOTY",
-    "4928": "OBRAJE SAN ANTONIO",
-    "4929": "OBRAJE SOLAECHE",
-    "4930": "OBRAJE TACUAPI",
-    "4931": "OBRAJE URBINA",
-    "4932": "OBRAJE YBYRA PYTA",
-    "4933": "OBRAJE YUKERI",
-    "4934": "PARAJE LUISA",
-    "4935": "PASITO",
-    "4936": "PASO ITA",
-    "4937": "PASO PARODI",
-    "4938": "PASO REAL",
-    "4939": "PASO ROMERO",
-    "4940": "PIRACAI",
-    "4941": "POTRERITO",
-    "4942": "POTRERO BAEZ",
-    "4943": "POTRERO TACUARA",
-    "4944": "POTRERO VAI",
-    "4945": "PRIMAVERA",
-    "4946": "PUENTE CAVETI",
-    "4947": "PUERTO JHU",
-    "4948": "PUERTO MOROMBI",
-    "4949": "PUESTO ACARAY-MI",
-    "4950": "PUESTO SANDOVAL",
-    "4951": "PUESTO YSAU",
-    "4952": "QUEREU",
-    "4953": "RIO CORRIENTES",
-    "4954": "RIO VERDE",
-    "4955": "SAN ANTONIO",
-    "4956": "SAN JUAN",
-    "4957": "SAN RAFAEL",
-    "4958": "TACUARA TY",
-    "4959": "TACUAREMBOY",
-    "4960": "TENDAL",
-    "4961": "VILLA YGATIMI (MUNICIPIO)",
-    "4962": "YBYBUCUA",
-    "4963": "YBYRAROBANA",
-    "4964": "YBU 1A.",
-    "4965": "YBU 2A.",
-    "4966": "YUICAI",
-    "4967": "ÑAMBY",
-    "4968": "ÑANDUROCAI",
-    "5839": "VILLA YGATIMI",
-    "5840": "ESCALERA",
-    "5841": "JEJUI-MI",
-    "5842": "LAGUNA PACOBA 3A.LINEA",
-    "5843": "MBARIGUIY",
-    "4969": "YPEJHU",
-    "4970": "AGUARA YARTHE",
-    "4971": "CAAGUY PORA",
-    "4972": "CALI-CUE",
-    "4973": "CARAPA-I",
-    "4974": "CARAPE",
-    "4975": "COFISA",
-    "4976": "COL.INDIGENA CAZAL",
-    "4977": "COL.INDIGENA PARIRI",
-    "4978": "CURUZU",
-    "4979": "GUAYAIBI",
-    "4980": "ITANARA",
-    "4981": "LAGUNITA",
-    "4982": "LOPEZ CUE",
-    "4983": "MENCHACA CUE",
-    "4984": "MOJON",
-    "4985": "0BRAJE PINDOTY",
-    "4986": "OBRAJE ROTELA",
-    "4987": "PASO JHU",
-    "4988": "PASTAJE CERRO",
-    "4989": "SAN ROQUE",
-    "4990": "TACUARA",
-    "4991": "TACUARATY",
-    "4992": "YBYCUI",
-    "4993": "YBU",
-    "4994": "YPAU",
-    "4995": "YPEJHU (MUNICIPIO)",
-    "4996": "ÑUA-I",
-    "4997": "CORPUS CHRISTI",
-    "4998": "11 DE SETIEMBRE",
-    "4999": "3 NACIENTES",
-    "5000": "ADMINISTRACION CUE",
-    "5001": "AMERICANA CARAPE",
-    "5002": "ARROYO ITA",
-    "5003": "ARROYO PALOMBO",
-    "5004": "ARROYO PORA",
-    "5005": "ARROYO ROYSA",
-    "5006": "BUEN VIAJE",
-    "5007": "CADETE CUE",
-    "5008": "CALLE CERRO PORTEÑO",
-    "5009": "CANEAN",
-    "5010": "CARAPA",
-    "5011": "CAYE CUE (ÑUMI)",
-    "5012": "CERRO PYTA",
-    "5013": "CERRO DE ORO",
-    "5014": "CHACRA SAN LUIS",
-    "5015": "CHACRA DOMINGO",
-    "5016": "CLEVAS CARAPA",
-    "5017": "CLEVAS CATUETE",
-    "5018": "CLEVAS GUARANI",
-    "5019": "CLEVAS OLIMPIA",
-    "5020": "CLEVAS SAN FRANCISCO",
-    "5021": "CLEVAS SAN JUAN",
-    "5022": "CORPUS CRISTI (RURAL)",
-    "5023": "CORPUS CHRISTI (MUNICIPIO)",
-    "5024": "DESTACAMENTO MILITAR",
-    "5025": "DISTRITO MILITAR",
-    "5026": "DON PEDRO",
-    "5027": "ESPADIN YAJHE-O",
-    "5028": "FAZENDA 22 DE SETIEMBRE",
-    "5029": "FAZENDA BACHIRAS",
-    "5030": "FAZENDA BUENA ESPERANZA",
-    "5031": "FAZENDA DON RAUL",
-    "5032": "FAZENDA ESPAÑA",
-    "5033": "FAZENDA ESPAÑA 2A.",
-    "5034": "FAZENDA NTRA.SRA.ASUNCION",
-    "5035": "FAZENDA SAN JOSE",
-    "5036": "FELICIDAD LA FUENTE",
-    "5037": "FRANCISCO PALOMBO",
-    "5038": "FRANCISCO PALOMBO 2A.",
-    "5039": "GORRA PYTA",
-    "5040": "GUARANI AMERICANA",
-    "5041": "GUEMBE VERA",
-    "5042": "HITO 86",
-    "5043": "INFIERNO CUE",
-    "5581": "ITABO CUBAS",
-    "5582": "KILOMETRO 41",
-    "5583": "LALI CUE",
-    "5584": "MIMBY CUE",
-    "5585": "NUEVA ASUNCION 1A.",
-    "5586": "NUEVA ASUNCION 2A.",
-    "5587": "OBRAJE AMERICANO",
-    "5588": "OBRAJE GUERRILLERO",
-    "5589": "OBRAJE ITABO",
-    "5590": "OBRAJE SANTA CLARA",
-    "5591": "PACOBA",
-    "5592": "PACOBA 1A.",
-    "5593": "PACOBA 27",
-    "5594": "PACOBA 2A.",
-    "5595": "PALMITAL",
-    "5596": "PALMITAL CARAPA",
-    "5597": "PALMITAL IBEL",
-    "5598": "PALMITAL SAN ONOFRE",
-    "5599": "PALMITAL YAJHAPE",
-    "5600": "PIQUIÑO CUE",
-    "5601": "PLANCHADA LA NOVIA",
-    "5602": "PORTON NRO.1",
-    "5603": "PORTON NRO.2",
-    "5604": "PORTON NRO.3",
-    "5605": "PUENTE GUAYAKI",
-    "5606": "PUENTE ONOFRE",
-    "5607": "PUENTE PERO",
-    "5608": "RAMONITA",
-    "5609": "RANCHO DOS HERMANAS",
-    "5610": "RANCHO MARIA",
-    "5611": "RANCHO TUYU",
-    "5612": "SAN ALCIDES",
-    "5613": "SAN LUIS",
-    "5614": "SITIO 4 HERMANOS",
-    "5615": "VILLA IBEL",
-    "5616": "Y-JHOVY",
-    "5617": "YNAMBU Y-GUA",
-    "5618": "YUQUERI",
-    "5619": "YUQUERI 2A.",
-    "5620": "ZANJA PYTA",
-    "5621": "ÑASAINDY",
-    "5844": "FAZENDA PROGRESO",
-    "5845": "GUARANI AMERICANA 2A.",
-    "5622": "ITANARA",
-    "5623": "CAZAL CUE",
-    "5624": "COL.ITANARA",
-    "5625": "PARIRI",
-    "5626": "FRANCISCO CABALLERO ALVAREZ",
-    "5627": "6 DE ENERO",
-    "5628": "CRUCE PUENTE",
-    "5629": "ESTANCIA ITAKYRY",
-    "5630": "GUALIPANGO",
-    "5631": "KATUETE",
-    "5632": "LA PALOMA",
-    "5633": "MBARACAYU",
-    "5634": "PUENTE KYJHA",
-    "5635": "SAN FELIPE",
-    "5636": "SANTA CLARA",
-    "5637": "SANTA MARIA",
-    "4738": "SALTO DEL GUAIRA",
-    "4739": "22 MBARACAYU",
-    "4740": "6 DE ENERO",
-    "4741": "ALICA-I",
-    "4742": "ARROYO GUAZU",
-    "4743": "ARROYO GUAZU 2DO.",
-    "4744": "ARROYO ITAMBEY I",
-    "4745": "ARROYO ITA BLANCA CUE",
-    "4746": "ARROYO PERO",
-    "4747": "ARROYO SAN FRANCISCO",
-    "4748": "ARROYO YUQUERI",
-    "4749": "ASERRADERO ANGELITO",
-    "4750": "AUDIBER CUE",
-    "4751": "BAJADA GUAZU",
-    "4752": "BUEN DESTINO",
-    "4753": "CAMPAMENTO IBEL",
-    "4754": "CANINDEYU",
-    "4755": "CARAPA COLONIA GUARANI",
-    "4756": "CARAPA KM.3 MBARACAYU",
-    "4757": "CARAPA PARANA",
-    "4758": "CAÑADA SAN VICENTE",
-    "4759": "COL.GUARANI 4 Y 6",
-    "4760": "COL.MARANGATU",
-    "4761": "COL.MBARACAYU GUARANI",
-    "4762": "COL.SALTOS DEL GUAIRA (MUNIC)",
-    "4763": "COL.SAN LUIS BORBA",
-    "4764": "CRUCE PUENTE KYJHA",
-    "4765": "CRUCE PUENTE KYJHA 2A.LINEA",
-    "4766": "EL HUASIPONGO",
-    "4767": "ESTANCIA ALTO PARANA",
-    "4768": "ESTANCIA ITA BLANCA",
-    "4769": "ESTANCIA MALDONADO",
-    "4770": "ESTANCIA MACAEMBU KM.29",
-    "4771": "ESTANCIA SAN BERNARDO",
-    "4772": "ESTANCIA SAN LUIS",
-    "4773": "ESTANCIA SANTA TERESA",
-    "4774": "FAZENDA 47",
-    "4775": "FAZENDA 5 DE SETIEMBRE",
-    "4776": "FAZENDA ALBORADA",
-    "4777": "FAZENDA BEATRIZ LOPEZ",
-    "4778": "FAZENDA BELLA FLOR",
-    "4779": "FAZENDA EBRAIN",
-    "4780": "FAZENDA FIDELINO ROSA",
-    "4781": "FAZENDA GARCIA",
-    "4782": "FAZENDA GENTIL MACHADO",
-    "4783": "FAZENDA GUAVIRA POTY",
-    "4784": "FAZENDA JOSE",
-    "4785": "FAZENDA MALDONADO (HACIENDA)",
-    "4786": "FAZENDA MINEROS",
-    "4787": "FAZENDA MOISES BERNARDO",
-    "4788": "FAZENDA NANAWA",
-    "4789": "FAZENDA SERRATI",
-    "4790": "FAZENDA TACUARA",
-    "4791": "FAZENDA TACUARA 2A.",
-    "4792": "FAZENDA VILINA KELVIN",
-    "4793": "GAZOTY 2A.",
-    "4794": "GRANJA SERRATI",
-    "4795": "GUATA PORA (KM.39)",
-    "4796": "GUAVIRA",
-    "4797": "GUAVIRA 2A.(GUAVIRA-I)",
-    "4798": "GUAZURY KM.16",
-    "4799": "GUAZURY PARANA",
-    "4800": "GUAZU YCUA",
-    "4801": "ITABO-MI",
-    "4802": "ITABO TACUARA",
-    "4803": "ITACURUBI",
-    "4804": "KILOMETRO 10 GUARANI",
-    "4805": "KILOMETRO 14 MBARACAYU",
-    "4806": "KILOMETRO 23 PRADO",
-    "4807": "KILOMETRO 24 MBARACAYU",
-    "4808": "KILOMETRO 29 MBARACAYU",
-    "4809": "KILOMETRO 30",
-    "4810": "KILOMETRO 4 CARAPA",
-    "4811": "KILOMETRO 4 MBARACAYU",
-    "4812": "KILOMETRO 40",
-    "4813": "KILOMETRO 40 GUARANI",
-    "4814": "KILOMETRO 40 MBARACAYU",
-    "4815": "KILOMETRO 41 BORBA",
-    "4816": "KILOMETRO 42 BORBA",
-    "4817": "KILOMETRO 47 BORBA",
-    "4818": "KILOMETRO 5 MBARACAYU",
-    "4819": "KILOMETRO 53 Y PATRIMONIO PORA",
-    "4820": "KILOMETRO 6",
-    "4821": "KILOMETRO 8",
-    "4822": "LA REINA",
-    "4823": "LA REINA 2A.",
-    "4824": "LA REINA 3A.",
-    "4825": "MAINUMBY",
-    "4826": "NUESTRA SRA.APARECIDA",
-    "4827": "ORO VERDE",
-    "4828": "PALMITAL M.AMORE",
-    "4829": "PALMITAL SAN MIGUEL",
-    "4830": "PANAMBI VERA KM.34 GUARANI",
-    "4831": "PATRIMONIO YACY PORA",
-    "4832": "PATRIMONIO YBY PORA",
-    "4833": "PORTON NRO.4",
-    "4834": "PORTON NRO.5",
-    "4835": "POSUELO",
-    "4836": "PUENTE CARAPA",
-    "4837": "PUENTE KYJHA",
-    "4838": "PUENTE KYJHA 2A.",
-    "4839": "PUERTO ADELA",
-    "4840": "PUERTO MARANGATU",
-    "4841": "PUERTO TEMBEY",
-    "4842": "RANCHO ALEGRE",
-    "4843": "RANCHO CORONEL",
-    "4844": "RANCHO MARTINEZ KM.30",
-    "4845": "RANCHO PALMITO",
-    "4846": "RANCHO SANTA ISABEL",
-    "4847": "REINA BETTI",
-    "4848": "RESERVADO 29",
-    "4849": "RIVEROS PARANA",
-    "4850": "ROSENDO PALMITAL",
-    "4851": "SALTOS DEL GUAIRA",
-    "4852": "SAN JUAN",
-    "4853": "SANTO DOMINGO",
-    "4854": "SITIO SANTANA",
-    "4855": "SITIO YBY CATU",
-    "4856": "TACUARA",
-    "4857": "TUNA",
-    "4858": "YAJHAPE SANTA CRUZ",
-    "4859": "YUKYRYBIY",
-    "5829": "ARROYO BLANCO",
-    "5830": "ARROYO LA REINA",
-    "5831": "AZUCA",
-    "5832": "CAMPAMENTO ZATO",
-    "5833": "CERRO VERA",
-    "4602": "LA PALOMA",
-    "4599": "KATUETE",
-    "4603": "NUEVA ESPERANZA",
-    "4607": "YASY KAÑY",
-    "6424": "YBYRAROBANA",
-    "6426": "YBY PYTA (MUNICIPIO)",
-    "6431": "MARACANA",
-}
-
 INDICADORES_PRESENCIA = {
     "1": "Operación presencial",
     "2": "Operación electrónica",
@@ -8018,5 +289,3 @@ TIPO_DOC_IDENTIDAD = {
     "3": "Cédula extranjera",
     "4": "Carnet de residencia",
 }
-
-
@@ -0,0 +1,50 @@
+import os
+import pickle
+import shutil
+
+from sifen.core.signers.almacen_claves import AlmacenClaves, AlmacenPKCS12, CERT_PATH, KEY_PATH
+
+
+class _AlmacenPropio(AlmacenPKCS12):
+    """Subclase de un usuario (p. ej. para redefinir _leer)."""
+
+
+def _copiar_par(tmp_path):
+    key_path = tmp_path / "key.pem"
+    cert_path = tmp_path / "cert.pem"
+    shutil.copy(KEY_PATH, key_path)
+    shutil.copy(CERT_PATH, cert_path)
+    return str(key_path), str(cert_path)
+
+
+def test_carga_el_par_una_sola_vez(tmp_path):
+    key_path, cert_path = _copiar_par(tmp_path)
+    almacen = AlmacenClaves(key_path, cert_path, intervalo_verificacion=0)
+    primera = almacen.obtener_clave()
+    assert almacen.obtener_clave() is primera
+    assert almacen.cargas == 1
+
+
+def test_recarga_si_cambia_el_mtime(tmp_path):
+    key_path, cert_path = _copiar_par(tmp_path)
+    almacen = AlmacenClaves(key_path, cert_path, intervalo_verificacion=0)
+    primera = almacen.obtener_clave()
+    mtime = os.stat(cert_path).st_mtime
+    os.utime(cert_path, (mtime + 10, mtime + 10))
+    assert almacen.obtener_clave() is not primera
+    assert almacen.cargas == 2
+
+
+def test_invalidar(tmp_path):
+    key_path, cert_path = _copiar_par(tmp_path)
+    almacen = AlmacenClaves(key_path, cert_path)
+    almacen.precargar()
+    almacen.invalidar()
+    almacen.precargar()
+    assert almacen.cargas == 2
+
+
+def test_copia_entre_procesos_conserva_la_subclase(tmp_path):
+    copia = pickle.loads(pickle.dumps(_AlmacenPropio(str(tmp_path / "a.p12"), "secreto", 5.0)))
+    assert type(copia) is _AlmacenPropio
+    assert (copia.key_path, copia.contrasena, copia.intervalo_verificacion) == (str(tmp_path / "a.p12"), "secreto", 5.0)
@@ -0,0 +1,36 @@
+import re
+
+from sifen.core.builders.xml_builder import SIFEN_NS, XMLBuilder
+from sifen.utils.cdc import calcular_dv, generar_cdc, generar_cdc_lote
+from tests.conftest import crear_factura
+
+
+def test_dv_del_ejemplo_de_la_set():
+    cdc = "01800695631001001000000612021112917595714694"
+    assert calcular_dv(cdc[:-1]) == int(cdc[-1])
+    assert calcular_dv("80069563") == 1
+
+
+def test_cdc_tiene_44_digitos_y_dv_valido(factura):
+    cdc = generar_cdc(factura)
+    assert re.fullmatch(r"[0-9]{44}", cdc)
+    assert int(cdc[-1]) == calcular_dv(cdc[:-1])
+    assert factura.generar_id() == cdc
+
+
+def test_cdc_lote_coincide_con_el_individual():
+    facturas = []
+    for numero in range(1, 21):
+        factura = crear_factura()
+        factura.numero_factura = f"001-002-{numero:07d}"
+        factura.codigo_seguridad = f"{numero * 7919:09d}"
+        facturas.append(factura)
+
+    assert generar_cdc_lote(facturas) == [generar_cdc(f) for f in facturas]
+
+
+def test_builder_usa_el_cdc_como_id(factura):
+    de = XMLBuilder.build_tree(factura).find("{%s}DE" % SIFEN_NS)
+    cdc = factura.generar_id()
+    assert de.get("Id") == cdc
+    assert de.findtext("{%s}dDVId" % SIFEN_NS) == cdc[-1]
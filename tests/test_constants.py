@@ -0,0 +1,23 @@
+import subprocess
+import sys
+
+from sifen.utils import constants
+
+
+def test_catalogos_diferidos_mantienen_la_api_de_dict():
+    from sifen.utils.constants import PAISES
+
+    assert PAISES["PRY"] == "Paraguay"
+    assert constants.CIUDADES_PARAGUAY.get("1") == "ASUNCION (DISTRITO)"
+    assert constants.MONEDAS is constants.MONEDAS
+    assert "CIUDADES_PARAGUAY" in dir(constants)
+
+
+def test_importar_constants_no_carga_los_catalogos():
+    codigo = (
+        "from sifen.utils import constants\n"
+        "assert not set(constants.CATALOGOS_DIFERIDOS) & set(vars(constants))\n"
+        "constants.DISTRITOS_PARAGUAY\n"
+        "assert 'DISTRITOS_PARAGUAY' in vars(constants)\n"
+    )
+    subprocess.run([sys.executable, "-c", codigo], check=True)
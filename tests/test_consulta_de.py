@@ -0,0 +1,76 @@
+import asyncio
+import multiprocessing
+import time
+
+from lxml import etree
+
+from sifen.core.clients.consulta_de import CacheDE, ClienteConsultaDE, EstadoDE
+from sifen.core.clients.soap import SIFEN_NS, sifen
+from sifen.core.validators.validator import validar_xml
+from sifen.emulador.servidor import ServidorSIFEN
+
+CDC = "0180012345670010010000001120240115112345{:03d}"
+
+
+def _guardar_en_otro_proceso(ruta, cdc):
+    cache = CacheDE(ruta_sqlite=ruta)
+    cache.guardar(EstadoDE(cdc=cdc, codigo="0422", estado="Cancelado", protocolo="77"))
+    cache.cerrar()
+
+
+def test_estados_finales_no_vencen_y_se_comparten_entre_procesos(tmp_path):
+    ruta = str(tmp_path / "consultas.db")
+    reloj = [1000.0]
+    cache = CacheDE(ttl_pendiente=30, ruta_sqlite=ruta, reloj=lambda: reloj[0])
+    cache.guardar(EstadoDE(cdc=CDC.format(1), codigo="0422", estado="Aprobado"))
+    cache.guardar(EstadoDE(cdc=CDC.format(2), codigo="0420"))
+
+    reloj[0] += 31
+    assert cache.obtener(CDC.format(1)).estado == "Aprobado"
+    assert cache.obtener(CDC.format(2)) is None
+
+    proceso = multiprocessing.Process(target=_guardar_en_otro_proceso, args=(ruta, CDC.format(3)))
+    proceso.start()
+    proceso.join()
+    assert proceso.exitcode == 0
+    compartido = cache.obtener(CDC.format(3))
+    assert compartido.final and compartido.protocolo == "77"
+
+
+def test_consultar_muchos_usa_la_cache_y_respeta_el_limite():
+    cdcs = [CDC.format(i) for i in range(10)]
+
+    async def escenario():
+        async with ServidorSIFEN() as servidor:
+            servidor.documentos.update({cdc: "Aprobado" for cdc in cdcs[:8]})
+            servidor.documentos[cdcs[0]] = "Cancelado"
+            cliente = ClienteConsultaDE(
+                url_base=servidor.url, cache=CacheDE(ttl_pendiente=0), concurrencia=4, por_segundo=50
+            )
+            async with cliente:
+                inicio = time.perf_counter()
+                primera = await cliente.consultar_muchos(cdcs + cdcs[:3])
+                segundos = time.perf_counter() - inicio
+                solicitudes = servidor.solicitudes
+                segunda = await cliente.consultar_muchos(cdcs)
+
+                mensaje = etree.Element(sifen("rEnviConsDeRequest"), nsmap={None: SIFEN_NS})
+                etree.SubElement(mensaje, sifen("dId")).text = "1"
+                etree.SubElement(mensaje, sifen("dCDC")).text = cdcs[0]
+                respuesta = await cliente.llamar(cliente.ruta, mensaje)
+                return primera, segundos, solicitudes, segunda, servidor.solicitudes, respuesta
+
+    primera, segundos, solicitudes, segunda, total, respuesta = asyncio.run(escenario())
+
+    assert list(primera) == cdcs
+    assert primera[cdcs[0]].estado == "Cancelado"
+    assert all(primera[cdc].estado == "Aprobado" for cdc in cdcs[1:8])
+    assert primera[cdcs[9]].estado == "Inexistente" and not primera[cdcs[9]].final
+    assert solicitudes == 10
+    assert segundos >= 9 / 50
+
+    # Con ttl_pendiente=0 solo los dos CDC pendientes se vuelven a consultar,
+    # más la llamada directa que valida la respuesta
+    assert total - solicitudes == 2 + 1
+    assert segunda[cdcs[3]] is primera[cdcs[3]]
+    assert validar_xml(respuesta, "rEnviConsDe") == (True, None)
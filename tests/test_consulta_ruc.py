@@ -0,0 +1,91 @@
+import asyncio
+
+from sifen.core.clients.consulta_ruc import CacheRUC, ClienteConsultaRUC, DatosRUC
+from sifen.core.clients.soap import sifen
+from sifen.core.emision import emitir_arbol
+from sifen.core.validators.validator import validar_xml
+from sifen.emulador.servidor import ServidorSIFEN
+from sifen.models.receptor import Receptor
+from tests.conftest import crear_factura
+
+
+class Reloj:
+    def __init__(self):
+        self.ahora = 1000.0
+
+    def __call__(self):
+        return self.ahora
+
+
+def _encontrado(ruc, razon_social="CLIENTE S.A."):
+    return DatosRUC(ruc=ruc, codigo="0502", mensaje="RUC encontrado", razon_social=razon_social)
+
+
+def test_cache_lru_con_vencimiento():
+    reloj = Reloj()
+    cache = CacheRUC(max_entradas=2, ttl=60, reloj=reloj)
+    cache.guardar(_encontrado("1111111"))
+    cache.guardar(_encontrado("2222222"))
+    assert cache.obtener("1111111") is not None  # 1111111 pasa a ser el más reciente
+    cache.guardar(_encontrado("3333333"))
+
+    assert cache.obtener("2222222") is None
+    assert cache.obtener("1111111") is not None
+    reloj.ahora += 61
+    assert cache.obtener("1111111") is None
+
+    cache.guardar(DatosRUC(ruc="4444444", codigo="0501", mensaje="Sin permiso"))
+    assert cache.obtener("4444444") is None
+
+
+def test_cache_sqlite_persiste_entre_instancias(tmp_path):
+    ruta = str(tmp_path / "ruc.db")
+    reloj = Reloj()
+    primera = CacheRUC(ruta_sqlite=ruta, reloj=reloj, ttl=60)
+    primera.guardar(_encontrado("80012345", "EMPRESA S.A."))
+    primera.cerrar()
+
+    segunda = CacheRUC(ruta_sqlite=ruta, reloj=reloj, ttl=60)
+    assert segunda.obtener("80012345") == _encontrado("80012345", "EMPRESA S.A.")
+    reloj.ahora += 61
+    segunda.invalidar()
+    assert segunda.obtener("80012345") is None
+
+
+def test_consultas_simultaneas_se_unen_y_lote_acotado():
+    async def escenario():
+        async with ServidorSIFEN(latencia=0.02) as servidor:
+            servidor.contribuyentes = {str(ruc): f"CLIENTE {ruc}" for ruc in range(1000000, 1000020)}
+            async with ClienteConsultaRUC(url_base=servidor.url, concurrencia=4) as cliente:
+                mismos = await asyncio.gather(*(cliente.consultar("1000000-5") for _ in range(10)))
+                solicitudes_mismo = servidor.solicitudes
+
+                rucs = [str(ruc) for ruc in range(1000000, 1000021)] * 2
+                lote = await cliente.consultar_muchos(rucs)
+                return mismos, solicitudes_mismo, lote, servidor, cliente
+
+    mismos, solicitudes_mismo, lote, servidor, cliente = asyncio.run(escenario())
+
+    assert solicitudes_mismo == 1
+    assert all(datos is mismos[0] for datos in mismos)
+    assert mismos[0].razon_social == "CLIENTE 1000000" and mismos[0].activo
+
+    assert len(lote) == 21
+    assert not lote["1000020"].encontrado and lote["1000020"].codigo == "0500"
+    assert servidor.solicitudes == 21  # 1000000 ya estaba en cache
+    assert servidor.max_en_curso <= 4
+    assert cliente.cache.obtener("1000020") is not None
+
+
+def test_receptor_desde_consulta_llena_dnomrec():
+    datos = _encontrado("80012345", "RAZÓN SOCIAL SEGÚN SIFEN")
+    factura = crear_factura()
+    factura.receptor = Receptor.desde_consulta_ruc(datos, nombre="NOMBRE LOCAL", direccion="Calle 1", c_departamento="1",
+                                                   c_distrito="1", c_ciudad="1")
+    factura.receptor.validar()
+    assert factura.receptor.dv == "0"
+
+    rde = emitir_arbol(factura)
+    assert rde.findtext(f".//{sifen('dNomRec')}") == "RAZÓN SOCIAL SEGÚN SIFEN"
+    assert rde.findtext(f".//{sifen('dDVRec')}") == "0"
+    assert validar_xml(rde) == (True, None)
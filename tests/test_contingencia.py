@@ -0,0 +1,91 @@
+import asyncio
+from collections import Counter
+
+from sifen.core.clients.consulta_de import CacheDE, ClienteConsultaDE
+from sifen.core.clients.consulta_lote import ClienteConsultaLote
+from sifen.core.clients.contingencia import (
+    APROBADO,
+    ENVIADO,
+    ENVIANDO,
+    PENDIENTE,
+    BandejaContingencia,
+    DrenadorContingencia,
+)
+from sifen.core.clients.lote import ClienteLote, cdc_de
+from sifen.core.emision import emitir_factura
+from sifen.emulador.servidor import ServidorSIFEN
+from tests.conftest import crear_factura
+
+
+def _documentos(cantidad):
+    """Copias de un rDE firmado con CDC distintos (el emulador no verifica la firma)."""
+    xml = emitir_factura(crear_factura())
+    original = cdc_de(xml)
+    return [xml.replace(original.encode(), f"{original[:-6]}{i:06d}".encode()) for i in range(cantidad)]
+
+
+def test_bandeja_guarda_cada_cdc_una_vez_y_solo_transiciones_validas(tmp_path):
+    bandeja = BandejaContingencia(str(tmp_path / "bandeja.db"))
+    documentos = _documentos(5)
+    assert bandeja.guardar_muchos(documentos) == 5
+    assert bandeja.guardar(documentos[0]) is False
+
+    tomados = bandeja.tomar(3)
+    assert [cdc for cdc, _ in tomados] == [cdc_de(doc) for doc in documentos[:3]]
+    assert bandeja.tomar(10)[0][0] == cdc_de(documentos[3])
+    assert bandeja.tomar(10) == []
+
+    # Un PENDIENTE no puede darse por enviado, ni un ENVIADO volver a PENDIENTE
+    cdc = tomados[0][0]
+    assert bandeja.marcar_enviados([cdc], "7") == 1
+    assert bandeja.devolver([cdc]) == 0
+    assert bandeja.obtener(cdc).protocolo_lote == "7"
+    assert bandeja.contar() == {ENVIADO: 1, ENVIANDO: 4}
+    bandeja.cerrar()
+
+
+def test_drenar_sin_conexion_y_reanudar_tras_una_caida(tmp_path):
+    ruta = str(tmp_path / "bandeja.db")
+    documentos = _documentos(120)
+    cdcs = [cdc_de(doc) for doc in documentos]
+    BandejaContingencia(ruta).guardar_muchos(documentos)
+
+    async def sin_sifen():
+        cliente = ClienteLote(url_base="http://127.0.0.1:9", max_conexiones=2)
+        async with cliente:
+            return await DrenadorContingencia(BandejaContingencia(ruta), cliente).drenar()
+
+    assert asyncio.run(sin_sifen()) == 0
+    bandeja = BandejaContingencia(ruta)
+    assert bandeja.contar() == {PENDIENTE: 120}
+
+    # El proceso muere con un lote tomado; parte de él sí había llegado a SIFEN
+    bandeja.tomar(50)
+    bandeja.cerrar()
+    bandeja = BandejaContingencia(ruta)
+    assert bandeja.recuperar() == 50
+
+    async def con_sifen():
+        async with ServidorSIFEN(latencia=0.005, consultas_en_proceso=1) as servidor:
+            servidor.documentos.update({cdc: "Aprobado" for cdc in cdcs[:10]})
+            clientes = dict(url_base=servidor.url)
+            async with ClienteLote(**clientes, concurrencia=2) as lote, \
+                    ClienteConsultaLote(**clientes) as consulta_lote, \
+                    ClienteConsultaDE(**clientes, cache=CacheDE(ttl_pendiente=0)) as consulta_de:
+                drenador = DrenadorContingencia(
+                    bandeja, lote, consulta_lote, consulta_de, espera_dudosos=0,
+                    espera_inicial=0.01, jitter=0,
+                )
+                lotes = await drenador.drenar()
+            return lotes, servidor.lotes
+
+    lotes, recibidos = asyncio.run(con_sifen())
+
+    assert lotes == 3
+    enviados = Counter(cdc for lote in recibidos.values() for cdc in lote)
+    assert set(enviados) == set(cdcs[10:]) and max(enviados.values()) == 1
+    # Los 10 que SIFEN ya tenía se confirmaron con siConsDE, sin reenviarlos
+    assert bandeja.contar() == {APROBADO: 120}
+    assert bandeja.obtener(cdcs[0]).protocolo is not None
+    assert not bandeja.dudosos()
+    bandeja.cerrar()
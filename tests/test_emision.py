@@ -0,0 +1,112 @@
+import base64
+import multiprocessing
+
+import xmlsec
+from cryptography.hazmat.primitives import serialization
+from lxml import etree
+
+from sifen.core.builders.xml_builder import XMLBuilder
+from sifen.core.emision import emitir_arbol, emitir_factura, emitir_lote
+from sifen.core.signers.almacen_claves import CERT_PATH, AlmacenPKCS12
+from sifen.core.signers.qr import URLS_QR, ServicioQR
+from sifen.core.signers.signer import firmar_xml
+from sifen.core.validators.validator import validar_xml
+from tests.conftest import crear_factura
+from tests.test_qr import NS, qr_de_referencia
+from tests.test_registro_certificados import _certificado_firmante, _pkcs12
+
+DS = "{http://www.w3.org/2000/09/xmldsig#}"
+
+
+def verificar_firma(xml_bytes):
+    root = etree.fromstring(xml_bytes)
+    xmlsec.tree.add_ids(root, ["Id"])
+    ctx = xmlsec.SignatureContext()
+    ctx.key = xmlsec.Key.from_file(CERT_PATH, xmlsec.KeyFormat.CERT_PEM)
+    ctx.verify(root.find(DS + "Signature"))
+
+
+def test_build_tree_es_equivalente_a_build(factura):
+    arbol = XMLBuilder.build_tree(factura)
+    reparseado = etree.fromstring(XMLBuilder.build(factura), etree.XMLParser(remove_blank_text=True))
+    assert [e.tag for e in arbol.iter()] == [e.tag for e in reparseado.iter()]
+
+
+def test_firmar_xml_con_elemento_devuelve_el_mismo_arbol(factura):
+    arbol = XMLBuilder.build_tree(factura)
+    assert firmar_xml(arbol) is arbol
+    assert arbol.find(DS + "Signature") is not None
+
+
+def test_emitir_factura_valida_y_con_firma_verificable(factura):
+    xml = emitir_factura(factura)
+    assert validar_xml(xml) == (True, None)
+    verificar_firma(xml)
+
+
+def test_firmar_xml_con_bytes_sigue_verificando(factura):
+    verificar_firma(firmar_xml(XMLBuilder.build(factura)))
+
+
+def test_emitir_arbol_valida_en_memoria(factura):
+    arbol = emitir_arbol(factura)
+    assert validar_xml(arbol) == (True, None)
+
+
+def _facturas(cantidad):
+    for numero in range(1, cantidad + 1):
+        factura = crear_factura()
+        factura.numero_factura = f"001-002-{numero:07d}"
+        yield factura
+
+
+def test_emitir_lote_mantiene_el_orden_y_aisla_errores():
+    facturas = list(_facturas(6))
+    facturas[2].numero_factura = "001-002-ABC"
+
+    resultados = list(emitir_lote(iter(facturas), workers=2, tamano_bloque=2))
+
+    assert [r.indice for r in resultados] == list(range(6))
+    assert [r.ok for r in resultados] == [True, True, False, True, True, True]
+    assert "Número de factura" in resultados[2].error
+    assert resultados[0].cdc in resultados[0].xml.decode()
+
+
+def test_emitir_lote_en_el_proceso_actual():
+    resultados = list(emitir_lote(_facturas(2), workers=1))
+    assert all(r.ok for r in resultados)
+
+
+def test_emitir_lote_usa_el_csc_del_emisor_en_los_workers():
+    # Con "spawn" el ServicioQR llega a los workers copiado, no heredado
+    servicio = ServicioQR("0002", "CSC-DEL-EMISOR", ambiente="prod")
+    resultados = list(emitir_lote(
+        _facturas(3), workers=2, validar=False, tamano_bloque=1,
+        mp_context=multiprocessing.get_context("spawn"), servicio_qr=servicio,
+    ))
+    resultados += list(emitir_lote(_facturas(1), workers=1, validar=False, servicio_qr=servicio))
+
+    for resultado in resultados:
+        root = etree.fromstring(resultado.xml)
+        esperado = qr_de_referencia(root, "0002", "CSC-DEL-EMISOR", URLS_QR["prod"])
+        assert root.findtext("sifen:gCamFuFD/sifen:dCarQR", namespaces=NS) == esperado
+
+
+def test_emitir_lote_con_almacen_pkcs12(tmp_path):
+    certificado = _pkcs12(tmp_path, "80000002", "secreto")
+    almacen = AlmacenPKCS12(str(tmp_path / "80000002.p12"), "secreto")
+
+    resultados = list(emitir_lote(
+        _facturas(2), workers=2, almacen=almacen, tamano_bloque=1,
+        mp_context=multiprocessing.get_context("spawn"),
+    ))
+
+    assert all(r.ok for r in resultados), [r.error for r in resultados]
+    clave = xmlsec.Key.from_memory(certificado.public_bytes(serialization.Encoding.PEM), xmlsec.KeyFormat.CERT_PEM)
+    for resultado in resultados:
+        root = etree.fromstring(resultado.xml)
+        assert base64.b64decode(_certificado_firmante(root)) == certificado.public_bytes(serialization.Encoding.DER)
+        xmlsec.tree.add_ids(root, ["Id"])
+        ctx = xmlsec.SignatureContext()
+        ctx.key = clave
+        ctx.verify(root.find(DS + "Signature"))
@@ -0,0 +1,69 @@
+import asyncio
+import random
+
+import pytest
+from lxml import etree
+
+from sifen.core.clients.recepcion import ClienteRecepcion
+from sifen.core.clients.soap import SIFEN_NS, ErrorSOAP, sifen
+from sifen.core.emision import emitir_factura
+from sifen.emulador.carga import MODO_LOTE, MODO_SINCRONO, GeneradorCarga, facturas_sinteticas, percentil
+from sifen.emulador.servidor import ServidorSIFEN
+from tests.conftest import crear_factura
+
+
+def test_percentil_por_rango_mas_cercano():
+    valores = [float(i) for i in range(1, 101)]
+    assert [percentil(valores, p) for p in (50, 95, 99, 100)] == [50.0, 95.0, 99.0, 100.0]
+    assert percentil([], 99) == 0.0
+
+
+def test_errores_rechazos_y_validacion_configurables():
+    documento = emitir_factura(crear_factura())
+
+    async def escenario():
+        servidor = ServidorSIFEN(
+            tasa_rechazos=1.0, validar=True, latencias={"rEnviDe": lambda: 0.01}, azar=random.Random(1)
+        )
+        async with servidor:
+            async with ClienteRecepcion(url_base=servidor.url) as cliente:
+                rechazo = await cliente.enviar(documento)
+
+                invalido = etree.Element(sifen("rEnviConsRUC"), nsmap={None: SIFEN_NS})
+                etree.SubElement(invalido, sifen("dRUCCons")).text = "80012345"
+                with pytest.raises(ErrorSOAP):
+                    await cliente.llamar("/de/ws/consultas/consulta-ruc.wsdl", invalido)
+
+                servidor.tasa_rechazos, servidor.tasa_errores = 0.0, 1.0
+                with pytest.raises(ErrorSOAP):
+                    await cliente.enviar(documento)
+            return rechazo, servidor
+
+    rechazo, servidor = asyncio.run(escenario())
+
+    assert not rechazo.aprobado and rechazo.resultados[0][0] in ("1000", "1001")
+    assert rechazo.cdc in servidor.rechazados and rechazo.cdc not in servidor.documentos
+    assert servidor.errores == 1
+    assert servidor.operaciones == {"rEnviDe": 2, "rEnviConsRUC": 1}
+
+
+@pytest.mark.parametrize("modo", [MODO_LOTE, MODO_SINCRONO])
+def test_generador_de_carga_mide_cada_etapa(modo):
+    async def escenario():
+        async with ServidorSIFEN(tasa_rechazos=0.2, consultas_en_proceso=1, validar=True,
+                                 azar=random.Random(7)) as servidor:
+            generador = GeneradorCarga(servidor.url, modo=modo, concurrencia=2, tamano_lote=4,
+                                       intervalo_consulta=0.01)
+            return await generador.ejecutar(facturas_sinteticas(crear_factura(), 10)), servidor
+
+    resultado, servidor = asyncio.run(escenario())
+
+    assert resultado.documentos == 10 and resultado.fallidos == 0
+    assert resultado.aprobados + resultado.rechazados == 10
+    assert resultado.rechazados == len(servidor.rechazados)
+    etapas = resultado.etapas
+    assert len(etapas["firma"].duraciones) == len(etapas["validacion"].duraciones) == 10
+    assert len(etapas["total"].duraciones) == resultado.aprobados
+    assert len(etapas["envio"].duraciones) == (3 if modo == MODO_LOTE else 10)
+    assert etapas["total"].percentil(99) >= etapas["total"].percentil(50) > 0
+    assert "p95" in resultado.tabla()
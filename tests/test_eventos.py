@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+import xmlsec
+from lxml import etree
+
+from sifen.core.builders.evento_builder import ID_EVE_MAXIMO, EventoBuilder
+from sifen.core.clients.eventos import ClienteEventos
+from sifen.core.clients.soap import SIFEN_NS, sifen
+from sifen.core.signers.almacen_claves import CERT_PATH
+from sifen.core.validators.validator import validar_xml
+from sifen.emulador.servidor import ServidorSIFEN
+from sifen.models.evento import EventoCancelacion, EventoInutilizacion
+
+CDC = "01800123456700100100000011202401151123456{:03d}"
+
+
+def _verificar(ges_eve):
+    xmlsec.tree.add_ids(ges_eve, ["Id"])
+    ctx = xmlsec.SignatureContext()
+    ctx.key = xmlsec.Key.from_file(CERT_PATH, xmlsec.KeyFormat.CERT_PEM)
+    ctx.verify(ges_eve.find("{http://www.w3.org/2000/09/xmldsig#}Signature"))
+
+
+def test_grupo_firmado_y_valido_contra_el_esquema():
+    builder = EventoBuilder(id_inicial=1)
+    eventos = [EventoCancelacion(CDC.format(i), "Error en el precio") for i in range(14)]
+    eventos.append(EventoInutilizacion("12345678", "001", "001", 5, 9, "Salto de numeración"))
+    grupo = builder.construir_grupo(eventos)
+
+    assert len(grupo) == 15
+    assert [ges_eve.find(sifen("rEve")).get("Id") for ges_eve in grupo] == [str(i) for i in range(1, 16)]
+    assert grupo[-1].findtext(".//" + sifen("dNumIn")) == "0000005"
+    for ges_eve in grupo:
+        _verificar(ges_eve)
+
+    mensaje = etree.Element(sifen("rEnviEventoDe"), nsmap={None: SIFEN_NS})
+    etree.SubElement(mensaje, sifen("dId")).text = "1"
+    etree.SubElement(mensaje, sifen("dEvReg")).append(grupo)
+    assert validar_xml(mensaje, "rEnviEventoDe") == (True, None)
+
+
+def test_id_de_rEve_vuelve_a_1_al_pasar_el_maximo():
+    builder = EventoBuilder(id_inicial=ID_EVE_MAXIMO - 1)
+    grupo = builder.construir_grupo([EventoCancelacion(CDC.format(i), "Error en el precio") for i in range(3)])
+
+    assert [ges_eve.find(sifen("rEve")).get("Id") for ges_eve in grupo] == [str(ID_EVE_MAXIMO - 1), str(ID_EVE_MAXIMO), "1"]
+
+
+def test_eventos_invalidos_y_grupos_de_mas_de_15():
+    builder = EventoBuilder()
+    with pytest.raises(ValueError):
+        builder.construir(EventoCancelacion("123", "Error en el precio"))
+    with pytest.raises(ValueError):
+        builder.construir(EventoInutilizacion("12345678", "001", "001", 9, 5, "Rango al revés"))
+    with pytest.raises(ValueError):
+        builder.construir_grupo([EventoCancelacion(CDC.format(i), "Motivo") for i in range(16)])
+
+
+def test_enviar_eventos_en_grupos_concurrentes():
+    cdcs = [CDC.format(i) for i in range(40)]
+
+    async def escenario():
+        async with ServidorSIFEN(latencia=0.01) as servidor:
+            async with ClienteEventos(url_base=servidor.url, concurrencia=3) as cliente:
+                envios = await cliente.enviar_eventos(EventoCancelacion(cdc, "Error en el precio") for cdc in cdcs)
+            return envios, servidor
+
+    envios, servidor = asyncio.run(escenario())
+
+    assert [len(envio.ids) for envio in envios] == [15, 15, 10]
+    assert all(envio.error is None for envio in envios)
+    assert all(resultado.aprobado for envio in envios for resultado in envio.resultados.values())
+    assert [list(envio.resultados) for envio in envios] == [envio.ids for envio in envios]
+    assert servidor.eventos == 40 and servidor.max_en_curso > 1
+    assert all(servidor.documentos[cdc] == "Cancelado" for cdc in cdcs)
@@ -0,0 +1,33 @@
+import copy
+import threading
+
+import pytest
+
+from sifen.core.builders.xml_builder import XMLBuilder
+from sifen.core.signers.firmador import Firmador
+from sifen.core.signers.firmantes import BACKEND_PYTHON, BACKEND_XMLSEC
+from sifen.core.signers.signer import firmar_xml, serializar_xml
+from sifen.emulador.carga import facturas_sinteticas
+from tests.test_emision import verificar_firma
+
+
+@pytest.mark.parametrize("backend", [BACKEND_XMLSEC, BACKEND_PYTHON])
+def test_firmar_muchos_en_hilos_igual_que_en_serie(factura, backend):
+    arboles = [XMLBuilder.build_tree(f) for f in facturas_sinteticas(factura, 12)]
+    esperados = [serializar_xml(firmar_xml(copy.deepcopy(a), backend=backend)) for a in arboles]
+
+    hilos = set()
+    with Firmador(backend=backend, hilos=4) as firmador:
+        firmar = firmador.firmar
+
+        def firmar_registrando(documento):
+            hilos.add(threading.get_ident())
+            return firmar(documento)
+
+        firmador.firmar = firmar_registrando
+        firmados = firmador.firmar_muchos(arboles)
+
+    assert firmados == arboles  # Se firma sobre los mismos árboles, en orden
+    assert [serializar_xml(a) for a in arboles] == esperados
+    assert len(hilos) > 1
+    verificar_firma(esperados[0])
@@ -0,0 +1,36 @@
+import copy
+
+import pytest
+from lxml import etree
+
+from sifen.core.builders.xml_builder import XMLBuilder
+from sifen.core.emision import emitir_factura
+from sifen.core.signers.firmantes import BACKEND_PYTHON, BACKEND_XMLSEC, obtener_firmante
+from sifen.core.signers.signer import firmar_xml, serializar_xml
+from sifen.core.validators.validator import validar_xml
+from tests.test_emision import verificar_firma
+
+DS_XMLNS = b' xmlns:ds="http://www.w3.org/2000/09/xmldsig#"'
+
+
+def test_backends_producen_los_mismos_bytes(factura):
+    arbol = XMLBuilder.build_tree(factura)
+    firmados = {
+        backend: serializar_xml(firmar_xml(copy.deepcopy(arbol), backend=backend))
+        for backend in (BACKEND_XMLSEC, BACKEND_PYTHON)
+    }
+    assert firmados[BACKEND_XMLSEC] == firmados[BACKEND_PYTHON]
+    assert validar_xml(firmados[BACKEND_PYTHON]) == (True, None)
+    verificar_firma(firmados[BACKEND_PYTHON])
+
+    # Sin el prefijo ds declarado en el rDE, xmlsec usa xmlns por defecto
+    sin_prefijo = etree.tostring(arbol).replace(DS_XMLNS, b"")
+    xmlsec_bytes = firmar_xml(sin_prefijo, backend=BACKEND_XMLSEC)
+    assert firmar_xml(sin_prefijo, backend=BACKEND_PYTHON) == xmlsec_bytes
+    verificar_firma(xmlsec_bytes)
+
+
+def test_emision_con_backend_python_y_backend_desconocido(factura):
+    verificar_firma(emitir_factura(factura, backend=BACKEND_PYTHON))
+    with pytest.raises(ValueError):
+        obtener_firmante("openssl")
@@ -0,0 +1,106 @@
+import asyncio
+import multiprocessing
+import time
+
+import pytest
+from lxml import etree
+
+from sifen.core.clients.base import ClienteSIFEN
+from sifen.core.clients.limites import (
+    ABIERTO,
+    CERRADO,
+    SEMIABIERTO,
+    CircuitoAbierto,
+    CortaCircuito,
+    CubetaTokens,
+    LimitadorSIFEN,
+)
+from sifen.core.clients.soap import SIFEN_NS, ErrorSOAP, sifen
+from sifen.emulador.servidor import ServidorSIFEN
+
+RUTA_RUC = "/de/ws/consultas/consulta-ruc.wsdl"
+
+
+def _consumir(ruta, cantidad):
+    cubeta = CubetaTokens(50, capacidad=1, ruta=ruta)
+
+    async def consumir():
+        for _ in range(cantidad):
+            await cubeta.adquirir()
+
+    asyncio.run(consumir())
+
+
+def test_cubeta_admite_rafagas_y_se_comparte_entre_procesos(tmp_path):
+    cubeta = CubetaTokens(100, capacidad=5)
+
+    async def consumir():
+        return [await cubeta.adquirir() for _ in range(15)]
+
+    inicio = time.perf_counter()
+    esperas = asyncio.run(consumir())
+    assert esperas[:5] == [0.0] * 5 and all(e > 0 for e in esperas[5:])
+    assert time.perf_counter() - inicio >= 9 / 100
+    assert cubeta.metricas()["esperas"] == 10 and cubeta.tiempo_limitado > 0
+
+    # Tres procesos de a 10 llamadas sobre la misma cubeta de 50/s: 29 esperas de 1/50 s
+    ruta = str(tmp_path / "ruc.cubeta")
+    inicio = time.perf_counter()
+    procesos = [multiprocessing.Process(target=_consumir, args=(ruta, 10)) for _ in range(3)]
+    for proceso in procesos:
+        proceso.start()
+    for proceso in procesos:
+        proceso.join()
+    assert all(proceso.exitcode == 0 for proceso in procesos)
+    assert time.perf_counter() - inicio >= 29 / 50
+
+
+def test_corta_circuito_abre_sondea_y_cierra():
+    reloj = [0.0]
+    circuito = CortaCircuito(umbral_fallos=2, espera_apertura=10, reloj=lambda: reloj[0])
+    for _ in range(2):
+        circuito.fallo(circuito.permitir())
+    assert circuito.estado == ABIERTO
+    with pytest.raises(CircuitoAbierto):
+        circuito.permitir()
+
+    reloj[0] = 10
+    assert circuito.estado == SEMIABIERTO
+    sonda = circuito.permitir()
+    with pytest.raises(CircuitoAbierto):
+        circuito.permitir()  # Una sola sonda a la vez
+    circuito.fallo(sonda)
+    assert circuito.estado == ABIERTO and circuito.aperturas == 2
+
+    reloj[0] = 20
+    circuito.exito(circuito.permitir())
+    assert circuito.estado == CERRADO
+    assert circuito.metricas()["rechazadas"] == 2
+
+
+def test_limitador_envuelve_las_llamadas_del_cliente():
+    mensaje = etree.Element(sifen("rEnviConsRUC"), nsmap={None: SIFEN_NS})
+    etree.SubElement(mensaje, sifen("dId")).text = "1"
+    etree.SubElement(mensaje, sifen("dRUCCons")).text = "80012345"
+
+    async def escenario():
+        limitador = LimitadorSIFEN(por_segundo=200, umbral_fallos=3, espera_apertura=0.2)
+        async with ServidorSIFEN(tasa_errores=1.0) as servidor:
+            async with ClienteSIFEN(url_base=servidor.url, limitador=limitador) as cliente:
+                for _ in range(3):
+                    with pytest.raises(ErrorSOAP):
+                        await cliente.llamar(RUTA_RUC, mensaje)
+                with pytest.raises(CircuitoAbierto):
+                    await cliente.llamar(RUTA_RUC, mensaje)
+                solicitudes = servidor.solicitudes
+
+                servidor.tasa_errores = 0.0
+                await asyncio.sleep(0.2)
+                await cliente.llamar(RUTA_RUC, mensaje)
+                return solicitudes, limitador.metricas()[RUTA_RUC]
+
+    solicitudes, metricas = asyncio.run(escenario())
+
+    assert solicitudes == 3
+    assert metricas["estado"] == CERRADO and metricas["aperturas"] == 1 and metricas["rechazadas"] == 1
+    assert metricas["llamadas"] == 4
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+import xmlsec
+
+from sifen.core.clients.lote import (
+    ClienteLote,
+    agrupar,
+    armar_rlotede,
+    desempaquetar_lote,
+    empaquetar_lote,
+)
+from sifen.core.clients.soap import sifen
+from sifen.core.emision import emitir_arbol, emitir_factura
+from sifen.core.signers.almacen_claves import CERT_PATH
+from sifen.core.validators.validator import validar_xml
+from sifen.emulador.servidor import ServidorSIFEN
+from tests.conftest import crear_factura
+
+
+@pytest.fixture(scope="module")
+def documentos():
+    xmls = []
+    for numero in range(1, 6):
+        factura = crear_factura()
+        factura.numero_factura = f"001-002-{numero:07d}"
+        xmls.append(emitir_factura(factura))
+    return xmls
+
+
+def test_agrupar_respeta_el_limite_de_50():
+    grupos = list(agrupar(range(120)))
+    assert [len(g) for g in grupos] == [50, 50, 20]
+    with pytest.raises(ValueError):
+        list(agrupar(range(3), tamano=51))
+
+
+def test_empaquetar_conserva_firmas_y_valida_contra_rlotede(documentos):
+    lote = desempaquetar_lote(empaquetar_lote(documentos + [emitir_arbol(crear_factura())]))
+
+    assert validar_xml(lote, "rLoteDE") == (True, None)
+    for rde in lote.iterfind(sifen("rDE")):
+        xmlsec.tree.add_ids(rde, ["Id"])
+        ctx = xmlsec.SignatureContext()
+        ctx.key = xmlsec.Key.from_file(CERT_PATH, xmlsec.KeyFormat.CERT_PEM)
+        ctx.verify(rde.find("{http://www.w3.org/2000/09/xmldsig#}Signature"))
+
+    with pytest.raises(ValueError):
+        armar_rlotede([])
+
+
+def test_enviar_lotes_registra_protocolos(documentos):
+    async def escenario():
+        async with ServidorSIFEN() as servidor:
+            async with ClienteLote(url_base=servidor.url, concurrencia=2) as cliente:
+                lotes = await cliente.enviar_lotes(documentos * 3, tamano_lote=4)
+                return servidor.lotes, cliente.lotes, lotes
+
+    en_servidor, registrados, lotes = asyncio.run(escenario())
+
+    assert [lote.numero for lote in lotes] == [1, 2, 3, 4]
+    assert [len(lote.cdcs) for lote in lotes] == [4, 4, 4, 3]
+    assert all(lote.recibido for lote in lotes)
+    assert {lote.protocolo: lote.cdcs for lote in lotes} == en_servidor
+    assert registrados == {lote.numero: lote for lote in lotes}
@@ -0,0 +1,102 @@
+import asyncio
+import random
+
+from lxml import etree
+
+from sifen.core.clients.consulta_lote import ClienteConsultaLote, leer_consulta_lote
+from sifen.core.clients.planificador import PlanificadorConsultas
+from sifen.core.clients.soap import SIFEN_NS, sifen
+from sifen.core.validators.validator import validar_xml
+from sifen.emulador.servidor import ServidorSIFEN
+
+CDC_BASE = "018001234567001001000000112024011511234567"  # CDC sin los dos últimos dígitos
+
+
+def _lotes(servidor, cantidad, por_lote=3):
+    """Registra lotes directamente en el emulador, sin pasar por rEnvioLote."""
+    lotes = {}
+    for numero in range(1, cantidad + 1):
+        cdcs = [f"{CDC_BASE}{numero}{i}" for i in range(por_lote)]
+        servidor.lotes[str(numero)] = cdcs
+        lotes[str(numero)] = cdcs
+    return lotes
+
+
+def _planificador(cliente, **kwargs):
+    return PlanificadorConsultas(
+        cliente, espera_inicial=0.01, espera_maxima=0.05, azar=random.Random(7), **kwargs
+    )
+
+
+def test_respuesta_del_emulador_valida_y_se_lee_en_streaming():
+    async def escenario():
+        async with ServidorSIFEN() as servidor:
+            servidor.lotes["9"] = [CDC_BASE + "91", CDC_BASE + "92"]
+            async with ClienteConsultaLote(url_base=servidor.url) as cliente:
+                mensaje = etree.Element(sifen("rEnviConsLoteDe"), nsmap={None: SIFEN_NS})
+                etree.SubElement(mensaje, sifen("dId")).text = "1"
+                etree.SubElement(mensaje, sifen("dProtConsLote")).text = "9"
+                return await cliente.llamar(cliente.ruta, mensaje)
+
+    respuesta = asyncio.run(escenario())
+    assert validar_xml(respuesta, "rEnviConsLoteDe") == (True, None)
+
+    estado, resultados = leer_consulta_lote(etree.tostring(respuesta), "9")
+    assert estado.concluido
+    resultados = list(resultados)
+    assert [r.cdc for r in resultados] == [CDC_BASE + "91", CDC_BASE + "92"]
+    assert all(r.aprobado and r.lote == "9" for r in resultados)
+    assert resultados[0].resultados == [("0260", "Autorización del DE satisfactoria")]
+
+
+def test_planificador_reintenta_lotes_en_proceso_y_respeta_la_concurrencia():
+    recibidos = []
+    errores = []
+
+    async def al_resultado(resultado):
+        recibidos.append(resultado.cdc)
+
+    async def escenario():
+        async with ServidorSIFEN(consultas_en_proceso=2) as servidor:
+            lotes = _lotes(servidor, 6)
+            async with ClienteConsultaLote(url_base=servidor.url) as cliente:
+                planificador = _planificador(
+                    cliente, al_resultado=al_resultado, al_error=lambda *a: errores.append(a),
+                    max_concurrencia=2,
+                )
+                for protocolo, cdcs in lotes.items():
+                    planificador.agregar(protocolo, cdcs)
+                planificador.agregar("999")
+                await planificador.ejecutar()
+                return lotes, planificador, servidor.max_en_curso
+
+    lotes, planificador, max_en_curso = asyncio.run(escenario())
+
+    esperados = [cdc for cdcs in lotes.values() for cdc in cdcs]
+    assert sorted(recibidos) == sorted(esperados)
+    assert planificador.consultas == len(lotes) * 3 + 1
+    assert planificador.pendientes == {}
+    assert max_en_curso <= 2
+
+    assert len(errores) == 1
+    lote, estado = errores[0]
+    assert lote.protocolo == "999" and estado.codigo == "0360"
+
+
+def test_resultados_como_iterador_y_limite_de_intentos():
+    errores = []
+
+    async def escenario():
+        async with ServidorSIFEN(consultas_en_proceso=10) as servidor:
+            lotes = _lotes(servidor, 2)
+            async with ClienteConsultaLote(url_base=servidor.url) as cliente:
+                servidor.consultas_lote["1"] = 10  # el lote 1 ya terminó
+                planificador = _planificador(cliente, al_error=lambda *a: errores.append(a), max_intentos=3)
+                for protocolo, cdcs in lotes.items():
+                    planificador.agregar(protocolo, cdcs)
+                return lotes, [r.cdc async for r in planificador.resultados()]
+
+    lotes, cdcs = asyncio.run(escenario())
+
+    assert cdcs == lotes["1"]
+    assert [(lote.protocolo, lote.intentos, estado.codigo) for lote, estado in errores] == [("2", 3, "0361")]
@@ -0,0 +1,69 @@
+import hashlib
+import hmac
+import pickle
+
+import pytest
+
+from sifen.core.builders.xml_builder import SIFEN_NS
+from sifen.core.emision import emitir_arbol
+from sifen.core.signers.qr import CSC_PRUEBA, ID_CSC_PRUEBA, URLS_QR, DatosQR, ServicioQR
+from sifen.core.signers.signer import generar_dCarQR
+from sifen.emulador.carga import facturas_sinteticas
+
+NS = {"sifen": SIFEN_NS, "ds": "http://www.w3.org/2000/09/xmldsig#"}
+
+
+def qr_de_referencia(root, id_csc, csc, url_base=URLS_QR["test"]):
+    """El dCarQR armado campo por campo con find y un HMAC nuevo."""
+    de = root.find("sifen:DE", namespaces=NS)
+    cadena = "&".join([
+        "nVersion=150",
+        f"Id={de.get('Id')}",
+        f"dFeEmiDE={de.findtext('sifen:gDatGralOpe/sifen:dFeEmiDE', namespaces=NS)}",
+        f"dRucRec={de.findtext('sifen:gDatGralOpe/sifen:gDatRec/sifen:dRucRec', namespaces=NS)}",
+        f"dTotGralOpe={de.findtext('sifen:gTotSub/sifen:dTotGralOpe', namespaces=NS)}",
+        f"dTotIVA={de.findtext('sifen:gTotSub/sifen:dTotIVA', namespaces=NS)}",
+        f"cItems={len(de.findall('sifen:gDtipDE/sifen:gCamItem', namespaces=NS))}",
+        f"DigestValue={root.findtext('ds:Signature/ds:SignedInfo/ds:Reference/ds:DigestValue', namespaces=NS)}",
+        f"IdCSC={id_csc}",
+    ])
+    hash_qr = hmac.new(csc.encode("utf-8"), cadena.encode("utf-8"), hashlib.sha256).hexdigest()
+    return f"{url_base}{cadena}&cHashQR={hash_qr}"
+
+
+def test_firma_arma_el_mismo_qr_que_antes(factura):
+    root = emitir_arbol(factura, validar=False)
+    esperado = qr_de_referencia(root, ID_CSC_PRUEBA, CSC_PRUEBA)
+    assert root.findtext("sifen:gCamFuFD/sifen:dCarQR", namespaces=NS) == esperado
+    assert generar_dCarQR(root, ID_CSC_PRUEBA, CSC_PRUEBA) == esperado
+
+    datos = DatosQR.desde_arbol(root)
+    assert datos.items == len(factura.items) and datos.digest
+
+
+def test_servicio_por_emisor_y_lote(factura):
+    servicio = ServicioQR("0002", "CSC-DEL-EMISOR", ambiente="prod")
+    documentos = [emitir_arbol(f, validar=False, servicio_qr=servicio) for f in facturas_sinteticas(factura, 3)]
+
+    urls = servicio.generar_qr_lote(documentos)
+    assert urls == [qr_de_referencia(d, "0002", "CSC-DEL-EMISOR", URLS_QR["prod"]) for d in documentos]
+    assert urls == [d.findtext("sifen:gCamFuFD/sifen:dCarQR", namespaces=NS) for d in documentos]
+    assert servicio.generar_qr_lote(DatosQR.desde_arbol(d) for d in documentos) == urls
+
+    with pytest.raises(ValueError):
+        ServicioQR("0001", "x", ambiente="produccion")
+
+
+class _ServicioPropio(ServicioQR):
+    pass
+
+
+def test_copia_entre_procesos_conserva_csc_y_subclase(factura):
+    servicio = _ServicioPropio("0002", "CSC-DEL-EMISOR", ambiente="prod")
+    copia = pickle.loads(pickle.dumps(servicio))
+    root = emitir_arbol(factura, validar=False)
+
+    assert type(copia) is _ServicioPropio
+    assert copia.generar(root) == servicio.generar(root) == qr_de_referencia(
+        root, "0002", "CSC-DEL-EMISOR", URLS_QR["prod"]
+    )
@@ -0,0 +1,94 @@
+import asyncio
+import ssl
+
+import pytest
+
+from sifen.core.clients.http import crear_contexto_ssl
+from sifen.core.clients.recepcion import ClienteRecepcion
+from sifen.core.clients.soap import ErrorSOAP
+from sifen.core.emision import emitir_factura
+from sifen.core.signers.almacen_claves import AlmacenPKCS12
+from sifen.core.validators.validator import validar_xml
+from sifen.emulador.servidor import ServidorSIFEN
+from tests.conftest import crear_factura, generar_certificado
+from tests.test_registro_certificados import _pkcs12
+
+
+@pytest.fixture(scope="module")
+def documentos():
+    xmls = []
+    for numero in range(1, 4):
+        factura = crear_factura()
+        factura.numero_factura = f"001-002-{numero:07d}"
+        xmls.append(emitir_factura(factura))
+    return xmls
+
+
+def test_enviar_muchos_reutiliza_el_pool(documentos):
+    async def escenario():
+        async with ServidorSIFEN(latencia=0.01) as servidor:
+            async with ClienteRecepcion(url_base=servidor.url, max_conexiones=3) as cliente:
+                respuestas = await cliente.enviar_muchos(documentos * 10)
+                return servidor, cliente.pool.conexiones_creadas, respuestas
+
+    servidor, creadas, respuestas = asyncio.run(escenario())
+
+    assert all(r.aprobado for r in respuestas)
+    assert [r.cdc for r in respuestas[:3]] == [doc.split(b'Id="')[1][:44].decode() for doc in documentos]
+    assert creadas <= 3 and servidor.conexiones == creadas
+    assert servidor.solicitudes == 30
+    assert validar_xml(respuestas[0].xml, "rEnviDe") == (True, None)
+
+
+def test_tls_mutuo_con_keep_alive(tmp_path, documentos):
+    cert_servidor, key_servidor = generar_certificado(tmp_path, "servidor")
+    cert_cliente, key_cliente = generar_certificado(tmp_path, "cliente")
+
+    contexto_servidor = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH, cafile=cert_cliente)
+    contexto_servidor.load_cert_chain(cert_servidor, key_servidor)
+    contexto_servidor.verify_mode = ssl.CERT_REQUIRED
+
+    async def escenario(contexto_cliente):
+        async with ServidorSIFEN(contexto_ssl=contexto_servidor) as servidor:
+            async with ClienteRecepcion(url_base=servidor.url, contexto_ssl=contexto_cliente) as cliente:
+                respuestas = [await cliente.enviar(doc) for doc in documentos]
+            return servidor.conexiones, respuestas
+
+    conexiones, respuestas = asyncio.run(
+        escenario(crear_contexto_ssl(cert_cliente, key_cliente, cafile=cert_servidor))
+    )
+    assert conexiones == 1
+    assert all(r.aprobado for r in respuestas)
+
+    with pytest.raises((ssl.SSLError, ConnectionError)):
+        asyncio.run(escenario(crear_contexto_ssl(cafile=cert_servidor)))
+
+
+def test_tls_mutuo_con_almacen_pkcs12(tmp_path, monkeypatch, documentos):
+    cert_servidor, key_servidor = generar_certificado(tmp_path, "servidor")
+    _pkcs12(tmp_path, "80000002", "secreto")  # Deja también tmp80000002.pem, el certificado
+
+    contexto_servidor = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH, cafile=str(tmp_path / "tmp80000002.pem"))
+    contexto_servidor.load_cert_chain(cert_servidor, key_servidor)
+    contexto_servidor.verify_mode = ssl.CERT_REQUIRED
+    # El cliente arma su contexto con las CAs por defecto: se confía en el servidor de prueba
+    monkeypatch.setenv("SSL_CERT_FILE", cert_servidor)
+
+    async def escenario():
+        almacen = AlmacenPKCS12(str(tmp_path / "80000002.p12"), "secreto")
+        async with ServidorSIFEN(contexto_ssl=contexto_servidor) as servidor:
+            async with ClienteRecepcion(url_base=servidor.url, almacen=almacen) as cliente:
+                return await cliente.enviar(documentos[0])
+
+    assert asyncio.run(escenario()).aprobado
+
+
+def test_soap_fault_se_informa_como_error(documentos):
+    async def escenario():
+        async with ServidorSIFEN() as servidor:
+            servidor.manejadores.clear()
+            async with ClienteRecepcion(url_base=servidor.url) as cliente:
+                await cliente.enviar(documentos[0])
+
+    with pytest.raises(ErrorSOAP, match="no soportada"):
+        asyncio.run(escenario())
@@ -0,0 +1,70 @@
+import base64
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.serialization import pkcs12
+
+from sifen.core.emision import emitir_arbol
+from sifen.core.signers.firmantes import BACKEND_PYTHON, BACKEND_XMLSEC
+from sifen.core.signers.registro_certificados import CertificadoVencido, RegistroCertificados
+from tests.conftest import generar_certificado
+
+DS = "{http://www.w3.org/2000/09/xmldsig#}"
+
+
+def _pkcs12(tmp_path, ruc, contrasena):
+    cert_path, key_path = generar_certificado(tmp_path, f"tmp{ruc}", ruc=ruc)
+    with open(key_path, "rb") as f:
+        clave = serialization.load_pem_private_key(f.read(), None)
+    with open(cert_path, "rb") as f:
+        certificado = x509.load_pem_x509_certificate(f.read())
+    datos = pkcs12.serialize_key_and_certificates(
+        ruc.encode(), clave, certificado, None, serialization.BestAvailableEncryption(contrasena.encode())
+    )
+    (tmp_path / f"{ruc}.p12").write_bytes(datos)
+    return certificado
+
+
+def _certificado_firmante(root):
+    return root.find(f"{DS}Signature/{DS}KeyInfo/{DS}X509Data/{DS}X509Certificate").text
+
+
+def test_resuelve_pem_y_pkcs12_por_ruc_con_lru(tmp_path, factura):
+    generar_certificado(tmp_path, "80000001", ruc="80000001")
+    certificado = _pkcs12(tmp_path, "80000002", "secreto")
+    registro = RegistroCertificados(str(tmp_path), contrasenas={"80000002": "secreto"}, capacidad=1)
+
+    firmados = {}
+    for ruc in ("80000001", "80000002", "80000001"):
+        for backend in (BACKEND_XMLSEC, BACKEND_PYTHON):
+            root = emitir_arbol(factura, almacen=registro.almacen(ruc), backend=backend)
+            firmados.setdefault(ruc, set()).add(_certificado_firmante(root))
+
+    assert len(firmados["80000001"]) == len(firmados["80000002"]) == 1
+    assert firmados["80000001"] != firmados["80000002"]
+    (firmado,) = firmados["80000002"]
+    assert base64.b64decode(firmado) == certificado.public_bytes(serialization.Encoding.DER)
+    assert registro.metricas() == {"en_memoria": 1, "cargas": 3, "descartes": 2}
+
+    with pytest.raises(FileNotFoundError):
+        registro.almacen("80000003")
+
+
+def test_vencimiento_se_controla_antes_de_firmar(tmp_path):
+    generar_certificado(tmp_path, "80000001", dias=2)
+    generar_certificado(tmp_path, "80000002", dias=60)
+    registro = RegistroCertificados(str(tmp_path), margen=timedelta(days=7))
+
+    with pytest.raises(CertificadoVencido) as error:
+        registro.almacen("80000001")
+    assert error.value.ruc == "80000001"
+    assert list(registro.por_vencer(["80000001", "80000002", "80000001"])) == ["80000001"]
+
+    # Desde varios hilos a la vez, con menos lugar que RUC
+    registro.margen, registro.capacidad = timedelta(0), 1
+    with ThreadPoolExecutor(8) as pool:
+        almacenes = list(pool.map(registro.almacen, ["80000001", "80000002"] * 20))
+    assert all(a.obtener_par().vence for a in almacenes)
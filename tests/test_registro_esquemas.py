@@ -0,0 +1,59 @@
+import threading
+
+import pytest
+from lxml import etree
+
+from sifen.core.validators.registro_esquemas import RegistroEsquemas, ESQUEMAS, ESQUEMAS_ARMADOS
+from sifen.core.validators.validator import validar_xml
+
+
+def test_compila_una_sola_vez():
+    registro = RegistroEsquemas()
+    assert registro.obtener("siRecepDE") is registro.obtener("siRecepDE")
+
+
+def test_compila_todos_los_esquemas_sin_red():
+    registro = RegistroEsquemas()
+    registro.precargar()
+    assert set(ESQUEMAS) | set(ESQUEMAS_ARMADOS) == set(registro.compilados())
+
+
+def test_recargar_descarta_el_esquema():
+    registro = RegistroEsquemas()
+    esquema = registro.obtener("siRecepDE")
+    registro.recargar("siRecepDE")
+    assert registro.compilados() == []
+    assert registro.obtener("siRecepDE") is not esquema
+
+
+def test_obtener_concurrente_devuelve_el_mismo_objeto():
+    registro = RegistroEsquemas()
+    resultados = []
+    hilos = [
+        threading.Thread(target=lambda: resultados.append(registro.obtener("siRecepEvento")))
+        for _ in range(8)
+    ]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert len({id(esquema) for esquema in resultados}) == 1
+
+
+def test_esquema_desconocido():
+    with pytest.raises(KeyError):
+        RegistroEsquemas().obtener("rNoExiste")
+
+
+def test_validar_xml_reporta_errores():
+    xml = b'<rDE xmlns="http://ekuatia.set.gov.py/sifen/xsd"><dVerFor>150</dVerFor></rDE>'
+    es_valido, mensaje = validar_xml(xml)
+    assert not es_valido
+    assert "Errores de validación" in mensaje
+
+
+def test_validar_lote_vacio_invalido():
+    registro = RegistroEsquemas()
+    lote = etree.fromstring(b'<rLoteDE xmlns="http://ekuatia.set.gov.py/sifen/xsd"/>')
+    with pytest.raises(etree.DocumentInvalid):
+        registro.validar(lote, "rLoteDE")
@@ -0,0 +1,57 @@
+import io
+
+import pytest
+from lxml import etree
+
+from sifen.core.clients.consulta_lote import leer_consulta_lote
+from sifen.core.clients.respuestas import iterar_resultados, leer_resultado, liberar_elemento
+from sifen.core.clients.soap import sifen
+from tests.conftest import respuesta_consulta_lote
+
+RRETENVIDE = """<rRetEnviDe xmlns="http://ekuatia.set.gov.py/sifen/xsd"><rProtDe>
+<Id>01800123456700100100000011202401151123456789</Id>
+<dFecProc>2024-01-15T10:00:00-03:00</dFecProc>
+<dDigVal>YWJjZGVm</dDigVal>
+<dEstRes>Aprobado</dEstRes>
+<dProtAut>123</dProtAut>
+<gResProc><dCodRes>0260</dCodRes><dMsgRes>Autorización del DE satisfactoria</dMsgRes></gResProc>
+</rProtDe></rRetEnviDe>""".encode()
+
+
+def test_rprotde_valida_contra_protprocesde():
+    (resultado,) = iterar_resultados(RRETENVIDE, validar=True)
+    assert resultado.cdc == "01800123456700100100000011202401151123456789"
+    assert resultado.aprobado and resultado.protocolo == "123"
+    assert resultado.fecha_proceso == "2024-01-15T10:00:00-03:00"
+    assert resultado.digest == "YWJjZGVm"
+    assert resultado.codigos == ["0260"]
+
+    with pytest.raises(etree.DocumentInvalid):
+        list(iterar_resultados(RRETENVIDE.replace(b">123<", b">abc<"), validar=True))
+
+
+def test_lote_de_50_des_en_streaming(tmp_path):
+    xml = respuesta_consulta_lote(50, 5)
+    resultados = list(iterar_resultados(xml, lote="7", validar=True))
+    assert len(resultados) == 50
+    assert all(not r.aprobado and r.lote == "7" for r in resultados)
+    assert resultados[0].codigos == ["1000", "1001", "1002", "1003", "1004"]
+
+    archivo = tmp_path / "respuesta.xml"
+    archivo.write_bytes(xml)
+    estado, desde_archivo = leer_consulta_lote(str(archivo), lote="7", validar=True)
+    assert estado.concluido
+    assert list(desde_archivo) == resultados
+
+
+def test_libera_los_elementos_ya_leidos():
+    # Respuesta mucho más grande que el búfer de lectura de iterparse
+    xml = respuesta_consulta_lote(2000, 1)
+    maximo = 0
+    for _, elemento in etree.iterparse(io.BytesIO(xml), tag=sifen("gResProcLote")):
+        leer_resultado(elemento)
+        padre = elemento.getparent()
+        maximo = max(maximo, len(padre))
+        liberar_elemento(elemento)
+    assert maximo < 200
+    assert len(padre) == 1 and len(elemento) == 0
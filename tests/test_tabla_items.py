@@ -0,0 +1,98 @@
+import io
+from array import array
+from decimal import Decimal
+
+import pytest
+from lxml import etree
+
+from sifen.core.builders.xml_builder import XMLBuilder
+from sifen.core.emision import emitir_factura
+from sifen.core.validators.validator import validar_xml
+from sifen.models.item import ItemFactura
+from sifen.models.tabla_items import TablaItems
+
+
+def _c14n(xml_bytes):
+    parser = etree.XMLParser(remove_blank_text=True)
+    arbol = etree.fromstring(xml_bytes, parser)
+    for nodo in arbol.iter("{*}dFecFirma"):
+        nodo.text = ""
+    return etree.tostring(arbol, method="c14n")
+
+
+def _items_variados():
+    return [
+        ItemFactura(codigo="A", descripcion="A", cantidad=Decimal("3.5"), precio_unitario=Decimal("1234.57"),
+                    tasa_iva=10, porcentaje_descuento=Decimal("12.5")),
+        ItemFactura(codigo="B", descripcion="B", cantidad=Decimal(7), precio_unitario=Decimal(3333),
+                    tasa_iva=5, descuento=Decimal(100), descuento_global_Item=Decimal("0.5")),
+        ItemFactura(codigo="C", descripcion="C", cantidad=Decimal(1), precio_unitario=Decimal(999),
+                    tasa_iva=0, afectacion_iva="3"),
+    ]
+
+
+def test_tabla_calcula_igual_que_item_factura():
+    items = _items_variados()
+    tabla = TablaItems.desde_items(items)
+
+    for item, fila in zip(items, tabla):
+        assert fila.totales == item.totales
+        assert fila.calcular_subtotal() == item.calcular_subtotal()
+
+
+def test_factura_con_tabla_genera_el_mismo_xml(factura):
+    con_lista = XMLBuilder.build(factura)
+    factura.items = TablaItems.desde_items(factura.items)
+
+    assert _c14n(XMLBuilder.build(factura)) == _c14n(con_lista)
+
+    destino = io.BytesIO()
+    XMLBuilder.build_stream(factura, destino)
+    assert _c14n(destino.getvalue()) == _c14n(con_lista)
+    assert validar_xml(emitir_factura(factura)) == (True, None)
+
+
+def test_totales_de_tabla_coinciden_con_la_lista(factura):
+    factura.items = _items_variados()
+    esperado = factura.calcular_totales()
+    factura.items = TablaItems.desde_items(factura.items)
+    assert factura.calcular_totales() == esperado
+
+
+def test_validacion_por_columnas_indica_el_item():
+    tabla = TablaItems()
+    tabla.agregar(codigo="A", descripcion="A", cantidad=1, precio_unitario=10, tasa_iva=10)
+    tabla.agregar(codigo="B", descripcion="B", cantidad=1, precio_unitario=10, tasa_iva=7)
+    with pytest.raises(ValueError, match="Ítem 2: IVA"):
+        tabla.validar()
+
+
+def test_agregar_invalida_los_calculos():
+    tabla = TablaItems()
+    tabla.agregar(codigo="A", descripcion="A", cantidad=2, precio_unitario=10, tasa_iva=10)
+    assert tabla.calcular_totales().total == Decimal("22.00")
+    tabla.agregar(codigo="B", descripcion="B", cantidad=1, precio_unitario=10, tasa_iva=5)
+    assert tabla.calcular_totales().total == Decimal("32.50")
+
+    with pytest.raises(ValueError):
+        tabla.agregar(codigo="C", descripcion="C", cantidad=1, precio_unitario=Decimal("0.001"), tasa_iva=10)
+    assert len(tabla) == 2 and len(tabla.subtotales()) == 2
+
+
+@pytest.mark.parametrize("campos", [
+    {"tasa_iva": 200},
+    {"afectacion_iva": "300"},
+    {"cantidad": 10**16},
+])
+def test_fila_fuera_de_rango_no_modifica_la_tabla(campos):
+    tabla = TablaItems()
+    tabla.agregar(codigo="A", descripcion="A", cantidad=2, precio_unitario=10, tasa_iva=10)
+    totales = tabla.calcular_totales()
+
+    fila = dict(codigo="B", descripcion="B", cantidad=1, precio_unitario=10, tasa_iva=10)
+    with pytest.raises(ValueError, match="fuera de rango"):
+        tabla.agregar(**{**fila, **campos})
+
+    columnas = [c for c in vars(tabla).values() if isinstance(c, (list, array))]
+    assert {len(c) for c in columnas} == {1}
+    assert tabla.calcular_totales() == totales and totales.cantidad_items == 1
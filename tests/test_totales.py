@@ -0,0 +1,60 @@
+import io
+from decimal import Decimal
+
+from sifen.core.builders.xml_builder import SIFEN_NS, XMLBuilder
+from sifen.core.emision import emitir_arbol
+from sifen.models.item import ItemFactura
+
+
+def _item(codigo, precio, tasa, afectacion="1"):
+    return ItemFactura(
+        codigo=codigo,
+        descripcion=f"Producto {codigo}",
+        cantidad=Decimal(1),
+        precio_unitario=Decimal(precio),
+        tasa_iva=Decimal(tasa),
+        afectacion_iva=afectacion,
+    )
+
+
+def test_totales_del_item_se_recalculan_al_cambiar_un_campo():
+    item = _item("A", 1000, 10)
+    assert item.totales is item.totales
+    assert item.total == Decimal("1100.00")
+
+    item.cantidad = Decimal(3)
+    assert item.calcular_subtotal() == Decimal("3000.00")
+    assert item.calcular_iva() == Decimal("300.00")
+
+
+def test_totales_por_tasa_y_afectacion(factura):
+    factura.items = [
+        _item("A", 1000, 10),
+        _item("B", 2000, 5),
+        _item("C", 500, 0, afectacion="3"),
+    ]
+    factura.items[1].descuento = Decimal(100)
+
+    totales = factura.calcular_totales()
+
+    assert totales["sub10"] == Decimal("1000.00")
+    assert totales["sub5"] == Decimal("2000.00")
+    assert totales["sub_exe"] == Decimal("500.00")
+    assert totales["iva5"] == Decimal("95.00")
+    assert totales["base_grav5"] == Decimal("1900.00")
+    assert totales["total_descuentos"] == Decimal("100")
+    assert totales["iva"] == Decimal("195.00")
+    assert totales["subtotal"] == Decimal("3500.00")
+
+    de = emitir_arbol(factura).find("{%s}DE" % SIFEN_NS)
+    assert de.findtext(".//{%s}dSub5" % SIFEN_NS) == "2000.00"
+    assert de.findtext(".//{%s}dSubExe" % SIFEN_NS) == "500.00"
+    assert de.findtext(".//{%s}dIVA5" % SIFEN_NS) == "95.00"
+
+
+def test_build_stream_usa_los_mismos_totales(factura):
+    factura.items = [_item("A", 1000, 10), _item("B", 2000, 5)]
+    destino = io.BytesIO()
+    XMLBuilder.build_stream(factura, destino)
+    assert b"<dSub5>2000.00</dSub5>" in destino.getvalue()
+    assert b"<dTotIVA>200.00</dTotIVA>" in destino.getvalue()
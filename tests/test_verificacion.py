@@ -0,0 +1,106 @@
+from lxml import etree
+
+from sifen.core.emision import emitir_factura
+from sifen.core.signers.almacen_claves import AlmacenClaves
+from sifen.core.signers.firmantes import BACKEND_PYTHON
+from sifen.core.signers.qr import CSC_PRUEBA, ID_CSC_PRUEBA, URLS_QR, ServicioQR
+from sifen.core.signers.verificacion import CacheCertificados, verificar_documento, verificar_firmas
+from sifen.emulador.carga import facturas_sinteticas
+from tests.conftest import generar_certificado
+
+
+def _almacen(tmp_path, nombre, ruc):
+    cert_path, key_path = generar_certificado(tmp_path, nombre, ruc=ruc)
+    return AlmacenClaves(key_path, cert_path)
+
+
+def _documentos(tmp_path, factura):
+    # Dos certificados del mismo emisor (p. ej. antes y después de renovarlo)
+    almacen = _almacen(tmp_path, "emisor", factura.emisor.ruc)
+    otro = _almacen(tmp_path, "renovado", factura.emisor.ruc)
+    servicio = ServicioQR("0002", "CSC-PROVEEDOR")
+    documentos = []
+    for i, f in enumerate(facturas_sinteticas(factura, 6)):
+        if i % 2:
+            xml = emitir_factura(f, almacen=otro, servicio_qr=servicio, backend=BACKEND_PYTHON)
+        else:
+            xml = emitir_factura(f, almacen=almacen)
+        ruta = tmp_path / f"de{i}.xml"
+        ruta.write_bytes(xml)
+        documentos.append(str(ruta) if i < 3 else xml)
+    documentos.append(documentos[-1].replace(b"<dTotIVA>", b"<dTotIVA>1"))
+    return documentos
+
+
+def test_verifica_firma_qr_y_reusa_certificados(tmp_path, factura):
+    documentos = _documentos(tmp_path, factura)
+    cscs = {factura.emisor.ruc: (ID_CSC_PRUEBA, CSC_PRUEBA)}
+    cache = CacheCertificados()
+
+    resultados = [verificar_documento(d, cscs, cache, indice=i) for i, d in enumerate(documentos)]
+
+    assert [r.firma_valida for r in resultados] == [True] * 6 + [False]
+    assert "DigestValue" in resultados[-1].error
+    # El CSC conocido es el de prueba: los del proveedor con otro CSC no verifican el QR
+    assert [r.qr_valido for r in resultados[:6]] == [True, False] * 3
+    assert resultados[0].origen == documentos[0] and resultados[5].origen is None
+    assert len({r.certificado for r in resultados[:6]}) == 2
+    assert {r.ruc_certificado for r in resultados[:6]} == {factura.emisor.ruc}
+    assert cache.parseados == 2
+
+
+def test_pool_devuelve_lo_mismo_en_orden(tmp_path, factura):
+    documentos = _documentos(tmp_path, factura)
+    cscs = {factura.emisor.ruc: (ID_CSC_PRUEBA, CSC_PRUEBA)}
+
+    en_serie = list(verificar_firmas(documentos, workers=1, cscs=cscs))
+    en_pool = list(verificar_firmas(iter(documentos), workers=2, cscs=cscs, tamano_bloque=2))
+
+    assert en_pool == en_serie
+    assert [r.indice for r in en_pool] == list(range(len(documentos)))
+    assert [r.ok for r in en_pool] == [True, False] * 3 + [False]
+
+
+def test_rechaza_certificado_de_otro_ruc(tmp_path, factura):
+    ajeno = emitir_factura(factura, almacen=_almacen(tmp_path, "ajeno", "80000099"))
+    sin_ruc = emitir_factura(factura)  # El certificado de ejemplo no trae SERIAL_NUMBER
+
+    resultado = verificar_documento(ajeno)
+    assert not resultado.ok and not resultado.firma_valida
+    assert resultado.ruc_certificado == "80000099" and resultado.certificado
+    assert f"no es del emisor (RUC {factura.emisor.ruc})" in resultado.error
+
+    resultado = verificar_documento(sin_ruc)
+    assert not resultado.ok and resultado.ruc_certificado is None
+
+
+def test_rechaza_qr_que_no_apunta_a_la_set(tmp_path, factura):
+    xml = emitir_factura(factura, almacen=_almacen(tmp_path, "emisor", factura.emisor.ruc))
+    ajeno = xml.replace(URLS_QR["test"].encode(), b"https://consultas.example.com/qr?")
+
+    for cscs in ({factura.emisor.ruc: (ID_CSC_PRUEBA, CSC_PRUEBA)}, None):
+        assert verificar_documento(xml, cscs).qr_valido is (True if cscs else None)
+        resultado = verificar_documento(ajeno, cscs)
+        assert resultado.firma_valida and resultado.qr_valido is False and not resultado.ok
+        assert "consultas.example.com" in resultado.error
+
+
+def test_rechaza_firma_alterada_y_certificado_cambiado(tmp_path, factura):
+    ds = "{http://www.w3.org/2000/09/xmldsig#}"
+    firmado = etree.fromstring(emitir_factura(factura, almacen=_almacen(tmp_path, "emisor", factura.emisor.ruc)))
+    renovado = etree.fromstring(emitir_factura(factura, almacen=_almacen(tmp_path, "renovado", factura.emisor.ruc)))
+
+    alterado = etree.fromstring(etree.tostring(firmado))
+    valor = alterado.find(f"{ds}Signature/{ds}SignatureValue")
+    valor.text = ("B" if valor.text[0] == "A" else "A") + valor.text[1:]
+
+    # Certificado de otro par del mismo RUC: pasa el control de RUC pero no la firma
+    cambiado = etree.fromstring(etree.tostring(firmado))
+    certificado = f"{ds}Signature/{ds}KeyInfo/{ds}X509Data/{ds}X509Certificate"
+    cambiado.find(certificado).text = renovado.find(certificado).text
+
+    assert verificar_documento(firmado).firma_valida
+    for documento in (alterado, cambiado):
+        resultado = verificar_documento(documento)
+        assert not resultado.firma_valida
+        assert resultado.error == "La SignatureValue no es válida"
@@ -0,0 +1,62 @@
+import io
+import re
+
+import pytest
+from lxml import etree
+
+from sifen.core.builders.xml_builder import XMLBuilder
+from sifen.core.signers.signer import firmar_xml
+from sifen.core.validators.validator import validar_xml
+
+
+def _canonico(xml_bytes):
+    parser = etree.XMLParser(remove_blank_text=True)
+    c14n = etree.tostring(etree.fromstring(xml_bytes, parser), method="c14n")
+    return re.sub(rb"<dFecFirma>[^<]*<", b"<dFecFirma><", c14n)
+
+
+def test_build_stream_equivale_a_build(factura):
+    destino = io.BytesIO()
+    id_de = XMLBuilder.build_stream(factura, destino)
+
+    assert _canonico(destino.getvalue()) == _canonico(XMLBuilder.build(factura))
+    assert f'Id="{id_de}"'.encode() in destino.getvalue()
+
+
+def test_build_stream_acepta_generador_de_items(factura):
+    items = list(factura.items)
+    factura.items = (items[i % len(items)] for i in range(50))
+    destino = io.BytesIO()
+    XMLBuilder.build_stream(factura, destino)
+
+    firmado = firmar_xml(destino.getvalue())
+    assert validar_xml(firmado) == (True, None)
+    assert firmado.count(b"<gCamItem") == 50
+
+
+def test_build_stream_sin_items(factura):
+    factura.items = iter(())
+    with pytest.raises(ValueError):
+        XMLBuilder.build_stream(factura, io.BytesIO())
+
+
+def test_cache_reutiliza_gemis_y_gtimb(factura):
+    cache = XMLBuilder.cache_fragmentos
+    cache.invalidar()
+    antes = cache.estadisticas()
+
+    primero = XMLBuilder.build(factura)
+    factura.numero_factura = "001-002-0000006"
+    segundo = XMLBuilder.build(factura)
+
+    stats = cache.estadisticas()
+    assert stats["aciertos"] - antes["aciertos"] == 2
+    assert stats["entradas"] == 2
+    assert b"<dNumDoc>0000005</dNumDoc>" in primero
+    assert b"<dNumDoc>0000006</dNumDoc>" in segundo
+
+
+def test_cache_detecta_cambios_del_emisor(factura):
+    XMLBuilder.build(factura)
+    factura.emisor.nombre = "OTRO NOMBRE SA"
+    assert b"<dNomEmi>OTRO NOMBRE SA</dNomEmi>" in XMLBuilder.build(factura)